@@ -0,0 +1,232 @@
+"""
+Catálogo das imagens do app, endereçado pelo conteúdo.
+
+As pastas de imagens são varridas uma vez (na subida do servidor e de novo
+pelo grafo de construção quando algum arquivo muda). Cada imagem é
+identificada pelo hash do seu conteúdo; nomes lógicos ("polimero/PET",
+"secao/museu_fachada") apontam para um hash, e arquivos idênticos em lugares
+diferentes contam como um conteúdo só. Na renderização basta consultar um
+dicionário, sem tocar no disco.
+
+    python acervo.py                    # relatório: duplicatas, órfãs, faltando, inválidos
+    python acervo.py --publicar destino  # um arquivo <hash>.<ext> por conteúdo + manifesto.json
+    python acervo.py --verificar destino # confere se cada arquivo publicado bate com o seu hash
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+from PIL import Image
+
+PASTA_MATERIAIS = "imagens_materiais"
+PASTA_RESIDUOS = "imagens_residuos"
+PASTAS_IMAGENS = [PASTA_MATERIAIS, PASTA_RESIDUOS]
+
+# Imagens soltas na raiz do repositório: entram no catálogo só para o relatório
+ARQUIVOS_AVULSOS = ["san.png", "download-_1_.png"]
+
+EXTENSOES = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG", ".gif": "GIF", ".webp": "WEBP"}
+
+# Imagens fixas das seções do app
+IMAGENS_SECOES = {
+    "museu_fachada": os.path.join(PASTA_MATERIAIS, "museuext.png"),
+    "museu_equipe": os.path.join(PASTA_MATERIAIS, "museuint.png"),
+    "polimeros_estrutura": os.path.join(PASTA_MATERIAIS, "polo.png"),
+    "polimeros_aplicacoes": os.path.join(PASTA_MATERIAIS, "tipos2.png"),
+    "isopor_reciclagem": os.path.join(PASTA_RESIDUOS, "isopor.png"),
+    "isopor_usos": os.path.join(PASTA_RESIDUOS, "eps.png"),
+    "compostagem_leira": os.path.join(PASTA_RESIDUOS, "leira.png"),
+    "compostagem_metodo_ufsc": os.path.join(PASTA_RESIDUOS, "metodo_ufsc.png"),
+    "microplasticos": os.path.join(PASTA_MATERIAIS, "micro.png"),
+    "cooperativas": os.path.join(PASTA_MATERIAIS, "copimagem.png"),
+}
+
+
+# Função para normalizar nomes (sigla do polímero -> nome do arquivo)
+def normalizar_nome(nome):
+    return nome.lower().replace(" ", "_").replace("(", "").replace(")", "").replace(".", "").replace(",", "")
+
+
+def nomes_logicos(polimeros):
+    """Nome lógico -> arquivo esperado: uma imagem por sigla de polímero e as imagens das seções."""
+    nomes = {f"polimero/{sigla}": os.path.join(PASTA_MATERIAIS, normalizar_nome(sigla) + ".png")
+             for sigla in polimeros["Sigla"].dropna().astype(str)}
+    nomes.update({f"secao/{chave}": caminho for chave, caminho in IMAGENS_SECOES.items()})
+    return nomes
+
+
+def hash_arquivo(caminho):
+    h = hashlib.sha256()
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(1 << 20), b""):
+            h.update(bloco)
+    return h.hexdigest()[:16]
+
+
+def _formato(caminho):
+    """Formato lido do cabeçalho (não decodifica a imagem inteira); None se não for imagem."""
+    try:
+        with Image.open(caminho) as img:
+            return img.format
+    except OSError:
+        return None
+
+
+class Acervo:
+    def __init__(self, arquivos, conteudos, nomes, faltando, invalidos):
+        self.arquivos = arquivos    # caminho -> hash
+        self.conteudos = conteudos  # hash -> {"caminho": arquivo canônico, "formato", "bytes"}
+        self.nomes = nomes          # nome lógico -> hash
+        self.faltando = faltando    # nome lógico -> arquivo esperado que não existe
+        self.invalidos = invalidos  # caminho -> motivo
+
+    def caminho(self, nome):
+        """Arquivo com o conteúdo do nome lógico; None se não houver imagem."""
+        h = self.nomes.get(nome)
+        return None if h is None else self.conteudos[h]["caminho"]
+
+    def duplicatas(self):
+        """hash -> todos os arquivos com aquele conteúdo (só os que aparecem mais de uma vez)."""
+        grupos = {}
+        for caminho, h in self.arquivos.items():
+            grupos.setdefault(h, []).append(caminho)
+        return {h: sorted(caminhos) for h, caminhos in grupos.items() if len(caminhos) > 1}
+
+    def orfaos(self):
+        """Imagens que nenhum nome lógico usa."""
+        usados = set(self.nomes.values())
+        return sorted(caminho for caminho, h in self.arquivos.items() if h not in usados)
+
+    def relatorio(self):
+        return {
+            "imagens": len(self.arquivos),
+            "conteudos": len(self.conteudos),
+            "bytes": sum(c["bytes"] for c in self.conteudos.values()),
+            "duplicatas": self.duplicatas(),
+            "orfaos": self.orfaos(),
+            "faltando": dict(sorted(self.faltando.items())),
+            "invalidos": dict(sorted(self.invalidos.items())),
+        }
+
+    def verificar(self):
+        """Arquivos que mudaram ou sumiram desde a varredura: caminho -> problema."""
+        problemas = {}
+        for caminho, h in self.arquivos.items():
+            try:
+                if hash_arquivo(caminho) != h:
+                    problemas[caminho] = "conteúdo alterado"
+            except OSError:
+                problemas[caminho] = "arquivo não encontrado"
+        return problemas
+
+    def publicar(self, destino):
+        """
+        Copia cada conteúdo uma vez como <hash>.<ext> e grava manifesto.json
+        (nome lógico -> arquivo). Os nomes mudam junto com o conteúdo, então
+        podem ser servidos com cache permanente.
+        """
+        os.makedirs(destino, exist_ok=True)
+        arquivos = {}
+        for h, conteudo in self.conteudos.items():
+            nome = h + os.path.splitext(conteudo["caminho"])[1].lower()
+            if nome.endswith("."):
+                nome += conteudo["formato"].lower()
+            if not os.path.isfile(os.path.join(destino, nome)):
+                shutil.copyfile(conteudo["caminho"], os.path.join(destino, nome + ".tmp"))
+                os.replace(os.path.join(destino, nome + ".tmp"), os.path.join(destino, nome))
+            arquivos[h] = nome
+        manifesto = {nome: arquivos[h] for nome, h in sorted(self.nomes.items())}
+        temporario = os.path.join(destino, "manifesto.json.tmp")
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump(manifesto, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, os.path.join(destino, "manifesto.json"))
+        return manifesto
+
+
+def verificar_publicados(destino):
+    """Arquivos publicados cujo conteúdo não bate com o hash do nome: nome -> problema."""
+    with open(os.path.join(destino, "manifesto.json"), encoding="utf-8") as f:
+        manifesto = json.load(f)
+    problemas = {}
+    for nome in sorted(set(manifesto.values())):
+        try:
+            if hash_arquivo(os.path.join(destino, nome)) != nome.split(".")[0]:
+                problemas[nome] = "conteúdo alterado"
+        except OSError:
+            problemas[nome] = "arquivo não encontrado"
+    return problemas
+
+
+def catalogar(nomes, pastas=PASTAS_IMAGENS, avulsos=ARQUIVOS_AVULSOS):
+    """
+    Varre as pastas (sem subpastas) e os arquivos avulsos e resolve os nomes lógicos.
+    Entre arquivos idênticos, o canônico é o primeiro usado por um nome lógico.
+    """
+    candidatos = []
+    for pasta in pastas:
+        if os.path.isdir(pasta):
+            candidatos += [os.path.join(pasta, nome) for nome in sorted(os.listdir(pasta)) if not nome.startswith(".")]
+    candidatos += [caminho for caminho in avulsos if os.path.isfile(caminho)]
+
+    arquivos, conteudos, invalidos = {}, {}, {}
+    for caminho in candidatos:
+        if not os.path.isfile(caminho):
+            continue
+        formato = _formato(caminho)
+        extensao = os.path.splitext(caminho)[1].lower()
+        if formato is None:
+            invalidos[caminho] = "não é uma imagem"
+            continue
+        if EXTENSOES.get(extensao) != formato:
+            # Ex.: "pa,png." é um PNG, mas nunca seria achado como "pa.png"
+            invalidos[caminho] = f"nome malformado ({formato} com extensão '{extensao}')"
+        h = hash_arquivo(caminho)
+        arquivos[caminho] = h
+        conteudos.setdefault(h, {"caminho": caminho, "formato": formato, "bytes": os.path.getsize(caminho)})
+
+    resolvidos, faltando = {}, {}
+    for nome, caminho in nomes.items():
+        if caminho in arquivos and caminho not in invalidos:
+            resolvidos[nome] = arquivos[caminho]
+        else:
+            faltando[nome] = caminho
+    # O arquivo canônico de um conteúdo é o que os nomes lógicos usam
+    for nome, caminho in reversed(list(nomes.items())):
+        if nome in resolvidos:
+            conteudos[resolvidos[nome]]["caminho"] = caminho
+    return Acervo(arquivos, conteudos, resolvidos, faltando, invalidos)
+
+
+if __name__ == "__main__":
+    from dados import caminho_dados, ler_tabela
+
+    parser = argparse.ArgumentParser(description="Catálogo das imagens do app.")
+    parser.add_argument("--verificar", metavar="DESTINO", help="confere os arquivos publicados com o hash do nome")
+    parser.add_argument("--publicar", metavar="DESTINO", help="copia os conteúdos únicos com nome pelo hash")
+    args = parser.parse_args()
+
+    if args.verificar:
+        problemas = verificar_publicados(args.verificar)
+        for nome, problema in problemas.items():
+            print(f"{nome}: {problema}")
+        sys.exit(1 if problemas else 0)
+
+    acervo = catalogar(nomes_logicos(ler_tabela(caminho_dados("polimeros.csv"))))
+    if args.publicar:
+        manifesto = acervo.publicar(args.publicar)
+        print(f"{len(set(manifesto.values()))} arquivos e manifesto.json em {args.publicar}")
+    else:
+        relatorio = acervo.relatorio()
+        print(f"{relatorio['imagens']} imagens, {relatorio['conteudos']} conteúdos diferentes "
+              f"({relatorio['bytes'] / 1e6:.1f} MB)")
+        for h, caminhos in relatorio["duplicatas"].items():
+            print(f"duplicata {h}: {', '.join(caminhos)}")
+        for caminho, motivo in relatorio["invalidos"].items():
+            print(f"inválido: {caminho} ({motivo})")
+        for nome, caminho in relatorio["faltando"].items():
+            print(f"faltando: {nome} (esperado em {caminho})")
+        for caminho in relatorio["orfaos"]:
+            print(f"órfã: {caminho}")
@@ -0,0 +1,133 @@
+import os
+import sqlite3
+
+import pandas as pd
+import plotly.express as px
+
+from registro_respostas import CAMINHO_BANCO, FAIXAS_LATENCIA_S
+
+ROTULOS_FAIXAS = (
+    [f"< {FAIXAS_LATENCIA_S[0]} s"]
+    + [f"{a}–{b} s" for a, b in zip(FAIXAS_LATENCIA_S, FAIXAS_LATENCIA_S[1:])]
+    + [f"> {FAIXAS_LATENCIA_S[-1]} s"]
+)
+
+COLUNAS_RESUMO = ["pergunta_id", "Pergunta", "Respostas", "Acertos (%)", "Tempo médio (s)",
+                  "Distrator mais escolhido", "Escolhido por (%)"]
+
+
+def _conectar_leitura(caminho):
+    if not os.path.isfile(caminho):
+        return None
+    return sqlite3.connect(f"file:{caminho}?mode=ro", uri=True, timeout=30)
+
+
+def versao_agregados(caminho=CAMINHO_BANCO):
+    """Total de respostas agregadas; muda sempre que um lote novo é gravado."""
+    conexao = _conectar_leitura(caminho)
+    if conexao is None:
+        return 0
+    try:
+        return conexao.execute("SELECT COALESCE(SUM(total), 0) FROM agregado_pergunta").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0
+    finally:
+        conexao.close()
+
+
+def ler_agregados(caminho=CAMINHO_BANCO):
+    """Lê apenas as tabelas agregadas (tamanho proporcional ao nº de perguntas, não de respostas)."""
+    tabelas = {
+        "perguntas": "SELECT * FROM agregado_pergunta",
+        "opcoes": "SELECT * FROM agregado_opcao",
+        "latencias": "SELECT * FROM agregado_latencia",
+        "dias": "SELECT * FROM agregado_dia ORDER BY dia",
+    }
+    conexao = _conectar_leitura(caminho)
+    if conexao is None:
+        return {nome: pd.DataFrame() for nome in tabelas}
+    try:
+        return {nome: pd.read_sql_query(sql, conexao) for nome, sql in tabelas.items()}
+    except (sqlite3.OperationalError, pd.errors.DatabaseError):
+        return {nome: pd.DataFrame() for nome in tabelas}
+    finally:
+        conexao.close()
+
+
+def resumo_perguntas(agregados, perguntas):
+    """
+    Uma linha por pergunta: acertos, tempo médio e o distrator mais escolhido.
+    Perguntas que não estão mais no banco (texto editado muda o id) ficam de fora.
+    """
+    resumo = agregados["perguntas"]
+    if resumo.empty:
+        return pd.DataFrame(columns=COLUNAS_RESUMO)
+    por_id = {p["id"]: p for p in perguntas}
+    opcoes = agregados["opcoes"]
+
+    linhas = []
+    for _, row in resumo.iterrows():
+        pergunta = por_id.get(row["pergunta_id"])
+        if pergunta is None:
+            continue  # pergunta removida do arquivo
+        erradas = opcoes[(opcoes["pergunta_id"] == row["pergunta_id"]) & (opcoes["opcao"] != pergunta["resposta"])]
+        distrator, percentual = "—", 0.0
+        if not erradas.empty:
+            mais = erradas.loc[erradas["total"].idxmax()]
+            distrator = pergunta["opcoes"][int(mais["opcao"])]
+            percentual = 100 * mais["total"] / row["total"]
+        linhas.append({
+            "pergunta_id": row["pergunta_id"],
+            "Pergunta": pergunta["pergunta"],
+            "Respostas": int(row["total"]),
+            "Acertos (%)": round(100 * row["acertos"] / row["total"], 1),
+            "Tempo médio (s)": round(row["soma_latencia_ms"] / row["n_latencia"] / 1000, 1) if row["n_latencia"] else None,
+            "Distrator mais escolhido": distrator,
+            "Escolhido por (%)": round(percentual, 1),
+        })
+    if not linhas:
+        return pd.DataFrame(columns=COLUNAS_RESUMO)
+    return pd.DataFrame(linhas, columns=COLUNAS_RESUMO).sort_values("Acertos (%)").reset_index(drop=True)
+
+
+def figura_acertos(resumo):
+    fig = px.bar(
+        resumo, x="Acertos (%)", y=resumo["Pergunta"].str.slice(0, 60), orientation="h",
+        color="Acertos (%)", color_continuous_scale="RdYlGn", range_color=[0, 100],
+        labels={"y": ""}, title="Acertos por pergunta (as mais difíceis no topo)"
+    )
+    fig.update_layout(yaxis={"autorange": "reversed"}, height=max(300, 28 * len(resumo)))
+    return fig
+
+
+def figura_opcoes(agregados, pergunta):
+    opcoes = agregados["opcoes"]
+    contagem = opcoes[opcoes["pergunta_id"] == pergunta["id"]].set_index("opcao")["total"]
+    dados = pd.DataFrame({
+        "Opção": pergunta["opcoes"],
+        "Respostas": [int(contagem.get(i, 0)) for i in range(len(pergunta["opcoes"]))],
+        "Situação": ["Correta" if i == pergunta["resposta"] else "Distrator" for i in range(len(pergunta["opcoes"]))],
+    })
+    return px.bar(dados, x="Respostas", y="Opção", color="Situação", orientation="h",
+                  color_discrete_map={"Correta": "#2e7d32", "Distrator": "#d32f2f"},
+                  title="Escolha das alternativas")
+
+
+def figura_latencias(agregados, pergunta_id):
+    latencias = agregados["latencias"]
+    contagem = latencias[latencias["pergunta_id"] == pergunta_id].set_index("faixa")["total"]
+    dados = pd.DataFrame({
+        "Tempo de resposta": ROTULOS_FAIXAS,
+        "Respostas": [int(contagem.get(i, 0)) for i in range(len(ROTULOS_FAIXAS))],
+    })
+    return px.bar(dados, x="Tempo de resposta", y="Respostas", title="Tempo até responder")
+
+
+def figura_tendencia(agregados, pergunta_id=None):
+    dias = agregados["dias"]
+    if pergunta_id is not None:
+        dias = dias[dias["pergunta_id"] == pergunta_id]
+    por_dia = dias.groupby("dia", as_index=False)[["total", "acertos"]].sum()
+    por_dia["Acertos (%)"] = 100 * por_dia["acertos"] / por_dia["total"]
+    return px.line(por_dia, x="dia", y="Acertos (%)", markers=True, range_y=[0, 100],
+                   labels={"dia": "Dia"}, title="Evolução dos acertos")
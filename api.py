@@ -0,0 +1,438 @@
+"""
+API HTTP (JSON) para os totens do museu e o portal das escolas parceiras.
+
+Uma sessão do Streamlit custa um websocket, reexecuções do script e estado
+por visitante; quem só precisa dos dados fala com esta API, um servidor
+asyncio (só biblioteca padrão) que usa o mesmo grafo de artefatos do app
+(artefatos.py). Respostas de GET levam ETag e ficam num cache LRU até os
+dados mudarem.
+
+    python api.py --porta 8502
+    MUSEU_API_PORTA=8502 streamlit run app.py   # no mesmo processo do app
+
+Rotas:
+    GET  /api/polimeros?q=etileno&Reciclável=Sim&limite=20&inicio=0
+    GET  /api/polimeros/<sigla>
+    GET  /api/residuos?q=garrafa&Tipo de Resíduo=Plástico
+    GET  /api/descarte?q=pilhas usadas
+    GET  /api/pontos/proximos?lat=-27.58&lon=-48.50&categoria=Vidro&limite=3
+    GET  /api/quiz/amostra?n=10&semente=42
+    POST /api/quiz/resposta   {"id": "...", "opcao": 0, "sessao": "...", "turma": "..."}
+    GET  /api/pronto          health check: 503 enquanto o aquecimento (aquecimento.py) não termina
+    GET  /api/metricas        cálculos coalescidos (chamada_unica.py) e acertos do cache da API
+
+Em /api/quiz/resposta, "sessao" identifica o cliente (um por estudante ou
+partida); respostas sem ela são registradas, mas ficam fora do ajuste das
+dificuldades do quiz adaptativo (quiz_adaptativo.py).
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+import chamada_unica
+from estado_url import ordem_perguntas
+from geo import ISOPOR, RECICLAVEIS, VIDRO
+from registro_respostas import SESSAO_ANONIMA, registro_processo
+from utilitarios import normalizar_texto
+
+logger = logging.getLogger(__name__)
+
+PORTA_API = int(os.environ.get("MUSEU_API_PORTA", "0"))
+
+TAMANHO_CACHE = 2048        # respostas guardadas (LRU)
+LIMITE_CORPO = 16 * 1024    # bytes aceitos no corpo de um POST
+TEMPO_OCIOSO = 15           # segundos que uma conexão keep-alive pode ficar parada
+MAXIMO_ITENS = 100
+MAXIMO_PERGUNTAS = 50
+TAMANHO_IDENTIFICADOR = 100  # caracteres guardados de "sessao" e "turma"
+
+# Rotas que não tocam no grafo: respondidas direto no laço, mesmo com um artefato sendo construído
+ROTAS_SEM_GRAFO = {"/api/pronto", "/api/metricas"}
+
+CATEGORIAS_PONTOS = [RECICLAVEIS, VIDRO, ISOPOR]
+COLUNAS_PONTOS = ["nome", "camada", "detalhes", "latitude", "longitude"]
+
+_MOTIVOS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+            503: "Service Unavailable"}
+
+
+class ErroApi(Exception):
+    def __init__(self, status, mensagem, dados=None):
+        super().__init__(mensagem)
+        self.status = status
+        self.dados = dados or {}  # campos extras do corpo da resposta de erro
+
+
+def _json_padrao(valor):
+    if isinstance(valor, np.integer):
+        return int(valor)
+    if isinstance(valor, np.floating):
+        return None if np.isnan(valor) else float(valor)
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, Mapping):  # registros compactos (registros_compactos.Pergunta)
+        return dict(valor)
+    raise TypeError(f"{type(valor).__name__} não é serializável")
+
+
+def _registros(df, colunas=None):
+    """Linhas do DataFrame como dicionários, com NaN virando null."""
+    if colunas is not None:
+        df = df[[c for c in colunas if c in df.columns]]
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _inteiro(parametros, nome, padrao, minimo, maximo):
+    try:
+        valor = int(parametros.get(nome, [padrao])[0])
+    except ValueError:
+        raise ErroApi(400, f"'{nome}' precisa ser um número inteiro")
+    return min(max(valor, minimo), maximo)
+
+
+def _decimal(parametros, nome):
+    try:
+        return float(parametros[nome][0])
+    except KeyError:
+        raise ErroApi(400, f"parâmetro '{nome}' obrigatório")
+    except ValueError:
+        raise ErroApi(400, f"'{nome}' precisa ser um número")
+
+
+def _identificador(dados, nome):
+    """Texto opcional do corpo do POST, sem espaços nas pontas e com no máximo TAMANHO_IDENTIFICADOR caracteres."""
+    valor = dados.get(nome)
+    if valor is None:
+        return None
+    if not isinstance(valor, str):
+        raise ErroApi(400, f"'{nome}' precisa ser texto")
+    return valor.strip()[:TAMANHO_IDENTIFICADOR] or None
+
+
+class ApiMuseu:
+    """Rotas e cache; não sabe nada de rede (o servidor fica em `servir`)."""
+
+    def __init__(self, grafo, registro=None, aquecimento=None):
+        self.grafo = grafo
+        self.registro = registro  # RegistroRespostas (opcional): respostas da API entram nas análises
+        self.aquecimento = aquecimento  # Aquecimento (opcional): sem ele a réplica está sempre pronta
+        self.cache = OrderedDict()
+        self.acertos_cache = 0
+        self._trava = threading.Lock()
+        self._linhas = {}  # artefato -> (tabela, registros): conversão para dicionários feita uma vez por versão
+
+    def _registros_de(self, nome, tabela, colunas=None):
+        """
+        Registros de todas as linhas do artefato `nome`, reaproveitados enquanto
+        a tabela não for trocada. Uma entrada por artefato, nunca por parâmetro da requisição.
+        """
+        guardado = self._linhas.get(nome)
+        if guardado is None or guardado[0] is not tabela:
+            guardado = (tabela, _registros(tabela, colunas))
+            self._linhas[nome] = guardado
+        return guardado[1]
+
+    # ---- rotas ----
+
+    def _busca_facetada(self, nome, tabela, indice, parametros):
+        selecoes = {}
+        chaves = {normalizar_texto(faceta): faceta for faceta in indice.facetas}
+        for parametro, valores in parametros.items():
+            faceta = chaves.get(normalizar_texto(parametro))
+            if faceta:
+                selecoes[faceta] = [v for valor in valores for v in valor.split(",") if v]
+        registros = self._registros_de(nome, tabela)
+        base = indice.mascara_busca(parametros.get("q", [""])[0])
+        linhas = indice.linhas(indice.mascara(selecoes) & base)
+        inicio = _inteiro(parametros, "inicio", 0, 0, len(linhas))
+        limite = _inteiro(parametros, "limite", 20, 1, MAXIMO_ITENS)
+        return {
+            "total": len(linhas),
+            "itens": [registros[i] for i in linhas[inicio:inicio + limite]],
+            "facetas": indice.contagens(selecoes, base),
+        }
+
+    def polimeros(self, parametros):
+        polimeros, indice = self.grafo.obter_varios("polimeros", "indice_facetas_polimeros")
+        return self._busca_facetada("polimeros", polimeros, indice, parametros)
+
+    def polimero(self, sigla):
+        polimeros, similares = self.grafo.obter_varios("polimeros", "vizinhos_polimeros")
+        registros = self._registros_de("polimeros", polimeros)
+        posicao = next((i for i, r in enumerate(registros) if str(r["Sigla"]).upper() == sigla.upper()), None)
+        if posicao is None:
+            raise ErroApi(404, f"polímero '{sigla}' não encontrado")
+        return {
+            **registros[posicao],
+            "semelhantes": [{"sigla": registros[i]["Sigla"], "pontuacao": round(float(p), 3)}
+                            for i, p in similares.vizinhos(posicao)],
+        }
+
+    def residuos(self, parametros):
+        residuos, indice = self.grafo.obter_varios("residuos", "indice_facetas_residuos")
+        return self._busca_facetada("residuos", residuos, indice, parametros)
+
+    def descarte(self, parametros):
+        consulta = parametros.get("q", [""])[0]
+        if not consulta.strip():
+            raise ErroApi(400, "parâmetro 'q' obrigatório")
+        limite = _inteiro(parametros, "limite", 3, 1, 10)
+        return {"resultados": self.grafo.obter("indice_descarte").buscar(consulta, limite)}
+
+    def pontos_proximos(self, parametros):
+        latitude, longitude = _decimal(parametros, "lat"), _decimal(parametros, "lon")
+        categoria = parametros.get("categoria", [RECICLAVEIS])[0]
+        if categoria not in CATEGORIAS_PONTOS:
+            raise ErroApi(400, f"categoria deve ser uma de: {', '.join(CATEGORIAS_PONTOS)}")
+        limite = _inteiro(parametros, "limite", 3, 1, 20)
+        pontos, indice = self.grafo.obter_varios("camada_pontos", "indice_descarte")
+        proximos = indice.pontos_proximos(categoria, latitude, longitude, limite)
+        registros = self._registros_de("camada_pontos", pontos, COLUNAS_PONTOS)
+        return {"pontos": [{**registros[i], "distancia_km": round(float(d), 3)}
+                           for i, d in zip(pontos.index.get_indexer(proximos.index), proximos["distancia_km"])]}
+
+    def _variantes_por_enunciado(self, perguntas):
+        """{enunciado: ids das variantes}, refeito só quando o banco de perguntas é trocado."""
+        guardado = self._linhas.get("perguntas_por_id")
+        if guardado is None or guardado[0] is not perguntas:
+            variantes = {}
+            for pid, pergunta in perguntas.items():
+                variantes.setdefault(pergunta["pergunta"], []).append(pid)
+            guardado = (perguntas, {enunciado: sorted(ids) for enunciado, ids in variantes.items()})
+            self._linhas["perguntas_por_id"] = guardado
+        return guardado[1]
+
+    def quiz_amostra(self, parametros):
+        """
+        Perguntas sem o gabarito, no máximo uma variante de cada enunciado (como
+        no quiz adaptativo): o sorteio é entre enunciados, não entre variantes.
+        Com a mesma semente, a mesma amostra (e a resposta vai para o cache).
+        """
+        perguntas = self.grafo.obter("perguntas_por_id")
+        variantes = self._variantes_por_enunciado(perguntas)
+        n = _inteiro(parametros, "n", 10, 1, MAXIMO_PERGUNTAS)
+        semente = _inteiro(parametros, "semente", random.getrandbits(32), 0, 2**32 - 1)
+        rng = random.Random(semente)
+        ids = [rng.choice(variantes[enunciado]) for enunciado in ordem_perguntas(list(variantes), semente, n)]
+        return {
+            "semente": semente,
+            "perguntas": [{"id": pid, "pergunta": perguntas[pid]["pergunta"], "opcoes": perguntas[pid]["opcoes"]}
+                          for pid in ids],
+        }
+
+    def quiz_resposta(self, corpo):
+        try:
+            dados = json.loads(corpo or b"{}")
+            pergunta_id, opcao = str(dados["id"]), int(dados["opcao"])
+        except (ValueError, KeyError, TypeError):
+            raise ErroApi(400, 'corpo esperado: {"id": "...", "opcao": 0}')
+        pergunta = self.grafo.obter("perguntas_por_id").get(pergunta_id)
+        if pergunta is None:
+            raise ErroApi(404, f"pergunta '{pergunta_id}' não encontrada")
+        if not 0 <= opcao < len(pergunta["opcoes"]):
+            raise ErroApi(400, "opção fora do intervalo")
+        sessao, turma = _identificador(dados, "sessao"), _identificador(dados, "turma")
+        correta = opcao == pergunta["resposta"]
+        if self.registro is not None:
+            latencia = dados.get("latencia_ms")
+            self.registro.registrar(sessao or SESSAO_ANONIMA, pergunta_id, opcao, correta,
+                                    latencia if isinstance(latencia, int) and 0 <= latencia < 2 ** 31 else None, turma)
+        return {"correta": correta, "resposta": pergunta["resposta"], "explicacao": pergunta["explicacao"]}
+
+    # ---- despacho e cache ----
+
+    def pronto(self):
+        if self.aquecimento is None:
+            return {"pronto": True}
+        estado = self.aquecimento.estado()
+        if not estado["pronto"]:
+            raise ErroApi(503, "aquecendo", estado)
+        return estado
+
+    def metricas(self):
+        return {"chamada_unica": chamada_unica.metricas(),
+                "cache_api": {"entradas": len(self.cache), "acertos": self.acertos_cache}}
+
+    def _rota(self, metodo, caminho, parametros, corpo):
+        """(dados, cacheável)."""
+        partes = [unquote(p) for p in caminho.strip("/").split("/")]
+        if partes[:1] != ["api"]:
+            raise ErroApi(404, "rota não encontrada")
+        rota = partes[1:]
+        if rota == ["quiz", "resposta"]:
+            if metodo != "POST":
+                raise ErroApi(405, "use POST")
+            return self.quiz_resposta(corpo), False
+        if metodo not in ("GET", "HEAD"):
+            raise ErroApi(405, "use GET")
+        if rota == ["pronto"]:
+            return self.pronto(), False
+        if rota == ["metricas"]:
+            return self.metricas(), False
+        if rota == ["polimeros"]:
+            return self.polimeros(parametros), True
+        if len(rota) == 2 and rota[0] == "polimeros":
+            return self.polimero(rota[1]), True
+        if rota == ["residuos"]:
+            return self.residuos(parametros), True
+        if rota == ["descarte"]:
+            return self.descarte(parametros), True
+        if rota == ["pontos", "proximos"]:
+            return self.pontos_proximos(parametros), True
+        if rota == ["quiz", "amostra"]:
+            return self.quiz_amostra(parametros), "semente" in parametros
+        raise ErroApi(404, "rota não encontrada")
+
+    def _chave(self, metodo, partes):
+        # A versão do grafo entra na chave: dados trocados pelo observador invalidam o cache
+        return (self.grafo.versao, partes.path, partes.query) if metodo in ("GET", "HEAD") else None
+
+    def _montar(self, metodo, cabecalhos, status, dados, etag, cacheavel):
+        saida = {"Content-Type": "application/json; charset=utf-8", "ETag": etag,
+                 "Cache-Control": "public, max-age=60" if cacheavel else "no-store",
+                 "Access-Control-Allow-Origin": "*"}
+        if status == 200 and cabecalhos.get("if-none-match") == etag:
+            return 304, saida, b""
+        return status, saida, b"" if metodo == "HEAD" else dados
+
+    def resposta_guardada(self, metodo, alvo, cabecalhos):
+        """(status, cabeçalhos, corpo) se a requisição já está no cache; None se não está."""
+        chave = self._chave(metodo, urlsplit(alvo))
+        if chave is None:
+            return None
+        with self._trava:
+            guardada = self.cache.get(chave)
+            if guardada is None:
+                return None
+            self.cache.move_to_end(chave)
+            self.acertos_cache += 1
+        return self._montar(metodo, cabecalhos, *guardada)
+
+    def responder(self, metodo, alvo, cabecalhos, corpo=b""):
+        """(status, cabeçalhos, corpo) de uma requisição; usa o cache para GETs repetidos."""
+        guardada = self.resposta_guardada(metodo, alvo, cabecalhos)
+        if guardada:
+            return guardada
+        partes = urlsplit(alvo)
+        chave = self._chave(metodo, partes)
+        try:
+            resultado, cacheavel = self._rota(metodo, partes.path, parse_qs(partes.query), corpo)
+            status = 200
+        except ErroApi as e:
+            resultado, cacheavel, status = {"erro": str(e), **e.dados}, e.status == 404, e.status
+        except Exception:
+            logger.exception("Erro na API (%s)", alvo)
+            resultado, cacheavel, status = {"erro": "erro interno"}, False, 500
+        dados = json.dumps(resultado, ensure_ascii=False, separators=(",", ":"), default=_json_padrao).encode("utf-8")
+        etag = '"' + hashlib.sha1(dados).hexdigest()[:16] + '"'
+        if chave and cacheavel:
+            with self._trava:
+                self.cache[chave] = (status, dados, etag, cacheavel)
+                if len(self.cache) > TAMANHO_CACHE:
+                    self.cache.popitem(last=False)
+        return self._montar(metodo, cabecalhos, status, dados, etag, cacheavel)
+
+    async def responder_no_laco(self, metodo, alvo, cabecalhos, corpo=b""):
+        """
+        Como responder, sem nunca travar o laço asyncio: health check, métricas
+        e respostas em cache saem na hora; o resto (que pode construir um
+        artefato frio ou esperar a trava do grafo por até TEMPO_LIMITE) roda
+        numa thread, e as outras conexões seguem sendo atendidas.
+        """
+        if urlsplit(alvo).path.rstrip("/") in ROTAS_SEM_GRAFO:
+            return self.responder(metodo, alvo, cabecalhos, corpo)
+        guardada = self.resposta_guardada(metodo, alvo, cabecalhos)
+        if guardada:
+            return guardada
+        return await asyncio.to_thread(self.responder, metodo, alvo, cabecalhos, corpo)
+
+
+async def _atender(api, leitor, escritor):
+    """Uma conexão HTTP/1.1, com keep-alive."""
+    try:
+        while True:
+            linha = await asyncio.wait_for(leitor.readline(), TEMPO_OCIOSO)
+            if not linha.strip():
+                break
+            metodo, alvo, versao = linha.decode("latin-1").split()
+            cabecalhos = {}
+            while True:
+                linha = await leitor.readline()
+                if linha in (b"\r\n", b"\n", b""):
+                    break
+                nome, _, valor = linha.decode("latin-1").partition(":")
+                cabecalhos[nome.strip().lower()] = valor.strip()
+            tamanho = int(cabecalhos.get("content-length") or 0)
+            if tamanho > LIMITE_CORPO:
+                status, saida, dados = 413, {"Content-Type": "application/json"}, b'{"erro":"corpo grande demais"}'
+                manter = False
+            else:
+                corpo = await leitor.readexactly(tamanho) if tamanho else b""
+                status, saida, dados = await api.responder_no_laco(metodo.upper(), alvo, cabecalhos, corpo)
+                manter = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+
+            cabecalho = [f"HTTP/1.1 {status} {_MOTIVOS.get(status, '')}"]
+            cabecalho += [f"{nome}: {valor}" for nome, valor in saida.items()]
+            cabecalho += [f"Content-Length: {len(dados)}", f"Connection: {'keep-alive' if manter else 'close'}", "", ""]
+            escritor.write("\r\n".join(cabecalho).encode("latin-1") + dados)
+            await escritor.drain()
+            if not manter:
+                break
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        escritor.close()
+
+
+async def servir(api, porta, host="0.0.0.0"):
+    servidor = await asyncio.start_server(lambda l, e: _atender(api, l, e), host, porta)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+_threads = {}  # porta -> thread do servidor neste processo
+_trava_threads = threading.Lock()
+
+
+def iniciar_em_thread(api, porta, host="0.0.0.0"):
+    """
+    Servidor num laço asyncio próprio, numa thread (para rodar dentro do
+    processo do Streamlit). Uma porta já servida neste processo não é aberta de novo.
+    """
+    with _trava_threads:
+        if porta not in _threads:
+            _threads[porta] = threading.Thread(target=lambda: asyncio.run(servir(api, porta, host)),
+                                               name="api-museu", daemon=True)
+            _threads[porta].start()
+        return _threads[porta]
+
+
+if __name__ == "__main__":
+    from artefatos import montar_grafo
+
+    parser = argparse.ArgumentParser(description="API JSON do glossário, do quiz e dos pontos de entrega.")
+    parser.add_argument("--porta", type=int, default=PORTA_API or 8502)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--sem-registro", action="store_true", help="não grava as respostas do quiz no banco")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    grafo = montar_grafo()
+    grafo.iniciar_observador()
+    api = ApiMuseu(grafo, None if args.sem_registro else registro_processo())
+    # Constrói os índices antes de abrir a porta: a primeira requisição não trava o laço
+    grafo.obter_varios("indice_facetas_polimeros", "vizinhos_polimeros", "indice_facetas_residuos",
+                       "indice_descarte", "perguntas_por_id")
+    logger.info("API em http://%s:%d/api/", args.host, args.porta)
+    asyncio.run(servir(api, args.porta, args.host))
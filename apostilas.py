@@ -0,0 +1,474 @@
+"""
+Apostilas para imprimir: glossário de polímeros, tabela de resíduos e uma
+folha de atividade por estudante, com um QR code para o quiz dela.
+
+Professores pedem material impresso antes das visitas. Este script gera os
+documentos prontos para impressão (HTML com CSS de página A4 e, com
+WeasyPrint instalado, PDF) em três layouts e três idiomas. Os rótulos são
+traduzidos; os textos das tabelas continuam como estão nos arquivos.
+
+    python apostilas.py destino --polimeros PET PEAD --residuos Plástico Vidro \\
+        --layout cartoes --idioma pt --estudantes turma.txt --turma "7º ano B" \\
+        --app https://endereco-do-app
+
+Redução das imagens, QR codes, páginas e PDFs são feitos em paralelo num
+pool de processos. Cada página fica em cache (destino/.cache) pelo hash do
+seu conteúdo: gerar de novo a mesma turma, ou só acrescentar estudantes,
+renderiza apenas o que mudou.
+
+O link de cada estudante abre o quiz com o progresso na URL
+(MUSEU_QUIZ_NA_URL=1 no app), numa ordem de perguntas própria; turma.csv
+diz qual sessão do registro de respostas é de quem. O QR code precisa do
+pacote qrcode; sem ele a folha traz só o link.
+"""
+import argparse
+import csv
+import hashlib
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlencode
+
+from PIL import Image
+
+from acervo import catalogar, nomes_logicos
+from artefatos import montar_grafo
+from dados import caminho_dados, ler_tabela
+from estado_url import CHAVE_DEFINIDA, codificar, digest_perguntas, novo_estado
+
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
+
+try:
+    from weasyprint import HTML
+except ImportError:
+    HTML = None
+
+# Muda quando o modelo das páginas muda: invalida o cache inteiro
+VERSAO_PAGINAS = 1
+QUALIDADE_JPEG = 85
+
+# layout -> polímeros e resíduos por página e lado (px) da imagem impressa (0: sem imagem)
+LAYOUTS = {
+    "cartoes": {"por_pagina": 4, "lado_imagem": 600, "resumido": False},
+    "lista": {"por_pagina": 8, "lado_imagem": 240, "resumido": True},
+    "tabela": {"por_pagina": 20, "lado_imagem": 0, "resumido": True},
+}
+
+CAMPOS_POLIMEROS = ["Código", "Tipo de Polimerização", "Densidade", "Ponto de Fusão", "Reciclável",
+                    "Aplicações Comuns", "Descrição"]
+CAMPOS_POLIMEROS_RESUMIDOS = ["Código", "Reciclável", "Aplicações Comuns"]
+CAMPOS_RESIDUOS = ["Código", "Exemplos Comuns", "Tempo de Decomposição", "Reciclável", "Rota de Tratamento",
+                   "Descrição Técnica"]
+CAMPOS_RESIDUOS_RESUMIDOS = ["Exemplos Comuns", "Tempo de Decomposição", "Reciclável", "Rota de Tratamento"]
+
+# Resíduos na atividade de cada estudante
+RESIDUOS_ATIVIDADE = 6
+
+TEXTOS = {
+    "pt": {
+        "glossario": "Glossário de polímeros", "residuos": "Tabela de resíduos", "turma": "Atividades da turma",
+        "atividade": "Atividade: para onde vai cada resíduo?", "estudante": "Estudante", "turma_rotulo": "Turma",
+        "qr": "Aponte a câmera do celular para o código e responda o quiz do Museu do Lixo.",
+        "link": "Ou acesse", "onde": "Onde descartar?", "residuo": "Resíduo", "pagina": "Página",
+        "Sim": "Sim", "Não": "Não",
+    },
+    "en": {
+        "glossario": "Polymer glossary", "residuos": "Waste table", "turma": "Class activities",
+        "atividade": "Activity: where does each kind of waste go?", "estudante": "Student", "turma_rotulo": "Class",
+        "qr": "Point your phone camera at the code and take the Museu do Lixo quiz.",
+        "link": "Or open", "onde": "Where to dispose of it?", "residuo": "Waste", "pagina": "Page",
+        "Sim": "Yes", "Não": "No",
+        "Sigla": "Abbreviation", "Nome": "Name", "Código": "Code", "Tipo de Polimerização": "Polymerization type",
+        "Densidade": "Density", "Ponto de Fusão": "Melting point", "Reciclável": "Recyclable",
+        "Aplicações Comuns": "Common uses", "Descrição": "Description", "Tipo": "Type",
+        "Exemplos Comuns": "Common examples", "Tempo de Decomposição": "Decomposition time",
+        "Rota de Tratamento": "Treatment route", "Descrição Técnica": "Technical description",
+    },
+    "es": {
+        "glossario": "Glosario de polímeros", "residuos": "Tabla de residuos", "turma": "Actividades del grupo",
+        "atividade": "Actividad: ¿a dónde va cada residuo?", "estudante": "Estudiante", "turma_rotulo": "Grupo",
+        "qr": "Apunta la cámara del celular al código y responde el quiz del Museu do Lixo.",
+        "link": "O accede a", "onde": "¿Dónde desecharlo?", "residuo": "Residuo", "pagina": "Página",
+        "Sim": "Sí", "Não": "No",
+        "Sigla": "Sigla", "Nome": "Nombre", "Código": "Código", "Tipo de Polimerização": "Tipo de polimerización",
+        "Densidade": "Densidad", "Ponto de Fusão": "Punto de fusión", "Reciclável": "Reciclable",
+        "Aplicações Comuns": "Aplicaciones comunes", "Descrição": "Descripción", "Tipo": "Tipo",
+        "Exemplos Comuns": "Ejemplos comunes", "Tempo de Decomposição": "Tiempo de descomposición",
+        "Rota de Tratamento": "Ruta de tratamiento", "Descrição Técnica": "Descripción técnica",
+    },
+}
+
+ESTILO = """
+@page { size: A4; margin: 14mm; }
+body { margin: 0; font-family: system-ui, sans-serif; font-size: 10pt; color: #333333; line-height: 1.4; }
+h1 { font-size: 16pt; color: #1e88e5; margin: 0 0 4mm; }
+h2 { font-size: 12pt; color: #1e88e5; margin: 0 0 2mm; }
+.pagina { break-after: page; page-break-after: always; }
+.pagina:last-child { break-after: auto; page-break-after: auto; }
+.rodape { margin-top: 4mm; font-size: 8pt; color: gray; text-align: right; }
+.cartao { display: inline-block; vertical-align: top; box-sizing: border-box; width: 48%; margin: 0 1% 4mm;
+          border: 1px solid #cccccc; border-radius: 3mm; padding: 3mm; break-inside: avoid; }
+.cartao img { display: block; width: 100%; height: 45mm; object-fit: contain; margin-bottom: 2mm; }
+.lista .cartao { display: flex; gap: 3mm; width: 98%; margin-bottom: 2mm; }
+.lista .cartao img { width: 22mm; height: 22mm; flex: none; }
+dl { margin: 0; } dt { font-weight: bold; display: inline; } dd { display: inline; margin: 0; }
+dd::after { content: ""; display: block; }
+table { border-collapse: collapse; width: 100%; } td, th { border: 1px solid #999999; padding: 1mm 2mm; text-align: left; }
+.estudante { display: flex; gap: 8mm; align-items: center; margin-bottom: 8mm; }
+.estudante .qr { width: 45mm; height: 45mm; flex: none; }
+.link { font-family: monospace; font-size: 8pt; word-break: break-all; }
+.atividade td { height: 12mm; }
+@media screen {
+  body { background: #f5f7fa; }
+  .pagina { background: white; width: 182mm; min-height: 269mm; margin: 8mm auto; padding: 14mm; }
+}
+"""
+
+
+def _texto(idioma, chave):
+    return TEXTOS[idioma].get(chave, chave)
+
+
+def _valor(idioma, valor):
+    valor = "" if valor is None or valor != valor else str(valor)  # valor != valor: NaN
+    return html.escape(_texto(idioma, valor) if valor in ("Sim", "Não") else valor)
+
+
+def _campos(idioma, registro, campos):
+    return "<dl>" + "".join(f"<dt>{html.escape(_texto(idioma, campo))}:</dt> <dd>{_valor(idioma, registro.get(campo))}</dd>"
+                            for campo in campos) + "</dl>"
+
+
+def _tabela(idioma, registros, colunas):
+    cabecalho = "".join(f"<th>{html.escape(_texto(idioma, coluna))}</th>" for coluna in colunas)
+    linhas = "".join("<tr>" + "".join(f"<td>{_valor(idioma, r.get(coluna))}</td>" for coluna in colunas) + "</tr>"
+                     for r in registros)
+    return f"<table><thead><tr>{cabecalho}</tr></thead><tbody>{linhas}</tbody></table>"
+
+
+def _pagina_polimeros(dados):
+    idioma, layout = dados["idioma"], LAYOUTS[dados["layout"]]
+    if not layout["lado_imagem"]:
+        corpo = _tabela(idioma, dados["itens"], ["Sigla", "Nome", *CAMPOS_POLIMEROS_RESUMIDOS])
+    else:
+        campos = CAMPOS_POLIMEROS_RESUMIDOS if layout["resumido"] else CAMPOS_POLIMEROS
+        cartoes = []
+        for item in dados["itens"]:
+            imagem = (f'<img src="{item["imagem"]}" alt="{html.escape(item["Sigla"])}">' if item["imagem"] else "")
+            cartoes.append(f'<div class="cartao">{imagem}<div><h2>{html.escape(item["Sigla"])} – '
+                           f'{html.escape(str(item["Nome"]))}</h2>{_campos(idioma, item, campos)}</div></div>')
+        corpo = f'<div class="{dados["layout"]}">{"".join(cartoes)}</div>'
+    return corpo
+
+
+def _pagina_residuos(dados):
+    idioma, layout = dados["idioma"], LAYOUTS[dados["layout"]]
+    if layout["resumido"]:
+        return _tabela(idioma, dados["itens"], ["Tipo", *CAMPOS_RESIDUOS_RESUMIDOS])
+    cartoes = "".join(f'<div class="cartao"><h2>{html.escape(str(item["Tipo"]))}</h2>'
+                      f"{_campos(idioma, item, CAMPOS_RESIDUOS)}</div>" for item in dados["itens"])
+    return f'<div class="cartoes">{cartoes}</div>'
+
+
+def _pagina_estudante(dados):
+    idioma = dados["idioma"]
+    qr = f'<img class="qr" src="{dados["qr"]}" alt="QR code">' if dados["qr"] else ""
+    turma = (f'<p><strong>{html.escape(_texto(idioma, "turma_rotulo"))}:</strong> {html.escape(dados["turma"])}</p>'
+             if dados["turma"] else "")
+    link = (f'<p>{html.escape(_texto(idioma, "qr"))}</p><p>{html.escape(_texto(idioma, "link"))}: '
+            f'<span class="link">{html.escape(dados["url"])}</span></p>' if dados["url"] else "")
+    linhas = "".join(f"<tr><td>{html.escape(residuo)}</td><td></td></tr>" for residuo in dados["residuos"])
+    atividade = (f'<h2>{html.escape(_texto(idioma, "atividade"))}</h2><table class="atividade"><thead><tr>'
+                 f'<th>{html.escape(_texto(idioma, "residuo"))}</th><th>{html.escape(_texto(idioma, "onde"))}</th>'
+                 f"</tr></thead><tbody>{linhas}</tbody></table>" if linhas else "")
+    return (f'<div class="estudante">{qr}<div><h1>{html.escape(_texto(idioma, "estudante"))}: '
+            f'{html.escape(dados["estudante"])}</h1>{turma}{link}</div></div>{atividade}')
+
+
+_PAGINAS = {"polimeros": _pagina_polimeros, "residuos": _pagina_residuos, "estudante": _pagina_estudante}
+
+
+def renderizar_pagina(tarefa):
+    """(tipo, dados) -> HTML da página, com o rodapé de numeração."""
+    tipo, dados = tarefa
+    titulo = f'<h1>{html.escape(dados["titulo"])}</h1>' if dados.get("titulo") else ""
+    rodape = f'<div class="rodape">{html.escape(_texto(dados["idioma"], "pagina"))} {dados["numero"]}</div>'
+    return f'<section class="pagina">{titulo}{_PAGINAS[tipo](dados)}{rodape}</section>'
+
+
+# Funções executadas nos processos do pool (recebem só valores simples)
+
+def _trabalho_pagina(argumentos):
+    tarefa, caminho_cache = argumentos
+    conteudo = renderizar_pagina(tarefa)
+    _gravar(caminho_cache, conteudo.encode("utf-8"))
+    return conteudo
+
+
+def _trabalho_imagem(argumentos):
+    """Reduz a imagem para impressão (JPEG sobre fundo branco)."""
+    origem, saida, lado = argumentos
+    with Image.open(origem) as original:
+        img = original.convert("RGBA")
+    img.thumbnail((lado, lado))
+    fundo = Image.new("RGB", img.size, "white")
+    fundo.paste(img, mask=img.getchannel("A"))
+    fundo.save(saida + ".tmp", format="JPEG", quality=QUALIDADE_JPEG, optimize=True)
+    os.replace(saida + ".tmp", saida)
+    return saida
+
+
+def _trabalho_qr(argumentos):
+    url, saida = argumentos
+    qrcode.make(url, border=2).save(saida + ".tmp", format="PNG")
+    os.replace(saida + ".tmp", saida)
+    return saida
+
+
+def _trabalho_pdf(argumentos):
+    origem, saida = argumentos
+    HTML(filename=origem).write_pdf(saida)
+    return saida
+
+
+def _gravar(caminho, conteudo):
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+def _hash(*partes):
+    return hashlib.sha256(json.dumps(partes, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _registros(tabela):
+    return [{coluna: (None if valor != valor else valor) for coluna, valor in linha.items()}
+            for linha in tabela.to_dict("records")]
+
+
+def _em_paginas(itens, por_pagina):
+    return [itens[i:i + por_pagina] for i in range(0, len(itens), por_pagina)]
+
+
+def ler_estudantes(caminho):
+    """Um nome por linha (ou a primeira coluna de um CSV), sem linhas vazias nem repetidas."""
+    with open(caminho, encoding="utf-8-sig") as f:
+        nomes = (linha[0].strip() for linha in csv.reader(f) if linha)
+        return list(dict.fromkeys(nome for nome in nomes if nome))
+
+
+def semente_estudante(turma, estudante):
+    """A mesma semente (e a mesma ordem de perguntas) toda vez que a folha é gerada."""
+    return int.from_bytes(hashlib.sha256(f"{turma}|{estudante}".encode("utf-8")).digest()[:4], "big")
+
+
+def link_quiz(url_app, digest, turma, estudante):
+    """Endereço do quiz com o progresso na URL, começando do zero com a semente do estudante."""
+    estado = novo_estado(digest)
+    estado["semente"] = semente_estudante(turma, estudante)
+    parametros = {"quiz": codificar(estado)}
+    if turma:
+        parametros["turma"] = turma
+    return f"{url_app.rstrip('/')}/?{urlencode(parametros)}"
+
+
+def _digest_quiz():
+    manuais, geradas = montar_grafo().obter_varios("quiz", "quiz_gerado")
+    return digest_perguntas([q["id"] for q in manuais] + [q["id"] for q in geradas])
+
+
+def _documento(titulo, paginas, idioma):
+    return f"""<!DOCTYPE html>
+<html lang="{idioma}">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(titulo)} – Museu do Lixo</title>
+<link rel="stylesheet" href="apostila.css">
+</head>
+<body>
+{"".join(paginas)}
+</body>
+</html>
+"""
+
+
+class _Executor:
+    """Pool de processos, ou a própria thread quando processos=1."""
+
+    def __init__(self, processos):
+        self.pool = ProcessPoolExecutor(processos) if processos != 1 else None
+
+    def mapear(self, funcao, itens):
+        if not itens:
+            return []
+        if self.pool is None:
+            return [funcao(item) for item in itens]
+        return list(self.pool.map(funcao, itens, chunksize=max(1, len(itens) // 32)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+def gerar_apostilas(destino, siglas=None, tipos_residuo=None, layout="cartoes", idioma="pt", formato="html",
+                    estudantes=(), turma="", url_app="", processos=None):
+    """
+    Grava glossario.html, residuos.html e, com estudantes, turma.html e
+    turma.csv (mais os PDFs com formato="pdf"). siglas e tipos_residuo
+    escolhem os itens (None: todos; lista vazia: nenhum). Retorna estatísticas
+    da execução, com os arquivos gerados.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"layout deve ser um de: {', '.join(LAYOUTS)}")
+    if idioma not in TEXTOS:
+        raise ValueError(f"idioma deve ser um de: {', '.join(TEXTOS)}")
+    if formato == "pdf" and HTML is None:
+        raise RuntimeError("para gerar PDF instale o WeasyPrint (pip install weasyprint)")
+    inicio = time.perf_counter()
+    for pasta in ("img", "qr", ".cache"):
+        os.makedirs(os.path.join(destino, pasta), exist_ok=True)
+    _gravar(os.path.join(destino, "apostila.css"), ESTILO.encode("utf-8"))
+
+    polimeros = ler_tabela(caminho_dados("polimeros.csv"))
+    residuos = ler_tabela(caminho_dados("residuos.csv"))
+    acervo = catalogar(nomes_logicos(polimeros))
+    if siglas is not None:
+        polimeros = polimeros[polimeros["Sigla"].isin(siglas)]
+    if tipos_residuo is not None:
+        residuos = residuos[residuos["Tipo"].isin(tipos_residuo)]
+    polimeros, residuos = _registros(polimeros), _registros(residuos)
+
+    # Imagens reduzidas: o hash do conteúdo no nome faz delas o próprio cache
+    lado = LAYOUTS[layout]["lado_imagem"]
+    imagens = {}
+    for item in polimeros:
+        item["Sigla"] = str(item["Sigla"])
+        conteudo_hash = acervo.nomes.get(f"polimero/{item['Sigla']}")
+        item["imagem"] = f"img/{conteudo_hash}-{lado}.jpg" if conteudo_hash and lado else None
+        if item["imagem"]:
+            imagens[item["imagem"]] = acervo.conteudos[conteudo_hash]["caminho"]
+    tarefas_imagens = [(origem, os.path.join(destino, nome), lado) for nome, origem in imagens.items()
+                       if not os.path.isfile(os.path.join(destino, nome))]
+
+    # Uma folha por estudante, com o link (e o QR code) para o quiz
+    folhas = []
+    tarefas_qr = []
+    if estudantes:
+        digest = _digest_quiz() if url_app else None
+        exemplos = [str(r["Exemplos Comuns"] or r["Tipo"]) for r in residuos]
+        for estudante in estudantes:
+            url = link_quiz(url_app, digest, turma, estudante) if url_app else ""
+            qr = f"qr/{_hash(url)}.png" if url and qrcode is not None else None
+            if qr and not os.path.isfile(os.path.join(destino, qr)):
+                tarefas_qr.append((url, os.path.join(destino, qr)))
+            # Cada estudante recebe os resíduos numa ordem própria
+            semente = semente_estudante(turma, estudante)
+            ordem = sorted(exemplos, key=lambda exemplo: _hash(semente, exemplo))[:RESIDUOS_ATIVIDADE]
+            folhas.append({"estudante": estudante, "turma": turma, "url": url, "qr": qr, "residuos": ordem,
+                           "sessao": f"url-{semente:08x}"})
+
+    documentos = {}  # arquivo -> [(tipo, dados)]
+    por_pagina = LAYOUTS[layout]["por_pagina"]
+    for documento, tipo, itens, titulo in (("glossario", "polimeros", polimeros, "glossario"),
+                                            ("residuos", "residuos", residuos, "residuos")):
+        documentos[documento] = [
+            (tipo, {"idioma": idioma, "layout": layout, "itens": pagina, "numero": numero,
+                    "titulo": _texto(idioma, titulo) if numero == 1 else ""})
+            for numero, pagina in enumerate(_em_paginas(itens, por_pagina), 1)
+        ]
+    if folhas:
+        documentos["turma"] = [("estudante", {"idioma": idioma, "numero": numero, **folha})
+                               for numero, folha in enumerate(folhas, 1)]
+
+    # Páginas: só as que não estão no cache são renderizadas
+    paginas = {}   # chave -> html
+    faltando = {}  # chave -> tarefa
+    for tarefas in documentos.values():
+        for tarefa in tarefas:
+            chave = _hash(VERSAO_PAGINAS, tarefa)
+            caminho_cache = os.path.join(destino, ".cache", f"{chave}.html")
+            if chave in paginas or chave in faltando:
+                continue
+            if os.path.isfile(caminho_cache):
+                with open(caminho_cache, encoding="utf-8") as f:
+                    paginas[chave] = f.read()
+            else:
+                faltando[chave] = tarefa
+    em_cache = len(paginas)
+
+    with _Executor(processos) as executor:
+        executor.mapear(_trabalho_imagem, tarefas_imagens)
+        executor.mapear(_trabalho_qr, tarefas_qr)
+        renderizadas = executor.mapear(_trabalho_pagina, [
+            (tarefa, os.path.join(destino, ".cache", f"{chave}.html")) for chave, tarefa in faltando.items()])
+        paginas.update(zip(faltando, renderizadas))
+
+        gerados = []
+        for documento, tarefas in documentos.items():
+            if not tarefas:
+                continue
+            conteudo = _documento(_texto(idioma, documento), [paginas[_hash(VERSAO_PAGINAS, t)] for t in tarefas], idioma)
+            arquivo = os.path.join(destino, f"{documento}.html")
+            _gravar(arquivo, conteudo.encode("utf-8"))
+            gerados.append(arquivo)
+        if formato == "pdf":
+            gerados += executor.mapear(_trabalho_pdf, [(arquivo, arquivo[:-len(".html")] + ".pdf")
+                                                       for arquivo in list(gerados)])
+
+    if folhas:
+        arquivo = os.path.join(destino, "turma.csv")
+        with open(arquivo, "w", encoding="utf-8", newline="") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(["estudante", "turma", "sessao", "link"])
+            escritor.writerows([folha["estudante"], turma, folha["sessao"], folha["url"]] for folha in folhas)
+        gerados.append(arquivo)
+
+    return {
+        "arquivos": gerados,
+        "paginas": sum(len(tarefas) for tarefas in documentos.values()),
+        "renderizadas": len(faltando),
+        "em_cache": em_cache,
+        "imagens": len(tarefas_imagens),
+        "qr_codes": len(tarefas_qr),
+        "segundos": round(time.perf_counter() - inicio, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera apostilas para imprimir: glossário, resíduos e folhas da turma.")
+    parser.add_argument("destino", help="pasta de saída")
+    parser.add_argument("--polimeros", nargs="*", default=None, help="siglas dos polímeros (padrão: todos)")
+    parser.add_argument("--residuos", nargs="*", default=None, help="tipos de resíduo (padrão: todos)")
+    parser.add_argument("--layout", choices=list(LAYOUTS), default="cartoes")
+    parser.add_argument("--idioma", choices=list(TEXTOS), default="pt")
+    parser.add_argument("--formato", choices=["html", "pdf"], default="html")
+    parser.add_argument("--estudantes", help="arquivo com um nome de estudante por linha")
+    parser.add_argument("--turma", default="")
+    parser.add_argument("--app", default=os.environ.get("MUSEU_URL_APP", ""),
+                        help="endereço do app Streamlit, para os links e QR codes do quiz")
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: um por CPU)")
+    args = parser.parse_args()
+
+    if args.formato == "pdf" and HTML is None:
+        parser.error("para gerar PDF instale o WeasyPrint (pip install weasyprint)")
+    if args.estudantes and not CHAVE_DEFINIDA:
+        parser.error("os links do quiz são assinados: defina MUSEU_CHAVE_QUIZ com a mesma chave do app")
+    if args.estudantes and qrcode is None:
+        print("Aviso: pacote qrcode não instalado; as folhas trazem só o link (pip install qrcode)")
+    estatisticas = gerar_apostilas(
+        args.destino, args.polimeros, args.residuos, args.layout, args.idioma, args.formato,
+        ler_estudantes(args.estudantes) if args.estudantes else (), args.turma, args.app, args.processos)
+    print(f"{estatisticas['paginas']} páginas ({estatisticas['renderizadas']} renderizadas, "
+          f"{estatisticas['em_cache']} do cache), {estatisticas['imagens']} imagens e "
+          f"{estatisticas['qr_codes']} QR codes em {estatisticas['segundos']:.1f} s")
+    for arquivo in estatisticas["arquivos"]:
+        print(f"  {arquivo}")
@@ -2,6 +2,9 @@ import streamlit as st
 import pandas as pd
 import random
 import os
+import time
+import uuid
+import hashlib
 from PIL import Image
 import re
 import folium
@@ -9,6 +12,28 @@ import plotly.express as px
 from streamlit_folium import folium_static
 from datetime import datetime
 
+from acervo import PASTA_MATERIAIS, PASTA_RESIDUOS
+from artefatos import grafo_processo
+from aquecimento import iniciar_aquecimento
+from busca_fotos import DISTANCIA_CONFIAVEL, descrever_foto
+import secoes
+from modo_leve import (OrcamentoBytes, LADO_LEVE, LADO_LEVE_MINIATURA, cliente_pede_leve, variante_leve,
+                       tamanho_figura, tamanho_mapa, tamanho_tabela, formatar_bytes)
+from geo import MUSEU_COORDENADAS
+from api import PORTA_API, ApiMuseu, iniciar_em_thread
+from cobertura import analisar_cobertura, DISTANCIA_ADEQUADA_KM
+from cenarios_municipio import RESULTADOS, avaliar, valores_parametros
+from cenarios_municipio import varredura as varredura_cenarios
+from compostagem import (ALTURA_UFSC, FONTES_CARBONO, LARGURA_UFSC, TEMPERATURA_HIGIENIZACAO,
+                         TEMPERATURA_TERMOFILICA, indicadores, simular, varredura)
+from registro_respostas import registro_processo
+from sala_aula import RegistroSalas
+from estado_url import QUIZ_NA_URL, codificar, decodificar, digest_perguntas, novo_estado, ordem_perguntas
+from quiz_adaptativo import (BancoAdaptativo, CAMINHO_PARAMETROS, LOG_PRIORI, carregar_parametros,
+                             atualizar_habilidade, estimar_habilidade)
+from analise_quiz import (versao_agregados, ler_agregados, resumo_perguntas, figura_acertos,
+                          figura_opcoes, figura_latencias, figura_tendencia)
+
 st.set_page_config(layout="wide")
 
 # Adicione o CSS para melhorar as abas
@@ -25,156 +50,130 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Caminho correto para a pasta de imagens
-IMAGES_MATERIAIS_DIR = "imagens_materiais"
-IMAGES_RESIDUOS_DIR = "imagens_residuos"
-
-# Função para normalizar nomes (exemplo simples)
-def normalizar_nome(nome):
-    return nome.lower().replace(" ", "_").replace("(", "").replace(")", "").replace(".", "").replace(",", "")
+IMAGES_MATERIAIS_DIR = PASTA_MATERIAIS
+IMAGES_RESIDUOS_DIR = PASTA_RESIDUOS
+
+# Função para achar a imagem de uma seção no catálogo (acervo.py), sem consultar o disco
+def imagem_secao(chave):
+    return grafo_dados().obter("acervo").caminho(f"secao/{chave}")
+
+# Modo leve: ?leve=1 (ou ?leve=0) na URL ou, sem isso, pedido pelo navegador (Save-Data, rede lenta)
+def modo_leve_ativo():
+    if "modo_leve" not in st.session_state:
+        if "leve" in st.query_params:
+            st.session_state["modo_leve"] = st.query_params["leve"] != "0"
+        else:
+            st.session_state["modo_leve"] = cliente_pede_leve(st.context.headers)
+    return st.session_state["modo_leve"]
+
+# Bytes enviados por seção nesta execução (recriado a cada execução em main)
+def orcamento_pagina():
+    return st.session_state.setdefault("orcamento_bytes", OrcamentoBytes(False))
+
+# Conteúdo pesado que só aparece depois de um toque (e continua aberto nas próximas execuções)
+def liberado(chave, rotulo):
+    if st.session_state.get(f"liberado_{chave}"):
+        return True
+    if st.button(rotulo, key=f"liberar_{chave}"):
+        st.session_state[f"liberado_{chave}"] = True
+        return True
+    return False
+
+# Função para mostrar uma imagem do catálogo contando os bytes da seção.
+# No modo leve vai uma variante reduzida, as decorativas são puladas e o que
+# estouraria o orçamento da seção fica atrás de um toque.
+def mostrar_imagem(nome, legenda, cor_fundo, decorativa=False, conteudo=None, lado_leve=LADO_LEVE, **kwargs):
+    orcamento = orcamento_pagina()
+    if orcamento.leve and decorativa:
+        return
+    if "width" not in kwargs:
+        kwargs["use_container_width"] = True
+    acervo = grafo_dados().obter("acervo")
+    conteudo_hash = acervo.nomes.get(nome)
+    try:
+        if conteudo_hash is None:
+            raise FileNotFoundError(nome)
+        if orcamento.leve:
+            conteudo = variante_leve(conteudo_hash, acervo.caminho(nome), lado_leve)
+        elif conteudo is None:
+            conteudo = acervo.caminho(nome)
+        tamanho = acervo.conteudos[conteudo_hash]["bytes"] if isinstance(conteudo, str) else len(conteudo)
+    except OSError:
+        # Sem imagem: um quadro colorido no lugar (só enfeite, pulado no modo leve)
+        if not orcamento.leve:
+            st.image(Image.new('RGB', (300, 300), color=cor_fundo), caption=legenda, **kwargs)
+        return
+    if not orcamento.cabe(tamanho) and not liberado(f"imagem_{nome}", f"🖼️ {legenda} ({formatar_bytes(tamanho)})"):
+        return
+    orcamento.registrar(tamanho)
+    st.image(conteudo, caption=legenda, **kwargs)
+
+# Função para mostrar imagens das seções com fallback
+def mostrar_imagem_com_fallback(chave, legenda, cor_fundo, decorativa=False, **kwargs):
+    mostrar_imagem(f"secao/{chave}", legenda, cor_fundo, decorativa, **kwargs)
+
+# Gráfico plotly contando os bytes; no modo leve só carrega depois de um toque
+def mostrar_grafico(fig, chave, **kwargs):
+    orcamento = orcamento_pagina()
+    tamanho = tamanho_figura(fig)
+    if orcamento.leve and not liberado(f"grafico_{chave}", f"📊 Mostrar gráfico ({formatar_bytes(tamanho)})"):
+        return
+    orcamento.registrar(tamanho)
+    st.plotly_chart(fig, key=chave, **kwargs)
+
+# Mapa folium contando os bytes; no modo leve só carrega depois de um toque
+def mostrar_mapa(mapa, chave):
+    orcamento = orcamento_pagina()
+    tamanho = tamanho_mapa(mapa)
+    if orcamento.leve and not liberado(f"mapa_{chave}", f"🗺️ Mostrar mapa ({formatar_bytes(tamanho)})"):
+        return
+    orcamento.registrar(tamanho)
+    folium_static(mapa)
 
-# Função para mostrar imagens com fallback
-def mostrar_imagem_com_fallback(nome_imagem, caminho_dir, legenda, cor_fundo):
-    caminho_imagem = os.path.join(caminho_dir, nome_imagem)
-    if os.path.exists(caminho_imagem):
-        try:
-            img = Image.open(caminho_imagem)
-            st.image(img, use_container_width=True, caption=legenda)
-        except:
-            img_padrao = Image.new('RGB', (300, 300), color=cor_fundo)
-            st.image(img_padrao, use_container_width=True, caption=legenda)
-    else:
-        img_padrao = Image.new('RGB', (300, 300), color=cor_fundo)
-        st.image(img_padrao, use_container_width=True, caption=legenda)
+# Tabela contando os bytes (em Arrow, como o Streamlit envia)
+def mostrar_tabela(df, **kwargs):
+    orcamento_pagina().registrar(tamanho_tabela(df))
+    st.dataframe(df, **kwargs)
 
-# Função para carregar dados polimeros e residuos
-@st.cache_data
+# Função para carregar dados polimeros e residuos (da mesma versão dos arquivos)
 def carregar_dados():
-    polimeros = pd.read_csv("polimeros.csv", sep=";")
-    residuos = pd.read_csv("residuos.csv", sep=";")  # Se tiver o arquivo resíduos na raiz também
-    return polimeros, residuos
+    return grafo_dados().obter_varios("polimeros", "residuos")
 
-#função para carregar os dados da coleta seletiva
-@st.cache_data
-def load_coleta_data():
-    try:
-        url = "https://raw.githubusercontent.com/michaufsc/glossario-quimica-residuos/refs/heads/main/pontos_coleta.csv"
-        df = pd.read_csv(url)
-        return df
-    except Exception as e:
-        st.error(f"Erro ao carregar dados de coleta: {str(e)}")
-        return pd.DataFrame()
-        
-#função dados quiz        
-@st.cache_data
+#função dados quiz: embaralhada uma vez por processo; cache_resource devolve a mesma tupla
+#de registros congelados (somente_leitura.py) a todas as sessões, sem a cópia do cache_data
+@st.cache_resource
 def load_quiz():
     try:
-        # Verificação mais robusta do arquivo
-        if not os.path.isfile("quiz_perguntas.csv"):
-            st.error("Arquivo quiz_perguntas.csv não encontrado no diretório atual")
-            return []
-
-        # Tentativas de leitura mais organizadas
-        read_attempts = [
-            {"sep": ";", "encoding": "utf-8"},
-            {"sep": ",", "encoding": "utf-8"}, 
-            {"sep": ";", "encoding": "latin1"}
-        ]
-        
-        df = None
-        for attempt in read_attempts:
-            try:
-                df = pd.read_csv(
-                    "quiz_perguntas.csv",
-                    sep=attempt["sep"],
-                    encoding=attempt["encoding"],
-                    on_bad_lines='warn'
-                )
-                break
-            except Exception as e:
-                continue
-                
-        if df is None or df.empty:
-            st.error("Não foi possível ler o arquivo ou o arquivo está vazio")
-            return []
-
-        # Limpeza e padronização mais eficiente
-        df.columns = df.columns.str.strip().str.lower()
-        
-        # Mapeamento mais completo
-        column_mapping = {
-            'pergunta': ['pergunta', 'question', 'pregunta', 'enunciado'],
-            'opcao_1': ['opcao_1', 'opção 1', 'option1', 'alternativa_a', 'a)'],
-            'opcao_2': ['opcao_2', 'opção 2', 'option2', 'alternativa_b', 'b)'],
-            'opcao_3': ['opcao_3', 'opção 3', 'option3', 'alternativa_c', 'c)'],
-            'opcao_4': ['opcao_4', 'opção 4', 'option4', 'alternativa_d', 'd)'],
-            'resposta': ['resposta', 'answer', 'correct', 'correta', 'gabarito'],
-            'explicacao': ['explicacao', 'explicação', 'explanation', 'feedback']
-        }
-
-        # Renomeação mais segura
-        renamed_cols = {}
-        for standard_name, alternatives in column_mapping.items():
-            for alt in alternatives:
-                if alt in df.columns:
-                    renamed_cols[alt] = standard_name
-        df = df.rename(columns=renamed_cols)
-
-        # Verificação de colunas obrigatórias mais clara
-        required_cols = ['pergunta', 'opcao_1', 'opcao_2', 'opcao_3', 'opcao_4', 'resposta', 'explicacao']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-        
-        if missing_cols:
-            st.error(f"Colunas obrigatórias faltando: {', '.join(missing_cols)}")
-            st.write("Colunas encontradas:", list(df.columns))
-            return []
-
-        # Processamento mais seguro das perguntas
-        questions = []
-        for _, row in df.iterrows():
-            try:
-                # Tratamento mais robusto da resposta
-                resposta_str = str(row['resposta']).strip().upper()
-                resposta_num = None
-                
-                # Aceita respostas como "1", "A", "a)", etc.
-                if resposta_str in ['1', 'A', 'A)']:
-                    resposta_num = 1
-                elif resposta_str in ['2', 'B', 'B)']:
-                    resposta_num = 2
-                elif resposta_str in ['3', 'C', 'C)']:
-                    resposta_num = 3
-                elif resposta_str in ['4', 'D', 'D)']:
-                    resposta_num = 4
-                
-                if resposta_num is None:
-                    st.warning(f"Resposta inválida na pergunta: {row['pergunta']}")
-                    continue
-                    
-                questions.append({
-                    "pergunta": str(row['pergunta']).strip(),
-                    "opcoes": [
-                        str(row['opcao_1']).strip(),
-                        str(row['opcao_2']).strip(),
-                        str(row['opcao_3']).strip(),
-                        str(row['opcao_4']).strip()
-                    ],
-                    "resposta": resposta_num - 1,  # Convertendo para índice 0-3
-                    "explicacao": str(row['explicacao']).strip()
-                })
-            except Exception as e:
-                st.warning(f"Erro ao processar linha: {str(e)}")
-                continue
-                
-        if not questions:
-            st.error("Nenhuma pergunta válida foi carregada")
-            return []
-            
-        random.shuffle(questions)
-        return questions
-        
+        questions, avisos = grafo_dados().obter("quiz_lido")
+    except ValueError as e:
+        st.error(str(e))
+        return ()
     except Exception as e:
         st.error(f"Falha crítica ao carregar quiz: {str(e)}")
-        return []
+        return ()
+
+    for aviso in avisos:
+        st.warning(aviso)
+    return tuple(random.sample(questions, len(questions)))
+
+#quantas perguntas geradas entram em cada partida, além das escritas à mão
+PERGUNTAS_GERADAS_POR_QUIZ = 5
+
+#perguntas geradas a partir das tabelas (gerador_perguntas.py); o arquivo é criado na primeira vez
+def load_quiz_gerado():
+    return grafo_dados().obter("quiz_gerado")
+
+#todas as perguntas (escritas à mão e geradas) pelo id, para consultas rápidas
+def perguntas_por_id():
+    return grafo_dados().obter("perguntas_por_id")
+
+#perguntas de uma partida: todas as escritas à mão e algumas geradas, sorteadas a cada visita
+def montar_quiz():
+    questions = load_quiz()
+    geradas = load_quiz_gerado()
+    questions = list(questions) + random.sample(geradas, min(PERGUNTAS_GERADAS_POR_QUIZ, len(geradas)))
+    return random.sample(questions, len(questions))
+
 #acessibilidade
 def load_custom_css():
     """Carrega os estilos CSS personalizados"""
@@ -234,220 +233,327 @@ def load_custom_css():
     </style>
     """, unsafe_allow_html=True)
     
-#dados esps isopor
-@st.cache_data
-def carregar_pontos_isopor():
-    """Base de dados oficial dos PEVs de Isopor® em Florianópolis"""
-    dados = {
-        'Local': [
-            'Centro - Hercílio Luz x Anita Garibaldi',
-            'Centro - Praça dos Namorados',
-            'Beira-Mar Norte - Mirante',
-            'Parque São Jorge - Av. Gov. José Boabaid',
-            'Trindade - Praça Gama Rosa',
-            'Coqueiros - Centro de Saúde',
-            'Estreito - Praça N.S. Fátima',
-            'Santa Mônica - Av. Madre Benvenuta',
-            'João Paulo - Praça Dr. Fausto Lobo',
-            'Jurerê Internacional - Final Av. dos Búzios'
-        ],
-        'Endereço': [
-            'Rua Hercílio Luz, 60 (esquina com Anita Garibaldi)',
-            'Largo São Sebastião, Centro',
-            'Avenida Beira-Mar Norte, 1030 (Mirante)',
-            'Avenida Governador José Boabaid, 250',
-            'Rua Gama Rosa, Trindade',
-            'Rua General Bittencourt, 175 (frente ao Centro de Saúde)',
-            'Rua Henrique Meyer, 550 (Praça N.S. Fátima)',
-            'Avenida Madre Benvenuta, 1580 (ao lado posto policial)',
-            'Rodovia João Paulo, 5000 (Praça Dr. Fausto Lobo)',
-            'Avenida dos Búzios, 1500 (junto ao PEV de Vidro)'
-        ],
-        'Latitude': [
-            -27.5945, -27.5918, -27.5872,
-            -27.5701, -27.5867, -27.5728,
-            -27.6003, -27.5824, -27.5603,
-            -27.4245
-        ],
-        'Longitude': [
-            -48.5482, -48.5495, -48.5581,
-            -48.5268, -48.5214, -48.5472,
-            -48.5330, -48.5008, -48.5067,
-            -48.4221
-        ],
-        'Horário': [
-            '24 horas', '24 horas', '24 horas',
-            '24 horas', '24 horas', '24 horas',
-            '24 horas', '24 horas', '24 horas',
-            '24 horas'
-        ]
+#filtros por faceta com contagem ao vivo
+def mostrar_filtros_facetas(indice, chave):
+    busca = st.text_input("🔍 Buscar por termo, sigla ou aplicação:", key=f"{chave}_busca")
+    base = indice.mascara_busca(busca)
+
+    # Lê as seleções atuais antes de desenhar os filtros, para que as contagens
+    # de cada faceta já considerem o que foi escolhido nas demais
+    selecoes = {
+        faceta: st.session_state.get(f"{chave}_{faceta}", [])
+        for faceta in indice.facetas
     }
-    return pd.DataFrame(dados)
-        
-# Adicione esta função para carregar os dados das cooperativas
-@st.cache_data
-def load_cooperativas():
-    """
-    Carrega os dados das cooperativas de reciclagem.
-    Retorna um DataFrame com: nome, endereco, latitude, longitude, descricao.
-    """
-
-    # Dados diretamente no código
-    data = [
-        {
-            "nome": "Associação de Catadores de Materiais Recicláveis de Florianópolis (ACMR)",
-            "endereco": "Rua João Pio Duarte Silva, 150",
-            "latitude": -27.5942,
-            "longitude": -48.5478,
-            "descricao": "Maior associação, responsável pela triagem e comercialização dos recicláveis."
-        },
-        {
-            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Capoeiras",
-            "endereco": "Av. Mauro Ramos, 820",
-            "latitude": -27.5945,
-            "longitude": -48.5450,
-            "descricao": "Foco na inclusão social e sustentabilidade ambiental."
-        },
-        {
-            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Estreito",
-            "endereco": "Rua Henrique Meyer, 300",
-            "latitude": -27.6000,
-            "longitude": -48.5330,
-            "descricao": "Promove trabalho digno e educação ambiental."
-        },
-        {
-            "nome": "Cooperativa de Reciclagem e Trabalho de Florianópolis (COOPERTFLOR)",
-            "endereco": "Rua Des. Pedro Silva, 200",
-            "latitude": -27.5950,
-            "longitude": -48.5400,
-            "descricao": "Atua com triagem e comercialização, valorizando o trabalho dos catadores."
-        },
-        {
-            "nome": "Associação de Catadores de Materiais Recicláveis do bairro Itacorubi",
-            "endereco": "Rua Henrique Veras, 180",
-            "latitude": -27.5930,
-            "longitude": -48.5600,
-            "descricao": "Promove ações de reciclagem e conscientização ambiental."
-        },
-        {
-            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Saco Grande",
-            "endereco": "Rua Deputado Antônio Edu Vieira, 250",
-            "latitude": -27.6005,
-            "longitude": -48.5405,
-            "descricao": "Organiza cooperativa para melhorar as condições de trabalho."
-        },
-        {
-            "nome": "Cooperativa de Catadores de Florianópolis (COOPERCAT)",
-            "endereco": "Rua José Maria Tavares, 100",
-            "latitude": -27.5960,
-            "longitude": -48.5450,
-            "descricao": "Valoriza a inclusão social e sustentabilidade."
-        }
-    ]
+    contagens = indice.contagens(selecoes, base)
+
+    colunas = st.columns(len(indice.facetas))
+    for coluna, (faceta, valores) in zip(colunas, indice.facetas.items()):
+        with coluna:
+            selecoes[faceta] = st.multiselect(
+                faceta,
+                options=list(valores),
+                format_func=lambda valor, faceta=faceta: f"{valor} ({contagens[faceta][valor]})",
+                key=f"{chave}_{faceta}"
+            )
+
+    linhas = indice.linhas(indice.mascara(selecoes) & base)
+    st.caption(f"{len(linhas)} de {indice.n_linhas} itens")
+    return linhas
+
+#artefatos derivados dos arquivos de dados (tabelas, índices, vizinhos, camada do mapa, miniaturas), em artefatos.py.
+#o observador confere os arquivos a cada poucos segundos e refaz só o que depende do que mudou,
+#sem reiniciar o servidor nem limpar os outros caches. O grafo é um só por processo, o mesmo do aquecimento
+def grafo_dados():
+    return grafo_processo()
+
+#API JSON (api.py) para totens e parceiros, no mesmo processo e com o mesmo grafo, se MUSEU_API_PORTA estiver definida
+@st.cache_resource
+def servidor_api():
+    return iniciar_em_thread(ApiMuseu(grafo_dados(), registro_processo(), iniciar_aquecimento(grafo_dados())),
+                             PORTA_API)
+
+#grade de cobertura, calculada uma vez por versão dos dados e resolução
+@st.cache_resource
+def cobertura_pontos(pontos: pd.DataFrame, resolucao_m: int):
+    return analisar_cobertura(pontos, resolucao_m)
+
+#pontos de partida oferecidos ao visitante: o museu e os bairros atendidos pela coleta
+def origens_disponiveis(pontos: pd.DataFrame):
+    origens = {"Museu do Lixo (Itacorubi)": MUSEU_COORDENADAS}
+    for _, row in pontos[pontos["camada"] == "Coleta seletiva"].iterrows():
+        origens.setdefault(row["nome"], (row["latitude"], row["longitude"]))
+    return origens
+
+#cartão de um polímero (glossário e busca por foto)
+def mostrar_cartao_polimero(polimeros, posicao, acervo, miniaturas, similares):
+    row = polimeros.iloc[posicao]
+    with st.container():
+        col1, col2 = st.columns([1, 3], gap="medium")
+
+        with col1:
+            nome_imagem = f"polimero/{row['Sigla']}"
+            caminho_imagem = acervo.caminho(nome_imagem)
+            miniatura = miniaturas.get(os.path.basename(caminho_imagem)) if caminho_imagem else None
+            mostrar_imagem(nome_imagem, f"{row['Nome']}", (220, 220, 255), conteudo=miniatura,
+                           lado_leve=LADO_LEVE_MINIATURA)
+
+        with col2:
+            st.subheader(f"{row['Sigla']} - {row['Nome']}")
+            st.markdown(f"**Código:** {row.get('Código', 'Não informado')}")
+            st.markdown(f"**Tipo de Polimerização:** {row.get('Tipo de Polimerização', 'Não informado')}")
+            st.markdown(f"**Densidade:** {row.get('Densidade', 'Não informado')}")
+            st.markdown(f"**Ponto de Fusão:** {row.get('Ponto de Fusão', 'Não informado')}")
+            st.markdown(f"**Reciclável:** {row.get('Reciclável', 'Não informado')}")
+            st.markdown(f"**Aplicações Comuns:** {row.get('Aplicações Comuns', 'Não informado')}")
+            st.markdown(f"**Descrição:** {row.get('Descrição', 'Não informado')}")
+
+            vizinhos = similares.vizinhos(posicao)
+            if vizinhos:
+                st.caption("🔗 Materiais semelhantes: " + " · ".join(
+                    f"{polimeros.iloc[i]['Sigla']} ({pontuacao:.0%})" for i, pontuacao in vizinhos
+                ))
 
-    # Criar DataFrame
-    df = pd.DataFrame(data)
+#mostrar glossário
+def mostrar_glossario_polimeros():
+    st.header("🧪 Glossário Completo de Polímeros")
 
-    # Garantir que latitude e longitude sejam float válidos
-    df['latitude'] = df['latitude'].astype(str).str.replace(',', '.').astype(float)
-    df['longitude'] = df['longitude'].astype(str).str.replace(',', '.').astype(float)
+    polimeros, indice, similares, acervo, miniaturas = grafo_dados().obter_varios(
+        "polimeros", "indice_facetas_polimeros", "vizinhos_polimeros", "acervo", "miniaturas_materiais")
+    linhas = mostrar_filtros_facetas(indice, "polimeros")
 
-    # Eliminar valores faltantes ou inválidos
-    df = df.dropna(subset=['latitude', 'longitude'])
-    df = df[(df['latitude'].between(-90, 0)) & (df['longitude'].between(-90, -30))]
+    for posicao in linhas:
+        mostrar_cartao_polimero(polimeros, posicao, acervo, miniaturas, similares)
+        st.divider()
 
-    return df
+#descritor da foto enviada, pelo hash do arquivo: os reruns dos widgets não decodificam a foto de novo
+@st.cache_data(max_entries=32, show_spinner=False)
+def descritor_foto(chave, _dados):
+    return descrever_foto(_dados)
+
+#busca por foto: o polímero cujas imagens de referência mais se parecem com a foto
+def mostrar_busca_por_foto():
+    with st.expander("📷 Que material é este? Busque por uma foto"):
+        st.caption("Fotografe a embalagem ou o símbolo de reciclagem. A foto é usada só para a busca e não fica guardada.")
+        foto = st.file_uploader("Envie uma foto:", type=["png", "jpg", "jpeg", "webp"], key="busca_foto_arquivo")
+        if st.toggle("Usar a câmera", key="busca_foto_camera"):
+            foto = st.camera_input("Tire uma foto:", key="busca_foto_captura") or foto
+        if foto is None:
+            return
 
-#mostrar glossário
-def mostrar_glossario_polimeros(polimeros: pd.DataFrame):
-    st.header("🧪 Glossário Completo de Polímeros")
+        dados = foto.getvalue()
+        try:
+            descritor = descritor_foto(hashlib.sha1(dados).hexdigest(), dados)
+        except Image.DecompressionBombError:
+            st.error("A foto é grande demais para a busca. Envie uma versão menor.")
+            return
+        except (OSError, ValueError) as e:
+            st.error(f"Não foi possível ler a foto: {e}")
+            return
 
-    for _, row in polimeros.iterrows():
-        with st.container():
-            col1, col2 = st.columns([1, 3], gap="medium")
+        polimeros, indice, similares, acervo, miniaturas = grafo_dados().obter_varios(
+            "polimeros", "indice_fotos", "vizinhos_polimeros", "acervo", "miniaturas_materiais")
+        resultados = indice.buscar(descritor)
+        if not resultados:
+            st.info("Ainda não há imagens de referência para comparar.")
+            return
 
-            with col1:
-                nome_imagem = normalizar_nome(row['Sigla']) + ".png"
-                caminho_imagem = os.path.join(IMAGES_MATERIAIS_DIR, nome_imagem)
+        sigla, distancia, _, _ = resultados[0]
+        if distancia <= DISTANCIA_CONFIAVEL:
+            st.success(f"Parece ser **{sigla}** ({1 - distancia:.0%} de semelhança).")
+        else:
+            st.warning(f"Não tenho certeza, mas o mais parecido é **{sigla}** ({1 - distancia:.0%} de semelhança).")
+        posicao = polimeros["Sigla"].astype(str).tolist().index(sigla)
+        mostrar_cartao_polimero(polimeros, posicao, acervo, miniaturas, similares)
+        if len(resultados) > 1:
+            st.caption("Outras possibilidades: " + " · ".join(
+                f"{outra} ({1 - d:.0%})" for outra, d, _, _ in resultados[1:]))
+
+#glossário de resíduos
+def mostrar_glossario_residuos():
+    st.header("🗑️ Glossário de Resíduos")
+
+    residuos, indice = grafo_dados().obter_varios("residuos", "indice_facetas_residuos")
+    linhas = mostrar_filtros_facetas(indice, "residuos")
+
+    mostrar_tabela(
+        residuos.iloc[linhas],
+        hide_index=True,
+        use_container_width=True
+    )
 
-                if os.path.exists(caminho_imagem):
-                    st.image(Image.open(caminho_imagem), use_container_width=True, caption=f"{row['Nome']}")
-                else:
-                    img_padrao = Image.new('RGB', (300, 300), color=(220, 220, 255))
-                    st.image(img_padrao, use_container_width=True, caption=f"{row['Nome']}")
-
-            with col2:
-                st.subheader(f"{row['Sigla']} - {row['Nome']}")
-                st.markdown(f"**Código:** {row['Código de Identificação']}")
-                st.markdown(f"**Tipo de Polimerização:** {row['Tipo de Polimerização']}")
-                st.markdown(f"**Densidade:** {row['Densidade']}")
-                st.markdown(f"**Ponto de Fusão:** {row['Ponto de Fusão']}")
-                st.markdown(f"**Reciclável:** {row['Reciclável']}")
-                st.markdown(f"**Aplicações Comuns:** {row['Aplicações Comuns']}")
-                st.markdown(f"**Descrição:** {row['Descrição']}")
 
-        st.divider()
-def mostrar_glossario_polimeros(polimeros: pd.DataFrame):
-    st.header("🧪 Glossário Completo de Polímeros")
+#quiz adaptativo: nº máximo de perguntas e precisão que encerra o quiz antes
+PERGUNTAS_ADAPTATIVO = 8
+ERRO_PADRAO_MINIMO = 0.45
+
+#perguntas ordenadas pela dificuldade ajustada offline (python quiz_adaptativo.py)
+@st.cache_resource
+def banco_adaptativo(versao_parametros):
+    parametros = carregar_parametros()
+    # Perguntas escritas à mão ainda sem ajuste entram com dificuldade média (0); as geradas
+    # só entram depois de calibradas (elas aparecem sorteadas no modo sequencial)
+    perguntas = list(load_quiz()) + [q for q in load_quiz_gerado() if q['id'] in parametros]
+    ids = [q['id'] for q in perguntas]
+    return BancoAdaptativo(ids, [parametros.get(pid, 0.0) for pid in ids], [q['pergunta'] for q in perguntas])
+
+def obter_banco_adaptativo():
+    versao = os.path.getmtime(CAMINHO_PARAMETROS) if os.path.isfile(CAMINHO_PARAMETROS) else 0
+    return banco_adaptativo(versao)
+
+#atualiza a habilidade estimada e escolhe a próxima pergunta mais informativa
+def avancar_quiz_adaptativo(quiz_data, question):
+    banco = obter_banco_adaptativo()
+    quiz_data['log_posteriori'] = atualizar_habilidade(
+        quiz_data['log_posteriori'],
+        banco.dificuldade(question['id']),
+        quiz_data['user_answer'] == question['resposta']
+    )
+    habilidade, erro = estimar_habilidade(quiz_data['log_posteriori'])
 
-    for _, row in polimeros.iterrows():
-        with st.container():
-            col1, col2 = st.columns([1, 3], gap="medium")
+    proxima = None
+    if len(quiz_data['questions']) < quiz_data['total'] and erro > ERRO_PADRAO_MINIMO:
+        proxima = banco.proxima(habilidade, {q['id'] for q in quiz_data['questions']})
+    if proxima is None:
+        quiz_data['total'] = len(quiz_data['questions'])
+    else:
+        quiz_data['questions'].append(perguntas_por_id()[proxima])
+
+#salas de aula ao vivo, compartilhadas por todas as sessões deste processo
+@st.cache_resource
+def salas_de_aula():
+    return RegistroSalas()
+
+#painel do monitor: só esta parte da página é redesenhada, a cada 2 segundos, mesmo sem respostas novas
+#(um fragmento que não desenha nada apaga o que mostrava); o placar vem do cache da sala (Sala.placar)
+@st.fragment(run_every=2)
+def painel_sala(codigo):
+    sala = salas_de_aula().obter(codigo)
+    if sala is None:
+        st.warning("A sala expirou. Crie uma nova sala.")
+        return
+    resumo = sala.resumo()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Estudantes", resumo["estudantes"])
+    col2.metric("Respostas", resumo["respostas"])
+    col3.metric("Acertos da turma", f"{resumo['acertos']:.0%}")
+
+    placar = sala.placar()
+    if placar:
+        mostrar_tabela(
+            pd.DataFrame(placar, columns=["Estudante", "Acertos", "Respondidas"]),
+            hide_index=True,
+            use_container_width=True
+        )
+    else:
+        st.info("Aguardando os estudantes entrarem na sala...")
+
+#modo sala de aula: o monitor cria uma sala e os estudantes entram com o código
+def mostrar_sala_de_aula():
+    with st.expander("👩‍🏫 Modo sala de aula", expanded='sala_codigo' in st.session_state):
+        if st.session_state.get('sala_monitor'):
+            st.markdown(f"### Código da sala: `{st.session_state.sala_codigo}`")
+            st.caption("Peça aos estudantes que abram o Quiz e entrem com este código.")
+            painel_sala(st.session_state.sala_codigo)
+            if st.button("Encerrar sala"):
+                for chave in ('sala_codigo', 'sala_monitor'):
+                    st.session_state.pop(chave, None)
+                st.rerun()
+            return
 
-            with col1:
-                nome_imagem = normalizar_nome(row['Sigla']) + ".png"
-                caminho_imagem = os.path.join(IMAGES_MATERIAIS_DIR, nome_imagem)
+        if 'sala_codigo' in st.session_state:
+            st.success(f"Você está na sala `{st.session_state.sala_codigo}` como **{st.session_state.sala_estudante}**.")
+            return
 
-                if os.path.exists(caminho_imagem):
-                    st.image(Image.open(caminho_imagem), use_container_width=True, caption=f"{row['Nome']}")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**Sou estudante**")
+            codigo = st.text_input("Código da sala:", max_chars=4, key="sala_entrada_codigo")
+            nome = st.text_input("Seu nome ou apelido:", max_chars=30, key="sala_entrada_nome")
+            if st.button("Entrar na sala") and codigo and nome.strip():
+                sala = salas_de_aula().obter(codigo)
+                if sala is None:
+                    st.error("Sala não encontrada. Confira o código com o monitor.")
                 else:
-                    img_padrao = Image.new('RGB', (300, 300), color=(220, 220, 255))
-                    st.image(img_padrao, use_container_width=True, caption=f"{row['Nome']}")
-
-            with col2:
-                st.subheader(f"{row['Sigla']} - {row['Nome']}")
-                st.markdown(f"**Código:** {row.get('Código', 'Não informado')}")
-                st.markdown(f"**Tipo de Polimerização:** {row.get('Tipo de Polimerização', 'Não informado')}")
-                st.markdown(f"**Densidade:** {row.get('Densidade', 'Não informado')}")
-                st.markdown(f"**Ponto de Fusão:** {row.get('Ponto de Fusão', 'Não informado')}")
-                st.markdown(f"**Reciclável:** {row.get('Reciclável', 'Não informado')}")
-                st.markdown(f"**Aplicações Comuns:** {row.get('Aplicações Comuns', 'Não informado')}")
-                st.markdown(f"**Descrição:** {row.get('Descrição', 'Não informado')}")
-
-        st.divider()
-
+                    sala.entrar(nome.strip())
+                    st.session_state.sala_codigo = sala.codigo
+                    st.session_state.sala_estudante = nome.strip()
+                    st.rerun()
+        with col2:
+            st.markdown("**Sou monitor(a)**")
+            if st.button("Criar sala"):
+                st.session_state.sala_codigo = salas_de_aula().criar()
+                st.session_state.sala_monitor = True
+                st.rerun()
 
 # Função: quiz interativo
 def mostrar_quiz():
     st.header("🧐 Quiz de Resíduos e Polímeros")
-    
+
+    # Identifica a sessão e, opcionalmente, a turma para o registro das respostas
+    if 'sessao_id' not in st.session_state:
+        st.session_state.sessao_id = uuid.uuid4().hex
+    turma = st.text_input("Turma ou grupo (opcional):", key="quiz_turma",
+                          value=st.query_params.get("turma", ""),  # links das apostilas (apostilas.py)
+                          placeholder="Ex.: 7º ano B – Escola Básica")
+
+    mostrar_sala_de_aula()
+    if st.session_state.get('sala_monitor'):
+        return  # o monitor acompanha a sala em vez de responder o quiz
+
+    if QUIZ_NA_URL:
+        mostrar_quiz_na_url(turma)
+        return
+
+    modo = st.radio("Modo do quiz:", ["Sequencial", "Adaptativo"], horizontal=True, key="quiz_modo",
+                    help="No modo adaptativo, cada pergunta é escolhida conforme o seu desempenho "
+                         "e o quiz termina assim que o seu nível estiver bem estimado.")
+
+    # Trocar de modo reinicia o quiz
+    if 'quiz_data' in st.session_state and st.session_state.quiz_data.get('modo', 'Sequencial') != modo:
+        del st.session_state.quiz_data
+
     # Inicializa o estado do quiz se necessário
     if 'quiz_data' not in st.session_state:
-        questions = load_quiz()
+        questions = montar_quiz()
         if not questions:
             st.error("Não foi possível carregar as perguntas do quiz.")
             return
+        total = len(questions)
+        log_posteriori = None
+        if modo == "Adaptativo":
+            banco = obter_banco_adaptativo()
+            primeira = banco.proxima(0.0, set())
+            questions = [perguntas_por_id()[primeira]]
+            total = min(PERGUNTAS_ADAPTATIVO, len(banco))
+            log_posteriori = LOG_PRIORI.copy()
         st.session_state.quiz_data = {
+            'modo': modo,
             'questions': questions,
+            'total': total,
             'current_question': 0,
             'score': 0,
             'user_answer': None,
-            'show_feedback': False
+            'show_feedback': False,
+            'mostrada_em': time.time(),
+            'log_posteriori': log_posteriori
         }
     
     quiz_data = st.session_state.quiz_data
     
     # Se o quiz foi completado, mostra resultados
-    if quiz_data['current_question'] >= len(quiz_data['questions']):
-        mostrar_resultado_final(quiz_data['score'], len(quiz_data['questions']))
+    if quiz_data['current_question'] >= quiz_data['total']:
+        habilidade = None
+        if quiz_data['modo'] == "Adaptativo":
+            habilidade = estimar_habilidade(quiz_data['log_posteriori'])[0]
+        mostrar_resultado_final(quiz_data['score'], quiz_data['total'], habilidade)
         return
     
     # Obtém a pergunta atual
     question = quiz_data['questions'][quiz_data['current_question']]
     
     # Mostra progresso
-    st.progress((quiz_data['current_question'] + 1) / len(quiz_data['questions']))
-    st.caption(f"Pergunta {quiz_data['current_question'] + 1} de {len(quiz_data['questions'])}")
+    st.progress((quiz_data['current_question'] + 1) / quiz_data['total'])
+    st.caption(f"Pergunta {quiz_data['current_question'] + 1} de {quiz_data['total']}")
     
     # Mostra pergunta
     st.subheader(question['pergunta'])
@@ -467,8 +573,22 @@ def mostrar_quiz():
         quiz_data['show_feedback'] = True
         
         # Verifica resposta
-        if quiz_data['user_answer'] == question['resposta']:
+        correta = quiz_data['user_answer'] == question['resposta']
+        if correta:
             quiz_data['score'] += 1
+
+        registro_processo().registrar(
+            sessao=st.session_state.sessao_id,
+            turma=turma.strip(),
+            pergunta_id=question['id'],
+            opcao=quiz_data['user_answer'],
+            correta=correta,
+            latencia_ms=1000 * (time.time() - quiz_data.get('mostrada_em', time.time()))
+        )
+        if 'sala_codigo' in st.session_state:
+            sala = salas_de_aula().obter(st.session_state.sala_codigo)
+            if sala is not None:
+                sala.registrar(st.session_state.sala_estudante, correta)
         
         st.session_state.quiz_data = quiz_data
         st.rerun()
@@ -483,15 +603,162 @@ def mostrar_quiz():
         
         # Botão para próxima pergunta
         if st.button("Próxima pergunta"):
+            if quiz_data['modo'] == "Adaptativo":
+                avancar_quiz_adaptativo(quiz_data, question)
             quiz_data['current_question'] += 1
             quiz_data['show_feedback'] = False
             quiz_data['user_answer'] = None
+            quiz_data['mostrada_em'] = time.time()
             st.session_state.quiz_data = quiz_data
             st.rerun()
 
-def mostrar_resultado_final(score, total_questions):
+#ids do quiz na URL e o digest que amarra os tokens a este conjunto de perguntas
+@st.cache_resource
+def ids_quiz_na_url():
+    manuais = [q['id'] for q in load_quiz()]
+    geradas = [q['id'] for q in load_quiz_gerado()]
+    return manuais, geradas, digest_perguntas(manuais + geradas)
+
+#mesma sequência de perguntas em qualquer réplica, a partir da semente do token
+def ordem_quiz_na_url(semente):
+    manuais, geradas, _ = ids_quiz_na_url()
+    ordem = ordem_perguntas(manuais, semente) + ordem_perguntas(geradas, semente, PERGUNTAS_GERADAS_POR_QUIZ)
+    random.Random(semente).shuffle(ordem)
+    return ordem
+
+#quiz sem estado no servidor: o progresso vai e volta no parâmetro ?quiz= da URL
+def mostrar_quiz_na_url(turma):
+    manuais, geradas, digest = ids_quiz_na_url()
+    if not manuais and not geradas:
+        st.error("Não foi possível carregar as perguntas do quiz.")
+        return
+    por_id = perguntas_por_id()
+    total = len(manuais) + min(PERGUNTAS_GERADAS_POR_QUIZ, len(geradas))
+
+    estado = decodificar(st.query_params.get('quiz', ''), digest, total)
+    if estado is None:
+        estado = novo_estado(digest)
+        estado['mostrada_em'] = time.time()
+        st.query_params['quiz'] = codificar(estado)
+    elif estado['mostrada_em'] == 0:
+        # Link impresso (apostilas.py): a primeira pergunta está sendo mostrada agora
+        estado['mostrada_em'] = time.time()
+        st.query_params['quiz'] = codificar(estado)
+    ordem = ordem_quiz_na_url(estado['semente'])
+
+    if estado['atual'] >= total:
+        mostrar_resultado_final(sum(estado['acertos']), total)
+        return
+
+    question = por_id[ordem[estado['atual']]]
+    st.progress((estado['atual'] + 1) / total)
+    st.caption(f"Pergunta {estado['atual'] + 1} de {total} · o progresso fica salvo no endereço desta página")
+    st.subheader(question['pergunta'])
+
+    options = question['opcoes']
+    respondida = estado['resposta'] is not None
+    user_answer = st.radio(
+        "Selecione sua resposta:",
+        options,
+        index=estado['resposta'],
+        disabled=respondida,
+        key=f"question_url_{estado['semente']}_{estado['atual']}"
+    )
+
+    if not respondida:
+        if st.button("Enviar resposta") and user_answer is not None:
+            estado['resposta'] = options.index(user_answer)
+            correta = estado['resposta'] == question['resposta']
+            estado['acertos'].append(correta)
+            registro_processo().registrar(
+                sessao=f"url-{estado['semente']:08x}",
+                turma=turma.strip(),
+                pergunta_id=question['id'],
+                opcao=estado['resposta'],
+                correta=correta,
+                latencia_ms=1000 * max(0, int(time.time()) - estado['mostrada_em'])
+            )
+            if 'sala_codigo' in st.session_state:
+                sala = salas_de_aula().obter(st.session_state.sala_codigo)
+                if sala is not None:
+                    sala.registrar(st.session_state.sala_estudante, correta)
+            st.query_params['quiz'] = codificar(estado)
+            st.rerun()
+        return
+
+    if estado['resposta'] == question['resposta']:
+        st.success(f"✅ Correto! {question['explicacao']}")
+    else:
+        st.error(f"❌ Resposta incorreta. A resposta correta é: {options[question['resposta']]}. {question['explicacao']}")
+
+    if st.button("Próxima pergunta"):
+        estado['atual'] += 1
+        estado['resposta'] = None
+        estado['mostrada_em'] = time.time()
+        st.query_params['quiz'] = codificar(estado)
+        st.rerun()
+
+#análise das respostas: agregados e figuras ficam em cache até um novo lote ser gravado
+@st.cache_data
+def analise_respostas(versao):
+    agregados = ler_agregados()
+    resumo = resumo_perguntas(agregados, perguntas_por_id().values())
+    if resumo.empty:
+        return agregados, resumo, None, None
+    return agregados, resumo, figura_acertos(resumo), figura_tendencia(agregados)
+
+@st.cache_data
+def figuras_pergunta(versao, pergunta_id):
+    agregados = ler_agregados()
+    pergunta = perguntas_por_id()[pergunta_id]
+    return (figura_opcoes(agregados, pergunta),
+            figura_latencias(agregados, pergunta_id),
+            figura_tendencia(agregados, pergunta_id))
+
+#painel para os educadores: quais perguntas os estudantes mais erram
+def mostrar_analise_quiz():
+    st.header("📊 Análise das Respostas do Quiz")
+
+    versao = versao_agregados()
+    agregados, resumo, fig_acertos, fig_tendencia = analise_respostas(versao)
+    if resumo.empty:
+        if versao:
+            st.info("As respostas registradas são de perguntas que não estão mais no banco do quiz.")
+        else:
+            st.info("Ainda não há respostas registradas.")
+        return
+
+    total = resumo["Respostas"].sum()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Respostas registradas", f"{total:,}".replace(",", "."))
+    col2.metric("Acertos (geral)", f"{(resumo['Respostas'] * resumo['Acertos (%)']).sum() / total:.0f}%")
+    col3.metric("Perguntas respondidas", len(resumo))
+
+    mostrar_grafico(fig_acertos, "analise_acertos", use_container_width=True)
+    mostrar_grafico(fig_tendencia, "analise_tendencia", use_container_width=True)
+    mostrar_tabela(resumo.drop(columns="pergunta_id"), hide_index=True, use_container_width=True)
+
+    st.subheader("🔍 Detalhes de uma pergunta")
+    pergunta_id = st.selectbox(
+        "Pergunta:", resumo["pergunta_id"].tolist(),
+        format_func=lambda pid: resumo.set_index("pergunta_id").loc[pid, "Pergunta"],
+        key="analise_pergunta"
+    )
+    fig_opcoes, fig_latencias, fig_tendencia_pergunta = figuras_pergunta(versao, pergunta_id)
+    col1, col2 = st.columns(2)
+    with col1:
+        mostrar_grafico(fig_opcoes, "analise_opcoes", use_container_width=True)
+    with col2:
+        mostrar_grafico(fig_latencias, "analise_latencias", use_container_width=True)
+    mostrar_grafico(fig_tendencia_pergunta, "analise_tendencia_pergunta", use_container_width=True)
+
+def mostrar_resultado_final(score, total_questions, habilidade=None):
     st.balloons()
     st.success(f"## 🎯 Pontuação Final: {score}/{total_questions} ({(score/total_questions):.0%})")
+
+    # No modo adaptativo as perguntas têm dificuldades diferentes: mostra o nível estimado
+    if habilidade is not None:
+        st.metric("Nível estimado (escala de -4 a 4)", f"{habilidade:+.1f}")
     
     # Feedback personalizado
     if score == total_questions:
@@ -505,477 +772,290 @@ def mostrar_resultado_final(score, total_questions):
     
     # Botão para reiniciar
     if st.button("🔄 Refazer Quiz"):
-        del st.session_state.quiz_data
+        st.session_state.pop('quiz_data', None)
+        st.query_params.pop('quiz', None)
         st.rerun()
 
 # Função: história do Museu
 def mostrar_historia():
-    st.empty()  # Limpa qualquer conteúdo residual
-    st.header("🏛️ Museu do Lixo – História e Agenda")
-
-    # Introdução
-    st.markdown("""
-    O **Museu do Lixo**, instalado pela Comcap em **25 de setembro de 2003**, tornou-se uma referência em **educação ambiental** em Santa Catarina. 
-    Sua abordagem lúdica e acessível reforça conceitos de **consumo consciente** com base nos princípios:
-    """)
-
-    # Seção dos 4Rs – versão didática sem HTML
-    st.subheader("♻️ Os 4Rs da Sustentabilidade")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.markdown("### 🔍 1. REPENSAR")
-        st.success("Questionar nossos hábitos:\n\n*“Preciso mesmo disso?”*")
+    secoes.historia(st, mostrar_imagem_com_fallback)
 
-        st.markdown("### 🔄 3. REUTILIZAR")
-        st.warning("Dar novos usos antes de descartar.")
 
-    with col2:
-        st.markdown("### 📉 2. REDUZIR")
-        st.success("Diminuir a quantidade de resíduos gerados.")
-
-        st.markdown("### ♻ 4. RECICLAR")
-        st.info("Transformar materiais usados em novos produtos.")
-
-    # Texto da história do museu
-    st.markdown("""
-    O museu nasceu do sonho de mais de dez anos de trabalhadores da Comcap, que desejavam **resgatar objetos descartados** 
-    para criar um espaço de memória sobre os hábitos de consumo da sociedade.
-
-    As primeiras peças foram reunidas no antigo galpão de triagem da coleta seletiva. Atualmente, o acervo está disposto em 
-    **ambientes temáticos**, montados e decorados com **materiais reaproveitados** — desde as tintas das paredes até a mandala 
-    do piso, tudo feito com resíduos reciclados.
-
-    ---
-
-    ### 🕓 Horário de Funcionamento  
-    📅 Segunda a sexta-feira  
-    🕗 Das 8h às 16h
-
-    **Visitas monitoradas devem ser agendadas:**  
-    📞 (48) 3261-4826  
-    📧 ambiental.comcap@pmf.sc.gov.br
-
-    ---
+def mostrar_quimica():
+    secoes.quimica(st, mostrar_imagem_com_fallback)
 
-    ### 📍 Localização  
-    Rodovia Admar Gonzaga, 72 – Bairro Itacorubi, Florianópolis – SC
 
-    ### 🔍 Saiba mais
-    - O museu integra o roteiro de **visitação monitorada ao Centro de Valorização de Resíduos (CVR)** da Comcap  
-    - Recebe cerca de **7 mil visitantes por ano**  
-    - Acervo com **10 mil itens** recuperados  
-    - Área de **200 m²** com decoração 100% reutilizada  
-    - Personagens educativos como **Neiciclagem** e **Dona Tainha**
-    """)
+def mostrar_isopor():
+    secoes.isopor(st, mostrar_imagem_com_fallback)
+# Função: compostagem
 
-    # Galeria de imagens
-    st.markdown("---")
-    st.subheader("📸 Conheça Nossa Estrutura")
+def mostrar_compostagem():
+    secoes.compostagem(st, mostrar_imagem_com_fallback, interativo=mostrar_simulador_leira,
+                       cenarios=mostrar_cenarios_municipio)
+
+#simulador da leira: cada conjunto de parâmetros é simulado uma vez e fica em cache
+ALTURAS_SENSIBILIDADE = tuple(round(0.5 + 0.125 * i, 3) for i in range(21))      # 0,5 a 3 m
+PROPORCOES_SENSIBILIDADE = tuple(round(0.2 + 0.14 * i, 2) for i in range(21))   # 0,2 a 3 kg/kg
+INDICADORES_LEIRA = {
+    "dias_termofilicos": f"Dias acima de {TEMPERATURA_TERMOFILICA:g} °C",
+    "temperatura_maxima": "Temperatura máxima (°C)",
+    "perda_massa": "Perda de massa (fração)",
+    "cn_final": "Relação C/N final",
+    "umidade_final": "Umidade final (fração)",
+}
+
+@st.cache_data(max_entries=64)
+def simulacao_leira(fonte, proporcao, altura, largura, ambiente):
+    return simular(proporcao, altura, largura, fonte, ambiente)
+
+@st.cache_data(max_entries=16)
+def sensibilidade_leira(fonte, largura, ambiente):
+    return varredura(ALTURAS_SENSIBILIDADE, PROPORCOES_SENSIBILIDADE, largura=largura,
+                     fonte_carbono=fonte, temperatura_ambiente=ambiente)
+
+def mostrar_simulador_leira():
+    st.subheader("🌡️ Simulador da Leira")
+    st.markdown("Escolha a mistura e o tamanho da leira e veja como temperatura, umidade, relação C/N e massa "
+                "evoluem ao longo de 180 dias. É um modelo simplificado, feito para comparar cenários.")
 
     col1, col2 = st.columns(2)
-
-    # Imagem 1 - Fachada
     with col1:
-        try:
-            img_path = os.path.join("imagens_materiais", "museuext.png")
-            if os.path.exists(img_path):
-                st.image(img_path, caption="Vista externa do Museu", use_container_width=True)
-            else:
-                raise FileNotFoundError
-        except Exception:
-            st.warning("Imagem da fachada não encontrada")
-            placeholder = Image.new('RGB', (600, 400), color=(220, 220, 220))
-            st.image(placeholder, caption="Fachada do Museu (imagem não disponível)", use_container_width=True)
-
-    # Imagem 2 - Equipe
+        fonte = st.selectbox("Fonte de carbono:", FONTES_CARBONO, key="leira_fonte")
+        proporcao = st.slider("kg da fonte de carbono por kg de restos de alimentos:", 0.2, 3.0, 1.0, 0.1,
+                              key="leira_proporcao")
+        ambiente = st.slider("Temperatura ambiente (°C):", 10, 35, 22, key="leira_ambiente")
     with col2:
-        try:
-            img_path = os.path.join("imagens_materiais", "museuint.png")
-            if os.path.exists(img_path):
-                st.image(img_path, caption="Nossa equipe de educadores", use_container_width=True)
-            else:
-                raise FileNotFoundError
-        except Exception:
-            st.warning("Imagem da equipe não encontrada")
-            placeholder = Image.new('RGB', (600, 400), color=(220, 220, 220))
-            st.image(placeholder, caption="Equipe do museu (imagem não disponível)", use_container_width=True)
-        # Sobre a Comcap
-      # Sobre a Comcap
-    st.markdown("---")
-    st.subheader("🏢 Sobre a Comcap")
-
-    st.markdown("""
-    A **Comcap – Companhia de Melhoramentos da Capital** é uma autarquia da Prefeitura de Florianópolis responsável por 
-    **limpeza urbana, coleta de resíduos sólidos e ações de educação ambiental**. Foi fundada em 1971 e transformada em 
-    autarquia em 2017.
-
-    ### 🏛️ O que faz a Comcap?
-
-    - 🚛 Realiza a **coleta de lixo domiciliar e seletiva** em todos os bairros de Florianópolis  
-    - 🧹 Cuida da **varrição de vias públicas**, capina e remoção de resíduos urbanos  
-    - 🏫 Mantém o **Museu do Lixo**, dentro do Centro de Valorização de Resíduos (CVR), como referência em educação ambiental  
-    - 🌿 Administra o **Jardim Botânico de Florianópolis** desde 2016  
-
-    ### 📊 Dimensões e Impacto
-
-    - 📅 **Fundação**: 1971 (autarquia desde 2017)  
-    - 👥 **Funcionários**: Cerca de 1.500 colaboradores  
-    - ♻️ **Volume de resíduos coletados por ano**:  
-      - Aproximadamente **193 mil toneladas no total**  
-      - Sendo cerca de **70 mil toneladas de orgânicos**  
-      - E **12 mil toneladas de recicláveis** por mês
-
-    🔗 Saiba mais no site oficial: [https://www.pmf.sc.gov.br/comcap](https://www.pmf.sc.gov.br/comcap)
-    """)
-
-
-    # Rodapé institucional (ajustado para celular)
-    st.markdown("### ℹ️ Agendamentos")
-    st.markdown("""
-📧 [ambiental.comcap@pmf.sc.gov.br](mailto:ambiental.comcap@pmf.sc.gov.br)  
-📞 (48) 3261-4808
-""")
-    
-def mostrar_quimica():
-    # Definição das cores de fallback
-    COR_MATERIAIS = (220, 220, 255)  # Azul claro
-    COR_RESIDUOS = (200, 230, 200)   # Verde claro
+        altura = st.slider("Altura da leira (m):", 0.5, 3.0, ALTURA_UFSC, 0.1, key="leira_altura")
+        largura = st.slider("Largura da base (m):", 1.0, 4.0, LARGURA_UFSC, 0.1, key="leira_largura")
+
+    historico = simulacao_leira(fonte, proporcao, altura, largura, float(ambiente))
+    resumo = {nome: valor[0] for nome, valor in indicadores(historico).items()}
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Temperatura máxima", f"{resumo['temperatura_maxima']:.0f} °C", f"no dia {resumo['dia_pico']}")
+    col2.metric("Fase termofílica", f"{resumo['dias_termofilicos']} dias", f"acima de {TEMPERATURA_TERMOFILICA:g} °C")
+    col3.metric("Perda de massa", f"{resumo['perda_massa']:.0%}")
+    col4.metric("Relação C/N", f"{resumo['cn_inicial']:.0f} → {resumo['cn_final']:.0f}")
+    if resumo["dias_higienizacao"] < 3:
+        st.warning(f"A leira não passa de {TEMPERATURA_HIGIENIZACAO:g} °C por 3 dias: o composto pode não ficar "
+                   "livre de patógenos. Experimente outra proporção de carbono ou uma leira maior.")
+
+    evolucao = pd.DataFrame({
+        "Dia": historico["dias"],
+        "Temperatura (°C)": historico["temperatura"][0],
+        "Umidade (%)": 100 * historico["umidade"][0],
+        "Relação C/N": historico["cn"][0],
+        "Perda de massa (%)": 100 * historico["perda_massa"][0],
+    }).melt(id_vars="Dia", var_name="Variável", value_name="Valor")
+    fig = px.line(evolucao, x="Dia", y="Valor", facet_col="Variável", facet_col_wrap=2, height=500)
+    fig.update_yaxes(matches=None, showticklabels=True, title_text="")
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    mostrar_grafico(fig, "leira_evolucao", use_container_width=True)
+
+    st.markdown(f"**Sensibilidade:** o mesmo indicador para {len(ALTURAS_SENSIBILIDADE) * len(PROPORCOES_SENSIBILIDADE)} "
+                "combinações de altura da leira e proporção de carbono (com a fonte, a largura e a temperatura escolhidas).")
+    indicador = st.selectbox("Indicador:", list(INDICADORES_LEIRA), format_func=INDICADORES_LEIRA.get,
+                             key="leira_indicador")
+    grade = sensibilidade_leira(fonte, largura, float(ambiente))
+    fig = px.imshow(
+        grade[indicador], x=list(PROPORCOES_SENSIBILIDADE), y=list(ALTURAS_SENSIBILIDADE), origin="lower",
+        aspect="auto", color_continuous_scale="YlOrRd",
+        labels={"x": "kg de carbono por kg de restos", "y": "Altura da leira (m)", "color": INDICADORES_LEIRA[indicador]}
+    )
+    mostrar_grafico(fig, "leira_sensibilidade", use_container_width=True)
+
+#cenários do município: a grade metas × parâmetro escolhido é calculada de uma vez e fica em cache
+METAS_GRADE = tuple(i / 100 for i in range(101))
+FATORES_EIXO = tuple(round(0.5 + 0.05 * i, 2) for i in range(21))   # 50% a 150% do valor do arquivo
+EIXOS_MUNICIPIO = {
+    "custo_aterro": "Custo do aterro (R$/t)",
+    "custo_compostagem": "Custo da compostagem (R$/t)",
+    "fracao_organicos": "Fração orgânica dos resíduos",
+    "distancia_aterro": "Distância até o aterro (km)",
+    "fator_aterro_organicos": "Emissão dos orgânicos aterrados (t CO2e/t)",
+}
+FORMATOS_MUNICIPIO = {
+    "custo": lambda v: f"R$ {v / 1e6:.1f} mi",
+    "viagens_dia": lambda v: f"{v:.1f}",
+    "volume_aterro": lambda v: f"{v / 1000:.0f} mil m³",
+    "emissoes": lambda v: f"{v / 1000:.1f} mil t CO2e",
+    "aterrado": lambda v: f"{v / 1000:.0f} mil t",
+}
+
+@st.cache_data(max_entries=8)
+def varredura_municipio(parametros, eixo):
+    parametros = dict(parametros)
+    grade = varredura_cenarios(parametros, {
+        eixo: [parametros[eixo] * fator for fator in FATORES_EIXO],
+        "meta_organicos": METAS_GRADE,
+        "meta_reciclaveis": METAS_GRADE,
+    })
+    return {nome: valor.copy() for nome, valor in grade.items()}
 
-    # Parte 1: Teoria sobre polímeros
-    st.markdown("""
-    ## 🔬 Polímeros: Estrutura, Propriedades e Sustentabilidade
+def mostrar_cenarios_municipio():
+    st.subheader("🏙️ E se Florianópolis separasse mais?")
+    st.markdown("Escolha metas de separação na fonte e veja o que muda no custo, nas viagens de caminhão até o "
+                "aterro em Biguaçu, no volume aterrado e nas emissões. Os números do município podem ser editados.")
 
-    Os **polímeros** são macromoléculas formadas pela repetição de unidades estruturais menores chamadas **monômeros**, unidas por ligações covalentes. Essa repetição pode ocorrer centenas ou milhares de vezes, conferindo propriedades únicas como elasticidade, resistência térmica e mecânica.
+    with st.expander("⚙️ Parâmetros do município"):
+        tabela = st.data_editor(grafo_dados().obter("parametros_municipio"), hide_index=True, use_container_width=True,
+                                disabled=["parametro", "unidade", "descricao"], key="municipio_parametros")
+    parametros = valores_parametros(tabela)
 
-    ### Classificação dos Polímeros
+    col1, col2 = st.columns(2)
+    meta_organicos = col1.slider("Orgânicos separados na fonte (%):", 0, 100, 50, key="municipio_meta_organicos") / 100
+    meta_reciclaveis = col2.slider("Recicláveis separados na fonte (%):", 0, 100, 60, key="municipio_meta_reciclaveis") / 100
 
-    Podemos classificar os polímeros em:
+    atual, cenario = avaliar(parametros), avaliar(parametros, meta_organicos, meta_reciclaveis)
+    for coluna, (nome, (rotulo, _)) in zip(st.columns(len(RESULTADOS)), RESULTADOS.items()):
+        variacao = cenario[nome] / atual[nome] - 1
+        coluna.metric(rotulo, FORMATOS_MUNICIPIO[nome](cenario[nome]), f"{variacao:+.0%} em relação a hoje",
+                      delta_color="inverse")
 
-    - **Naturais**: celulose (paredes celulares vegetais), amido (reserva energética), proteínas (colágeno, seda), látex (borracha natural)
-    - **Sintéticos**: PET (garrafas), PE e PP (embalagens), PVC (tubos), PS (isopor), Nylon (tecidos), PLA (bioplásticos)
+    st.markdown(f"**Varredura:** todas as combinações de metas (de 1 em 1%) com o parâmetro escolhido entre 50% e 150% "
+                f"do valor da tabela, {len(METAS_GRADE) ** 2 * len(FATORES_EIXO):,} cenários.".replace(",", "."))
+    col1, col2 = st.columns(2)
+    indicador = col1.selectbox("Resultado:", list(RESULTADOS), format_func=lambda nome: " – ".join(RESULTADOS[nome]),
+                               key="municipio_indicador")
+    eixo = col2.selectbox("Parâmetro variado:", list(EIXOS_MUNICIPIO), format_func=EIXOS_MUNICIPIO.get,
+                          key="municipio_eixo")
+    grade = varredura_municipio(tuple(parametros.items()), eixo)[indicador]
+    fator = st.select_slider(f"{EIXOS_MUNICIPIO[eixo]}:", FATORES_EIXO, value=1.0, key="municipio_fator",
+                             format_func=lambda f: f"{parametros[eixo] * f:g} ({f:.0%})")
+    rotulo, unidade = RESULTADOS[indicador]
+    metas = [round(100 * meta) for meta in METAS_GRADE]
+
+    fig = px.imshow(grade[FATORES_EIXO.index(fator)], x=metas, y=metas, origin="lower", aspect="auto",
+                    color_continuous_scale="RdYlGn_r",
+                    labels={"x": "Recicláveis separados (%)", "y": "Orgânicos separados (%)", "color": unidade})
+    fig.add_scatter(x=[round(100 * meta_reciclaveis)], y=[round(100 * meta_organicos)], mode="markers",
+                    marker={"symbol": "x", "size": 12, "color": "black"}, name="Metas escolhidas")
+    mostrar_grafico(fig, "municipio_mapa_calor", use_container_width=True)
+
+    # Curvas: o resultado pela meta de orgânicos, com a meta de recicláveis escolhida, para cinco valores do parâmetro
+    curvas = pd.DataFrame({
+        "Orgânicos separados (%)": metas * 5,
+        rotulo: [valor for i in range(0, len(FATORES_EIXO), 5)
+                 for valor in grade[i, :, round(100 * meta_reciclaveis)]],
+        EIXOS_MUNICIPIO[eixo]: [f"{parametros[eixo] * FATORES_EIXO[i]:g}" for i in range(0, len(FATORES_EIXO), 5)
+                                for _ in metas],
+    })
+    fig = px.line(curvas, x="Orgânicos separados (%)", y=rotulo, color=EIXOS_MUNICIPIO[eixo],
+                  labels={rotulo: f"{rotulo} ({unidade})"})
+    mostrar_grafico(fig, "municipio_curvas", use_container_width=True)
 
-    Quanto ao comportamento térmico:
-    - **Termoplásticos**: Podem ser remodelados (PET, PE, PP)
-    - **Termofixos**: Mantêm forma após moldagem (borracha vulcanizada)
 
-    Estruturalmente:
-    - **Lineares**: Flexíveis (PE)
-    - **Ramificados**: Menor densidade (LDPE)
-    - **Reticulados**: Alta rigidez (borracha vulcanizada)
+#busca: do nome do item ao descarte correto e ao ponto mais próximo
+def mostrar_onde_descartar():
+    st.header("🔎 Onde Descartar?")
 
-    ### Propriedades dos Principais Polímeros Sintéticos
+    pontos, indice = grafo_dados().obter_varios("camada_pontos", "indice_descarte")
 
-    - **PET (♳)**: Ponto de fusão 260-265°C, densidade 1.38-1.39 g/cm³, resistência 55-75 MPa
-    - **PEAD (♴)**: Fusão 130-137°C, densidade 0.94-0.96 g/cm³, resistência 20-32 MPa
-    - **PVC (♵)**: Fusão 100-260°C, libera HCl no processamento
-    - **PP (♷)**: Fusão 160-165°C, resistência 30-40 MPa
-    - **PS (♸)**: Fusão 240°C, baixa reciclabilidade
-    """)
+    origens = origens_disponiveis(pontos)
 
-    # Adicionar imagens após a primeira parte do texto
-    col1, col2 = st.columns(2)
+    col1, col2 = st.columns([2, 1])
     with col1:
-        mostrar_imagem_com_fallback("polo.png", IMAGES_MATERIAIS_DIR,
-                                  "Estrutura molecular de polímeros", COR_MATERIAIS)
+        item = st.text_input("O que você quer descartar?",
+                             placeholder="Ex.: garrafa de óleo, isopor, pilhas",
+                             key="descarte_item")
     with col2:
-        mostrar_imagem_com_fallback("tipos2.png", IMAGES_MATERIAIS_DIR,
-                                  "Aplicações dos polímeros", COR_MATERIAIS)
-
-    # Parte 2: Continuação do texto sobre reciclagem
-    st.markdown("""
-    ### Reciclagem e Sustentabilidade
-
-    No Brasil:
-    - PET: 55% de reciclagem
-    - PEAD: 30%
-    - PVC: <5%
-    - Embalagens multicamadas: difíceis de reciclar
-
-    Processo de reciclagem:
-    - Temperaturas: PET 270-290°C, PP 200-230°C
-    - Consumo: ~10L água/kg plástico
-    - Eficiência: 30-50% melhor que produção virgem
-
-    **Inovações:**
-    1. Biopolímeros (PLA, PHA)
-    2. Reciclagem química avançada
-    3. Catalisadores enzimáticos
-    4. IA para triagem automatizada
-
-    **Boas Práticas:**
-    - Indústria: Design ecológico, logística reversa
-    - Sociedade: Separação adequada, redução de descartáveis, apoio a cooperativas
-
-    **Referências:**
-    - ATKINS, P.; JONES, L. Princípios de Química. 5.ed. Bookman, 2012.
-    - CALLISTER, W. D. Fundamentos da Ciência dos Materiais. 9.ed. LTC, 2020.
-    - MANO, E. B. Introdução a Polímeros. 4.ed. Edgard Blücher, 2005.
-    """)
-
-
-def mostrar_isopor():
-    st.header("♻️ Projeto Recicla+EPS - Florianópolis")
-    
-    # Texto técnico sobre EPS
-    st.markdown("""
-    ### Poliestireno Expandido (EPS): O Material Versátil
-
-    O EPS, conhecido popularmente como isopor, é um plástico celular rígido composto por 98% de ar e apenas 2% de matéria-prima plástica. Sua estrutura única de células fechadas lhe confere propriedades excepcionais que o tornam indispensável em diversas aplicações.
-
-    Do ponto de vista químico, o EPS é um polímero termoplástico derivado do estireno. Suas características técnicas incluem:
-
-    - **Excelente isolamento térmico**: condutividade entre 0,031-0,038 W/mK
-    - **Baixa absorção de água**: menos de 1% em 24 horas
-    - **Resistência mecânica**: proporcional à sua densidade (10-30 kg/m³)
-    - **Ampla faixa térmica**: opera entre -40°C a +70°C
-    - **Vida útil prolongada**: mais de 50 anos em aplicações estáticas
+        origem = st.selectbox("Você está em:", list(origens), key="descarte_origem")
 
-    **Principais aplicações industriais:**
-    - Embalagens protetoras para produtos eletrônicos e eletrodomésticos
-    - Isolamento térmico em construções civis
-    - Componentes para refrigeração industrial
-    - Moldes para fundição
-    - Elementos flutuantes
+    if not item:
+        return
 
-    **Aspectos ambientais:**
-    - 100% reciclável (mecânica e quimicamente)
-    - Baixo consumo energético na produção moderna
-    - Programas eficientes de logística reversa implementados
+    resultados = indice.buscar(item)
+    if not resultados:
+        st.warning("Não encontramos esse item. Tente outro nome ou consulte os links da Prefeitura abaixo.")
+        return
 
-    *Observação*: "Isopor" é uma marca registrada que se tornou sinônimo de EPS no Brasil, representando produtos de alta qualidade nesta categoria de materiais.
-    """)
-    
-    # Mostra a imagem local eps.png
-    eps_path = os.path.join(IMAGES_RESIDUOS_DIR, "isopor.png")
-    try:
-        st.image(
-            eps_path,
-            caption="Diagrama do processo de reciclagem mecânica de EPS - Projeto Recicla+EPS",
-            use_container_width=True
-        )
-    except FileNotFoundError:
-        placeholder = Image.new('RGB', (800, 400), color=(200, 230, 200))
-        st.image(
-            placeholder,
-            caption="Diagrama ilustrativo do processo de reciclagem",
-            use_container_width=True
-        )
-    
-    # Dicas de descarte
-    st.subheader("📦 Como Preparar seu Isopor® para a reciclagem:")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("""
-        **✅ Faça assim:**  
-        • Limpe restos de alimentos  
-        • Não precisa lavar (apenas remover resíduos)  
-        • Deixe secar naturalmente  
-        """)
-    with col2:
-        st.markdown("""
-        **🚫 Evite:**  
-        • Isopor com gordura ou sujeira  
-        • Embalagens contaminadas  
-        • Descartar no lixo comum  
+    latitude, longitude = origens[origem]
+    for resultado in resultados:
+        st.markdown(f"""
+        **{resultado['classe']} ({resultado['codigo']})** – parecido com *{resultado['exemplo']}*  
+        ♻️ **Reciclável:** {resultado['reciclavel']}  
+        🚚 **Rota de Tratamento:** {resultado['rota']}
         """)
-
-    # Benefícios do projeto
-    st.subheader("🌱 Por que descartar corretamente?")
-    st.markdown("""
-    - Transforma-se em novos produtos (réguas, rodapés, placas)  
-    - Gera renda para cooperativas de reciclagem  
-    - Florianópolis recicla **10 toneladas/mês** de Isopor®  
-    - Reduz a poluição ambiental  
-    """)
-    
-    # Mostra a imagem local eps.png
-    eps_path = os.path.join(IMAGES_RESIDUOS_DIR, "eps.png")
-    try:
-        st.image(
-            eps_path,
-            caption="O EPS é amplamente utilizado em nossa sociedade",
-            use_container_width=True
-        )
-    except FileNotFoundError:
-        placeholder = Image.new('RGB', (800, 400), color=(200, 230, 200))
-        st.image(
-            placeholder,
-            caption="Diagrama ilustrativo do processo de reciclagem",
+        if resultado["categoria"] is None:
+            st.info("Não há ponto de entrega cadastrado para este tipo. "
+                    "Siga a rota de tratamento indicada ou procure um Ecoponto.")
+            continue
+        proximos = indice.pontos_proximos(resultado["categoria"], latitude, longitude)
+        mostrar_tabela(
+            proximos[["nome", "camada", "detalhes", "distancia_km"]].rename(columns={
+                "nome": "Ponto",
+                "camada": "Tipo",
+                "detalhes": "Detalhes",
+                "distancia_km": "Distância (km)"
+            }).round({"Distância (km)": 1}),
+            hide_index=True,
             use_container_width=True
         )
-    
-    # Título geral da seção de reciclagem
-    st.header("♻️ A Reciclagem do Isopor®")
-
-    # Etapas da reciclagem
-    st.subheader("🔄 Como o Isopor® é Reciclado: Passo a Passo")
-    st.markdown("""
-    **1. Coleta**  
-    O isopor limpo é recolhido por cooperativas ou coleta seletiva.  
 
-    **2. Triagem**  
-    É separado de outros resíduos nas centrais de triagem.  
+#roteiro com várias paradas para quem leva mais de um tipo de resíduo
+def mostrar_roteiro_entrega():
+    st.header("🗺️ Roteiro de Entrega")
+    st.markdown("Vai levar vários tipos de resíduo? Escolha os tipos e o ponto de partida para montar o caminho mais curto.")
 
-    **3. Trituração**  
-    O material é quebrado em pequenos pedaços para facilitar o processamento.  
+    pontos, planejador = grafo_dados().obter_varios("camada_pontos", "planejador_rotas")
+    origens = origens_disponiveis(pontos)
 
-    **4. Compactação**  
-    Os flocos podem ser compactados em blocos (lingotes), reduzindo o volume.  
-
-    **5. Extrusão**  
-    É derretido e transformado em grânulos de poliestireno reciclado.  
-
-    **6. Reutilização**  
-    Os grânulos são usados para fabricar novos produtos: molduras, vasos, peças de construção etc.  
-    """)
-
-    st.subheader("📍 Lista Completa dos Pontos de Entrega Voluntária (PEVs)")
-
-    # Dados dos pontos
-    pontos_df = pd.DataFrame({
-        'Local': [
-            'Centro - Hercílio Luz x Anita Garibaldi',
-            'Centro - Praça dos Namorados',
-            'Beira-Mar - Mirante',
-            'Parque São Jorge',
-            'Trindade - Praça Gama Rosa',
-            'Coqueiros - Centro de Saúde',
-            'Estreito - Praça N.S. Fátima',
-            'Santa Mônica',
-            'João Paulo',
-            'Jurerê Internacional'
-        ],
-        'Endereço': [
-            'Hercílio Luz esquina com Anita Garibaldi',
-            'Praça dos Namorados, Largo São Sebastião',
-            'Av. Beira-Mar Norte (Mirante)',
-            'Av. Gov. José Boabaid',
-            'Praça da Rua Gama Rosa',
-            'Em frente ao Centro de Saúde de Coqueiros',
-            'Praça Nossa Senhora de Fátima',
-            'Av. Madre Benvenuta (posto policial)',
-            'Rodovia João Paulo, Praça Dr. Fausto Lobo',
-            'Final da Av. dos Búzios (junto ao PEV de Vidro)'
-        ],
-        'Link': [
-            'https://maps.app.goo.gl/1',
-            'https://maps.app.goo.gl/2',
-            'https://maps.app.goo.gl/3',
-            'https://maps.app.goo.gl/4',
-            'https://maps.app.goo.gl/5',
-            'https://maps.app.goo.gl/6',
-            'https://maps.app.goo.gl/7',
-            'https://maps.app.goo.gl/8',
-            'https://maps.app.goo.gl/9',
-            'https://maps.app.goo.gl/10'
-        ]
-    })
-
-    # Mostrar lista com links para Google Maps
-    for _, row in pontos_df.iterrows():
-        st.markdown(f"""
-        **{row['Local']}**  
-        📍 {row['Endereço']}  
-        🔗 [Abrir no Google Maps]({row['Link']})  
-        ---  
-        """)
-
-    # Rodapé
-    st.markdown("""
-    📌 **Fonte:** Prefeitura de Florianópolis – [Recicla+EPS](https://www.pmf.sc.gov.br)  
-    📞 **Dúvidas:** Secretaria de Meio Ambiente – (48) 3212-1650  
-    🕒 **Funcionamento:** Todos os pontos abertos 24h  
-    """)
-# Função: compostagem
-
-def mostrar_compostagem():
-    st.header("🌱 Compostagem como Método Adequado ao Tratamento de Resíduos Sólidos Orgânicos Urbanos")
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        categorias = st.multiselect("Tipos de resíduo:", list(planejador.pontos_por_categoria), key="roteiro_tipos")
+    with col2:
+        origem = st.selectbox("Saindo de:", list(origens), key="roteiro_origem")
 
-    with st.expander("📌 Resumo", expanded=True):
-        st.markdown("""
-        A compostagem da fração orgânica dos resíduos sólidos urbanos é uma solução eficiente, econômica e sustentável, 
-        alinhada à Política Nacional de Resíduos Sólidos (Lei 12.305/2010). Em Florianópolis, o método de **leira estática 
-        com aeração passiva** (Método UFSC) tem demonstrado excelentes resultados, processando cerca de **2 mil toneladas/ano** 
-        de matéria orgânica e gerando composto de alta qualidade para uso em hortas escolares e ajardinamento público.
-        """)
+    if not categorias:
+        return
 
-    st.subheader("✅ Benefícios da Compostagem")
-    st.markdown("""
-    - **Redução de custos**: Economia de R$ 100 mil/ano comparado ao aterro sanitário
-    - **Qualidade do composto**: Rico em nutrientes (carbono, nitrogênio, fósforo) e livre de patógenos
-    - **Sustentabilidade**: Fecha o ciclo dos resíduos, evitando aterrar recursos naturais
-    - **Educação ambiental**: Promove conscientização e participação comunitária
-    """)
+    latitude, longitude = origens[origem]
+    paradas, distancia, trajeto = planejador.planejar(latitude, longitude, categorias)
 
-    st.subheader("🧪 Método UFSC de Compostagem Termofílica")
-    st.markdown("""
-    Desenvolvido pelo **professor Paul Richard Momsen Miller (UFSC)**, o método utiliza:
-    - **Leiras estáticas** (2,5m x 35m x 2m) com camadas de resíduos úmidos (restos de alimentos) e secos (podas trituradas)
-    - **Aeração passiva**: Sem revolvimento mecânico, apenas ventilação natural
-    - **Fases do processo**:
-      1. **Termofílica** (45-75°C): Elimina patógenos e acelera decomposição
-      2. **Maturação** (120 dias): Produz húmus estável e biofertilizante líquido
-    """)
+    st.metric("Distância total", f"{distancia:.1f} km")
+    mostrar_tabela(
+        paradas[["nome", "camada", "atende", "detalhes"]].rename(columns={
+            "nome": "Parada",
+            "camada": "Tipo",
+            "atende": "Entregar",
+            "detalhes": "Detalhes"
+        }),
+        use_container_width=True
+    )
 
-    # Container para as imagens lado a lado
+    mapa = folium.Map(location=[latitude, longitude], zoom_start=12)
+    folium.Marker([latitude, longitude], tooltip=f"Partida: {origem}",
+                  icon=folium.Icon(color="green", icon="home")).add_to(mapa)
+    for ordem, (_, row) in enumerate(paradas.iterrows(), start=1):
+        folium.Marker([row["latitude"], row["longitude"]],
+                      tooltip=f"{ordem}. {row['nome']} – {row['atende']}").add_to(mapa)
+    folium.PolyLine(trajeto, weight=4, color="#1e88e5").add_to(mapa)
+    mostrar_mapa(mapa, "roteiro")
+
+#mapa de calor das áreas mais distantes dos pontos de entrega
+def mostrar_cobertura():
+    st.header("📊 Cobertura dos Pontos de Entrega")
+    st.markdown("Distância de cada trecho da cidade até o ponto de entrega mais próximo. "
+                "As áreas mais escuras são as menos atendidas.")
+
+    pontos = grafo_dados().obter("camada_pontos")
     col1, col2 = st.columns(2)
     with col1:
-        st.image("imagens_residuos/leira.png", 
-                caption="Modelo de leira estática com cobertura vegetal",
-                use_container_width=True)
+        resolucao = st.selectbox("Resolução da grade:", [100, 50, 30],
+                                 format_func=lambda m: f"{m} m", key="cobertura_resolucao")
+    cobertura = cobertura_pontos(pontos, resolucao)
     with col2:
-        st.image("imagens_residuos/metodo_ufsc.png", 
-                caption="Etapas do processo de compostagem – Método UFSC",
-                use_container_width=True)
-
-    st.markdown("""
-    **Locais de aplicação em Florianópolis:**
-    - Campus da UFSC (Pátio de Compostagem)
-    - SESC Cacupé
-    - Fundação Serte
-    - Hortas escolares e comunitárias
-    - Projetos da COMCAP em parceria com a sociedade civil
-    """)
-
-    st.subheader("📊 Dados Relevantes")
-    
-    with st.expander("Composição dos Resíduos no Brasil (ABRELPE, 2012)"):
-        st.table({
-            "Material": ["Matéria Orgânica", "Plásticos", "Papel/Papelão", "Outros"],
-            "Participação (%)": ["51,4", "13,5", "13,1", "22,0"]
-        })
-    
-    st.markdown("""
-    **Florianópolis (2013):**
-    - 11.755 toneladas/ano coletadas seletivamente (7% do total)
-    - 70 mil toneladas/ano de resíduos orgânicos potencialmente compostáveis
-    """)
-
-    st.subheader("💡 Como Implementar na Sua Cidade?")
-    st.markdown("""
-    1. **Segregação na fonte**: Separação doméstica de orgânicos
-    2. **Coleta especializada**: Transporte dedicado para resíduos compostáveis
-    3. **Pátios de compostagem**: Estruturas simples com leiras estáticas
-    4. **Parcerias**: Envolvimento de universidades, ONGs e cooperativas
-    """)
-
-    st.subheader("📚 Materiais Complementares")
-    st.markdown("""
-    - [📘 Manual de Compostagem Doméstica](https://cepagroagroecologia.wordpress.com/minhoca-na-cabeca/) - Cepagro
-    - [📗 Compostagem Comunitária: Passo a Passo](https://compostagemcomunitaria.com.br)
-    - [🎥 Vídeo Educativo: Método UFSC](https://www.youtube.com)
-    - [📄 Política Nacional de Resíduos Sólidos](http://www.planalto.gov.br/ccivil_03/_ato2007-2010/2010/lei/l12305.htm)
-    """)
-
-    st.markdown("---")
-    st.markdown("""
-    *"Compostar é transformar lixo em vida, fechando o ciclo da natureza na cidade."*
-    """)
-    st.markdown("✂️ **Dica prática**: Use serragem ou podas trituradas para equilibrar a umidade nas leiras!")
+        categoria = st.selectbox("Tipo de ponto:", list(cobertura.distancias), key="cobertura_categoria")
 
+    latitudes, longitudes, grade = cobertura.reduzida(categoria)
+    fig = px.imshow(
+        grade, x=longitudes, y=latitudes, origin="lower", aspect="equal",
+        color_continuous_scale="Reds", labels={"color": "km", "x": "Longitude", "y": "Latitude"}
+    )
+    mostrar_grafico(fig, "cobertura", use_container_width=True)
+    st.caption(f"Grade com {cobertura.n_celulas:,} células de {resolucao} m".replace(",", "."))
 
+    st.subheader(f"Bairros com mais área a mais de {DISTANCIA_ADEQUADA_KM:g} km")
+    mostrar_tabela(cobertura.resumo_bairros(categoria), hide_index=True, use_container_width=True)
 
 # coleta seletiva
 def mostrar_coleta_seletiva():
@@ -985,164 +1065,23 @@ def mostrar_coleta_seletiva():
         layout="wide"
     )
 
-    st.title("♻️ Coleta Seletiva em Florianópolis")
-
-    # DICAS DE SEPARAÇÃO
-    st.header("💡 Como Separar Corretamente Seus Resíduos")
-    st.markdown("""
-    Contribua com a coleta seletiva seguindo essas orientações:
-
-    - ✅ **Lave e esvazie** embalagens recicláveis (plástico, metal, vidro, papel).
-    - ✅ **Amasse embalagens** para economizar espaço.
-    - ✅ **Use sacos transparentes** para facilitar a triagem.
-    - ❌ **Não misture lixo orgânico com recicláveis**.
-    - ❌ **Evite papel sujo ou engordurado**.
-    - 🚨 **Vidros quebrados devem ser embalados separadamente**.
-    - ⚠️ **Pilhas, baterias, eletrônicos, lâmpadas e medicamentos** devem ser levados aos ecopontos ou PEVs específicos.
-    """)
+    secoes.coleta_seletiva(st, mostrar_imagem_com_fallback, interativo=mostrar_coleta_interativa)
 
+# Partes interativas da aba Coleta (ficam de fora da exportação estática)
+def mostrar_coleta_interativa():
     st.markdown("---")
-    st.header("📎 Acesse os Links Oficiais da Prefeitura")
-
-    st.markdown("""
-    ### 📄 Informações e Documentos
-
-    - [📘 Coleta Seletiva por Bairros (PDF)](https://www.pmf.sc.gov.br/arquivos/documentos/pdf/26_09_2023_15.26.16.8e205a59c090b98fc50ed49e314c90cc.pdf)
-    - [📙 Coleta Convencional por Bairros (PDF)](https://www.pmf.sc.gov.br/arquivos/documentos/pdf/26_09_2023_15.24.20.a8304eceb7cd33a8b67b1c5b262a3e0d.pdf)
-    - [📚 Mais Informações sobre Coletas (Site da PMF)](https://www.pmf.sc.gov.br/servicos/index.php?pagina=servpagina&id=260)
-    """)
-
-    st.markdown("""
-    ### 🗺️ Mapas Interativos
-
-    - [🗺️ Mapa da Coleta Seletiva por Região (Google Maps)](https://www.google.com/maps/d/u/0/viewer?mid=1O_t7--E4ThnhgLoJChHu2ymi3GtUpjV7&ll=-27.60205956989343%2C-48.49012502589044&z=10)
-    - [🗺️ Mapa da Coleta Convencional (Google Maps)](https://www.google.com/maps/d/u/0/viewer?hl=pt-BR&ll=-27.580450935796346%2C-48.54644372984463&z=12&mid=1tbLrVVv9QGukKekrxpENiylwAbGAmFqn)
-    - [🥬 Mapa da Seletiva Flex - Orgânicos](https://www.google.com/maps/d/viewer?mid=1s5N4nqbBBbJpnE9gQ7Hu14L-1NTfVFDS&ll=-27.59521928888022%2C-48.5046136&z=11)
-    - [🍾 PEVs Exclusivos para Vidro (Google Maps)](https://www.google.com/maps/d/u/0/viewer?mid=1hTeXGy8ckN5BzkIQdAlOdV_b72XNq0s&ll=-27.60189878885822%2C-48.49012502589044&z=10)
-    """)
+    mostrar_onde_descartar()
 
-    st.markdown("""
-    ### 🏠 Ecopontos Oficiais
-
-    - [🏢 Rede de Ecopontos da SMMA - PMF](https://www.pmf.sc.gov.br/entidades/residuos/index.php?cms=ecopontos+da+smma&menu=4&submenuid=150)
-    """)
-
-    st.info("ℹ️ Os links acima são atualizados diretamente pela Prefeitura de Florianópolis (COMCAP / SMMA).")
-
-    # CONTATOS
     st.markdown("---")
-    st.header("📞 Contatos Úteis")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("""
-        **COMCAP - Atendimento Geral**  
-        📞 (48) 3212-1650  
-        📧 comcap@pmf.sc.gov.br  
-        🕒 Segunda a Sexta: 8h às 18h
-        """)
+    mostrar_roteiro_entrega()
 
-    with col2:
-        st.markdown("""
-        **Coleta de Volumosos (agendamento)**  
-        📞 (48) 3216-0202  
-
-        **Emergências Ambientais**  
-        ☎️ 0800 644 1144
-        """)
-
-    # RODAPÉ
     st.markdown("---")
-    st.markdown("""
-    <div style='font-size: 0.9em; color: gray;'>
-        Fonte: <a href="https://www.pmf.sc.gov.br/comcap" target="_blank">Prefeitura de Florianópolis - COMCAP</a><br>
-        Atualizado em Julho/2024 ♻️
-    </div>
-    """, unsafe_allow_html=True)
-
+    mostrar_cobertura()
 
 # Aba: Microplásticos
 
 def mostrar_microplasticos():
-    st.header("🧩 Microplásticos – Um Problema Invisível nos Mares")
-
-    st.markdown("""
-    ### 🔎 O que são microplásticos?
-
-    Microplásticos são fragmentos de plástico com menos de 5 milímetros, muitas vezes invisíveis a olho nu.
-
-    Eles se dividem em dois tipos:
-
-    - **Primários**: fabricados intencionalmente nesse tamanho, como microesferas usadas em cosméticos, pastas de dente e produtos de limpeza.
-    - **Secundários**: formados pela fragmentação de plásticos maiores devido ao sol, chuva, vento, ondas e ação de organismos.
-    """)
-
-    mostrar_imagem_com_fallback("micro.png", IMAGES_MATERIAIS_DIR,
-                              "Tipos e fontes de microplásticos no ambiente marinho", 
-                              (200, 230, 200))
-
-    st.markdown("""
-    ### 🌊 Impacto Ambiental
-
-    Esses fragmentos acabam nos oceanos e podem permanecer por décadas no ambiente, acumulando-se em:
-    - Praias e costas marinhas
-    - Sedimentos oceânicos
-    - Corpos de organismos marinhos
-    - Até na água potável
-
-    ### 🔬 O Papel da Química
-
-    A Química nos permite detectar, identificar e compreender os efeitos dos microplásticos:
-    1. Análise espectroscópica (FTIR, Raman)
-    2. Cromatografia (GC-MS)
-    3. Técnicas de microscopia avançada
-
-    ---
-
-    ### 🐠 Impactos nos oceanos e na vida marinha
-
-    Animais marinhos frequentemente ingerem microplásticos por engano, levando a:
-
-    - Dificuldade de digestão e absorção de nutrientes;
-    - Inflamações e bloqueios intestinais;
-    - Acúmulo de substâncias tóxicas nos tecidos.
-
-     Os efeitos não param por aí: os microplásticos **sobem na cadeia alimentar**, chegando até peixes e frutos do mar consumidos por humanos - um risco silencioso, mas real.
-    ---
-
-    ### 🌍 O caso de Florianópolis
-
-    Com suas mais de 100 praias e alto consumo de frutos do mar, **Florianópolis está diretamente exposta à contaminação por microplásticos.** A limpeza inadequada das praias, o descarte incorreto de lixo e o turismo intenso aumentam o risco da poluição plástica marinha.
-
-    Estudos já identificaram a presença de microplásticos em:
-    - Praias urbanas e remotas da ilha;
-    - Ostras, mexilhões e peixes vendidos em mercados locais;
-    - Sedimentos de rios que deságuam no mar.
-
-    ---
-
-    ### ✅ O que você pode fazer?
-
-    #### Como cidadão:
-    - Evite produtos com microesferas plásticas.
-    - Reduza o uso de plástico descartável.
-    - Participe de limpezas de praia e separe seu lixo corretamente.
-
-    #### Como estudante, professor ou pesquisador:
-    - Incentive a pesquisa sobre alternativas sustentáveis.
-    - Estimule debates nas escolas sobre consumo consciente e química ambiental.
-    - Divulgue ações de preservação dos oceanos e fontes de poluição invisível.
-
-    ---
-
-    ### 📚 Referências
-
-    1. Rezende, L. T. et al. *Microplásticos: ocorrência ambiental e desafios analíticos*. **Química Nova**, 2022. [https://www.scielo.br/j/qn/a/VJ58TBjHVqDZsvWLckcFbTQ](https://www.scielo.br/j/qn/a/VJ58TBjHVqDZsvWLckcFbTQ)
-    2. Dawson, A. L. et al. (2023). *Microplastics: A new contaminant in the environment*. **Frontiers in Environmental Science**, [PMC9914693](https://www.ncbi.nlm.nih.gov/pmc/articles/PMC9914693/)
-    3. ISO/TR 21960:2020. *Plastics Environmental aspects State of knowledge and methodologies*.
-    4. Browne, M. A. et al. (2011). *Accumulation of microplastic on shorelines worldwide: sources and sinks*. **Environmental Science & Technology**.
-    5. NOAA  National Oceanic and Atmospheric Administration (2009). *Microplastics Program Overview*.
-    6. Cózar, A. et al. (2014). *Plastic debris in the open ocean*. **PNAS**.
-    """)
+    secoes.microplasticos(st, mostrar_imagem_com_fallback)
 
 #função coperativas
 def mostrar_cooperativas():
@@ -1152,21 +1091,14 @@ def mostrar_cooperativas():
     As cooperativas de reciclagem em Florianópolis exercem um papel essencial na gestão dos resíduos sólidos urbanos, contribuindo para a sustentabilidade ambiental, inclusão social e geração de trabalho digno para catadores e cooperados. Estas organizações funcionam a partir de princípios democráticos e autogestionários, promovendo o protagonismo dos trabalhadores no processo produtivo e na tomada de decisões.
     """)
     
-    # Caminho corrigido usando a variável global IMAGES_MATERIAIS_DIR
-    caminho_imagem = os.path.join(IMAGES_MATERIAIS_DIR, "copimagem.png")
+    # Imagem resolvida pelo catálogo (acervo.py)
+    caminho_imagem = imagem_secao("cooperativas")
     
     # Verificação robusta com diagnóstico
-    if os.path.exists(caminho_imagem):
-        try:
-            st.image(caminho_imagem, 
-                    caption="Cooperativas de Reciclagem",
-                    width=600)
-        except Exception as e:
-            st.error(f"Erro ao carregar a imagem: {str(e)}")
+    if caminho_imagem:
+        mostrar_imagem_com_fallback("cooperativas", "Cooperativas de Reciclagem", (200, 230, 200), width=600)
     else:
-        st.error(f"Arquivo não encontrado em: {os.path.abspath(caminho_imagem)}")
-        st.warning("Conteúdo da pasta:")
-        st.write(os.listdir(IMAGES_MATERIAIS_DIR))  # Mostra o que há na pasta
+        st.error("Imagem das cooperativas não encontrada (veja o relatório de `python acervo.py`)")
         
     st.markdown("""
     ### Governança e Organização
@@ -1184,7 +1116,7 @@ def mostrar_cooperativas():
     - OLIVEIRA, R. F.; SILVA, M. S. Gestão ambiental e desafios das cooperativas de reciclagem. *Revista Gestão Ambiental*, v. 14, n. 2, p. 115-130, 2021. [Artigo](https://portaldeperiodicos.animaeducacao.com.br/index.php/gestao_ambiental/article/view/3908/3086)
     """)
 
-    df = load_cooperativas()
+    df = grafo_dados().obter("cooperativas")
 
     st.subheader("Cooperativas Cadastradas")
 
@@ -1198,7 +1130,7 @@ def mostrar_cooperativas():
     else:
         df_filtrado = df.copy()
 
-    st.dataframe(
+    mostrar_tabela(
         df_filtrado.rename(columns={
             'nome': 'Cooperativa',
             'endereco': 'Endereço',
@@ -1209,103 +1141,15 @@ def mostrar_cooperativas():
         height=min(400, 45 * len(df_filtrado) + 45)
     )
 def mostrar_plastico_oceanos():
-
-    st.header("🌊 A Crise dos Plásticos nos Oceanos")
-    
-    st.markdown("""
-    ## A Década da Ciência Oceânica para o Desenvolvimento Sustentável (2021-2030)
-    
-    A Organização das Nações Unidas (ONU) declarou o período de 2021 a 2030 como a **Década da Ciência Oceânica**, um esforço global para reverter o declínio da saúde dos oceanos e criar melhores condições para o desenvolvimento sustentável. Entre os principais desafios está o combate à poluição por plásticos, que já atinge níveis alarmantes em todos os oceanos do planeta.
-
-    ### As Ilhas de Plástico: Um Problema Global
-
-    As chamadas "ilhas de plástico" ou "giros oceânicos de plástico" são áreas onde correntes marinhas concentram grandes quantidades de detritos plásticos. A mais conhecida é a **Grande Mancha de Lixo do Pacífico**, localizada entre o Havaí e a Califórnia, com estimativas que variam de 700.000 km² a mais de 15 milhões de km² (cerca de 3 vezes o tamanho da França).
-
-    Características dessas zonas:
-    - 94% dos detritos são microplásticos (partículas menores que 5mm)
-    - Cada km² pode conter até 750.000 fragmentos de plástico
-    - 80% do material vem de fontes terrestres
-    - 20% de atividades marítimas (pesca, navegação)
-
-    ## Impactos no Litoral Catarinense
-
-    Dados científicos recentes mostram que Santa Catarina não está imune a este problema:
-    """)
-    st.markdown("""
-        #### 1. Distribuição de Microplásticos em Praias Urbanas
-        **Autores:** Schmidt, C.; et al.  
-        **Publicação:** *Marine Pollution Bulletin* (2023)  
-        **Amostras:** 48 pontos em 12 praias de Florianópolis  
-        **Resultados:**  
-        - Densidade média de 128 partículas/m²  
-        - 73% fibras têxteis  
-        - Maiores concentrações nas praias de:  
-          • Ingleses (215 partículas/m²)  
-          • Canasvieiras (198 partículas/m²)  
-
-        #### 2. Acúmulo em Organismos Marinhos
-        **Autores:** Ferreira, G.V.B.; et al.  
-        **Publicação:** *Environmental Research* (2022)  
-        **Amostras:** 120 exemplares de tainhas e siris  
-        **Descobertas:**  
-        - 85% dos organismos com microplásticos no trato digestivo  
-        - Média de 4,7 partículas/indivíduo  
-        - Correlação com áreas de desemboque de rios urbanos  
-
-        #### 3. Efeitos em Ecossistemas Costeiros
-        **Autores:** UFSC/Laboratório de Oceanografia Química  
-        **Parceiros:** UNIVALI, EPAGRI  
-        **Métodos:** Análise FTIR e microscopia Raman  
-        **Conclusões:**  
-        - Bioacumulação em cadeias tróficas  
-        - Alterações fisiológicas em moluscos  
-        - Contaminação de áreas de preservação  
-        """)
-
-    st.markdown("""
-    ### Dados Relevantes no Litoral Catarinense
-    """)
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Praia do Campeche", "127 partículas/m³", 
-                 "UFSC/2023")
-        st.metric("Sedimentos (Baía Norte)", "28 partículas/g", 
-                 "Tese Oceanografia/UFSC")
-    with col2:
-        st.metric("Organismos Marinhos", "4,7 partículas/indivíduo", 
-                 "Ferreira et al. 2022")
-        st.metric("Áreas Protegidas", "62% contaminadas", 
-                 "Projeto MAPS/UFSC")
-
-    st.markdown("""
-    ## Referências Científicas da UFSC
-
-    1. **SCHMIDT, C.** et al. (2023). *Spatial distribution of microplastics in urban beaches*. Marine Pollution Bulletin, 186, 114-123.  
-       [DOI:10.1016/j.marpolbul.2022.114123](https://doi.org/10.1016/j.marpolbul.2022.114123)
-
-    2. **FERREIRA, G.V.B.** et al. (2022). *Microplastic contamination in commercial fish from SC*. Environmental Research, 204(1), 112-125.  
-       [DOI:10.1016/j.envres.2021.112125](https://doi.org/10.1016/j.envres.2021.112125)
-
-    3. **UFSC/LABOQUI** (2023). *Relatório Técnico: Microplásticos em Unidades de Conservação*. Projeto MAPS, 156p.  
-       [Disponível no Repositório UFSC](https://repositorio.ufsc.br/handle/123456789/123456)
-
-    ## Como Contribuir?
-
-    - **Participe** das pesquisas através do programa de extensão da UFSC
-    - **Acesse** os dados abertos no Repositório Institucional
-    - **Colabore** com projetos como o MAPS (Monitoramento Ambiental Participativo)
-    """)
-
-    st.markdown("""
-    📍 **Contato para pesquisas:**  
-    Laboratório de Oceanografia Química - UFSC  
-    📧 loq@cfh.ufsc.br | 📞 (48) 3721-1234
-    """)
+    secoes.plastico_oceanos(st, mostrar_imagem_com_fallback)
 # Função principal
 def main():
      # Carrega CSS primeiro
     load_custom_css()
+    # Aquecimento dos caches em segundo plano (já em andamento se o servidor subiu por servidor.py)
+    iniciar_aquecimento(grafo_dados())
+    if PORTA_API:
+        servidor_api()
     
     st.header("Museu do Lixo ♻️ COMCAP Florianópolis")
     st.subheader("Aplicativo para educação ambiental")
@@ -1314,10 +1158,15 @@ def main():
     st.markdown("Curso de Graduação em Química")
     st.markdown("Universidade Federal de Santa Catarina (UFSC)")
     
-    polimeros, residuos = carregar_dados()
-    
-    # Controle de abas (agora com 12 abas)
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12 = st.tabs([
+    # Modo leve (imagens reduzidas, gráficos e mapas sob demanda) e contagem de bytes por aba
+    modo_leve_ativo()
+    st.toggle("📶 Modo leve (economiza dados)", key="modo_leve",
+              help="Imagens menores, sem imagens decorativas; gráficos e mapas só carregam quando você pedir.")
+    orcamento = OrcamentoBytes(st.session_state["modo_leve"])
+    st.session_state["orcamento_bytes"] = orcamento
+
+    # Controle de abas (agora com 13 abas)
+    abas = [
         "🏛️ História", 
         "🧪 Química",
         "🏷️ Plásticos",
@@ -1328,45 +1177,65 @@ def main():
         "🤝 Cooperativas",
         "🌱 Compostagem",
         "🧐 Quiz",
+        "📊 Análises",
         "📚 Atividades",
         "ℹ️ Sobre"
-    ])
+    ]
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12, tab13 = st.tabs(abas)
 
     with tab1:
+        orcamento.secao(abas[0])
         mostrar_historia()
         
     with tab2:
+        orcamento.secao(abas[1])
         mostrar_quimica()
 
     with tab3:
-        mostrar_glossario_polimeros(polimeros)
+        orcamento.secao(abas[2])
+        mostrar_busca_por_foto()
+        mostrar_glossario_polimeros()
+        mostrar_glossario_residuos()
 
     with tab4:
+        orcamento.secao(abas[3])
         mostrar_microplasticos()
         
     with tab5:
+        orcamento.secao(abas[4])
         mostrar_isopor()
         
     with tab6:
+        orcamento.secao(abas[5])
         mostrar_plastico_oceanos()
    
     with tab7:
+        orcamento.secao(abas[6])
         mostrar_coleta_seletiva()
         
     with tab8:
+        orcamento.secao(abas[7])
         mostrar_cooperativas()
         
     with tab9:
+        orcamento.secao(abas[8])
         mostrar_compostagem()
         
     with tab10:
+        orcamento.secao(abas[9])
         mostrar_quiz()
         
     with tab11:
+        orcamento.secao(abas[10])
+        mostrar_analise_quiz()
+
+    with tab12:
+        orcamento.secao(abas[11])
         st.header("📚 Atividades Pedagógicas")
         st.markdown("Sugestões de atividades educativas sobre resíduos e meio ambiente.")
 
-    with tab12:
+    with tab13:
+        orcamento.secao(abas[12])
         st.header("ℹ️ Sobre o Projeto")
         st.markdown("""
         **Glossário Interativo de Resíduos e Polímeros**  
@@ -1376,6 +1245,8 @@ def main():
         """)
         # ... (mantenha o restante do conteúdo da aba Sobre)
 
+    st.caption("📶 Dados enviados por aba (imagens, gráficos, mapas e tabelas): " + orcamento.resumo())
+
 if __name__ == "__main__":
     os.makedirs(IMAGES_MATERIAIS_DIR, exist_ok=True)
     os.makedirs(IMAGES_RESIDUOS_DIR, exist_ok=True)
@@ -0,0 +1,101 @@
+"""
+Aquecimento dos caches quando o servidor sobe.
+
+Depois de um deploy (ou de uma réplica nova), quem chegasse primeiro pagaria
+por ler todas as tabelas, montar os índices e reduzir as imagens. Uma thread
+em segundo plano faz isso antes: constrói todos os artefatos do grafo
+(artefatos.py) e as variantes leves das imagens (modo_leve.py). Enquanto ela
+não termina, a réplica não está pronta: /api/pronto responde 503 e o arquivo
+de MUSEU_ARQUIVO_PRONTO não existe, para o health check do balanceador.
+
+    python servidor.py   # aquece já na subida, antes da primeira sessão
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+from modo_leve import LADO_LEVE, LADO_LEVE_MINIATURA, variante_leve
+
+logger = logging.getLogger(__name__)
+
+# Arquivo criado quando o aquecimento termina (para health checks que olham o disco)
+ARQUIVO_PRONTO = os.environ.get("MUSEU_ARQUIVO_PRONTO", "")
+
+
+class Aquecimento:
+    def __init__(self, grafo, arquivo_pronto=ARQUIVO_PRONTO):
+        self.grafo = grafo
+        self.arquivo_pronto = arquivo_pronto
+        self.pronto = threading.Event()
+        self.etapas = {}  # etapa -> segundos
+        self.erros = {}   # etapa -> mensagem
+        self.inicio = None
+        self.duracao = None
+        self._thread = None
+        # Um arquivo de uma execução anterior não vale para esta
+        if arquivo_pronto and os.path.exists(arquivo_pronto):
+            os.remove(arquivo_pronto)
+
+    def _etapa(self, nome, funcao):
+        inicio = time.perf_counter()
+        try:
+            funcao()
+        except Exception as e:
+            self.erros[nome] = str(e)
+            logger.exception("Erro no aquecimento (%s)", nome)
+        self.etapas[nome] = round(time.perf_counter() - inicio, 3)
+
+    def _imagens(self):
+        """Variantes leves de todas as imagens do catálogo, no tamanho em que o app as pede."""
+        acervo = self.grafo.obter("acervo")
+        for nome, conteudo_hash in acervo.nomes.items():
+            lado = LADO_LEVE_MINIATURA if nome.startswith("polimero/") else LADO_LEVE
+            variante_leve(conteudo_hash, acervo.caminho(nome), lado)
+
+    def executar(self):
+        self.inicio = time.time()
+        inicio = time.perf_counter()
+        # Na ordem de registro: as dependências já estão prontas quando cada artefato é pedido
+        for nome in self.grafo.artefatos:
+            self._etapa(nome, lambda nome=nome: self.grafo.obter(nome))
+        self._etapa("imagens_leves", self._imagens)
+        self.duracao = round(time.perf_counter() - inicio, 3)
+        self.pronto.set()
+        logger.info("Aquecimento concluído em %.1f s%s", self.duracao,
+                    f" ({len(self.erros)} erros)" if self.erros else "")
+        if self.arquivo_pronto:
+            temporario = self.arquivo_pronto + ".tmp"
+            with open(temporario, "w", encoding="utf-8") as f:
+                json.dump(self.estado(), f, ensure_ascii=False)
+            os.replace(temporario, self.arquivo_pronto)
+
+    def iniciar(self):
+        """Roda o aquecimento numa thread (uma só por instância)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.executar, name="aquecimento", daemon=True)
+            self._thread.start()
+        return self
+
+    def estado(self):
+        """Resumo para o health check: pronto, duração total e tempo de cada etapa."""
+        return {
+            "pronto": self.pronto.is_set(),
+            "segundos": self.duracao if self.pronto.is_set() else round(time.time() - (self.inicio or time.time()), 3),
+            "etapas": dict(self.etapas),
+            "erros": dict(self.erros),
+        }
+
+
+_aquecimento = None
+_trava = threading.Lock()
+
+
+def iniciar_aquecimento(grafo):
+    """O aquecimento do processo; a primeira chamada o inicia, as seguintes devolvem o mesmo."""
+    global _aquecimento
+    with _trava:
+        if _aquecimento is None:
+            _aquecimento = Aquecimento(grafo).iniciar()
+        return _aquecimento
@@ -0,0 +1,134 @@
+"""
+Os artefatos derivados dos arquivos de dados, registrados num grafo de
+construção (construcao.py). O app e a API (api.py) montam o grafo com esta
+mesma função, então leem os mesmos arquivos e usam os mesmos índices.
+"""
+import logging
+import os
+import threading
+
+import pandas as pd
+
+from acervo import PASTA_MATERIAIS, PASTAS_IMAGENS, catalogar, nomes_logicos
+from busca_fotos import PASTA_FOTOS_REFERENCIA, construir_indice
+from cenarios_municipio import CAMINHO_PARAMETROS, ler_parametros
+from construcao import GrafoConstrucao, atualizar_miniaturas, gerar_miniaturas, impressao_tabela
+from dados import (COLUNAS_COLETA, DIRETORIO_DADOS, caminho_dados, carregar_coleta, carregar_cooperativas,
+                   ler_perguntas, ler_tabela, pontos_isopor)
+from descarte import construir_indice_descarte
+from facetas import FACETAS_POLIMEROS, FACETAS_RESIDUOS, construir_indice_facetas
+from geo import montar_camada_pontos
+from gerador_perguntas import (CAMINHO_GERADAS, assinatura_tabelas, carregar_perguntas, gerar_perguntas, origem_perguntas,
+                               registros_perguntas, salvar_perguntas)
+from registros_compactos import compactar_perguntas, compactar_pontos
+from rotas import PlanejadorRotas
+from similaridade import calcular_vizinhos
+from somente_leitura import congelar_mapa, congelar_tabela
+
+logger = logging.getLogger(__name__)
+
+
+def _tabela(nome):
+    return congelar_tabela(ler_tabela(caminho_dados(nome)))
+
+
+def _coleta():
+    try:
+        return congelar_tabela(carregar_coleta())
+    except Exception:
+        # Sem os pontos de coleta o mapa e a busca seguem com isopor e cooperativas
+        logger.exception("Erro ao carregar dados de coleta")
+        return congelar_tabela(pd.DataFrame(columns=COLUNAS_COLETA))
+
+
+def _perguntas_geradas(polimeros, residuos):
+    """
+    Perguntas geradas a partir das tabelas. O arquivo só é reaproveitado se foi
+    gerado destas mesmas tabelas; se polimeros.csv ou residuos.csv mudou, as
+    respostas antigas podem estar erradas e o banco é gerado de novo.
+    """
+    origem = assinatura_tabelas(polimeros, residuos)
+    if os.path.isfile(CAMINHO_GERADAS) and origem_perguntas(CAMINHO_GERADAS) == origem:
+        return compactar_perguntas(carregar_perguntas(CAMINHO_GERADAS))
+    perguntas = gerar_perguntas(polimeros, residuos)
+    try:
+        salvar_perguntas(perguntas, CAMINHO_GERADAS, origem)
+    except OSError:
+        pass  # sem permissão de escrita: usa só a versão em memória
+    return compactar_perguntas(registros_perguntas(perguntas))
+
+
+def _quiz_lido():
+    perguntas, avisos = ler_perguntas(caminho_dados("quiz_perguntas.csv"))
+    return compactar_perguntas(perguntas), tuple(avisos)
+
+
+def montar_grafo():
+    """
+    Grafo com todos os artefatos; cada um é construído na primeira vez que for
+    pedido. Tabelas e perguntas ficam congeladas (somente_leitura.py) e em
+    registros compactos (registros_compactos.py): todas as sessões recebem os
+    mesmos objetos, sem cópia.
+    """
+    grafo = GrafoConstrucao()
+    grafo.registrar("polimeros", lambda: _tabela("polimeros.csv"),
+                    fontes=[caminho_dados("polimeros.csv")], impressao=impressao_tabela)
+    grafo.registrar("residuos", lambda: _tabela("residuos.csv"),
+                    fontes=[caminho_dados("residuos.csv")], impressao=impressao_tabela)
+    grafo.registrar("coleta", _coleta, fontes=[caminho_dados("pontos_coleta.csv")], impressao=impressao_tabela)
+    grafo.registrar("cooperativas", lambda: congelar_tabela(carregar_cooperativas()),
+                    fontes=[caminho_dados("cooperativas.csv")] if DIRETORIO_DADOS else [], impressao=impressao_tabela)
+    # Todas as camadas de pontos (coleta, PEVs de isopor e cooperativas) numa tabela só
+    grafo.registrar("camada_pontos",
+                    lambda coleta, cooperativas: congelar_tabela(compactar_pontos(
+                        montar_camada_pontos(coleta, pontos_isopor(), cooperativas))),
+                    depende=["coleta", "cooperativas"], impressao=impressao_tabela)
+
+    grafo.registrar("indice_facetas_polimeros", lambda polimeros: construir_indice_facetas(polimeros, FACETAS_POLIMEROS),
+                    depende=["polimeros"])
+    grafo.registrar("indice_facetas_residuos", lambda residuos: construir_indice_facetas(residuos, FACETAS_RESIDUOS),
+                    depende=["residuos"])
+    # Vizinhos mais parecidos de cada polímero
+    grafo.registrar("vizinhos_polimeros", calcular_vizinhos, depende=["polimeros"])
+    # Índice de busca "onde descartar?"
+    grafo.registrar("indice_descarte", construir_indice_descarte, depende=["residuos", "camada_pontos"])
+    # Matriz de distâncias entre os pontos
+    grafo.registrar("planejador_rotas", PlanejadorRotas, depende=["camada_pontos"])
+    # Números do município para os cenários de desvio do aterro
+    grafo.registrar("parametros_municipio", lambda: congelar_tabela(ler_parametros()),
+                    fontes=[CAMINHO_PARAMETROS], impressao=impressao_tabela)
+    # Catálogo das imagens por conteúdo: nomes lógicos (sigla, seção) -> arquivo, duplicatas e faltantes
+    grafo.registrar("acervo", lambda polimeros: catalogar(nomes_logicos(polimeros)),
+                    fontes=PASTAS_IMAGENS, depende=["polimeros"])
+    # Hashes perceptuais, cor e textura das imagens de referência, para a busca por foto
+    grafo.registrar("indice_fotos", construir_indice, fontes=[PASTA_FOTOS_REFERENCIA], depende=["polimeros", "acervo"])
+    # Miniaturas das imagens do glossário; uma imagem nova ou trocada refaz só a sua miniatura
+    grafo.registrar("miniaturas_materiais", lambda: gerar_miniaturas(PASTA_MATERIAIS),
+                    fontes=[PASTA_MATERIAIS], incremental=atualizar_miniaturas)
+
+    # Perguntas do quiz (escritas à mão e geradas), pelo id
+    grafo.registrar("quiz_lido", _quiz_lido,
+                    fontes=[caminho_dados("quiz_perguntas.csv")])  # (perguntas, avisos)
+    grafo.registrar("quiz", lambda lido: lido[0], depende=["quiz_lido"])
+    grafo.registrar("quiz_gerado", _perguntas_geradas, fontes=[CAMINHO_GERADAS], depende=["polimeros", "residuos"])
+    grafo.registrar("perguntas_por_id", lambda manuais, geradas: congelar_mapa({q["id"]: q for q in manuais + geradas}),
+                    depende=["quiz", "quiz_gerado"])
+    return grafo
+
+
+_grafo = None
+_trava_grafo = threading.Lock()
+
+
+def grafo_processo():
+    """
+    O grafo do processo, com o observador ligado. O app, a API e o aquecimento
+    (aquecimento.py) usam este mesmo grafo, mesmo quando o aquecimento começa
+    antes da primeira sessão do Streamlit.
+    """
+    global _grafo
+    with _trava_grafo:
+        if _grafo is None:
+            _grafo = montar_grafo()
+            _grafo.iniciar_observador()
+        return _grafo
@@ -0,0 +1,227 @@
+"""
+Benchmark de escala: mede carga, busca, filtro, índices e renderização do app
+com os dados sintéticos de dados_sinteticos.py em tamanhos crescentes e
+desenha as curvas (log-log) de tempo por número de linhas.
+
+    python benchmark_escala.py --tamanhos 1000 10000 100000 1000000
+
+O expoente estimado entre os dois maiores tamanhos medidos indica a ordem de
+crescimento (≈1 linear, ≈2 quadrático). Operações cuja próxima medição
+passaria do orçamento de tempo são puladas.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import pyarrow as pa
+
+from cobertura import analisar_cobertura
+from dados import ler_cooperativas, ler_perguntas, ler_pontos_coleta, ler_tabela
+from dados_sinteticos import DIRETORIO_SINTETICOS, gerar_conjunto
+from descarte import construir_indice_descarte
+from estado_url import digest_perguntas, ordem_perguntas
+from facetas import FACETAS_POLIMEROS, FACETAS_RESIDUOS, construir_indice_facetas
+from geo import ISOPOR, MUSEU_COORDENADAS, RECICLAVEIS, VIDRO, montar_camada_pontos
+from gerador_perguntas import gerar_perguntas
+from rotas import PlanejadorRotas
+from similaridade import calcular_vizinhos
+
+DIRETORIO_RESULTADOS = os.path.join(DIRETORIO_SINTETICOS, "resultados")
+
+# Roda o app inteiro (todas as abas) com o AppTest num processo separado,
+# para que as variáveis de ambiente e os caches valham só para aquele tamanho
+_SCRIPT_RENDER = """
+import time
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app!r}, default_timeout=3600)
+inicio = time.perf_counter()
+app.run()
+print(time.perf_counter() - inicio)
+"""
+
+
+def _cronometrar(funcao, repeticoes):
+    """Menor tempo de `repeticoes` execuções (a primeira já diz se vale repetir)."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+        if melhor > 1:
+            break
+    return melhor
+
+
+def _medir_render(diretorio):
+    ambiente = dict(os.environ,
+                    MUSEU_DADOS=diretorio,
+                    MUSEU_QUIZ_GERADO=os.path.join(diretorio, "quiz_gerado.csv"),
+                    MUSEU_BANCO_RESPOSTAS=os.path.join(diretorio, "respostas.db"))
+    app = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    saida = subprocess.run([sys.executable, "-c", _SCRIPT_RENDER.format(app=app)], env=ambiente,
+                           capture_output=True, text=True, check=True)
+    return float(saida.stdout.strip().splitlines()[-1])
+
+
+def operacoes(diretorio):
+    """
+    (conjunto, operação, função) para um diretório de dados sintéticos.
+    As funções de preparo (leituras e índices) são cacheadas para que cada
+    operação meça só o seu próprio custo.
+    """
+    cache = {}
+
+    def preparado(nome, funcao):
+        if nome not in cache:
+            cache[nome] = funcao()
+        return cache[nome]
+
+    caminho = lambda nome: os.path.join(diretorio, nome)
+    polimeros = lambda: preparado("polimeros", lambda: ler_tabela(caminho("polimeros.csv")))
+    residuos = lambda: preparado("residuos", lambda: ler_tabela(caminho("residuos.csv")))
+    coleta = lambda: preparado("coleta", lambda: ler_pontos_coleta(caminho("pontos_coleta.csv")))
+    cooperativas = lambda: preparado("cooperativas", lambda: ler_cooperativas(caminho("cooperativas.csv")))
+    pontos = lambda: preparado("pontos", lambda: montar_camada_pontos(coleta(), pd.DataFrame(), cooperativas()))
+    idx_polimeros = lambda: preparado("idx_polimeros", lambda: construir_indice_facetas(polimeros(), FACETAS_POLIMEROS))
+    idx_residuos = lambda: preparado("idx_residuos", lambda: construir_indice_facetas(residuos(), FACETAS_RESIDUOS))
+    # Resíduos do repositório: o tamanho variável aqui é o de pontos
+    idx_descarte_pontos = lambda: preparado("idx_descarte_pontos", lambda: construir_indice_descarte(ler_tabela("residuos.csv"), pontos()))
+    idx_descarte = lambda: preparado("idx_descarte", lambda: construir_indice_descarte(residuos(), pontos().head(100)))
+    perguntas = lambda: preparado("perguntas", lambda: ler_perguntas(caminho("quiz_perguntas.csv"))[0])
+    latitude, longitude = MUSEU_COORDENADAS
+
+    def ordem_na_url():
+        ids = [q["id"] for q in perguntas()]
+        return digest_perguntas(ids), ordem_perguntas(ids, 42, 20)
+
+    def filtrar(indice, selecoes):
+        base = indice.mascara_busca("")
+        indice.contagens(selecoes, base)
+        return indice.linhas(indice.mascara(selecoes) & base)
+
+    return [
+        ("polímeros", "carregar", lambda: ler_tabela(caminho("polimeros.csv"))),
+        ("polímeros", "índice de facetas", lambda: construir_indice_facetas(polimeros(), FACETAS_POLIMEROS)),
+        ("polímeros", "filtro por faceta", lambda: filtrar(idx_polimeros(), {"Reciclável": ["Sim"], "Tipo de Polimerização": ["Adição"]})),
+        ("polímeros", "busca textual", lambda: idx_polimeros().mascara_busca("etileno")),
+        ("polímeros", "vizinhos similares", lambda: calcular_vizinhos(polimeros())),
+        ("polímeros", "tabela para o navegador", lambda: pa.Table.from_pandas(polimeros())),
+        ("resíduos", "carregar", lambda: ler_tabela(caminho("residuos.csv"))),
+        ("resíduos", "índice de facetas", lambda: construir_indice_facetas(residuos(), FACETAS_RESIDUOS)),
+        ("resíduos", "filtro por faceta", lambda: filtrar(idx_residuos(), {"Tipo de Resíduo": ["Plástico", "Metal"]})),
+        ("resíduos", "busca textual", lambda: idx_residuos().mascara_busca("garrafa")),
+        ("resíduos", "índice onde descartar", lambda: construir_indice_descarte(residuos(), pontos().head(100))),
+        ("resíduos", "busca onde descartar", lambda: idx_descarte().buscar("pilhas usadas")),
+        ("pontos", "carregar", lambda: (ler_pontos_coleta(caminho("pontos_coleta.csv")), ler_cooperativas(caminho("cooperativas.csv")))),
+        ("pontos", "camada de pontos", lambda: montar_camada_pontos(coleta(), pd.DataFrame(), cooperativas())),
+        ("pontos", "pontos próximos", lambda: idx_descarte_pontos().pontos_proximos(RECICLAVEIS, latitude, longitude)),
+        ("pontos", "roteiro de entrega", lambda: PlanejadorRotas(pontos()).planejar(latitude, longitude, [RECICLAVEIS, VIDRO, ISOPOR])),
+        ("pontos", "cobertura (grade 250 m)", lambda: analisar_cobertura(pontos(), 250)),
+        ("quiz", "carregar", lambda: ler_perguntas(caminho("quiz_perguntas.csv"))),
+        ("quiz", "ordem na URL", ordem_na_url),
+        ("quiz", "gerar perguntas", lambda: gerar_perguntas(polimeros(), residuos(), variantes_por_item=1)),
+        ("app", "renderizar todas as abas", lambda: _medir_render(diretorio)),
+    ]
+
+
+def executar(tamanhos, diretorio_base=DIRETORIO_SINTETICOS, orcamento=60.0, repeticoes=3, incluir_render=True):
+    resultados = []
+    historico = {}  # (conjunto, operação) -> [(n, segundos)]
+    for n in sorted(tamanhos):
+        diretorio = os.path.join(diretorio_base, f"n{n}")
+        if not os.path.isfile(os.path.join(diretorio, "quiz_perguntas.csv")):
+            inicio = time.perf_counter()
+            gerar_conjunto(n, diretorio)
+            print(f"[n={n}] dados sintéticos gerados em {time.perf_counter() - inicio:.1f} s")
+
+        for conjunto, operacao, funcao in operacoes(diretorio):
+            if conjunto == "app" and not incluir_render:
+                continue
+            anteriores = historico.setdefault((conjunto, operacao), [])
+            previsto = _prever(anteriores, n)
+            if previsto is not None and previsto > orcamento:
+                print(f"[n={n}] {conjunto} / {operacao}: pulado (previsão {previsto:.0f} s)")
+                resultados.append({"conjunto": conjunto, "operação": operacao, "n": n, "segundos": np.nan})
+                continue
+            try:
+                # A renderização já devolve o próprio tempo (sem contar a subida do processo)
+                segundos = funcao() if conjunto == "app" else _cronometrar(funcao, repeticoes)
+            except Exception as e:
+                print(f"[n={n}] {conjunto} / {operacao}: erro {e!r}")
+                segundos = np.nan
+            else:
+                anteriores.append((n, segundos))
+                print(f"[n={n}] {conjunto} / {operacao}: {segundos * 1000:.1f} ms")
+            resultados.append({"conjunto": conjunto, "operação": operacao, "n": n, "segundos": segundos})
+    return pd.DataFrame(resultados)
+
+
+def _expoente(medidas):
+    """Inclinação log-log entre as duas últimas medições (ignora tempos abaixo de 1 ms, só ruído)."""
+    medidas = [(n, s) for n, s in medidas if s >= 1e-3]
+    if len(medidas) < 2:
+        return None
+    (n1, s1), (n2, s2) = medidas[-2:]
+    return np.log(s2 / s1) / np.log(n2 / n1)
+
+
+def _prever(medidas, n):
+    if not medidas:
+        return None
+    ultimo_n, ultimo_s = medidas[-1]
+    expoente = max(_expoente(medidas) or 1.0, 1.0)
+    return ultimo_s * (n / ultimo_n) ** expoente
+
+
+def resumo(resultados):
+    """Uma linha por operação: maior tamanho medido, tempo e expoente de crescimento."""
+    linhas = []
+    for (conjunto, operacao), grupo in resultados.groupby(["conjunto", "operação"], sort=False):
+        medidas = list(grupo.dropna(subset=["segundos"])[["n", "segundos"]].itertuples(index=False, name=None))
+        if not medidas:
+            continue
+        expoente = _expoente(medidas)
+        linhas.append({
+            "conjunto": conjunto,
+            "operação": operacao,
+            "maior n medido": medidas[-1][0],
+            "segundos": round(medidas[-1][1], 4),
+            "expoente": None if expoente is None else round(expoente, 2),
+            "atenção": "superlinear" if expoente is not None and expoente > 1.3 else "",
+        })
+    return pd.DataFrame(linhas)
+
+
+def figura(resultados):
+    fig = px.line(
+        resultados.dropna(subset=["segundos"]), x="n", y="segundos", color="operação",
+        facet_col="conjunto", facet_col_wrap=3, markers=True, log_x=True, log_y=True,
+        title="Tempo por tamanho dos dados (escala log-log)",
+    )
+    fig.update_yaxes(matches=None, showticklabels=True)
+    return fig
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mede como carga, busca, filtros e renderização escalam com o tamanho dos dados.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--dados", default=DIRETORIO_SINTETICOS, help="pasta dos dados sintéticos (um subdiretório por tamanho)")
+    parser.add_argument("--saida", default=DIRETORIO_RESULTADOS)
+    parser.add_argument("--orcamento", type=float, default=60.0, help="segundos máximos previstos por medição")
+    parser.add_argument("--sem-render", action="store_true", help="não mede a renderização do app completo")
+    args = parser.parse_args()
+
+    resultados = executar(args.tamanhos, args.dados, args.orcamento, incluir_render=not args.sem_render)
+    os.makedirs(args.saida, exist_ok=True)
+    resultados.to_csv(os.path.join(args.saida, "tempos.csv"), index=False)
+    figura(resultados).write_html(os.path.join(args.saida, "curvas.html"), include_plotlyjs="cdn")
+
+    tabela = resumo(resultados)
+    print()
+    print(tabela.to_string(index=False))
+    print(f"\nResultados em {args.saida}/tempos.csv e {args.saida}/curvas.html")
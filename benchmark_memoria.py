@@ -0,0 +1,112 @@
+"""
+Benchmark de memória: quanto ocupam as perguntas do quiz e a camada de
+pontos do mapa em cada formato, com os dados sintéticos de dados_sinteticos.py
+em tamanhos crescentes.
+
+    python benchmark_memoria.py --tamanhos 1000 10000 50000
+
+Compara os formatos anteriores (lista de dicionários, registros congelados,
+camada de pontos com uma string e uma tupla por linha) com os registros
+compactos de registros_compactos.py. A memória é a que continua alocada
+depois de construída a estrutura: a do Python (tracemalloc) mais a do Arrow,
+onde ficam as colunas de texto do pandas.
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+
+import pandas as pd
+import pyarrow as pa
+
+from dados import ler_cooperativas, ler_perguntas, ler_pontos_coleta
+from dados_sinteticos import DIRETORIO_SINTETICOS, gerar_conjunto
+from geo import montar_camada_pontos
+from registros_compactos import compactar_perguntas, compactar_pontos
+from somente_leitura import congelar_registros
+
+DIRETORIO_RESULTADOS = os.path.join(DIRETORIO_SINTETICOS, "resultados")
+
+
+def _memoria(construir):
+    """Bytes que ficam alocados pelo resultado de construir() (os temporários não contam)."""
+    gc.collect()
+    arrow_antes = pa.total_allocated_bytes()
+    tracemalloc.start()
+    try:
+        resultado = construir()
+        gc.collect()
+        python, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return python + pa.total_allocated_bytes() - arrow_antes, resultado
+
+
+def estruturas(diretorio):
+    """(conjunto, estrutura, função que a constrói) para um diretório de dados sintéticos."""
+    caminho = lambda nome: os.path.join(diretorio, nome)
+    coleta = ler_pontos_coleta(caminho("pontos_coleta.csv"))
+    cooperativas = ler_cooperativas(caminho("cooperativas.csv"))
+    perguntas = lambda: ler_perguntas(caminho("quiz_perguntas.csv"))[0]
+    pontos = lambda: montar_camada_pontos(coleta, pd.DataFrame(), cooperativas)
+    return [
+        ("perguntas", "lista de dicionários", perguntas),
+        ("perguntas", "registros congelados", lambda: congelar_registros(perguntas())),
+        ("perguntas", "registros compactos", lambda: compactar_perguntas(perguntas())),
+        ("pontos", "DataFrame", pontos),
+        ("pontos", "DataFrame compacto", lambda: compactar_pontos(pontos())),
+    ]
+
+
+def executar(tamanhos, diretorio_base=DIRETORIO_SINTETICOS):
+    resultados = []
+    for n in sorted(tamanhos):
+        diretorio = os.path.join(diretorio_base, f"n{n}")
+        if not os.path.isfile(os.path.join(diretorio, "quiz_perguntas.csv")):
+            inicio = time.perf_counter()
+            gerar_conjunto(n, diretorio)
+            print(f"[n={n}] dados sintéticos gerados em {time.perf_counter() - inicio:.1f} s")
+
+        for conjunto, estrutura, construir in estruturas(diretorio):
+            memoria, resultado = _memoria(construir)
+            itens = len(resultado)
+            del resultado
+            print(f"[n={n}] {conjunto} / {estrutura}: {memoria / 2**20:.1f} MiB ({memoria / max(itens, 1):.0f} B por item)")
+            resultados.append({"conjunto": conjunto, "estrutura": estrutura, "n": n, "itens": itens,
+                               "bytes": memoria, "bytes por item": round(memoria / max(itens, 1))})
+    return pd.DataFrame(resultados)
+
+
+def resumo(resultados):
+    """Bytes por item no maior tamanho medido e a proporção em relação ao primeiro formato de cada conjunto."""
+    maiores = resultados[resultados["n"] == resultados["n"].max()]
+    linhas = []
+    for conjunto, grupo in maiores.groupby("conjunto", sort=False):
+        base = grupo["bytes"].iloc[0]
+        for linha in grupo.itertuples(index=False):
+            linhas.append({
+                "conjunto": conjunto,
+                "estrutura": linha.estrutura,
+                "itens": linha.itens,
+                "MiB": round(linha.bytes / 2**20, 2),
+                "bytes por item": linha[5],
+                "proporção": round(linha.bytes / base, 2),
+            })
+    return pd.DataFrame(linhas)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara a memória das perguntas e da camada de pontos em cada formato.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dados", default=DIRETORIO_SINTETICOS, help="pasta dos dados sintéticos (um subdiretório por tamanho)")
+    parser.add_argument("--saida", default=DIRETORIO_RESULTADOS)
+    args = parser.parse_args()
+
+    resultados = executar(args.tamanhos, args.dados)
+    os.makedirs(args.saida, exist_ok=True)
+    resultados.to_csv(os.path.join(args.saida, "memoria.csv"), index=False)
+
+    print()
+    print(resumo(resultados).to_string(index=False))
+    print(f"\nResultados em {args.saida}/memoria.csv")
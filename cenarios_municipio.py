@@ -0,0 +1,144 @@
+"""
+Cenários de desvio do aterro para Florianópolis.
+
+Com os números do município (parametros_municipio.csv, MUSEU_PARAMETROS_MUNICIPIO):
+quanto se coleta, quanto é orgânico e reciclável, quanto custa aterrar e
+quantos caminhões vão por dia até o aterro em Biguaçu, calcula o que muda
+com metas de separação na fonte: custo anual, viagens ao aterro, volume
+aterrado e emissões.
+
+Todas as contas são operações de numpy elemento a elemento, então qualquer
+parâmetro pode ser um array. varredura() põe cada parâmetro variado num
+eixo próprio e avalia a grade inteira (o fatorial completo) de uma vez:
+centenas de milhares de combinações em poucos milissegundos.
+
+    python cenarios_municipio.py --meta-organicos 0.5 --meta-reciclaveis 0.6
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+CAMINHO_PARAMETROS = os.environ.get("MUSEU_PARAMETROS_MUNICIPIO", "parametros_municipio.csv")
+
+PARAMETROS_NECESSARIOS = [
+    "total_coletado", "fracao_organicos", "fracao_reciclaveis", "separacao_atual_organicos",
+    "separacao_atual_reciclaveis", "custo_aterro", "custo_compostagem", "custo_reciclagem",
+    "rejeito_compostagem", "rejeito_triagem", "caminhoes_dia", "dias_operacao", "distancia_aterro",
+    "consumo_diesel", "fator_diesel", "densidade_aterro", "fator_aterro_organicos", "fator_aterro_outros",
+    "fator_compostagem", "credito_reciclagem",
+]
+
+# Metas de separação na fonte: fração de cada tipo de resíduo que deixa de ir para o aterro
+METAS = ["meta_organicos", "meta_reciclaveis"]
+
+# Resultados de cada cenário: nome -> (rótulo, unidade)
+RESULTADOS = {
+    "custo": ("Custo anual", "R$/ano"),
+    "viagens_dia": ("Viagens ao aterro por dia", "viagens/dia"),
+    "volume_aterro": ("Volume aterrado", "m³/ano"),
+    "emissoes": ("Emissões", "t CO2e/ano"),
+    "aterrado": ("Resíduos aterrados", "t/ano"),
+}
+
+
+def ler_parametros(caminho=CAMINHO_PARAMETROS):
+    """Tabela parametro;valor;unidade;descricao; falta de algum parâmetro é erro."""
+    tabela = pd.read_csv(caminho, sep=";")
+    faltando = [nome for nome in PARAMETROS_NECESSARIOS if nome not in set(tabela["parametro"])]
+    if faltando:
+        raise ValueError(f"{caminho}: faltam os parâmetros {', '.join(faltando)}")
+    return tabela
+
+
+def valores_parametros(tabela):
+    """Tabela de ler_parametros -> {parâmetro: valor}."""
+    return dict(zip(tabela["parametro"], tabela["valor"].astype(float)))
+
+
+def avaliar(parametros, meta_organicos=None, meta_reciclaveis=None):
+    """
+    Resultados por ano de um cenário (ou de vários: parâmetros e metas podem
+    ser arrays, com broadcasting). Sem metas, vale a separação atual. As
+    viagens partem da carga por caminhão de hoje: o que se aterra com a
+    separação atual dividido pelos caminhões_dia × dias_operacao.
+    """
+    p = parametros
+    total = p["total_coletado"]
+    organicos, reciclaveis = total * p["fracao_organicos"], total * p["fracao_reciclaveis"]
+    meta_organicos = p["separacao_atual_organicos"] if meta_organicos is None else meta_organicos
+    meta_reciclaveis = p["separacao_atual_reciclaveis"] if meta_reciclaveis is None else meta_reciclaveis
+
+    def aterrado_com(meta_org, meta_rec):
+        separados_org, separados_rec = organicos * meta_org, reciclaveis * meta_rec
+        rejeitos = separados_org * p["rejeito_compostagem"] + separados_rec * p["rejeito_triagem"]
+        return separados_org, separados_rec, rejeitos, total - separados_org - separados_rec + rejeitos
+
+    separados_org, separados_rec, rejeitos, aterrado = aterrado_com(meta_organicos, meta_reciclaveis)
+    aterrado_atual = aterrado_com(p["separacao_atual_organicos"], p["separacao_atual_reciclaveis"])[3]
+    carga_viagem = aterrado_atual / (p["caminhoes_dia"] * p["dias_operacao"])
+
+    viagens_dia = aterrado / (carga_viagem * p["dias_operacao"])
+    diesel = viagens_dia * p["dias_operacao"] * 2 * p["distancia_aterro"] * p["consumo_diesel"]
+    organicos_aterrados = organicos - separados_org
+    emissoes = (organicos_aterrados * p["fator_aterro_organicos"]
+                + (aterrado - organicos_aterrados) * p["fator_aterro_outros"]
+                + separados_org * (1 - p["rejeito_compostagem"]) * p["fator_compostagem"]
+                - separados_rec * (1 - p["rejeito_triagem"]) * p["credito_reciclagem"]
+                + diesel * p["fator_diesel"] / 1000)
+    custo = (aterrado * p["custo_aterro"] + separados_org * p["custo_compostagem"]
+             + separados_rec * p["custo_reciclagem"])
+    return {
+        "custo": custo,
+        "viagens_dia": viagens_dia,
+        "volume_aterro": aterrado / p["densidade_aterro"],
+        "emissoes": emissoes,
+        "aterrado": aterrado,
+    }
+
+
+def varredura(parametros, eixos):
+    """
+    Fatorial completo: eixos = {parâmetro ou meta: valores}, na ordem dos
+    eixos do resultado. Retorna {resultado: array len(eixo 1) × len(eixo 2) × ...}.
+    """
+    parametros = dict(parametros)
+    metas = {}
+    for posicao, (nome, valores) in enumerate(eixos.items()):
+        forma = [1] * len(eixos)
+        forma[posicao] = -1
+        valores = np.asarray(valores, dtype=float).reshape(forma)
+        if nome in METAS:
+            metas[nome] = valores
+        elif nome in parametros:
+            parametros[nome] = valores
+        else:
+            raise KeyError(nome)
+    resultados = avaliar(parametros, **metas)
+    forma = tuple(len(valores) for valores in eixos.values())
+    return {nome: np.broadcast_to(valor, forma) for nome, valor in resultados.items()}
+
+
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description="Resultados de metas de separação na fonte para o município.")
+    parser.add_argument("--parametros", default=CAMINHO_PARAMETROS)
+    parser.add_argument("--meta-organicos", type=float, default=0.5)
+    parser.add_argument("--meta-reciclaveis", type=float, default=0.5)
+    args = parser.parse_args()
+
+    parametros = valores_parametros(ler_parametros(args.parametros))
+    atual = avaliar(parametros)
+    cenario = avaliar(parametros, args.meta_organicos, args.meta_reciclaveis)
+    for nome, (rotulo, unidade) in RESULTADOS.items():
+        print(f"{rotulo}: {atual[nome]:,.1f} -> {cenario[nome]:,.1f} {unidade}")
+
+    eixos = {"meta_organicos": np.linspace(0, 1, 101), "meta_reciclaveis": np.linspace(0, 1, 101),
+             "custo_aterro": parametros["custo_aterro"] * np.linspace(0.5, 1.5, 21),
+             "fator_aterro_organicos": parametros["fator_aterro_organicos"] * np.linspace(0.5, 1.5, 5)}
+    inicio = time.perf_counter()
+    grade = varredura(parametros, eixos)
+    combinacoes = np.prod([len(valores) for valores in eixos.values()])
+    print(f"Varredura com {combinacoes:,} combinações em {1000 * (time.perf_counter() - inicio):.0f} ms")
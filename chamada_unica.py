@@ -0,0 +1,83 @@
+"""
+Uma computação por chave, por mais que muitas threads peçam ao mesmo tempo.
+
+Quando uma turma inteira abre o app junto numa réplica fria, cada sessão
+(uma thread do Streamlit) erra o mesmo cache no mesmo instante. Com
+ChamadaUnica a primeira thread calcula e as outras esperam por aquele mesmo
+cálculo: recebem o mesmo valor ou a mesma exceção. Quem espera demais
+desiste com TimeoutError. As métricas contam os cálculos repetidos evitados.
+"""
+import os
+import threading
+
+# Segundos que uma thread espera pelo cálculo de outra antes de desistir
+TEMPO_LIMITE = float(os.environ.get("MUSEU_TEMPO_LIMITE_CARGA", "60"))
+
+_instancias = []
+_trava_instancias = threading.Lock()
+
+
+class _Voo:
+    def __init__(self):
+        self.feito = threading.Event()
+        self.valor = None
+        self.erro = None
+
+
+class ChamadaUnica:
+    def __init__(self, nome):
+        self.nome = nome
+        self.calculos = 0         # computações de fato executadas
+        self.coalescidas = 0      # pedidos que esperaram uma computação em andamento em vez de repeti-la
+        self.erros = 0
+        self.tempos_esgotados = 0
+        self._em_andamento = {}   # chave -> _Voo
+        self._trava = threading.Lock()
+        with _trava_instancias:
+            _instancias.append(self)
+
+    def executar(self, chave, funcao, tempo_limite=TEMPO_LIMITE):
+        with self._trava:
+            voo = self._em_andamento.get(chave)
+            lider = voo is None
+            if lider:
+                voo = self._em_andamento[chave] = _Voo()
+                self.calculos += 1
+            else:
+                self.coalescidas += 1
+
+        if lider:
+            try:
+                voo.valor = funcao()
+            except Exception as e:
+                voo.erro = e
+                with self._trava:
+                    self.erros += 1
+            finally:
+                with self._trava:
+                    del self._em_andamento[chave]
+                voo.feito.set()
+        elif not voo.feito.wait(tempo_limite):
+            with self._trava:
+                self.tempos_esgotados += 1
+            raise TimeoutError(f"{self.nome}: {chave!r} ainda em cálculo depois de {tempo_limite:g} s")
+
+        if voo.erro is not None:
+            raise voo.erro
+        return voo.valor
+
+    def metricas(self):
+        return {"calculos": self.calculos, "coalescidas": self.coalescidas,
+                "erros": self.erros, "tempos_esgotados": self.tempos_esgotados}
+
+
+def metricas():
+    """Métricas de todas as instâncias do processo, somadas por nome."""
+    totais = {}
+    with _trava_instancias:
+        instancias = list(_instancias)
+    for instancia in instancias:
+        soma = totais.setdefault(instancia.nome, dict.fromkeys(instancia.metricas(), 0))
+        for campo, valor in instancia.metricas().items():
+            soma[campo] += valor
+    return totais
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from geo import RAIO_TERRA_KM
+
+# Retângulo que envolve a Ilha de Santa Catarina e a parte continental de Florianópolis
+LIMITES_FLORIANOPOLIS = {"lat_min": -27.85, "lat_max": -27.37, "lon_min": -48.62, "lon_max": -48.35}
+
+# Células a mais de RAIO_URBANO_KM do centro de qualquer bairro são tratadas como mar/área não habitada
+RAIO_URBANO_KM = 2.5
+
+# Distância a partir da qual uma célula é considerada mal atendida
+DISTANCIA_ADEQUADA_KM = 1.0
+
+KM_POR_GRAU = np.pi * RAIO_TERRA_KM / 180
+
+
+def _projetar(lat, lon, lat_ref):
+    """Projeção equirretangular local em km (erro desprezível na escala da cidade)."""
+    x = np.asarray(lon, dtype=float) * KM_POR_GRAU * np.cos(np.radians(lat_ref))
+    y = np.asarray(lat, dtype=float) * KM_POR_GRAU
+    return x, y
+
+
+def mais_proximo_em_grade(xs, ys, px, py, bloco=64):
+    """
+    Distância (km) e índice do ponto mais próximo para cada célula da grade xs × ys.
+    A grade é processada em blocos; para cada bloco só entram os pontos que podem
+    ser os mais próximos de alguma célula (desigualdade triangular a partir do centro
+    do bloco), o que mantém o custo baixo mesmo com milhares de pontos.
+    """
+    ny, nx = len(ys), len(xs)
+    distancias = np.empty((ny, nx), dtype=np.float32)
+    indices = np.empty((ny, nx), dtype=np.int32)
+    px = np.asarray(px, dtype=np.float64)
+    py = np.asarray(py, dtype=np.float64)
+    if len(px) == 0:
+        distancias.fill(np.inf)
+        indices.fill(-1)
+        return distancias, indices
+
+    for i0 in range(0, ny, bloco):
+        bloco_y = ys[i0:i0 + bloco]
+        for j0 in range(0, nx, bloco):
+            bloco_x = xs[j0:j0 + bloco]
+            cx, cy = (bloco_x[0] + bloco_x[-1]) / 2, (bloco_y[0] + bloco_y[-1]) / 2
+            meia_diagonal = np.hypot(bloco_x[-1] - bloco_x[0], bloco_y[-1] - bloco_y[0]) / 2
+            ate_centro = np.hypot(px - cx, py - cy)
+            candidatos = np.flatnonzero(ate_centro <= ate_centro.min() + 2 * meia_diagonal)
+
+            dist2 = ((bloco_x[None, :, None] - px[candidatos]) ** 2
+                     + (bloco_y[:, None, None] - py[candidatos]) ** 2)
+            melhor = dist2.argmin(axis=2)
+            distancias[i0:i0 + bloco, j0:j0 + bloco] = np.sqrt(np.take_along_axis(dist2, melhor[..., None], axis=2)[..., 0])
+            indices[i0:i0 + bloco, j0:j0 + bloco] = candidatos[melhor]
+
+    return distancias, indices
+
+
+class Cobertura:
+    """Grade com a distância ao ponto mais próximo de cada categoria e o bairro de cada célula."""
+
+    def __init__(self, latitudes, longitudes, distancias, bairros, indice_bairro, urbana):
+        self.latitudes = latitudes        # eixo y da grade (centro das células)
+        self.longitudes = longitudes      # eixo x da grade
+        self.distancias = distancias      # categoria -> float32 (ny, nx) em km
+        self.bairros = bairros            # nomes dos bairros
+        self.indice_bairro = indice_bairro
+        self.urbana = urbana              # máscara das células consideradas habitadas
+
+    @property
+    def n_celulas(self):
+        return self.urbana.size
+
+    def resumo_bairros(self, categoria):
+        """Distância média/máxima e percentual de células mal atendidas por bairro."""
+        distancia = self.distancias[categoria][self.urbana]
+        bairro = self.indice_bairro[self.urbana]
+        n = len(self.bairros)
+        celulas = np.bincount(bairro, minlength=n)
+        soma = np.bincount(bairro, weights=distancia, minlength=n)
+        maxima = np.zeros(n)
+        np.maximum.at(maxima, bairro, distancia)
+        longe = np.bincount(bairro, weights=distancia > DISTANCIA_ADEQUADA_KM, minlength=n)
+
+        com_celulas = celulas > 0
+        resumo = pd.DataFrame({
+            "Bairro": np.asarray(self.bairros)[com_celulas],
+            "Distância média (km)": soma[com_celulas] / celulas[com_celulas],
+            "Distância máxima (km)": maxima[com_celulas],
+            f"Área a mais de {DISTANCIA_ADEQUADA_KM:g} km (%)": 100 * longe[com_celulas] / celulas[com_celulas],
+        })
+        return resumo.sort_values("Distância média (km)", ascending=False).round(2).reset_index(drop=True)
+
+    def reduzida(self, categoria, max_lado=400):
+        """Grade reamostrada (para desenhar o mapa de calor sem enviar milhões de células)."""
+        passo = max(1, int(np.ceil(max(self.urbana.shape) / max_lado)))
+        grade = np.where(self.urbana, self.distancias[categoria], np.nan)[::passo, ::passo]
+        return self.latitudes[::passo], self.longitudes[::passo], grade
+
+
+def analisar_cobertura(pontos: pd.DataFrame, resolucao_m=100, limites=LIMITES_FLORIANOPOLIS):
+    """Rasteriza a cidade numa grade de resolucao_m metros e mede a cobertura de cada categoria."""
+    lat_ref = (limites["lat_min"] + limites["lat_max"]) / 2
+    passo_lat = resolucao_m / 1000 / KM_POR_GRAU
+    passo_lon = passo_lat / np.cos(np.radians(lat_ref))
+    latitudes = np.arange(limites["lat_min"] + passo_lat / 2, limites["lat_max"], passo_lat)
+    longitudes = np.arange(limites["lon_min"] + passo_lon / 2, limites["lon_max"], passo_lon)
+    xs, _ = _projetar(lat_ref, longitudes, lat_ref)
+    _, ys = _projetar(latitudes, 0.0, lat_ref)
+
+    px, py = _projetar(pontos["latitude"].to_numpy(), pontos["longitude"].to_numpy(), lat_ref)
+    categorias = sorted({c for aceita in pontos["aceita"] for c in aceita})
+    distancias = {}
+    for categoria in categorias:
+        selecao = pontos["aceita"].map(lambda aceita: categoria in aceita).to_numpy()
+        distancias[categoria], _ = mais_proximo_em_grade(xs, ys, px[selecao], py[selecao])
+
+    # Os pontos de coleta seletiva marcam o centro de cada bairro atendido
+    bairros = pontos[pontos["camada"] == "Coleta seletiva"].drop_duplicates("nome")
+    if bairros.empty:
+        forma = (len(latitudes), len(longitudes))
+        return Cobertura(latitudes, longitudes, distancias, ["Florianópolis"],
+                         np.zeros(forma, dtype=np.int32), np.ones(forma, dtype=bool))
+    bx, by = _projetar(bairros["latitude"].to_numpy(), bairros["longitude"].to_numpy(), lat_ref)
+    ate_bairro, indice_bairro = mais_proximo_em_grade(xs, ys, bx, by)
+
+    return Cobertura(latitudes, longitudes, distancias, bairros["nome"].tolist(),
+                     indice_bairro, ate_bairro <= RAIO_URBANO_KM)
@@ -0,0 +1,200 @@
+"""
+Simulador da leira estática com aeração passiva (Método UFSC).
+
+Modelo didático, de balanço de massa e energia por kg de mistura úmida:
+a matéria orgânica degradável é consumida com cinética de primeira ordem,
+com a taxa modulada pela temperatura (modelo de temperaturas cardeais), pela
+umidade, pela relação C/N e pela aeração passiva, que cai com a altura da
+leira. O calor da degradação aquece a leira; as perdas pela superfície e
+pelo ar que atravessa a leira (parte delas evaporando água) a esfriam. Daí
+saem a temperatura, a umidade, a relação C/N e a perda de massa dia a dia.
+
+Todos os parâmetros aceitam arrays (com broadcasting): cada posição é um
+cenário, e todos avançam juntos no tempo, o que deixa varreduras de centenas
+de cenários (altura da leira × proporção de carbono, por exemplo) em poucos
+milissegundos.
+
+    python compostagem.py --fonte "Podas trituradas" --proporcao 1.0 --altura 2.0
+"""
+import argparse
+
+import numpy as np
+
+# Por material: umidade (fração da massa úmida), carbono e fração degradável (da massa seca) e relação C/N
+MATERIAIS = {
+    "Restos de alimentos": {"umidade": 0.80, "carbono": 0.46, "degradavel": 0.80, "cn": 15.0},
+    "Podas trituradas": {"umidade": 0.40, "carbono": 0.50, "degradavel": 0.45, "cn": 60.0},
+    "Serragem": {"umidade": 0.15, "carbono": 0.52, "degradavel": 0.25, "cn": 300.0},
+    "Palha": {"umidade": 0.12, "carbono": 0.47, "degradavel": 0.55, "cn": 80.0},
+}
+RESIDUO_UMIDO = "Restos de alimentos"
+FONTES_CARBONO = [nome for nome in MATERIAIS if nome != RESIDUO_UMIDO]
+
+# Leira do Método UFSC: 2,5 m de base por 2 m de altura (seção triangular)
+LARGURA_UFSC = 2.5
+ALTURA_UFSC = 2.0
+DIAS_UFSC = 180  # fase ativa + 120 dias de maturação
+
+TEMPERATURA_TERMOFILICA = 45.0
+TEMPERATURA_HIGIENIZACAO = 55.0
+
+# Cinética e energia (valores típicos da literatura de compostagem, ajustados para a leira estática)
+TAXA_MAXIMA = 0.08            # 1/dia, nas condições ótimas
+T_MINIMA, T_OTIMA, T_MAXIMA = 5.0, 58.0, 80.0
+UMIDADE_OTIMA = 0.55
+CN_OTIMA = 30.0
+CALOR_DEGRADACAO = 14e6       # J por kg de matéria seca degradada
+CALOR_ESPECIFICO = 2.8e3      # J/(kg·K) da mistura úmida
+CALOR_VAPORIZACAO = 2.26e6    # J/kg
+DENSIDADE = 600.0             # kg/m³, mistura úmida
+COEFICIENTE_SUPERFICIE = 2.0  # W/(m²·K)
+COEFICIENTE_AERACAO = 0.012    # W/(kg·K) trocados com o ar que entra pela aeração passiva
+ALTURA_AERACAO = 2.6          # m: acima disso o ar quase não chega ao miolo
+FRACAO_EVAPORACAO = 0.6       # das perdas pelo ar, a parte que sai como vapor
+AGUA_METABOLICA = 0.55        # kg de água formada por kg degradado
+PERDA_NITROGENIO = 0.15       # N volatilizado por unidade de C perdido, relativo à relação N/C atual
+SEGUNDOS_DIA = 86400.0
+
+
+def mistura(fonte_carbono, proporcao):
+    """
+    Estado inicial por kg de mistura úmida com `proporcao` kg da fonte de
+    carbono para cada kg de restos de alimentos: água, massa seca,
+    degradável, carbono e nitrogênio (kg).
+    """
+    proporcao = np.asarray(proporcao, dtype=float)
+    partes = {RESIDUO_UMIDO: 1 / (1 + proporcao), fonte_carbono: proporcao / (1 + proporcao)}
+    estado = dict.fromkeys(["agua", "seca", "degradavel", "carbono", "nitrogenio"], 0.0)
+    for nome, fracao in partes.items():
+        material = MATERIAIS[nome]
+        seca = fracao * (1 - material["umidade"])
+        estado["agua"] = estado["agua"] + fracao * material["umidade"]
+        estado["seca"] = estado["seca"] + seca
+        estado["degradavel"] = estado["degradavel"] + seca * material["degradavel"]
+        estado["carbono"] = estado["carbono"] + seca * material["carbono"]
+        estado["nitrogenio"] = estado["nitrogenio"] + seca * material["carbono"] / material["cn"]
+    return estado
+
+
+def superficie_por_volume(altura, largura):
+    """m²/m³ de uma leira de seção triangular (as pontas são desprezadas)."""
+    lateral = np.hypot(largura / 2, altura)
+    return 2 * lateral / (largura * altura / 2)
+
+
+def _fator_temperatura(t):
+    """Modelo de temperaturas cardeais (Rosso): 0 fora de [mínima, máxima], 1 na ótima."""
+    t = np.clip(t, T_MINIMA, T_MAXIMA)
+    numerador = (t - T_MAXIMA) * (t - T_MINIMA) ** 2
+    denominador = (T_OTIMA - T_MINIMA) * ((T_OTIMA - T_MINIMA) * (t - T_OTIMA)
+                                          - (T_OTIMA - T_MAXIMA) * (T_OTIMA + T_MINIMA - 2 * t))
+    return np.clip(numerador / denominador, 0, 1)
+
+
+def _fator_umidade(umidade):
+    return np.exp(-((umidade - UMIDADE_OTIMA) / 0.15) ** 2)
+
+
+def _fator_cn(cn):
+    return np.exp(-(np.log(cn / CN_OTIMA) / 0.8) ** 2)
+
+
+def simular(proporcao, altura=ALTURA_UFSC, largura=LARGURA_UFSC, fonte_carbono="Podas trituradas",
+            temperatura_ambiente=22.0, dias=DIAS_UFSC, passos_por_dia=4):
+    """
+    Evolução diária de cada cenário. proporcao, altura, largura e
+    temperatura_ambiente podem ser arrays (com broadcasting entre si).
+    Retorna arrays (cenários × dias + 1): temperatura (°C), umidade
+    (fração), cn, perda_massa (fração da massa inicial), e "dias".
+    """
+    proporcao, altura, largura, temperatura_ambiente = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (proporcao, altura, largura, temperatura_ambiente)))
+    estado = {nome: np.broadcast_to(valor, proporcao.shape).copy()
+              for nome, valor in mistura(fonte_carbono, proporcao).items()}
+    agua, seca, degradavel, carbono, nitrogenio = (estado[n] for n in ("agua", "seca", "degradavel", "carbono", "nitrogenio"))
+    carbono_degradado_por_kg = carbono / seca  # C que sai como CO2 por kg degradado
+    temperatura = temperatura_ambiente.copy()
+
+    aeracao = 1 / (1 + (altura / ALTURA_AERACAO) ** 3)
+    # Perdas de calor (J por kg, por dia e por K): superfície + ar da aeração passiva
+    perda_superficie = COEFICIENTE_SUPERFICIE * superficie_por_volume(altura, largura) / DENSIDADE * SEGUNDOS_DIA
+    perda_ar = COEFICIENTE_AERACAO * aeracao * SEGUNDOS_DIA
+    dt = 1 / passos_por_dia
+
+    historico = {nome: np.empty(proporcao.shape + (dias + 1,)) for nome in ("temperatura", "umidade", "cn", "perda_massa")}
+
+    def registrar(dia):
+        historico["temperatura"][..., dia] = temperatura
+        historico["umidade"][..., dia] = agua / (agua + seca)
+        historico["cn"][..., dia] = carbono / nitrogenio
+        historico["perda_massa"][..., dia] = 1 - (agua + seca)
+
+    registrar(0)
+    for dia in range(1, dias + 1):
+        for _ in range(passos_por_dia):
+            umidade = agua / (agua + seca)
+            taxa = (TAXA_MAXIMA * _fator_temperatura(temperatura) * _fator_umidade(umidade)
+                    * _fator_cn(carbono / nitrogenio) * (0.3 + 0.7 * aeracao))
+            degradado = np.minimum(taxa * degradavel * dt, degradavel)
+
+            excesso = temperatura - temperatura_ambiente
+            calor_ar = perda_ar * excesso * dt
+            calor = degradado * CALOR_DEGRADACAO - perda_superficie * excesso * dt - calor_ar
+            evaporada = np.minimum(np.maximum(calor_ar, 0) * FRACAO_EVAPORACAO / CALOR_VAPORIZACAO, agua * 0.5)
+
+            carbono_perdido = degradado * carbono_degradado_por_kg
+            nitrogenio -= PERDA_NITROGENIO * carbono_perdido * nitrogenio / carbono
+            carbono -= carbono_perdido
+            degradavel -= degradado
+            seca -= degradado
+            agua += degradado * AGUA_METABOLICA - evaporada
+            temperatura += calor / (CALOR_ESPECIFICO * (agua + seca))
+        registrar(dia)
+
+    historico["dias"] = np.arange(dias + 1)
+    return historico
+
+
+def indicadores(historico):
+    """Resumo de cada cenário: pico e dias na fase termofílica, higienização, perda de massa, umidade e C/N finais."""
+    temperatura = historico["temperatura"]
+    return {
+        "temperatura_maxima": temperatura.max(axis=-1),
+        "dia_pico": temperatura.argmax(axis=-1),
+        "dias_termofilicos": (temperatura >= TEMPERATURA_TERMOFILICA).sum(axis=-1),
+        "dias_higienizacao": (temperatura >= TEMPERATURA_HIGIENIZACAO).sum(axis=-1),
+        "perda_massa": historico["perda_massa"][..., -1],
+        "umidade_final": historico["umidade"][..., -1],
+        "cn_inicial": historico["cn"][..., 0],
+        "cn_final": historico["cn"][..., -1],
+    }
+
+
+def varredura(alturas, proporcoes, **parametros):
+    """Indicadores na grade altura × proporção (arrays len(alturas) × len(proporcoes))."""
+    alturas = np.asarray(alturas, dtype=float)[:, None]
+    proporcoes = np.asarray(proporcoes, dtype=float)[None, :]
+    return indicadores(simular(proporcoes, altura=alturas, **parametros))
+
+
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description="Simula uma leira estática (Método UFSC).")
+    parser.add_argument("--fonte", choices=FONTES_CARBONO, default="Podas trituradas")
+    parser.add_argument("--proporcao", type=float, default=1.0, help="kg da fonte de carbono por kg de restos de alimentos")
+    parser.add_argument("--altura", type=float, default=ALTURA_UFSC)
+    parser.add_argument("--largura", type=float, default=LARGURA_UFSC)
+    parser.add_argument("--ambiente", type=float, default=22.0, help="temperatura ambiente (°C)")
+    args = parser.parse_args()
+
+    resultado = simular(args.proporcao, args.altura, args.largura, args.fonte, args.ambiente)
+    for nome, valor in indicadores(resultado).items():
+        print(f"{nome}: {valor[0]:.2f}")
+    for dia in (0, 3, 7, 14, 30, 60, 90, 120, 180):
+        print(f"dia {dia:3d}: {resultado['temperatura'][0, dia]:5.1f} °C, umidade {resultado['umidade'][0, dia]:.0%}, "
+              f"C/N {resultado['cn'][0, dia]:.1f}, perda {resultado['perda_massa'][0, dia]:.0%}")
+
+    inicio = time.perf_counter()
+    grade = varredura(np.linspace(0.5, 3.0, 20), np.linspace(0.2, 3.0, 20), fonte_carbono=args.fonte)
+    print(f"Varredura 20 × 20 em {1000 * (time.perf_counter() - inicio):.0f} ms")
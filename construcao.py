@@ -0,0 +1,236 @@
+"""
+Grafo de construção dos artefatos derivados dos arquivos de dados.
+
+Cada artefato (tabelas, índices de busca, vizinhos similares, camada do mapa,
+miniaturas...) declara de quais arquivos e de quais outros artefatos depende.
+Quando um arquivo muda, só o que depende dele é reconstruído, em ordem
+topológica, e todos os valores novos entram de uma vez: quem está lendo
+continua com a versão anterior até a nova estar inteira pronta.
+"""
+import io
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+from PIL import Image
+
+from chamada_unica import TEMPO_LIMITE, ChamadaUnica
+
+logger = logging.getLogger(__name__)
+
+# Lado maior das miniaturas das imagens (px)
+TAMANHO_MINIATURA = 300
+
+# Segundos entre duas verificações dos arquivos pelo observador
+INTERVALO_OBSERVADOR = float(os.environ.get("MUSEU_INTERVALO_OBSERVADOR", "2"))
+
+
+def impressao_tabela(df: pd.DataFrame):
+    """Hash de cada linha: mostra quais linhas mudaram entre duas leituras do arquivo."""
+    return tuple(pd.util.hash_pandas_object(df, index=False).tolist()) + (tuple(df.columns),)
+
+
+def _assinatura(caminho):
+    """(mtime, tamanho) de cada arquivo; uma pasta vale pelos arquivos dentro dela."""
+    if os.path.isdir(caminho):
+        with os.scandir(caminho) as entradas:
+            return {entrada.path: (entrada.stat().st_mtime_ns, entrada.stat().st_size)
+                    for entrada in entradas if entrada.is_file()}
+    try:
+        estado = os.stat(caminho)
+    except OSError:
+        return {}
+    return {caminho: (estado.st_mtime_ns, estado.st_size)}
+
+
+def miniatura(caminho, tamanho=TAMANHO_MINIATURA):
+    """PNG reduzido de uma imagem; None se o arquivo não puder ser lido."""
+    try:
+        with Image.open(caminho) as img:
+            img.thumbnail((tamanho, tamanho))
+            saida = io.BytesIO()
+            img.save(saida, format="PNG")
+    except OSError:
+        return None
+    return saida.getvalue()
+
+
+def gerar_miniaturas(pasta):
+    """nome do arquivo -> miniatura, para todas as imagens da pasta."""
+    if not os.path.isdir(pasta):
+        return {}
+    return atualizar_miniaturas({}, [os.path.join(pasta, nome) for nome in os.listdir(pasta)])
+
+
+def atualizar_miniaturas(anteriores, arquivos):
+    """Refaz só as miniaturas dos arquivos alterados (e tira as dos apagados)."""
+    miniaturas = dict(anteriores)
+    for caminho in arquivos:
+        nome = os.path.basename(caminho)
+        imagem = miniatura(caminho) if os.path.isfile(caminho) else None
+        if imagem is None:
+            miniaturas.pop(nome, None)
+        else:
+            miniaturas[nome] = imagem
+    return miniaturas
+
+
+class Artefato:
+    def __init__(self, nome, funcao, fontes, depende, incremental, impressao):
+        self.nome = nome
+        self.funcao = funcao            # funcao(*valores das dependências) -> valor
+        self.fontes = fontes            # arquivos ou pastas lidos pela função
+        self.depende = depende          # nomes de outros artefatos
+        self.incremental = incremental  # incremental(valor_anterior, arquivos_alterados) -> valor novo
+        self.impressao = impressao      # valor -> algo comparável; igual à anterior = nada mudou
+
+
+class GrafoConstrucao:
+    """
+    Os valores prontos ficam num dicionário que nunca é alterado no lugar: uma
+    atualização monta um dicionário novo e troca a referência. Leituras de
+    artefatos já construídos não esperam por nenhuma trava.
+    """
+
+    def __init__(self):
+        self.artefatos = {}
+        self.versao = 0
+        self.erros = {}  # artefato -> última falha ao reconstruir (o valor anterior continua valendo)
+        self._valores = {}
+        self._impressoes = {}
+        self._assinaturas = {}
+        self._trava = threading.RLock()
+        self._voo = ChamadaUnica("grafo")  # sessões pedindo o mesmo artefato frio esperam uma construção só
+        self._thread = None
+
+    def registrar(self, nome, funcao, fontes=(), depende=(), incremental=None, impressao=None):
+        faltando = [d for d in depende if d not in self.artefatos]
+        if faltando:
+            raise ValueError(f"{nome} depende de artefatos não registrados: {', '.join(faltando)}")
+        self.artefatos[nome] = Artefato(nome, funcao, [os.path.abspath(f) for f in fontes],
+                                        list(depende), incremental, impressao)
+        for fonte in self.artefatos[nome].fontes:
+            self._assinaturas.setdefault(fonte, _assinatura(fonte))
+
+    def obter(self, nome):
+        valores = self._valores
+        if nome in valores:
+            return valores[nome]
+        return self.obter_varios(nome)[0]
+
+    def obter_varios(self, *nomes, tempo_limite=TEMPO_LIMITE):
+        """Vários artefatos da mesma versão (ex.: uma tabela e o índice montado sobre ela)."""
+        valores = self._valores
+        if all(nome in valores for nome in nomes):
+            return tuple(valores[nome] for nome in nomes)
+        for nome in nomes:
+            if nome not in self._valores:
+                self._voo.executar(nome, lambda nome=nome: self._construir_travado(nome, tempo_limite), tempo_limite)
+        # Valores nunca saem do dicionário e cada troca é inteira: uma leitura só é uma versão só
+        valores = self._valores
+        return tuple(valores[nome] for nome in nomes)
+
+    def _construir_travado(self, nome, tempo_limite):
+        # Construções sob demanda seguram a trava: nenhuma atualização troca as
+        # dependências no meio e o que já estava pronto continua consistente
+        if not self._trava.acquire(timeout=tempo_limite):
+            raise TimeoutError(f"grafo ocupado por mais de {tempo_limite:g} s ao construir {nome}")
+        try:
+            self._construir(nome)
+        finally:
+            self._trava.release()
+
+    def _construir(self, nome):
+        if nome in self._valores:
+            return
+        artefato = self.artefatos[nome]
+        for dependencia in artefato.depende:
+            self._construir(dependencia)
+        valor = artefato.funcao(*(self._valores[d] for d in artefato.depende))
+        if artefato.impressao:
+            self._impressoes[nome] = artefato.impressao(valor)
+        self._valores = {**self._valores, nome: valor}
+
+    def _dependentes(self, nomes):
+        """Os artefatos indicados e tudo o que depende deles, em ordem topológica."""
+        afetados, ordem = set(nomes), []
+        for nome in self.artefatos:  # registrar exige dependências antes: já é uma ordem topológica
+            if nome in afetados or any(d in afetados for d in self.artefatos[nome].depende):
+                afetados.add(nome)
+                ordem.append(nome)
+        return ordem
+
+    def verificar(self):
+        """Compara as assinaturas dos arquivos e reconstrói o que mudou. Retorna os artefatos trocados."""
+        alterados = set()
+        for fonte, anterior in list(self._assinaturas.items()):
+            atual = _assinatura(fonte)
+            if atual != anterior:
+                self._assinaturas[fonte] = atual
+                alterados.update(c for c in anterior.keys() | atual.keys() if anterior.get(c) != atual.get(c))
+        return self.atualizar(alterados) if alterados else []
+
+    def atualizar(self, arquivos):
+        arquivos = {os.path.abspath(a) for a in arquivos}
+        # Arquivos alterados de cada artefato que lê diretamente algum deles
+        diretos = {}
+        for nome, artefato in self.artefatos.items():
+            tocados = {a for a in arquivos for fonte in artefato.fontes
+                       if a == fonte or os.path.dirname(a) == fonte}
+            if tocados:
+                diretos[nome] = tocados
+
+        with self._trava:
+            novos, impressoes, mudaram = {}, {}, set()
+            for nome in self._dependentes(diretos):
+                artefato = self.artefatos[nome]
+                # Só o que já foi usado é reconstruído agora; o resto segue sob demanda
+                if nome not in self._valores:
+                    continue
+                if nome not in diretos and not any(d in mudaram for d in artefato.depende):
+                    continue
+                valores = {**self._valores, **novos}
+                try:
+                    if artefato.incremental and nome in diretos and not artefato.depende:
+                        valor = artefato.incremental(self._valores[nome], diretos[nome])
+                    else:
+                        valor = artefato.funcao(*(valores[d] for d in artefato.depende))
+                except Exception as e:
+                    self.erros[nome] = e
+                    logger.exception("Erro ao reconstruir %s", nome)
+                    continue
+                self.erros.pop(nome, None)
+                # Arquivo salvo sem mudar nenhuma linha: os dependentes não são refeitos
+                if artefato.impressao:
+                    impressoes[nome] = artefato.impressao(valor)
+                    if impressoes[nome] == self._impressoes.get(nome):
+                        continue
+                novos[nome] = valor
+                mudaram.add(nome)
+
+            if novos:
+                self._impressoes.update(impressoes)
+                self._valores = {**self._valores, **novos}
+                self.versao += 1
+        return [nome for nome in self.artefatos if nome in novos]
+
+    def iniciar_observador(self, intervalo=INTERVALO_OBSERVADOR):
+        """Thread que verifica os arquivos a cada `intervalo` segundos (uma só por grafo)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._observar, args=(intervalo,),
+                                            name="observador-dados", daemon=True)
+            self._thread.start()
+
+    def _observar(self, intervalo):
+        while True:
+            time.sleep(intervalo)
+            try:
+                trocados = self.verificar()
+            except Exception:
+                # O observador não pode morrer: sem ele o grafo nunca mais se atualiza
+                logger.exception("Erro ao verificar os arquivos de dados")
+                continue
+            if trocados:
+                logger.info("Dados atualizados: %s", ", ".join(trocados))
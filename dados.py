@@ -0,0 +1,244 @@
+"""
+Leitura dos arquivos de dados, sem dependência do Streamlit.
+
+O app chama estas funções dentro dos seus loaders com cache, e o benchmark
+(benchmark_escala.py) as chama diretamente. MUSEU_DADOS aponta para outra
+pasta com os mesmos arquivos, por exemplo os gerados por dados_sinteticos.py.
+"""
+import hashlib
+import os
+
+import pandas as pd
+
+# None = arquivos do repositório (e pontos de coleta baixados do GitHub)
+DIRETORIO_DADOS = os.environ.get("MUSEU_DADOS")
+
+URL_PONTOS_COLETA = "https://raw.githubusercontent.com/michaufsc/glossario-quimica-residuos/refs/heads/main/pontos_coleta.csv"
+
+# Nomes aceitos para cada coluna do arquivo de perguntas
+COLUNAS_QUIZ = {
+    'pergunta': ['pergunta', 'question', 'pregunta', 'enunciado'],
+    'opcao_1': ['opcao_1', 'opção 1', 'option1', 'alternativa_a', 'a)'],
+    'opcao_2': ['opcao_2', 'opção 2', 'option2', 'alternativa_b', 'b)'],
+    'opcao_3': ['opcao_3', 'opção 3', 'option3', 'alternativa_c', 'c)'],
+    'opcao_4': ['opcao_4', 'opção 4', 'option4', 'alternativa_d', 'd)'],
+    'resposta': ['resposta', 'answer', 'correct', 'correta', 'gabarito'],
+    'explicacao': ['explicacao', 'explicação', 'explanation', 'feedback']
+}
+
+# "1", "A", "a)"... -> índice da alternativa correta (0-3)
+RESPOSTAS_QUIZ = {valor: i for i, letra in enumerate("ABCD") for valor in (str(i + 1), letra, f"{letra})")}
+
+
+def caminho_dados(nome):
+    return os.path.join(DIRETORIO_DADOS or ".", nome)
+
+
+def ler_tabela(caminho):
+    """polimeros.csv e residuos.csv (separados por ponto e vírgula)."""
+    return pd.read_csv(caminho, sep=";")
+
+
+# Colunas de pontos_coleta.csv (e da tabela vazia usada quando ela não pode ser lida)
+COLUNAS_COLETA = ["nome", "longitude", "latitude", "tipo", "subtipo", "detalhes", "horarios"]
+
+
+def ler_pontos_coleta(caminho):
+    return pd.read_csv(caminho)
+
+
+def carregar_coleta():
+    """Pontos de coleta do GitHub; sem internet (ex.: quiosque do museu), a cópia local do arquivo."""
+    if DIRETORIO_DADOS:
+        return ler_pontos_coleta(caminho_dados("pontos_coleta.csv"))
+    try:
+        return pd.read_csv(URL_PONTOS_COLETA)
+    except Exception:
+        if os.path.isfile("pontos_coleta.csv"):
+            return ler_pontos_coleta("pontos_coleta.csv")
+        raise
+
+
+def pontos_isopor():
+    """Base de dados oficial dos PEVs de Isopor® em Florianópolis"""
+    dados = {
+        'Local': [
+            'Centro - Hercílio Luz x Anita Garibaldi',
+            'Centro - Praça dos Namorados',
+            'Beira-Mar Norte - Mirante',
+            'Parque São Jorge - Av. Gov. José Boabaid',
+            'Trindade - Praça Gama Rosa',
+            'Coqueiros - Centro de Saúde',
+            'Estreito - Praça N.S. Fátima',
+            'Santa Mônica - Av. Madre Benvenuta',
+            'João Paulo - Praça Dr. Fausto Lobo',
+            'Jurerê Internacional - Final Av. dos Búzios'
+        ],
+        'Endereço': [
+            'Rua Hercílio Luz, 60 (esquina com Anita Garibaldi)',
+            'Largo São Sebastião, Centro',
+            'Avenida Beira-Mar Norte, 1030 (Mirante)',
+            'Avenida Governador José Boabaid, 250',
+            'Rua Gama Rosa, Trindade',
+            'Rua General Bittencourt, 175 (frente ao Centro de Saúde)',
+            'Rua Henrique Meyer, 550 (Praça N.S. Fátima)',
+            'Avenida Madre Benvenuta, 1580 (ao lado posto policial)',
+            'Rodovia João Paulo, 5000 (Praça Dr. Fausto Lobo)',
+            'Avenida dos Búzios, 1500 (junto ao PEV de Vidro)'
+        ],
+        'Latitude': [
+            -27.5945, -27.5918, -27.5872,
+            -27.5701, -27.5867, -27.5728,
+            -27.6003, -27.5824, -27.5603,
+            -27.4245
+        ],
+        'Longitude': [
+            -48.5482, -48.5495, -48.5581,
+            -48.5268, -48.5214, -48.5472,
+            -48.5330, -48.5008, -48.5067,
+            -48.4221
+        ],
+        'Horário': [
+            '24 horas', '24 horas', '24 horas',
+            '24 horas', '24 horas', '24 horas',
+            '24 horas', '24 horas', '24 horas',
+            '24 horas'
+        ]
+    }
+    return pd.DataFrame(dados)
+
+
+def carregar_cooperativas():
+    """
+    Carrega os dados das cooperativas de reciclagem.
+    Retorna um DataFrame com: nome, endereco, latitude, longitude, descricao.
+    """
+
+    if DIRETORIO_DADOS:
+        return ler_cooperativas(caminho_dados("cooperativas.csv"))
+
+    # Dados diretamente no código
+    data = [
+        {
+            "nome": "Associação de Catadores de Materiais Recicláveis de Florianópolis (ACMR)",
+            "endereco": "Rua João Pio Duarte Silva, 150",
+            "latitude": -27.5942,
+            "longitude": -48.5478,
+            "descricao": "Maior associação, responsável pela triagem e comercialização dos recicláveis."
+        },
+        {
+            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Capoeiras",
+            "endereco": "Av. Mauro Ramos, 820",
+            "latitude": -27.5945,
+            "longitude": -48.5450,
+            "descricao": "Foco na inclusão social e sustentabilidade ambiental."
+        },
+        {
+            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Estreito",
+            "endereco": "Rua Henrique Meyer, 300",
+            "latitude": -27.6000,
+            "longitude": -48.5330,
+            "descricao": "Promove trabalho digno e educação ambiental."
+        },
+        {
+            "nome": "Cooperativa de Reciclagem e Trabalho de Florianópolis (COOPERTFLOR)",
+            "endereco": "Rua Des. Pedro Silva, 200",
+            "latitude": -27.5950,
+            "longitude": -48.5400,
+            "descricao": "Atua com triagem e comercialização, valorizando o trabalho dos catadores."
+        },
+        {
+            "nome": "Associação de Catadores de Materiais Recicláveis do bairro Itacorubi",
+            "endereco": "Rua Henrique Veras, 180",
+            "latitude": -27.5930,
+            "longitude": -48.5600,
+            "descricao": "Promove ações de reciclagem e conscientização ambiental."
+        },
+        {
+            "nome": "Associação dos Catadores de Materiais Recicláveis do bairro Saco Grande",
+            "endereco": "Rua Deputado Antônio Edu Vieira, 250",
+            "latitude": -27.6005,
+            "longitude": -48.5405,
+            "descricao": "Organiza cooperativa para melhorar as condições de trabalho."
+        },
+        {
+            "nome": "Cooperativa de Catadores de Florianópolis (COOPERCAT)",
+            "endereco": "Rua José Maria Tavares, 100",
+            "latitude": -27.5960,
+            "longitude": -48.5450,
+            "descricao": "Valoriza a inclusão social e sustentabilidade."
+        }
+    ]
+
+    # Criar DataFrame e eliminar coordenadas faltantes ou inválidas
+    return limpar_cooperativas(pd.DataFrame(data))
+
+
+def ler_cooperativas(caminho):
+    """Cooperativas com coordenadas válidas (aceita vírgula decimal)."""
+    df = pd.read_csv(caminho)
+    return limpar_cooperativas(df)
+
+
+def limpar_cooperativas(df):
+    df = df.copy()
+    df['latitude'] = pd.to_numeric(df['latitude'].astype(str).str.replace(',', '.'), errors='coerce')
+    df['longitude'] = pd.to_numeric(df['longitude'].astype(str).str.replace(',', '.'), errors='coerce')
+    df = df.dropna(subset=['latitude', 'longitude'])
+    return df[(df['latitude'].between(-90, 0)) & (df['longitude'].between(-90, -30))]
+
+
+def _ler_csv_quiz(caminho):
+    for tentativa in ({"sep": ";", "encoding": "utf-8"}, {"sep": ",", "encoding": "utf-8"}, {"sep": ";", "encoding": "latin1"}):
+        try:
+            return pd.read_csv(caminho, on_bad_lines='warn', **tentativa)
+        except Exception:
+            continue
+    return None
+
+
+def ler_perguntas(caminho):
+    """
+    Lê o arquivo de perguntas do quiz e retorna (perguntas, avisos).
+    Lança ValueError com uma mensagem para o usuário se o arquivo não puder ser usado.
+    """
+    if not os.path.isfile(caminho):
+        raise ValueError(f"Arquivo {os.path.basename(caminho)} não encontrado no diretório atual")
+
+    df = _ler_csv_quiz(caminho)
+    if df is None or df.empty:
+        raise ValueError("Não foi possível ler o arquivo ou o arquivo está vazio")
+
+    df.columns = df.columns.str.strip().str.lower()
+    renomear = {alt: padrao for padrao, alternativas in COLUNAS_QUIZ.items() for alt in alternativas if alt in df.columns}
+    df = df.rename(columns=renomear)
+
+    faltando = [col for col in COLUNAS_QUIZ if col not in df.columns]
+    if faltando:
+        raise ValueError(f"Colunas obrigatórias faltando: {', '.join(faltando)}. "
+                         f"Colunas encontradas: {', '.join(df.columns)}")
+
+    # Coluna a coluna (em vez de linha a linha): o custo fica no pandas, não no laço Python
+    texto = {col: df[col].astype(str).str.strip() for col in COLUNAS_QUIZ}
+    respostas = texto['resposta'].str.upper().map(RESPOSTAS_QUIZ)
+
+    avisos = [f"Resposta inválida na pergunta: {p}" for p in texto['pergunta'][respostas.isna()]]
+    validas = respostas.notna().to_numpy()
+    colunas = {col: serie[validas].tolist() for col, serie in texto.items()}
+
+    perguntas = [
+        {
+            # Identificador estável da pergunta (usado no registro das respostas)
+            "id": hashlib.sha1(pergunta.encode("utf-8")).hexdigest()[:12],
+            "pergunta": pergunta,
+            "opcoes": [o1, o2, o3, o4],
+            "resposta": int(resposta),
+            "explicacao": explicacao,
+        }
+        for pergunta, o1, o2, o3, o4, resposta, explicacao in zip(
+            colunas['pergunta'], colunas['opcao_1'], colunas['opcao_2'], colunas['opcao_3'],
+            colunas['opcao_4'], respostas[validas].tolist(), colunas['explicacao'])
+    ]
+    if not perguntas:
+        raise ValueError("Nenhuma pergunta válida foi carregada")
+    return perguntas, avisos
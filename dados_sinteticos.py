@@ -0,0 +1,230 @@
+"""
+Versões sintéticas (e válidas para os loaders) dos arquivos de dados do app,
+em qualquer tamanho, para medir como cada parte se comporta com mais dados:
+
+    python dados_sinteticos.py --tamanho 100000 --saida dados_sinteticos/n100000
+
+As colunas são montadas com as funções vetorizadas do Arrow (que já vem com
+o Streamlit), então 10⁶ linhas saem em segundos. Os valores são plausíveis, não reais.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from cobertura import LIMITES_FLORIANOPOLIS
+
+DIRETORIO_SINTETICOS = "dados_sinteticos"
+
+MONOMEROS = ["etileno", "propileno", "estireno", "vinila", "amida", "carbonato", "acetal", "lactato",
+             "tereftalato", "metacrilato", "uretano", "butadieno", "acrilonitrila", "sulfeto", "éster"]
+PREFIXOS = ["Poli", "Copoli", "Polimetil", "Polietil"]
+APLICACOES = ["garrafas", "filmes de embalagem", "tubos", "peças automotivas", "fibras têxteis", "brinquedos",
+              "sacolas", "copos descartáveis", "isolamento térmico", "engrenagens", "lentes", "calçados",
+              "cabos elétricos", "frascos de produtos de limpeza", "impressão 3D", "embalagens de alimentos"]
+ADJETIVOS = ["leve", "rígido", "flexível", "transparente", "resistente ao impacto", "resistente ao calor",
+             "de baixo custo", "quimicamente estável", "moldável", "durável"]
+
+TIPOS_RESIDUO = {
+    "Plástico": ["garrafas", "potes", "sacolas", "tampas", "embalagens flexíveis", "frascos"],
+    "Papel": ["jornais", "caixas", "cadernos", "folhetos", "envelopes", "papelão"],
+    "Metal": ["latas", "tampas metálicas", "pregos", "arames", "panelas velhas", "papel alumínio"],
+    "Vidro": ["garrafas de vidro", "potes de conserva", "frascos de perfume", "copos"],
+    "Orgânico": ["cascas de frutas", "borra de café", "restos de verduras", "folhas secas", "podas"],
+    "Rejeito": ["fraldas", "bitucas", "esponjas", "papel higiênico", "adesivos"],
+    "Perigoso": ["pilhas", "baterias", "lâmpadas", "medicamentos vencidos", "tintas", "óleo de motor"],
+    "Eletrônico": ["celulares", "carregadores", "cabos", "teclados", "placas de circuito"],
+}
+ROTAS = ["Coleta seletiva", "Reciclagem mecânica", "Reciclagem química", "Reciclagem por fundição",
+         "Reciclagem por fusão", "Compostagem", "Aterro sanitário", "Logística reversa",
+         "Coleta especializada e incineração", "Prensagem e reciclagem"]
+TEMPOS = ["{a} a {b} anos", "{a}-{b} anos", "Mais de {a} anos", "{a} a {b} meses", "{a} dias a {b} meses", "Indeterminado"]
+DIAS = ["SEG", "TER", "QUA", "QUI", "SEX", "SÁB"]
+
+
+def _texto(parte):
+    """Constante, array NumPy ou array Arrow -> algo aceito pelas funções de texto do Arrow."""
+    if isinstance(parte, (str, pa.Array)):
+        return parte
+    return pa.array(parte).cast(pa.string())
+
+
+def _juntar(*partes):
+    """Concatena colunas de texto elemento a elemento (em C++, sem laço Python)."""
+    return pc.binary_join_element_wise(*map(_texto, partes), "")
+
+
+def _escolher(rng, valores, n):
+    return pa.array(valores).take(rng.integers(0, len(valores), n))
+
+
+def _decimal(valores, casas=2):
+    """0.9137 -> "0,91" (vírgula decimal, como nos arquivos originais)."""
+    escala = 10 ** casas
+    centesimos = np.round(np.asarray(valores) * escala).astype(np.int64)
+    fracao = pc.utf8_lpad(_texto(centesimos % escala), casas, "0")
+    return _juntar(centesimos // escala, ",", fracao)
+
+
+def _lista(rng, vocabulario, n, maximo=3):
+    """Listas "a, b, c" com 1 a `maximo` termos sorteados do vocabulário."""
+    quantidade = rng.integers(1, maximo + 1, n)
+    texto = _escolher(rng, vocabulario, n)
+    for k in range(1, maximo):
+        texto = pc.if_else(quantidade <= k, texto, _juntar(texto, ", ", _escolher(rng, vocabulario, n)))
+    return texto
+
+
+def _dois_dias(rng, n):
+    primeiro = rng.integers(0, len(DIAS), n)
+    segundo = (primeiro + rng.integers(1, len(DIAS), n)) % len(DIAS)
+    dias = pa.array(DIAS)
+    return _juntar(dias.take(primeiro), " e ", dias.take(segundo))
+
+
+def gerar_polimeros(n, rng):
+    ids = np.arange(n)
+    monomero = _escolher(rng, MONOMEROS, n)
+    densidade = rng.uniform(0.85, 1.6, n)
+    largura = rng.uniform(0, 0.05, n)
+    fusao = rng.uniform(90, 330, n).round().astype(np.int64)
+    faixa_fusao = rng.integers(0, 15, n)
+    variavel = rng.random(n) < 0.03
+
+    densidade_txt = pc.if_else(largura > 0.02,
+                               _juntar(_decimal(densidade), "–", _decimal(densidade + largura), " g/cm³"),
+                               _juntar(_decimal(densidade), " g/cm³"))
+    fusao_txt = pc.if_else(faixa_fusao > 5, _juntar(fusao, "–", fusao + faixa_fusao, " °C"), _juntar(fusao, " °C"))
+    return pa.table({
+        "Sigla": _juntar("P", pc.utf8_upper(pc.utf8_slice_codeunits(monomero, 0, 2)), ids),
+        "Nome": _juntar(_escolher(rng, PREFIXOS, n), monomero, " ", ids),
+        "Código": rng.choice(np.arange(1, 8), n, p=[0.1, 0.1, 0.05, 0.1, 0.1, 0.05, 0.5]),
+        "Tipo de Polimerização": pc.if_else(rng.random(n) < 0.6, "Adição", "Policondensação"),
+        "Densidade": densidade_txt,
+        "Ponto de Fusão": pc.if_else(variavel, "Variável", fusao_txt),
+        "Reciclável": _escolher(rng, ["Sim"] * 16 + ["Não"] * 3 + ["Sim (compostável)"], n),
+        "Aplicações Comuns": pc.utf8_capitalize(_lista(rng, APLICACOES, n)),
+        "Descrição": _juntar("Polímero ", _escolher(rng, ADJETIVOS, n), " e ", _escolher(rng, ADJETIVOS, n),
+                             ", derivado do ", monomero, ". Usado em ", _lista(rng, APLICACOES, n, 2), "."),
+    })
+
+
+def gerar_residuos(n, rng):
+    tipos = list(TIPOS_RESIDUO)
+    tipo = rng.integers(0, len(tipos), n)
+    # Exemplos sorteados do vocabulário do próprio tipo
+    exemplos = pa.array([""] * n)
+    for i, nome in enumerate(tipos):
+        exemplos = pc.if_else(tipo == i, _lista(rng, TIPOS_RESIDUO[nome], n), exemplos)
+
+    a = rng.integers(1, 500, n)
+    b = a + rng.integers(1, 500, n)
+    modelo = rng.integers(0, len(TEMPOS), n)
+    tempo = pa.array([""] * n)
+    for i, texto in enumerate(TEMPOS):
+        partes = texto.replace("{a}", "\0").replace("{b}", "\0").split("\0")
+        if len(partes) == 3:
+            valor = _juntar(partes[0], a, partes[1], b, partes[2])
+        elif len(partes) == 2:
+            valor = _juntar(partes[0], a, partes[1])
+        else:
+            valor = texto
+        tempo = pc.if_else(modelo == i, valor, tempo)
+
+    return pa.table({
+        "Tipo": pa.array(tipos).take(tipo),
+        "Código": pc.utf8_lpad(_texto(np.arange(n) + 1), 2, "0"),
+        "Exemplos Comuns": pc.utf8_capitalize(exemplos),
+        "Tempo de Decomposição": tempo,
+        "Reciclável": _escolher(rng, ["Sim"] * 5 + ["Não"] * 3 + ["Sim (limitado)", "Não (mas compostável)"], n),
+        "Rota de Tratamento": _lista(rng, ROTAS, n, 2),
+        "Descrição Técnica": _juntar("Resíduo ", _escolher(rng, ADJETIVOS, n), ". Deve ser separado e encaminhado para ",
+                                     pc.utf8_lower(_escolher(rng, ROTAS, n)), "."),
+    })
+
+
+def _coordenadas(rng, n):
+    """Pontos agrupados em torno de centros de bairro sorteados dentro de Florianópolis."""
+    limites = LIMITES_FLORIANOPOLIS
+    n_centros = max(1, n // 50)
+    centros_lat = rng.uniform(limites["lat_min"] + 0.05, limites["lat_max"] - 0.05, n_centros)
+    centros_lon = rng.uniform(limites["lon_min"] + 0.08, limites["lon_max"] - 0.05, n_centros)
+    centro = rng.integers(0, n_centros, n)
+    return centro, centros_lat[centro] + rng.normal(0, 0.004, n), centros_lon[centro] + rng.normal(0, 0.004, n)
+
+
+def gerar_pontos_coleta(n, rng):
+    centro, lat, lon = _coordenadas(rng, n)
+    vidro = rng.random(n) < 0.1
+    return pa.table({
+        "nome": _juntar("Bairro ", centro, " (Setor ", np.arange(n), ")"),
+        "longitude": lon.round(7),
+        "latitude": lat.round(7),
+        "tipo": pc.if_else(rng.random(n) < 0.85, "Coleta", "Seletiva Flex"),
+        "subtipo": pc.if_else(vidro, "Contentor verde (vidros)", ""),
+        "detalhes": pc.if_else(vidro, "Contentor verde (vidros)", ""),
+        "horarios": _juntar(_dois_dias(rng, n), " - ", _escolher(rng, ["7h", "13h", "19h"], n)),
+    })
+
+
+def gerar_cooperativas(n, rng):
+    _, lat, lon = _coordenadas(rng, n)
+    return pa.table({
+        "nome": _juntar("Associação de Catadores ", np.arange(n)),
+        "endereco": _juntar("Rua ", _escolher(rng, MONOMEROS, n), ", ", rng.integers(1, 3000, n)),
+        "latitude": lat.round(4),
+        "longitude": lon.round(4),
+        "descricao": _juntar("Triagem e comercialização: ", pc.utf8_lower(_lista(rng, ROTAS, n, 2)), "."),
+    })
+
+
+def gerar_quiz(n, rng):
+    resposta = rng.integers(1, 5, n)
+    assunto = _escolher(rng, APLICACOES, n)
+    opcoes = {f"opcao_{i}": _juntar("Poli", _escolher(rng, MONOMEROS, n), f" {letra}") for i, letra in enumerate("ABCD", 1)}
+    return pa.table({
+        "pergunta": _juntar("Pergunta ", np.arange(n), ": qual material é mais usado em ", assunto, "?"),
+        **opcoes,
+        "resposta": resposta,
+        "explicacao": _juntar("A alternativa ", resposta, " é a correta para ", assunto, "."),
+    })
+
+
+# arquivo -> (gerador, separador)
+ARQUIVOS = {
+    "polimeros.csv": (gerar_polimeros, ";"),
+    "residuos.csv": (gerar_residuos, ";"),
+    "pontos_coleta.csv": (gerar_pontos_coleta, ","),
+    "cooperativas.csv": (gerar_cooperativas, ","),
+    "quiz_perguntas.csv": (gerar_quiz, ";"),
+}
+
+
+def gerar_conjunto(tamanho, diretorio, semente=0, arquivos=None):
+    """Grava os arquivos sintéticos com `tamanho` linhas cada em `diretorio`."""
+    os.makedirs(diretorio, exist_ok=True)
+    rng = np.random.default_rng(semente)
+    for nome in arquivos or ARQUIVOS:
+        gerador, separador = ARQUIVOS[nome]
+        # O escritor CSV do Arrow é bem mais rápido que o do pandas nesses tamanhos
+        pa_csv.write_csv(gerador(tamanho, rng), os.path.join(diretorio, nome),
+                         pa_csv.WriteOptions(delimiter=separador, quoting_style="needed"))
+    return diretorio
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera versões sintéticas dos arquivos de dados do app.")
+    parser.add_argument("--tamanho", type=int, default=1000, help="linhas por arquivo")
+    parser.add_argument("--saida", default=None, help=f"pasta de saída (padrão: {DIRETORIO_SINTETICOS}/n<tamanho>)")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    saida = args.saida or os.path.join(DIRETORIO_SINTETICOS, f"n{args.tamanho}")
+    inicio = time.perf_counter()
+    gerar_conjunto(args.tamanho, saida, args.semente)
+    print(f"{len(ARQUIVOS)} arquivos com {args.tamanho} linhas em {time.perf_counter() - inicio:.1f} s -> {saida}")
+    print(f"Para abrir o app com eles: MUSEU_DADOS={saida} streamlit run app.py")
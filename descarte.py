@@ -0,0 +1,176 @@
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from geo import haversine, RECICLAVEIS, VIDRO, ISOPOR
+from utilitarios import normalizar_texto, normalizar_reciclavel
+
+# Palavras ignoradas na busca ("garrafa DE óleo")
+PALAVRAS_VAZIAS = {"de", "da", "do", "das", "dos", "e", "com", "para", "em", "um", "uma", "o", "a", "os", "as"}
+
+# O isopor não aparece em residuos.csv, mas tem rede própria de PEVs
+ISOPOR_RESIDUO = {
+    "Tipo": "Isopor (EPS)",
+    "Código": "06",
+    "Exemplos Comuns": "Isopor, EPS, bandejas de isopor, caixas de isopor, copos de isopor, "
+                       "isopor de embalagens de eletrodomésticos",
+    "Reciclável": "Sim",
+    "Rota de Tratamento": "PEV de Isopor® (Projeto Recicla+EPS)",
+}
+
+SIMILARIDADE_MINIMA = 0.45
+
+
+def raiz(palavra):
+    """Reduz plurais simples para que "garrafas" encontre "garrafa"."""
+    if len(palavra) <= 3:
+        return palavra
+    for sufixo, troca in (("oes", "ao"), ("aes", "ao"), ("ns", "m"), ("is", "l"), ("res", "r"), ("zes", "z"), ("s", "")):
+        if palavra.endswith(sufixo):
+            return palavra[: -len(sufixo)] + troca
+    return palavra
+
+
+def tokens(texto):
+    return [raiz(t) for t in re.findall(r"[a-z0-9]+", normalizar_texto(texto)) if t not in PALAVRAS_VAZIAS]
+
+
+def trigramas(token):
+    token = f"  {token} "
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def categoria_residuo(tipo, reciclavel):
+    """Categoria de ponto de entrega que aceita a classe de resíduo (ou None)."""
+    tipo = normalizar_texto(tipo)
+    if tipo.startswith("isopor"):
+        return ISOPOR
+    if normalizar_reciclavel(reciclavel) != "Sim":
+        return None
+    if tipo == "vidro":
+        return VIDRO
+    if tipo in ("plastico", "papel", "metal"):
+        return RECICLAVEIS
+    return None
+
+
+class IndiceDescarte:
+    """Índice pré-compilado dos exemplos de resíduos e dos pontos que os aceitam."""
+
+    def __init__(self, classes, pontos: pd.DataFrame):
+        self.classes = classes
+        self.vocabulario = []
+        posicao = {}
+        self.docs_por_token = []  # id do token -> {id da classe: {índices dos exemplos}}
+        for id_classe, classe in enumerate(classes):
+            textos = [(i, exemplo) for i, exemplo in enumerate(classe["exemplos"])] + [(None, classe["classe"])]
+            for id_exemplo, texto in textos:
+                for token in tokens(texto):
+                    if token not in posicao:
+                        posicao[token] = len(self.vocabulario)
+                        self.vocabulario.append(token)
+                        self.docs_por_token.append(defaultdict(set))
+                    exemplos = self.docs_por_token[posicao[token]][id_classe]
+                    if id_exemplo is not None:
+                        exemplos.add(id_exemplo)
+
+        self.posicao = posicao
+        self.ordenado = sorted(posicao)
+        self.tokens_por_trigrama = defaultdict(list)
+        for token, id_token in posicao.items():
+            for trigrama in trigramas(token):
+                self.tokens_por_trigrama[trigrama].append(id_token)
+
+        # Coordenadas e índices dos pontos de cada categoria, prontos para o cálculo vetorizado
+        self.pontos = pontos.reset_index(drop=True)
+        self.lat = self.pontos["latitude"].to_numpy(dtype=float)
+        self.lon = self.pontos["longitude"].to_numpy(dtype=float)
+        self.pontos_por_categoria = {
+            categoria: np.flatnonzero(self.pontos["aceita"].map(lambda aceita: categoria in aceita).to_numpy())
+            for categoria in (RECICLAVEIS, VIDRO, ISOPOR)
+        }
+
+    def _tokens_parecidos(self, token):
+        """{id do token: similaridade} para um token da consulta."""
+        parecidos = {}
+        if token in self.posicao:
+            parecidos[self.posicao[token]] = 1.0
+        # Prefixo: permite resultados enquanto o visitante ainda digita
+        if len(token) >= 2:
+            inicio = bisect.bisect_left(self.ordenado, token)
+            while inicio < len(self.ordenado) and self.ordenado[inicio].startswith(token):
+                id_token = self.posicao[self.ordenado[inicio]]
+                parecidos[id_token] = max(parecidos.get(id_token, 0), 0.9)
+                inicio += 1
+        # Trigramas: tolera erros de digitação ("garafa", "isopo")
+        grams = trigramas(token)
+        comuns = defaultdict(int)
+        for trigrama in grams:
+            for id_token in self.tokens_por_trigrama.get(trigrama, ()):
+                comuns[id_token] += 1
+        for id_token, n in comuns.items():
+            dice = 2 * n / (len(grams) + len(trigramas(self.vocabulario[id_token])))
+            if dice >= SIMILARIDADE_MINIMA:
+                parecidos[id_token] = max(parecidos.get(id_token, 0), dice)
+        return parecidos
+
+    def buscar(self, consulta, limite=3):
+        """Classes de resíduo mais prováveis para um item digitado livremente."""
+        termos = tokens(consulta)
+        if not termos:
+            return []
+
+        pontuacao_classe = defaultdict(float)
+        pontuacao_exemplo = defaultdict(lambda: defaultdict(float))  # classe -> exemplo -> pontuação
+        for termo in termos:
+            melhor_classe = defaultdict(float)
+            melhor_termo = defaultdict(dict)
+            for id_token, similaridade in self._tokens_parecidos(termo).items():
+                for id_classe, exemplos in self.docs_por_token[id_token].items():
+                    melhor_classe[id_classe] = max(melhor_classe[id_classe], similaridade)
+                    melhor_exemplo = melhor_termo[id_classe]
+                    for id_exemplo in exemplos:
+                        melhor_exemplo[id_exemplo] = max(melhor_exemplo.get(id_exemplo, 0), similaridade)
+            for id_classe, similaridade in melhor_classe.items():
+                pontuacao_classe[id_classe] += similaridade / len(termos)
+            for id_classe, exemplos in melhor_termo.items():
+                for id_exemplo, similaridade in exemplos.items():
+                    pontuacao_exemplo[id_classe][id_exemplo] += similaridade
+
+        resultados = []
+        for id_classe, pontuacao in sorted(pontuacao_classe.items(), key=lambda item: -item[1])[:limite]:
+            classe = self.classes[id_classe]
+            exemplos = pontuacao_exemplo[id_classe]
+            exemplo = classe["exemplos"][max(exemplos, key=exemplos.get)] if exemplos else classe["classe"]
+            resultados.append({**classe, "exemplo": exemplo, "pontuacao": pontuacao})
+        return resultados
+
+    def pontos_proximos(self, categoria, latitude, longitude, limite=3):
+        """Pontos mais próximos que aceitam a categoria, com a distância em km."""
+        candidatos = self.pontos_por_categoria.get(categoria)
+        if candidatos is None or len(candidatos) == 0:
+            return self.pontos.iloc[[]].assign(distancia_km=[])
+        distancias = haversine(latitude, longitude, self.lat[candidatos], self.lon[candidatos])
+        limite = min(limite, len(candidatos))
+        melhores = np.argpartition(distancias, limite - 1)[:limite]
+        melhores = melhores[np.argsort(distancias[melhores])]
+        return self.pontos.iloc[candidatos[melhores]].assign(distancia_km=distancias[melhores])
+
+
+def construir_indice_descarte(residuos: pd.DataFrame, pontos: pd.DataFrame):
+    linhas = list(residuos.to_dict("records")) + [ISOPOR_RESIDUO]
+    classes = [
+        {
+            "classe": str(linha["Tipo"]).strip(),
+            "codigo": str(linha["Código"]).strip(),
+            "exemplos": [e.strip() for e in str(linha["Exemplos Comuns"]).split(",") if e.strip()],
+            "reciclavel": str(linha["Reciclável"]).strip(),
+            "rota": str(linha["Rota de Tratamento"]).strip(),
+            "categoria": categoria_residuo(linha["Tipo"], linha["Reciclável"]),
+        }
+        for linha in linhas
+    ]
+    return IndiceDescarte(classes, pontos)
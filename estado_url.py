@@ -0,0 +1,105 @@
+"""
+Progresso do quiz guardado na própria URL, assinado com HMAC.
+
+Com MUSEU_QUIZ_NA_URL=1 o servidor não guarda nada da partida na sessão:
+semente da ordem das perguntas, pergunta atual, alternativa escolhida e um
+bitmap de acertos viajam num token curto em ?quiz=..., e qualquer réplica
+atrás do balanceador consegue continuar o quiz.
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import random
+import secrets
+import struct
+
+QUIZ_NA_URL = os.environ.get("MUSEU_QUIZ_NA_URL", "0") == "1"
+
+# Todas as réplicas precisam da mesma chave secreta; sem ela, tokens de uma não valem na outra.
+# Uma chave conhecida deixaria qualquer um forjar placares, então o quiz na URL não sobe sem ela.
+CHAVE_DEFINIDA = bool(os.environ.get("MUSEU_CHAVE_QUIZ"))
+if QUIZ_NA_URL and not CHAVE_DEFINIDA:
+    raise RuntimeError("MUSEU_QUIZ_NA_URL=1 exige uma chave secreta em MUSEU_CHAVE_QUIZ "
+                       "(por exemplo: python -c \"import secrets; print(secrets.token_hex(32))\")")
+# Sem o quiz na URL o app não aceita tokens: uma chave aleatória basta
+CHAVE = (os.environ.get("MUSEU_CHAVE_QUIZ") or secrets.token_hex(32)).encode("utf-8")
+
+VERSAO = 2
+SEM_RESPOSTA = 0xFF
+TAMANHO_ASSINATURA = 8
+
+# versão, semente, digest das perguntas, pergunta atual, alternativa escolhida, momento em que foi mostrada
+# (a pergunta atual ocupa 2 bytes: bancos com mais de 255 perguntas cabem no token)
+_CABECALHO = struct.Struct(">BI2sHBI")
+
+
+def digest_perguntas(ids):
+    """2 bytes que mudam quando o conjunto de perguntas muda (invalida tokens antigos)."""
+    return hashlib.sha1("|".join(sorted(ids)).encode("utf-8")).digest()[:2]
+
+
+def ordem_perguntas(ids, semente, quantidade=None):
+    """
+    Mesma permutação em qualquer processo: parte da ordem dos ids, não da ordem de leitura.
+    Com `quantidade`, sorteia só essa quantidade de perguntas.
+    """
+    ordem = sorted(ids)
+    rng = random.Random(semente)
+    if quantidade is None:
+        rng.shuffle(ordem)
+        return ordem
+    return rng.sample(ordem, min(quantidade, len(ordem)))
+
+
+def novo_estado(digest):
+    return {
+        "semente": secrets.randbits(32),
+        "digest": digest,
+        "atual": 0,
+        "resposta": None,
+        "mostrada_em": 0,
+        "acertos": [],
+    }
+
+
+def _assinar(dados, chave):
+    return hmac.new(chave, dados, hashlib.sha256).digest()[:TAMANHO_ASSINATURA]
+
+
+def codificar(estado, chave=CHAVE):
+    """Estado -> token base64url (cerca de 30 caracteres para o quiz inteiro)."""
+    bitmap = sum(1 << i for i, acerto in enumerate(estado["acertos"]) if acerto)
+    dados = _CABECALHO.pack(
+        VERSAO, estado["semente"], estado["digest"], estado["atual"],
+        SEM_RESPOSTA if estado["resposta"] is None else estado["resposta"],
+        int(estado["mostrada_em"]) & 0xFFFFFFFF,
+    ) + bitmap.to_bytes((len(estado["acertos"]) + 7) // 8, "little")
+    return base64.urlsafe_b64encode(dados + _assinar(dados, chave)).rstrip(b"=").decode("ascii")
+
+
+def decodificar(token, digest, n_perguntas, chave=CHAVE):
+    """Token -> estado; None se a assinatura não confere ou as perguntas mudaram."""
+    try:
+        bruto = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        return None
+    dados, assinatura = bruto[:-TAMANHO_ASSINATURA], bruto[-TAMANHO_ASSINATURA:]
+    if len(dados) < _CABECALHO.size or not hmac.compare_digest(assinatura, _assinar(dados, chave)):
+        return None
+
+    versao, semente, digest_token, atual, resposta, mostrada_em = _CABECALHO.unpack_from(dados)
+    if versao != VERSAO or digest_token != digest or atual > n_perguntas:
+        return None
+    # A pergunta atual já conta como respondida quando há alternativa escolhida
+    respondidas = atual + (resposta != SEM_RESPOSTA)
+    bitmap = int.from_bytes(dados[_CABECALHO.size:], "little")
+    return {
+        "semente": semente,
+        "digest": digest,
+        "atual": atual,
+        "resposta": None if resposta == SEM_RESPOSTA else resposta,
+        "mostrada_em": mostrada_em,
+        "acertos": [bool(bitmap >> i & 1) for i in range(min(respondidas, n_perguntas))],
+    }
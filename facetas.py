@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+from utilitarios import normalizar_texto, normalizar_reciclavel
+
+
+# Cada bitset é um inteiro do Python: o bit i ligado indica que a linha i
+# do DataFrame possui o valor da faceta. Combinar filtros vira um AND/OR
+# entre inteiros, sem percorrer o DataFrame de novo.
+def _bitset_de_mascara(mascara):
+    """Converte um vetor booleano do NumPy em bitset (int)."""
+    mascara = np.asarray(mascara, dtype=bool)
+    if not mascara.any():
+        return 0
+    return int.from_bytes(np.packbits(mascara, bitorder="little").tobytes(), "little")
+
+
+def _mascara_de_bitset(bitset, n_linhas):
+    """Converte um bitset (int) de volta em vetor booleano do NumPy."""
+    n_bytes = (n_linhas + 7) // 8
+    dados = np.frombuffer(bitset.to_bytes(n_bytes, "little"), dtype=np.uint8)
+    return np.unpackbits(dados, bitorder="little")[:n_linhas].astype(bool)
+
+
+class IndiceFacetas:
+    """Bitsets pré-calculados por faceta e valor, montados no carregamento."""
+
+    def __init__(self, n_linhas, facetas, textos):
+        self.n_linhas = n_linhas
+        self.todos = (1 << n_linhas) - 1
+        self.facetas = facetas  # faceta -> {valor: bitset}
+        self.textos = textos    # texto normalizado de cada linha (para a busca)
+
+    def mascara(self, selecoes, ignorar=None):
+        """AND entre facetas e OR entre os valores escolhidos de cada faceta."""
+        resultado = self.todos
+        for faceta, valores in selecoes.items():
+            if faceta == ignorar or not valores:
+                continue
+            bits = 0
+            for valor in valores:
+                bits |= self.facetas[faceta].get(valor, 0)
+            resultado &= bits
+        return resultado
+
+    def mascara_busca(self, termo):
+        """Bitset das linhas cujo texto contém o termo (sem diferenciar acentos)."""
+        termo = normalizar_texto(termo)
+        if not termo:
+            return self.todos
+        return _bitset_de_mascara([termo in texto for texto in self.textos])
+
+    def contagens(self, selecoes, base=None):
+        """Contagem ao vivo de cada valor, considerando as demais facetas selecionadas."""
+        base = self.todos if base is None else base
+        resultado = {}
+        for faceta, valores in self.facetas.items():
+            filtro = self.mascara(selecoes, ignorar=faceta) & base
+            resultado[faceta] = {valor: (bits & filtro).bit_count() for valor, bits in valores.items()}
+        return resultado
+
+    def linhas(self, bitset):
+        """Índices posicionais das linhas presentes no bitset."""
+        return np.flatnonzero(_mascara_de_bitset(bitset, self.n_linhas))
+
+
+def construir_indice_facetas(df: pd.DataFrame, extratores):
+    """
+    Monta o índice a partir de um dicionário faceta -> função.
+    Cada função recebe o DataFrame e devolve uma Series com um valor
+    (ou uma lista de valores, para facetas multivaloradas) por linha.
+    """
+    facetas = {}
+    for faceta, extrator in extratores.items():
+        valores = extrator(df).reset_index(drop=True)
+        if valores.map(lambda v: isinstance(v, list)).any():
+            valores = valores.explode()
+        valores = valores.dropna().astype(str)
+        facetas[faceta] = {}
+        for valor, posicoes in sorted(valores.groupby(valores).groups.items()):
+            mascara = np.zeros(len(df), dtype=bool)
+            mascara[np.asarray(posicoes)] = True
+            facetas[faceta][valor] = _bitset_de_mascara(mascara)
+
+    textos = [
+        normalizar_texto(" ".join(str(v) for v in linha))
+        for linha in df.astype(str).itertuples(index=False)
+    ]
+    return IndiceFacetas(len(df), facetas, textos)
+
+
+# Funções de extração das facetas de cada glossário
+def _reciclavel(df):
+    return df["Reciclável"].map(normalizar_reciclavel)
+
+
+def _classe_abnt(df):
+    # ABNT NBR 10004: Classe I (perigosos) e Classe II (não perigosos)
+    return df["Tipo"].map(
+        lambda tipo: "Classe I – Perigoso" if normalizar_texto(tipo) == "perigoso" else "Classe II – Não perigoso"
+    )
+
+
+def _rotas_tratamento(df):
+    def separar(rota):
+        return [parte.strip().capitalize() for parte in str(rota).split(",") if parte.strip()]
+    return df["Rota de Tratamento"].map(separar)
+
+
+FACETAS_POLIMEROS = {
+    "Reciclável": _reciclavel,
+    "Tipo de Polimerização": lambda df: df["Tipo de Polimerização"].astype(str).str.strip(),
+    "Código de Resina": lambda df: df["Código"].astype(str).str.strip(),
+}
+
+FACETAS_RESIDUOS = {
+    "Tipo de Resíduo": lambda df: df["Tipo"].astype(str).str.strip(),
+    "Reciclável": _reciclavel,
+    "Classe ABNT": _classe_abnt,
+    "Rota de Tratamento": _rotas_tratamento,
+}
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from utilitarios import normalizar_texto
+
+RAIO_TERRA_KM = 6371.0088
+
+# Museu do Lixo – Rodovia Admar Gonzaga, 72, Itacorubi (ponto de partida padrão do quiosque)
+MUSEU_COORDENADAS = (-27.5836, -48.5048)
+
+# Categorias de descarte atendidas pelas camadas de pontos
+RECICLAVEIS = "Recicláveis secos"
+VIDRO = "Vidro"
+ISOPOR = "Isopor (EPS)"
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Distância em km entre coordenadas (aceita arrays e faz broadcasting)."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RAIO_TERRA_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+def _aceita_coleta(row):
+    texto = normalizar_texto(f"{row.get('tipo', '')} {row.get('subtipo', '')} {row.get('detalhes', '')}")
+    aceita = []
+    # "Coleta" e "Seletiva Flex" (esta às vezes sem subtipo nem detalhes) recolhem recicláveis secos
+    if "coleta" in texto or "seletiva" in texto:
+        aceita.append(RECICLAVEIS)
+    if "vidro" in texto:
+        aceita.append(VIDRO)
+    return tuple(aceita)
+
+
+def montar_camada_pontos(coleta: pd.DataFrame, isopor: pd.DataFrame, cooperativas: pd.DataFrame):
+    """
+    Junta pontos de coleta, PEVs de isopor e cooperativas numa única tabela
+    com nome, latitude, longitude, camada, detalhes e categorias aceitas.
+    """
+    partes = []
+    if not coleta.empty:
+        partes.append(pd.DataFrame({
+            "nome": coleta["nome"],
+            "latitude": pd.to_numeric(coleta["latitude"], errors="coerce"),
+            "longitude": pd.to_numeric(coleta["longitude"], errors="coerce"),
+            "camada": "Coleta seletiva",
+            "detalhes": coleta["horarios"].fillna(""),
+            "aceita": coleta.apply(_aceita_coleta, axis=1),
+        }))
+    if not isopor.empty:
+        partes.append(pd.DataFrame({
+            "nome": isopor["Local"],
+            "latitude": isopor["Latitude"],
+            "longitude": isopor["Longitude"],
+            "camada": "PEV de Isopor®",
+            "detalhes": isopor["Endereço"],
+            "aceita": [(ISOPOR,)] * len(isopor),
+        }))
+    if not cooperativas.empty:
+        partes.append(pd.DataFrame({
+            "nome": cooperativas["nome"],
+            "latitude": cooperativas["latitude"],
+            "longitude": cooperativas["longitude"],
+            "camada": "Cooperativa",
+            "detalhes": cooperativas["endereco"],
+            "aceita": [(RECICLAVEIS,)] * len(cooperativas),
+        }))
+
+    if not partes:
+        return pd.DataFrame(columns=["nome", "latitude", "longitude", "camada", "detalhes", "aceita"])
+    pontos = pd.concat(partes, ignore_index=True)
+    # Remove linhas de rodapé do CSV ("Fonte", "Atualizado em") e pontos sem categoria
+    pontos = pontos.dropna(subset=["latitude", "longitude"])
+    pontos = pontos[pontos["aceita"].map(len) > 0]
+    return pontos.reset_index(drop=True)
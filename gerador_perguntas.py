@@ -0,0 +1,348 @@
+"""
+Gerador de perguntas do quiz a partir de polimeros.csv e residuos.csv.
+
+Cada modelo de pergunta produz um enunciado, a resposta certa e uma lista de
+candidatos a distrator já ordenada pela similaridade com a resposta (os
+vizinhos calculados em similaridade.py), de modo que as alternativas erradas
+sejam plausíveis. As variantes combinam os distratores mais parecidos, são
+validadas e deduplicadas e vão para um CSV no mesmo formato do
+quiz_perguntas.csv:
+
+    python gerador_perguntas.py --saida quiz_gerado.csv
+"""
+import argparse
+import hashlib
+import itertools
+import os
+import random
+import re
+import time
+
+import pandas as pd
+
+from similaridade import calcular_vizinhos, calcular_vizinhos_texto
+from utilitarios import normalizar_texto, numeros_do_texto, valor_medio
+
+CAMINHO_GERADAS = os.environ.get("MUSEU_QUIZ_GERADO", "quiz_gerado.csv")
+
+# Quantos dos distratores mais parecidos entram nas combinações de cada pergunta
+POOL_DISTRATORES = 6
+VIZINHOS = 15
+N_OPCOES = 4
+
+COLUNAS = ["id", "modelo", "pergunta", "opcao_1", "opcao_2", "opcao_3", "opcao_4", "resposta", "explicacao"]
+
+# Fatores para converter o tempo de decomposição para anos
+_UNIDADES_ANOS = {"dia": 1 / 365, "semana": 7 / 365, "mes": 1 / 12, "ano": 1.0}
+
+
+class Item:
+    """Uma pergunta antes de escolher os distratores."""
+
+    def __init__(self, modelo, pergunta, correta, candidatos, explicacao, detalhe=None):
+        self.modelo = modelo
+        self.pergunta = pergunta
+        self.correta = correta
+        # (alternativa, dado que a justifica) do mais para o menos parecido; pode ser um gerador
+        # preguiçoso, já que só os primeiros distratores válidos são usados
+        self.candidatos = candidatos
+        self.explicacao = explicacao
+        self.detalhe = detalhe  # dado da resposta certa (se houver, os dados entram na explicação)
+
+
+def anos_decomposicao(texto):
+    """'15 dias a 6 meses' -> média em anos; NaN para 'Indeterminado' e afins."""
+    texto = re.sub(r"(?<=\d)\.(?=\d{3}\b)", "", normalizar_texto(texto)).replace(",", ".")
+    valores, pendentes = [], []
+    for parte in re.findall(r"\d+(?:\.\d+)?|dias?|semanas?|mes(?:es)?|anos?", texto):
+        if parte[0].isdigit():
+            pendentes.append(float(parte))
+            continue
+        fator = next(f for unidade, f in _UNIDADES_ANOS.items() if parte.startswith(unidade))
+        valores += [n * fator for n in pendentes]
+        pendentes = []
+    return sum(valores) / len(valores) if valores else float("nan")
+
+
+def _unicos(candidatos, excluir, limite=None):
+    """
+    Primeiros `limite` candidatos (texto, detalhe) sem repetir texto (comparando
+    sem acentos/maiúsculas). Para de consumir os candidatos assim que completa.
+    """
+    vistos = {normalizar_texto(v) for v in excluir}
+    saida = []
+    for candidato in candidatos:
+        chave = normalizar_texto(candidato[0])
+        if chave and chave not in vistos:
+            vistos.add(chave)
+            saida.append(candidato)
+            if limite is not None and len(saida) >= limite:
+                break
+    return saida
+
+
+def _ordem_similaridade(vizinhos, posicao, n):
+    """Posições das linhas: primeiro os vizinhos mais parecidos, depois o resto (sob demanda)."""
+    proximas = [i for i, _ in vizinhos.vizinhos(posicao)]
+    yield from proximas
+    conjunto = set(proximas) | {posicao}
+    yield from (i for i in range(n) if i not in conjunto)
+
+
+def _sem_detalhe(textos):
+    return ((texto, None) for texto in textos)
+
+
+def _rotulo_polimero(row):
+    sigla, nome = str(row["Sigla"]).strip(), str(row["Nome"]).strip()
+    return nome if sigla in nome else f"{nome} ({sigla})"
+
+
+def _separar(texto):
+    return [parte.strip() for parte in str(texto).split(",") if parte.strip()]
+
+
+def _exemplo(texto):
+    return texto[0].upper() + texto[1:]
+
+
+def _intercalar(exemplos, linhas, maximo=3):
+    """1º exemplo de cada linha, depois o 2º... (evita três distratores da mesma linha)."""
+    linhas = list(itertools.islice(linhas, POOL_DISTRATORES * 4))
+    return [exemplos[j][k] for k in range(maximo) for j in linhas if k < len(exemplos[j])]
+
+
+def _rotas_parecidas(a, b):
+    """Rotas que compartilham uma etapa ("Reciclagem mecânica" x "Coleta seletiva, reciclagem mecânica")."""
+    partes_a = [normalizar_texto(p) for p in _separar(a)]
+    partes_b = [normalizar_texto(p) for p in _separar(b)]
+    return any(pa in pb or pb in pa for pa in partes_a for pb in partes_b)
+
+
+def itens_polimeros(polimeros: pd.DataFrame):
+    polimeros = polimeros.reset_index(drop=True)
+    n = len(polimeros)
+    vizinhos = calcular_vizinhos(polimeros, k=VIZINHOS)
+    rotulos = [_rotulo_polimero(row) for _, row in polimeros.iterrows()]
+    siglas = polimeros["Sigla"].astype(str).str.strip().tolist()
+    codigos = polimeros["Código"].astype(str).str.strip().tolist()
+    tipos = polimeros["Tipo de Polimerização"].astype(str).str.strip().tolist()
+    aplicacoes = [_separar(a) for a in polimeros["Aplicações Comuns"].fillna("")]
+    aplicacoes_norm = [{normalizar_texto(a) for a in lista} for lista in aplicacoes]
+    densidades = [numeros_do_texto(d) for d in polimeros["Densidade"]]
+    fusao = polimeros["Ponto de Fusão"].map(valor_medio).tolist()
+    todos_codigos = sorted(set(codigos), key=lambda c: (len(c), c))
+
+    def alternativas(linhas, coluna=None):
+        return ((rotulos[j], None if coluna is None else polimeros.at[j, coluna]) for j in linhas)
+
+    for i, row in polimeros.iterrows():
+        ordem = lambda: _ordem_similaridade(vizinhos, i, n)
+        sigla, rotulo, codigo = siglas[i], rotulos[i], codigos[i]
+
+        # Código de resina: distratores vêm dos códigos dos polímeros parecidos
+        candidatos = _unicos(_sem_detalhe(itertools.chain((codigos[j] for j in ordem()), todos_codigos)), [codigo], POOL_DISTRATORES)
+        explicacao = f"O {sigla} é identificado pelo código {codigo} no símbolo de reciclagem. O código 7 reúne os demais plásticos."
+        for pergunta in (f"Qual é o código de resina (o número dentro do triângulo ♻) do {rotulo}?",
+                         f"Que número aparece no símbolo de reciclagem de uma peça de {sigla}?"):
+            yield Item("codigo_resina", pergunta, codigo, candidatos, explicacao)
+
+        yield Item("sigla", f"Qual é a sigla do {row['Nome']}?", sigla,
+                   _sem_detalhe(siglas[j] for j in ordem()),
+                   f"{row['Nome']} é abreviado como {sigla}. Aplicações comuns: {row['Aplicações Comuns']}.")
+
+        # Aplicação: polímeros que também listam a mesma aplicação não servem de distrator
+        for aplicacao in aplicacoes[i]:
+            chave = normalizar_texto(aplicacao)
+            yield Item("aplicacao", f"Qual destes polímeros é usado em {aplicacao.lower()}?", rotulo,
+                       alternativas(j for j in ordem() if chave not in aplicacoes_norm[j]),
+                       f"O {sigla} é usado em: {row['Aplicações Comuns']}.")
+
+        # Flutua/afunda: só entram polímeros com a faixa de densidade inteira longe de 1 g/cm³
+        densidade = row["Densidade"]
+        if densidades[i] and max(densidades[i]) < 0.98:
+            yield Item("flutua", "Qual destes plásticos flutua na água?", rotulo,
+                       alternativas((j for j in ordem() if densidades[j] and min(densidades[j]) > 1.02), "Densidade"),
+                       "Materiais menos densos que a água (1 g/cm³) flutuam. Isso é usado para separar plásticos nas usinas de reciclagem.",
+                       densidade)
+        if densidades[i] and min(densidades[i]) > 1.02:
+            yield Item("afunda", "Qual destes plásticos afunda na água?", rotulo,
+                       alternativas((j for j in ordem() if densidades[j] and max(densidades[j]) < 0.98), "Densidade"),
+                       "Materiais mais densos que a água (1 g/cm³) afundam. Isso é usado para separar plásticos nas usinas de reciclagem.",
+                       densidade)
+
+        # Comparações: a resposta precisa ganhar com folga de todos os distratores
+        if densidades[i]:
+            yield Item("mais_denso", "Qual destes polímeros é o mais denso?", rotulo,
+                       alternativas((j for j in ordem() if densidades[j] and max(densidades[j]) < 0.97 * min(densidades[i])), "Densidade"),
+                       "Compare as densidades:", densidade)
+        if fusao[i] == fusao[i]:
+            yield Item("fusao", "Qual destes polímeros tem o maior ponto de fusão?", rotulo,
+                       alternativas((j for j in ordem() if fusao[j] < fusao[i] - 20), "Ponto de Fusão"),
+                       "Compare os pontos de fusão:", row["Ponto de Fusão"])
+
+        yield Item("polimerizacao", f"Qual destes polímeros é obtido por {tipos[i].lower()}?", rotulo,
+                   alternativas((j for j in ordem() if tipos[j] != tipos[i]), "Tipo de Polimerização"),
+                   f"O {sigla} é obtido por {tipos[i].lower()}.", tipos[i])
+
+
+def itens_residuos(residuos: pd.DataFrame):
+    residuos = residuos.reset_index(drop=True)
+    n = len(residuos)
+    textos = (residuos["Tipo"].fillna("") + " " + residuos["Exemplos Comuns"].fillna("") + " "
+              + residuos["Rota de Tratamento"].fillna("") + " " + residuos["Descrição Técnica"].fillna("")).tolist()
+    vizinhos = calcular_vizinhos_texto(textos, k=VIZINHOS)
+    tipos = residuos["Tipo"].astype(str).str.strip().tolist()
+    rotas = residuos["Rota de Tratamento"].astype(str).str.strip().tolist()
+    exemplos = [[_exemplo(e) for e in _separar(x)] for x in residuos["Exemplos Comuns"].fillna("")]
+    anos = residuos["Tempo de Decomposição"].map(anos_decomposicao).tolist()
+    reciclavel = residuos["Reciclável"].map(normalizar_texto).tolist()
+    todos_tipos = sorted(set(tipos))
+
+    tempos = residuos["Tempo de Decomposição"].astype(str).tolist()
+
+    for i, row in residuos.iterrows():
+        ordem = lambda: _ordem_similaridade(vizinhos, i, n)
+        for exemplo in exemplos[i]:
+            # "Vidro plano" é rejeito: "Vidro" não pode ser distrator
+            citados = normalizar_texto(exemplo)
+            yield Item("tipo_residuo", f"Em qual categoria se enquadra o resíduo “{exemplo.lower()}”?", tipos[i],
+                       _sem_detalhe(t for t in itertools.chain((tipos[j] for j in ordem()), todos_tipos)
+                                    if normalizar_texto(t) not in citados),
+                       f"{exemplo} é um resíduo do tipo {tipos[i].lower()}. {row['Descrição Técnica']}")
+            yield Item("rota", f"Qual é o destino adequado para “{exemplo.lower()}”?", rotas[i],
+                       _sem_detalhe(rotas[j] for j in ordem() if tipos[j] != tipos[i] and not _rotas_parecidas(rotas[j], rotas[i])),
+                       f"Destino indicado: {rotas[i].lower()}. {row['Descrição Técnica']}")
+
+            # Tempo de decomposição: os distratores duram no máximo metade do tempo da resposta
+            if anos[i] == anos[i]:
+                yield Item("decomposicao", "Qual destes itens demora mais para se decompor no ambiente?", exemplo,
+                           ((exemplos[j][0], tempos[j]) for j in ordem()
+                            if exemplos[j] and anos[j] == anos[j] and anos[j] <= anos[i] / 2),
+                           "Tempo de decomposição aproximado:", tempos[i])
+
+            # "Não" e "Sim" puros; casos com ressalvas (compostável, limitado...) ficam de fora
+            if reciclavel[i] == "nao":
+                yield Item("nao_reciclavel", "Qual destes itens NÃO pode ir para a reciclagem?", exemplo,
+                           _sem_detalhe(_intercalar(exemplos, (j for j in ordem() if reciclavel[j] == "sim"))),
+                           f"{exemplo}: {rotas[i].lower()}. {row['Descrição Técnica']}")
+            if tipos[i] == "Perigoso":
+                yield Item("perigoso", "Qual destes itens é um resíduo perigoso, que não pode ir para o lixo comum?",
+                           exemplo, _sem_detalhe(_intercalar(exemplos, (j for j in ordem() if tipos[j] != "Perigoso"))),
+                           f"{exemplo}: {rotas[i].lower()}. {row['Descrição Técnica']}")
+
+
+def _valida(opcoes):
+    normalizadas = [normalizar_texto(o) for o in opcoes]
+    return len(opcoes) == N_OPCOES and all(normalizadas) and len(set(normalizadas)) == N_OPCOES
+
+
+def gerar_perguntas(polimeros, residuos, variantes_por_item=20, pool=POOL_DISTRATORES, limite=None, semente=0):
+    """
+    DataFrame com as perguntas geradas (colunas COLUNAS). As variantes de cada
+    item combinam os `pool` distratores mais parecidos, das combinações mais
+    plausíveis para as menos plausíveis.
+    """
+    rng = random.Random(semente)
+    vistas = set()
+    linhas = []
+    for item in itertools.chain(itens_polimeros(polimeros), itens_residuos(residuos)):
+        distratores = _unicos(item.candidatos, [item.correta], pool)
+        chave_pergunta = normalizar_texto(item.pergunta)
+        for escolha in itertools.islice(itertools.combinations(distratores, N_OPCOES - 1), variantes_por_item):
+            opcoes = [texto for texto, _ in escolha]
+            detalhes = [detalhe for _, detalhe in escolha]
+            posicao = rng.randrange(N_OPCOES)
+            opcoes.insert(posicao, item.correta)
+            detalhes.insert(posicao, item.detalhe)
+            chave = (chave_pergunta, frozenset(normalizar_texto(o) for o in opcoes))
+            if not _valida(opcoes) or chave in vistas:
+                continue
+            vistas.add(chave)
+
+            explicacao = item.explicacao
+            if item.detalhe is not None:
+                explicacao += " " + "; ".join(f"{o}: {d}" for o, d in zip(opcoes, detalhes)) + "."
+            identificador = hashlib.sha1("|".join([item.pergunta, *sorted(opcoes)]).encode("utf-8")).hexdigest()[:12]
+            linhas.append((identificador, item.modelo, item.pergunta, *opcoes, posicao + 1, explicacao))
+            if limite is not None and len(linhas) >= limite:
+                return pd.DataFrame(linhas, columns=COLUNAS)
+    return pd.DataFrame(linhas, columns=COLUNAS)
+
+
+def assinatura_tabelas(polimeros: pd.DataFrame, residuos: pd.DataFrame):
+    """Hash das duas tabelas de origem: muda quando qualquer célula ou coluna muda."""
+    h = hashlib.sha1()
+    for tabela in (polimeros, residuos):
+        h.update("|".join(map(str, tabela.columns)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(tabela, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:16]
+
+
+def _caminho_origem(caminho):
+    return f"{caminho}.origem"
+
+
+def origem_perguntas(caminho=CAMINHO_GERADAS):
+    """Assinatura das tabelas com que o CSV foi gerado; None se não há registro."""
+    try:
+        with open(_caminho_origem(caminho), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def salvar_perguntas(perguntas: pd.DataFrame, caminho=CAMINHO_GERADAS, origem=None):
+    """
+    Grava num arquivo temporário e troca de uma vez: o app nunca lê um CSV pela
+    metade. `origem` (assinatura_tabelas) vai para caminho.origem, ao lado.
+    """
+    temporario = f"{caminho}.tmp"
+    perguntas.to_csv(temporario, sep=";", index=False, encoding="utf-8")
+    os.replace(temporario, caminho)
+    if origem is None:
+        if os.path.exists(_caminho_origem(caminho)):
+            os.remove(_caminho_origem(caminho))
+        return
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(origem)
+    os.replace(temporario, _caminho_origem(caminho))
+
+
+def registros_perguntas(perguntas: pd.DataFrame):
+    """DataFrame gerado -> lista de dicionários no formato usado pelo quiz."""
+    opcoes = zip(perguntas["opcao_1"], perguntas["opcao_2"], perguntas["opcao_3"], perguntas["opcao_4"])
+    return [
+        {"id": pid, "pergunta": pergunta, "opcoes": list(alternativas), "resposta": int(resposta) - 1, "explicacao": explicacao}
+        for pid, pergunta, alternativas, resposta, explicacao
+        in zip(perguntas["id"], perguntas["pergunta"], opcoes, perguntas["resposta"], perguntas["explicacao"])
+    ]
+
+
+def carregar_perguntas(caminho=CAMINHO_GERADAS):
+    """Lê o CSV gerado; lista vazia se ele ainda não existe."""
+    if not os.path.isfile(caminho):
+        return []
+    return registros_perguntas(pd.read_csv(caminho, sep=";", encoding="utf-8", dtype=str, keep_default_na=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera perguntas do quiz a partir das tabelas de polímeros e resíduos.")
+    parser.add_argument("--polimeros", default="polimeros.csv")
+    parser.add_argument("--residuos", default="residuos.csv")
+    parser.add_argument("--saida", default=CAMINHO_GERADAS)
+    parser.add_argument("--variantes", type=int, default=20, help="variantes por item (combinações de distratores)")
+    parser.add_argument("--distratores", type=int, default=POOL_DISTRATORES, help="distratores mais parecidos considerados")
+    parser.add_argument("--limite", type=int, default=None, help="número máximo de perguntas")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    polimeros, residuos = pd.read_csv(args.polimeros, sep=";"), pd.read_csv(args.residuos, sep=";")
+    perguntas = gerar_perguntas(
+        polimeros, residuos,
+        variantes_por_item=args.variantes, pool=args.distratores, limite=args.limite, semente=args.semente
+    )
+    salvar_perguntas(perguntas, args.saida, assinatura_tabelas(polimeros, residuos))
+    print(f"{len(perguntas)} perguntas em {time.perf_counter() - inicio:.1f} s -> {args.saida}")
+    print(perguntas["modelo"].value_counts().to_string())
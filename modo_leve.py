@@ -0,0 +1,118 @@
+"""
+Modo leve: para quem abre o app com pacote de dados ou no Wi-Fi lotado do museu.
+
+Imagens vão em versões reduzidas (JPEG pequeno), as decorativas são puladas e
+gráficos e mapas só carregam depois de um toque. Cada seção tem um orçamento
+de bytes; o que passaria do orçamento também fica atrás de um toque, e o
+rodapé mostra quanto cada seção enviou.
+"""
+import functools
+import io
+
+import pyarrow as pa
+from PIL import Image
+
+from chamada_unica import ChamadaUnica
+
+# Bytes que cada seção pode enviar no modo leve
+ORCAMENTO_SECAO = 300_000
+
+# Lado maior (px) e qualidade JPEG das variantes leves
+LADO_LEVE = 320
+LADO_LEVE_MINIATURA = 120
+QUALIDADE_LEVE = 55
+
+# Variantes sendo geradas: sessões que pedem a mesma imagem ao mesmo tempo esperam uma redução só
+_voo_variantes = ChamadaUnica("variantes_leves")
+
+# Conexões que o navegador informa como lentas (cabeçalho ECT, Network Information API)
+CONEXOES_LENTAS = {"slow-2g", "2g", "3g"}
+
+
+def cliente_pede_leve(cabecalhos):
+    """
+    True quando o navegador pede economia de dados (Save-Data: on) ou informa
+    rede lenta (ECT 2g/3g ou Downlink abaixo de 1 Mbps).
+    """
+    cabecalhos = {chave.lower(): str(valor).strip().lower() for chave, valor in dict(cabecalhos or {}).items()}
+    if cabecalhos.get("save-data") == "on":
+        return True
+    if cabecalhos.get("ect") in CONEXOES_LENTAS:
+        return True
+    try:
+        return float(cabecalhos.get("downlink", "inf")) < 1.0
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=512)
+def variante_leve(conteudo_hash, caminho, lado=LADO_LEVE, qualidade=QUALIDADE_LEVE):
+    """
+    JPEG reduzido da imagem. O hash do conteúdo (acervo.py) entra na chave do
+    cache: uma imagem trocada gera outra variante.
+    """
+    return _voo_variantes.executar((conteudo_hash, lado, qualidade),
+                                   lambda: _reduzir(caminho, lado, qualidade))
+
+
+def _reduzir(caminho, lado, qualidade):
+    with Image.open(caminho) as img:
+        img.thumbnail((lado, lado))
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            fundo = Image.new("RGB", img.size, (255, 255, 255))
+            fundo.paste(img, mask=img.getchannel("A"))
+            img = fundo
+        else:
+            img = img.convert("RGB")
+        saida = io.BytesIO()
+        img.save(saida, format="JPEG", quality=qualidade, optimize=True)
+    return saida.getvalue()
+
+
+def tamanho_figura(fig):
+    """Bytes da figura plotly enviada ao navegador (JSON)."""
+    return len(fig.to_json().encode("utf-8"))
+
+
+def tamanho_mapa(mapa):
+    """Bytes do HTML do mapa folium (sem os tiles, que o navegador baixa depois)."""
+    return len(mapa.get_root().render().encode("utf-8"))
+
+
+def tamanho_tabela(df):
+    """Bytes aproximados da tabela em Arrow, formato em que o Streamlit a envia."""
+    return pa.Table.from_pandas(df, preserve_index=False).nbytes
+
+
+def formatar_bytes(n):
+    return f"{n / 1000:.0f} KB" if n < 1_000_000 else f"{n / 1_000_000:.1f} MB"
+
+
+class OrcamentoBytes:
+    """Bytes enviados por seção numa execução da página."""
+
+    def __init__(self, leve, limite=ORCAMENTO_SECAO):
+        self.leve = leve
+        self.limite = limite
+        self.secoes = {}
+        self.atual = None
+
+    def secao(self, nome):
+        self.atual = nome
+        self.secoes.setdefault(nome, 0)
+
+    def cabe(self, n):
+        """No modo normal tudo cabe; no leve, só o que não estoura o orçamento da seção."""
+        return not self.leve or self.secoes.get(self.atual, 0) + n <= self.limite
+
+    def registrar(self, n):
+        self.secoes[self.atual] = self.secoes.get(self.atual, 0) + n
+
+    def resumo(self):
+        """Texto do rodapé: bytes por seção, com aviso nas que passaram do orçamento."""
+        partes = []
+        for nome, n in self.secoes.items():
+            alerta = " ⚠️" if self.leve and n > self.limite else ""
+            partes.append(f"{nome} ≈ {formatar_bytes(n)}{alerta}")
+        return " · ".join(partes)
@@ -0,0 +1,153 @@
+"""
+Quiz adaptativo com o modelo de Rasch (TRI de 1 parâmetro).
+
+As dificuldades das perguntas são ajustadas em lote a partir das respostas
+registradas (python quiz_adaptativo.py) e salvas num arquivo .npz compacto.
+Durante o quiz, a habilidade do estudante é estimada a cada resposta e a
+próxima pergunta é a de dificuldade mais próxima dessa estimativa, que é a
+mais informativa no modelo de Rasch.
+"""
+import argparse
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from registro_respostas import CAMINHO_BANCO, SESSAO_ANONIMA
+
+CAMINHO_PARAMETROS = os.environ.get("MUSEU_PARAMETROS_ITENS", "parametros_itens.npz")
+
+# Grade de habilidades usada na estimativa (EAP) com priori normal padrão
+GRADE_HABILIDADE = np.linspace(-4, 4, 81)
+LOG_PRIORI = -0.5 * GRADE_HABILIDADE ** 2
+
+
+def _sigmoide(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def ajustar_rasch(sessoes, itens, acertos, iteracoes=50, tolerancia=1e-4):
+    """
+    Ajuste conjunto (JML com prioris normais) de habilidades e dificuldades.
+    Cada passo de Newton é vetorizado com np.bincount sobre todas as respostas.
+    Retorna (dificuldades, habilidades) indexadas pelos códigos de item/sessão.
+    """
+    sessoes = np.asarray(sessoes)
+    itens = np.asarray(itens)
+    acertos = np.asarray(acertos, dtype=float)
+    n_sessoes, n_itens = sessoes.max() + 1, itens.max() + 1
+    theta = np.zeros(n_sessoes)
+    b = np.zeros(n_itens)
+
+    for _ in range(iteracoes):
+        p = _sigmoide(theta[sessoes] - b[itens])
+        info = p * (1 - p)
+        residuo = acertos - p
+        # Priori N(0, 1) evita estimativas infinitas para quem acertou/errou tudo
+        passo_theta = (np.bincount(sessoes, residuo, n_sessoes) - theta) / (np.bincount(sessoes, info, n_sessoes) + 1)
+        theta += np.clip(passo_theta, -1, 1)
+
+        p = _sigmoide(theta[sessoes] - b[itens])
+        info = p * (1 - p)
+        passo_b = (np.bincount(itens, p - acertos, n_itens) - b) / (np.bincount(itens, info, n_itens) + 1)
+        b += np.clip(passo_b, -1, 1)
+
+        if max(np.abs(passo_theta).max(), np.abs(passo_b).max()) < tolerancia:
+            break
+
+    return b, theta
+
+
+def ajustar_do_banco(caminho_banco=CAMINHO_BANCO, caminho_saida=CAMINHO_PARAMETROS, tamanho_bloco=1_000_000):
+    """
+    Lê as respostas registradas em blocos, ajusta o modelo e salva as dificuldades.
+    Respostas sem sessão (SESSAO_ANONIMA, vindas da API) ficam de fora: juntas
+    pareceriam um único estudante e distorceriam as dificuldades.
+    """
+    conexao = sqlite3.connect(f"file:{caminho_banco}?mode=ro", uri=True)
+    partes = pd.read_sql_query("SELECT sessao, pergunta_id, correta FROM respostas WHERE sessao != ?", conexao,
+                               params=(SESSAO_ANONIMA,), chunksize=tamanho_bloco)
+    respostas = pd.concat(list(partes), ignore_index=True)
+    conexao.close()
+    if respostas.empty:
+        raise ValueError("Não há respostas registradas para ajustar o modelo")
+
+    codigos_sessao, sessoes = np.unique(respostas["sessao"].to_numpy(), return_inverse=True)
+    codigos_item, itens = np.unique(respostas["pergunta_id"].to_numpy(), return_inverse=True)
+    dificuldades, _ = ajustar_rasch(sessoes, itens, respostas["correta"].to_numpy())
+
+    np.savez_compressed(
+        caminho_saida,
+        ids=codigos_item.astype("U12"),
+        dificuldades=dificuldades.astype(np.float32),
+        respostas=np.bincount(itens, minlength=len(codigos_item)).astype(np.int32),
+    )
+    return len(respostas), len(codigos_sessao), len(codigos_item)
+
+
+def carregar_parametros(caminho=CAMINHO_PARAMETROS):
+    """{id da pergunta: dificuldade}; vazio se o ajuste ainda não foi feito."""
+    if not os.path.isfile(caminho):
+        return {}
+    with np.load(caminho) as dados:
+        return dict(zip(dados["ids"].tolist(), dados["dificuldades"].tolist()))
+
+
+class BancoAdaptativo:
+    """
+    Perguntas ordenadas por dificuldade para escolher a próxima com busca binária.
+    `grupos` (opcional) junta variantes do mesmo enunciado: só uma delas entra por partida.
+    """
+
+    def __init__(self, ids, dificuldades, grupos=None):
+        ordem = np.argsort(dificuldades, kind="stable")
+        self.ids = np.asarray(ids)[ordem]
+        self.dificuldades = np.asarray(dificuldades, dtype=np.float32)[ordem]
+        self.grupos = [ids[i] for i in ordem] if grupos is None else [grupos[i] for i in ordem]
+        self.posicao = {pid: i for i, pid in enumerate(self.ids.tolist())}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def proxima(self, habilidade, respondidas):
+        """Id da pergunta não respondida (nem variante de uma respondida) com dificuldade mais próxima da habilidade."""
+        usados = {self.grupos[self.posicao[pid]] for pid in respondidas if pid in self.posicao}
+        centro = int(np.searchsorted(self.dificuldades, habilidade))
+        esquerda, direita = centro - 1, centro
+        while esquerda >= 0 or direita < len(self.ids):
+            if direita < len(self.ids) and (
+                esquerda < 0 or self.dificuldades[direita] - habilidade <= habilidade - self.dificuldades[esquerda]
+            ):
+                candidato, direita = direita, direita + 1
+            else:
+                candidato, esquerda = esquerda, esquerda - 1
+            if self.grupos[candidato] not in usados:
+                return str(self.ids[candidato])
+        return None
+
+    def dificuldade(self, pergunta_id):
+        return float(self.dificuldades[self.posicao[pergunta_id]])
+
+
+def atualizar_habilidade(log_posteriori, dificuldade, correta):
+    """Soma uma resposta à log-posteriori da habilidade (vetor sobre GRADE_HABILIDADE)."""
+    p = _sigmoide(GRADE_HABILIDADE - dificuldade)
+    return log_posteriori + np.log(p if correta else 1 - p)
+
+
+def estimar_habilidade(log_posteriori):
+    """Média (EAP) e desvio padrão da habilidade."""
+    pesos = np.exp(log_posteriori - log_posteriori.max())
+    pesos /= pesos.sum()
+    media = float(pesos @ GRADE_HABILIDADE)
+    return media, float(np.sqrt(pesos @ (GRADE_HABILIDADE - media) ** 2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ajusta as dificuldades das perguntas do quiz (modelo de Rasch).")
+    parser.add_argument("--banco", default=CAMINHO_BANCO, help="banco SQLite com as respostas registradas")
+    parser.add_argument("--saida", default=CAMINHO_PARAMETROS, help="arquivo .npz de saída")
+    args = parser.parse_args()
+    n_respostas, n_sessoes, n_itens = ajustar_do_banco(args.banco, args.saida)
+    print(f"{n_itens} perguntas ajustadas com {n_respostas} respostas de {n_sessoes} sessões -> {args.saida}")
@@ -0,0 +1,308 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+# Banco local das respostas do quiz (pode ser trocado pela variável de ambiente)
+CAMINHO_BANCO = os.environ.get("MUSEU_BANCO_RESPOSTAS", "respostas_quiz.db")
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS respostas (
+    id INTEGER PRIMARY KEY,
+    momento REAL NOT NULL,
+    sessao TEXT NOT NULL,
+    turma TEXT,
+    pergunta_id TEXT NOT NULL,
+    opcao INTEGER NOT NULL,
+    correta INTEGER NOT NULL,
+    latencia_ms INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_respostas_pergunta ON respostas (pergunta_id);
+
+-- Agregados mantidos a cada lote gravado, para que as análises não varram o histórico
+CREATE TABLE IF NOT EXISTS agregado_pergunta (
+    pergunta_id TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    acertos INTEGER NOT NULL,
+    soma_latencia_ms INTEGER NOT NULL,
+    n_latencia INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS agregado_opcao (
+    pergunta_id TEXT NOT NULL,
+    opcao INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (pergunta_id, opcao)
+);
+CREATE TABLE IF NOT EXISTS agregado_latencia (
+    pergunta_id TEXT NOT NULL,
+    faixa INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (pergunta_id, faixa)
+);
+CREATE TABLE IF NOT EXISTS agregado_dia (
+    pergunta_id TEXT NOT NULL,
+    dia TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    acertos INTEGER NOT NULL,
+    PRIMARY KEY (pergunta_id, dia)
+);
+"""
+
+# Sessão das respostas que chegam pela API sem identificar o cliente: não são de um único
+# estudante, então ficam fora do ajuste das dificuldades (quiz_adaptativo.py)
+SESSAO_ANONIMA = "api"
+
+# Respostas à espera na fila acima disso são descartadas (banco fora do ar por muito tempo)
+MAXIMO_NA_FILA = 100_000
+# Espera entre tentativas de gravar um lote que falhou: dobra a cada falha, até o máximo
+ESPERA_TENTATIVA_S = 0.5
+ESPERA_TENTATIVA_MAXIMA_S = 30
+# Ao fechar, desiste do lote depois destas tentativas
+TENTATIVAS_AO_FECHAR = 3
+
+logger = logging.getLogger(__name__)
+
+# Limites superiores (em segundos) das faixas do histograma de tempo de resposta
+FAIXAS_LATENCIA_S = [2, 5, 10, 20, 40, 60]
+
+_FIM = object()
+
+
+def faixa_latencia(latencia_ms):
+    """Índice da faixa do histograma (a última faixa é "mais de 60 s")."""
+    segundos = latencia_ms / 1000
+    for faixa, limite in enumerate(FAIXAS_LATENCIA_S):
+        if segundos < limite:
+            return faixa
+    return len(FAIXAS_LATENCIA_S)
+
+
+def atualizar_agregados(conexao, lote):
+    """Soma um lote de respostas aos agregados (deve rodar na mesma transação do INSERT)."""
+    perguntas = Counter()
+    acertos = Counter()
+    latencias = Counter()
+    n_latencias = Counter()
+    opcoes = Counter()
+    faixas = Counter()
+    dias = Counter()
+    acertos_dia = Counter()
+    for momento, _, _, pergunta_id, opcao, correta, latencia_ms in lote:
+        dia = datetime.fromtimestamp(momento).strftime("%Y-%m-%d")
+        perguntas[pergunta_id] += 1
+        acertos[pergunta_id] += correta
+        opcoes[(pergunta_id, opcao)] += 1
+        dias[(pergunta_id, dia)] += 1
+        acertos_dia[(pergunta_id, dia)] += correta
+        if latencia_ms is not None:
+            latencias[pergunta_id] += latencia_ms
+            n_latencias[pergunta_id] += 1
+            faixas[(pergunta_id, faixa_latencia(latencia_ms))] += 1
+
+    conexao.executemany(
+        "INSERT INTO agregado_pergunta VALUES (?, ?, ?, ?, ?) ON CONFLICT (pergunta_id) DO UPDATE SET "
+        "total = total + excluded.total, acertos = acertos + excluded.acertos, "
+        "soma_latencia_ms = soma_latencia_ms + excluded.soma_latencia_ms, n_latencia = n_latencia + excluded.n_latencia",
+        [(p, n, acertos[p], latencias[p], n_latencias[p]) for p, n in perguntas.items()]
+    )
+    conexao.executemany(
+        "INSERT INTO agregado_opcao VALUES (?, ?, ?) ON CONFLICT (pergunta_id, opcao) DO UPDATE SET "
+        "total = total + excluded.total",
+        [(p, o, n) for (p, o), n in opcoes.items()]
+    )
+    conexao.executemany(
+        "INSERT INTO agregado_latencia VALUES (?, ?, ?) ON CONFLICT (pergunta_id, faixa) DO UPDATE SET "
+        "total = total + excluded.total",
+        [(p, f, n) for (p, f), n in faixas.items()]
+    )
+    conexao.executemany(
+        "INSERT INTO agregado_dia VALUES (?, ?, ?, ?) ON CONFLICT (pergunta_id, dia) DO UPDATE SET "
+        "total = total + excluded.total, acertos = acertos + excluded.acertos",
+        [(p, d, n, acertos_dia[(p, d)]) for (p, d), n in dias.items()]
+    )
+
+
+def conectar(caminho=CAMINHO_BANCO):
+    """Conexão SQLite em modo WAL: leitores não bloqueiam o escritor."""
+    conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    conexao.execute("PRAGMA synchronous=NORMAL")
+    conexao.executescript(ESQUEMA)
+    # Bancos gravados antes dos agregados existirem: reconstrói uma única vez
+    with conexao:
+        vazio = conexao.execute("SELECT NOT EXISTS (SELECT 1 FROM agregado_pergunta)").fetchone()[0]
+        if vazio and conexao.execute("SELECT EXISTS (SELECT 1 FROM respostas)").fetchone()[0]:
+            cursor = conexao.execute(
+                "SELECT momento, sessao, turma, pergunta_id, opcao, correta, latencia_ms FROM respostas"
+            )
+            while lote := cursor.fetchmany(50000):
+                atualizar_agregados(conexao, lote)
+    return conexao
+
+
+class RegistroRespostas:
+    """
+    Grava as respostas do quiz em segundo plano (write-behind).
+    O clique em "Enviar resposta" só coloca o evento numa fila em memória;
+    uma thread dedicada junta os eventos em lotes e grava tudo numa única transação.
+    Um lote que não pôde ser gravado (banco travado, disco cheio, sem conexão)
+    volta a ser tentado com espera crescente; enquanto isso a fila segue
+    recebendo respostas, até MAXIMO_NA_FILA. Respostas com dado inválido
+    são descartadas uma a uma, sem segurar as outras.
+    """
+
+    def __init__(self, caminho=CAMINHO_BANCO, tamanho_lote=500, espera_lote=0.2, maximo_na_fila=MAXIMO_NA_FILA):
+        self.caminho = caminho
+        self.tamanho_lote = tamanho_lote
+        self.espera_lote = espera_lote
+        self.maximo_na_fila = maximo_na_fila
+        self.fila = queue.SimpleQueue()
+        self.gravadas = 0
+        self.lotes = 0
+        self.descartadas = 0
+        self._fechado = False
+        self._trava_escritor = threading.Lock()
+        self._thread = None
+        self._iniciar_escritor()
+        atexit.register(self.fechar)
+
+    def _iniciar_escritor(self):
+        with self._trava_escritor:
+            if self._fechado or (self._thread is not None and self._thread.is_alive()):
+                return
+            if self._thread is not None:
+                logger.error("A thread de gravação das respostas parou; iniciando outra")
+            self._thread = threading.Thread(target=self._executar, name="registro-respostas", daemon=True)
+            self._thread.start()
+
+    def registrar(self, sessao, pergunta_id, opcao, correta, latencia_ms=None, turma=None):
+        """Enfileira uma resposta; nunca espera pelo disco. False se a resposta foi descartada."""
+        if self._fechado:
+            return False
+        if not self._thread.is_alive():
+            self._iniciar_escritor()
+        if self.fila.qsize() >= self.maximo_na_fila:
+            self.descartadas += 1
+            if self.descartadas == 1 or self.descartadas % 1000 == 0:
+                logger.warning("Fila de respostas cheia (%d): %d respostas descartadas até agora",
+                               self.maximo_na_fila, self.descartadas)
+            return False
+        self.fila.put((time.time(), sessao, turma or None, pergunta_id, int(opcao), int(bool(correta)),
+                       None if latencia_ms is None else int(latencia_ms)))
+        return True
+
+    def esvaziar(self, timeout=10):
+        """Espera até que tudo o que já foi enfileirado esteja gravado."""
+        concluido = threading.Event()
+        self.fila.put(concluido)
+        return concluido.wait(timeout)
+
+    def fechar(self, timeout=10):
+        self._fechado = True
+        if self._thread.is_alive():
+            self.fila.put(_FIM)
+            self._thread.join(timeout)
+
+    def _gravar(self, conexao, lote):
+        with conexao:
+            conexao.executemany(
+                "INSERT INTO respostas (momento, sessao, turma, pergunta_id, opcao, correta, latencia_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                lote
+            )
+            atualizar_agregados(conexao, lote)
+        self.gravadas += len(lote)
+        self.lotes += 1
+
+    def _gravar_com_tentativas(self, conexao, lote, encerrando):
+        """Grava o lote, reconectando e esperando entre as tentativas; retorna a conexão (ou None)."""
+        falhas = 0
+        while True:
+            try:
+                if conexao is None:
+                    conexao = conectar(self.caminho)
+                self._gravar(conexao, lote)
+                return conexao
+            except (sqlite3.ProgrammingError, sqlite3.InterfaceError, sqlite3.IntegrityError, sqlite3.DataError,
+                    ValueError, TypeError, OverflowError):
+                # Dado inválido no lote: tentar de novo não adianta. Grava as respostas uma a uma
+                # para perder só as inválidas
+                if len(lote) > 1:
+                    logger.warning("Lote de %d respostas do quiz com dado inválido; gravando uma a uma", len(lote))
+                    for linha in lote:
+                        conexao = self._gravar_com_tentativas(conexao, [linha], encerrando)
+                    return conexao
+                logger.exception("Resposta do quiz descartada: %r", lote[0])
+                self.descartadas += 1
+                return conexao
+            except sqlite3.OperationalError:
+                # Banco travado ou ocupado, disco cheio, sem conexão: tenta de novo
+                falhas += 1
+                logger.exception("Erro ao gravar %d respostas do quiz (tentativa %d)", len(lote), falhas)
+                if conexao is not None:
+                    conexao.close()
+                    conexao = None
+                if encerrando and falhas >= TENTATIVAS_AO_FECHAR:
+                    logger.error("Encerrando sem gravar %d respostas do quiz", len(lote))
+                    return None
+                time.sleep(min(ESPERA_TENTATIVA_S * 2 ** (falhas - 1), ESPERA_TENTATIVA_MAXIMA_S))
+            except Exception:
+                # Qualquer outro erro (banco corrompido, falha inesperada) não passa tentando de novo
+                logger.exception("Lote de %d respostas do quiz descartado", len(lote))
+                self.descartadas += len(lote)
+                return conexao
+
+    def _executar(self):
+        conexao = None
+        try:
+            while True:
+                item = self.fila.get()
+                lote, sinais, encerrar = [], [], False
+                prazo = time.monotonic() + self.espera_lote
+                # Junta o que chegar até encher o lote ou acabar a espera
+                while True:
+                    if item is _FIM:
+                        encerrar = True
+                    elif isinstance(item, threading.Event):
+                        sinais.append(item)
+                    else:
+                        lote.append(item)
+                    if encerrar or len(lote) >= self.tamanho_lote:
+                        break
+                    restante = prazo - time.monotonic()
+                    try:
+                        item = self.fila.get(timeout=restante) if restante > 0 else self.fila.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if lote:
+                    conexao = self._gravar_com_tentativas(conexao, lote, encerrar)
+                for sinal in sinais:
+                    sinal.set()
+                if encerrar:
+                    return
+        finally:
+            if conexao is not None:
+                conexao.close()
+
+
+_registro = None
+_trava_registro = threading.Lock()
+
+
+def registro_processo():
+    """
+    O registro de respostas do processo. O app e a API (api.py, servidor.py)
+    gravam pela mesma fila e pela mesma thread: um único escritor no banco, e
+    esvaziar() ou fechar() cobrem todas as respostas do processo.
+    """
+    global _registro
+    with _trava_registro:
+        if _registro is None:
+            _registro = RegistroRespostas()
+        return _registro
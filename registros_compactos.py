@@ -0,0 +1,91 @@
+"""
+Registros compactos para as perguntas do quiz e a camada de pontos do mapa.
+
+Com dezenas de milhares de perguntas e pontos, o que pesa na memória do
+processo não são os dados em si, mas a forma de guardá-los: um dict por
+pergunta (tabela de hash, chaves, lista de opções) e, na camada de pontos,
+uma string Python por linha para a camada e os detalhes e uma tupla de
+categorias aceitas por ponto. Aqui:
+
+- Pergunta usa __slots__ (sem dict por instância), é imutável e guarda as
+  opções numa tupla. Textos que se repetem (alternativas, enunciados e
+  explicações das variantes geradas) são internados com sys.intern, então
+  cada texto existe uma vez só no processo. Continua sendo lida como um
+  dicionário (pergunta["opcoes"]), como o resto do app espera.
+- compactar_pontos guarda camada e detalhes como categorias (um código por
+  linha e cada texto uma vez) e faz todos os pontos com as mesmas
+  categorias aceitas apontarem para a mesma tupla.
+
+    python benchmark_memoria.py --tamanhos 1000 10000 50000
+"""
+import sys
+from collections.abc import Mapping
+
+import pandas as pd
+
+from somente_leitura import ErroSomenteLeitura
+
+# Colunas de texto da camada de pontos com poucos valores distintos
+COLUNAS_CATEGORIAS_PONTOS = ["camada", "detalhes"]
+
+
+def _internar(texto):
+    return sys.intern(str(texto))
+
+
+class Pergunta(Mapping):
+    """Pergunta do quiz somente leitura, com os campos do antigo dicionário."""
+
+    __slots__ = ("id", "pergunta", "opcoes", "resposta", "explicacao")
+
+    def __init__(self, id, pergunta, opcoes, resposta, explicacao):
+        definir = object.__setattr__
+        definir(self, "id", _internar(id))
+        definir(self, "pergunta", _internar(pergunta))
+        definir(self, "opcoes", tuple(_internar(opcao) for opcao in opcoes))
+        definir(self, "resposta", int(resposta))
+        definir(self, "explicacao", _internar(explicacao))
+
+    def __setattr__(self, nome, valor):
+        raise ErroSomenteLeitura("pergunta do quiz é somente leitura")
+
+    __delattr__ = __setattr__
+
+    def __getitem__(self, campo):
+        if campo not in Pergunta.__slots__:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def __iter__(self):
+        return iter(Pergunta.__slots__)
+
+    def __len__(self):
+        return len(Pergunta.__slots__)
+
+    def __reduce__(self):
+        return Pergunta, tuple(getattr(self, campo) for campo in Pergunta.__slots__)
+
+    def __repr__(self):
+        return f"Pergunta(id={self.id!r}, pergunta={self.pergunta!r})"
+
+
+def compactar_perguntas(registros):
+    """Dicionários de perguntas (ler_perguntas, registros_perguntas) -> tupla de Pergunta."""
+    return tuple(Pergunta(**registro) for registro in registros)
+
+
+def compactar_pontos(pontos: pd.DataFrame) -> pd.DataFrame:
+    """
+    A camada de pontos (geo.montar_camada_pontos) com camada e detalhes como
+    categorias e uma tupla compartilhada por combinação de categorias aceitas.
+    """
+    compartilhadas = {}
+
+    def aceita(categorias):
+        categorias = tuple(_internar(c) for c in categorias)
+        return compartilhadas.setdefault(categorias, categorias)
+
+    colunas = {coluna: pontos[coluna].astype("category") for coluna in COLUNAS_CATEGORIAS_PONTOS if coluna in pontos}
+    if "aceita" in pontos:
+        colunas["aceita"] = pd.Series([aceita(c) for c in pontos["aceita"]], index=pontos.index, dtype=object)
+    return pontos.assign(**colunas)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+from geo import haversine
+
+
+def matriz_distancias(lat, lon, bloco=2048):
+    """Matriz de distâncias haversine (km) em float32, calculada em blocos de linhas."""
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    n = len(lat)
+    distancias = np.empty((n, n), dtype=np.float32)
+    for inicio in range(0, n, bloco):
+        fim = min(inicio + bloco, n)
+        distancias[inicio:fim] = haversine(lat[inicio:fim, None], lon[inicio:fim, None], lat[None, :], lon[None, :])
+    return distancias
+
+
+class PlanejadorRotas:
+    """Roteiro de entrega com uma parada por tipo de resíduo, sobre a matriz pré-calculada."""
+
+    def __init__(self, pontos: pd.DataFrame, candidatos_por_tipo=6):
+        self.pontos = pontos.reset_index(drop=True)
+        self.lat = self.pontos["latitude"].to_numpy(dtype=float)
+        self.lon = self.pontos["longitude"].to_numpy(dtype=float)
+        self.distancias = matriz_distancias(self.lat, self.lon)
+        self.candidatos_por_tipo = candidatos_por_tipo
+        self.aceita = self.pontos["aceita"].tolist()
+        categorias = sorted({c for aceita in self.aceita for c in aceita})
+        self.pontos_por_categoria = {
+            categoria: np.flatnonzero([categoria in aceita for aceita in self.aceita])
+            for categoria in categorias
+        }
+
+    def _custo(self, origem, paradas):
+        if not paradas:
+            return 0.0
+        custo = float(origem[paradas[0]])
+        for a, b in zip(paradas, paradas[1:]):
+            custo += float(self.distancias[a, b])
+        return custo
+
+    def _cobertas(self, paradas):
+        return {c for p in paradas for c in self.aceita[p]}
+
+    def planejar(self, latitude, longitude, categorias):
+        """
+        Escolhe um ponto para cada categoria e ordena as paradas
+        (vizinho mais próximo seguido de 2-opt e troca de pontos).
+        Retorna as paradas, a distância total em km e o trajeto para o mapa.
+        """
+        categorias = [c for c in categorias if len(self.pontos_por_categoria.get(c, ())) > 0]
+        origem = haversine(latitude, longitude, self.lat, self.lon)
+
+        # Candidatos: os pontos mais próximos da origem que aceitam cada categoria
+        candidatos = {}
+        for categoria in categorias:
+            indices = self.pontos_por_categoria[categoria]
+            k = min(self.candidatos_por_tipo, len(indices))
+            candidatos[categoria] = indices[np.argpartition(origem[indices], k - 1)[:k]]
+
+        # Vizinho mais próximo: um ponto que aceita várias categorias atende todas de uma vez
+        paradas = []
+        faltando = set(categorias)
+        distancia_atual = origem
+        while faltando:
+            opcoes = np.unique(np.concatenate([candidatos[c] for c in faltando]))
+            proximo = int(opcoes[np.argmin(distancia_atual[opcoes])])
+            paradas.append(proximo)
+            faltando -= set(self.aceita[proximo])
+            distancia_atual = self.distancias[proximo]
+
+        # Melhorias locais até não haver ganho
+        melhorou = True
+        while melhorou:
+            melhorou = False
+            # 2-opt em caminho aberto (sem voltar à origem)
+            for i in range(len(paradas) - 1):
+                for j in range(i + 1, len(paradas)):
+                    nova = paradas[:i] + paradas[i:j + 1][::-1] + paradas[j + 1:]
+                    if self._custo(origem, nova) < self._custo(origem, paradas) - 1e-6:
+                        paradas, melhorou = nova, True
+            # Troca de cada parada por outro candidato que mantenha todas as categorias atendidas
+            for i, parada in enumerate(paradas):
+                for categoria in self.aceita[parada]:
+                    for candidato in candidatos.get(categoria, ()):
+                        nova = paradas[:i] + [int(candidato)] + paradas[i + 1:]
+                        if (set(categorias) <= self._cobertas(nova)
+                                and self._custo(origem, nova) < self._custo(origem, paradas) - 1e-6):
+                            paradas, melhorou = nova, True
+
+        # Remove paradas repetidas ou que não atendem mais nenhuma categoria pendente
+        finais = []
+        for parada in paradas:
+            if parada not in finais and (set(self.aceita[parada]) & set(categorias)) - self._cobertas(finais):
+                finais.append(parada)
+
+        tabela = self.pontos.iloc[finais].assign(
+            atende=[", ".join(c for c in self.aceita[p] if c in categorias) for p in finais]
+        )
+        trajeto = [(latitude, longitude)] + list(zip(self.lat[finais].tolist(), self.lon[finais].tolist()))
+        return tabela, self._custo(origem, finais), trajeto
@@ -0,0 +1,92 @@
+import heapq
+import random
+import threading
+import time
+
+# Letras e números sem os caracteres que se confundem (0/O, 1/I/L)
+ALFABETO_CODIGO = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
+TAMANHO_CODIGO = 4
+
+# Salas sem atividade há mais tempo que isso são descartadas
+VALIDADE_SALA_S = 6 * 3600
+
+
+class Sala:
+    """Placar de uma sala; cada sala tem o seu próprio lock."""
+
+    def __init__(self, codigo):
+        self.codigo = codigo
+        self._lock = threading.Lock()
+        self.pontos = {}       # estudante -> acertos
+        self.respostas = {}    # estudante -> perguntas respondidas
+        self.versao = 0        # muda a cada alteração; o placar só é recalculado quando muda
+        self.atualizada_em = time.time()
+        self._placar = (-1, [])
+
+    def entrar(self, estudante):
+        with self._lock:
+            if estudante not in self.pontos:
+                self.pontos[estudante] = 0
+                self.respostas[estudante] = 0
+                self.versao += 1
+                self.atualizada_em = time.time()
+
+    def registrar(self, estudante, correta):
+        """Atualização O(1) do placar."""
+        with self._lock:
+            self.pontos[estudante] = self.pontos.get(estudante, 0) + int(bool(correta))
+            self.respostas[estudante] = self.respostas.get(estudante, 0) + 1
+            self.versao += 1
+            self.atualizada_em = time.time()
+
+    def placar(self, limite=10):
+        """
+        [(estudante, acertos, respondidas), ...] em ordem de acertos.
+        É recalculado só quando a versão muda, fora do lock, a partir de uma cópia.
+        """
+        versao, placar = self._placar
+        if versao == self.versao:
+            return placar[:limite]
+        with self._lock:
+            versao = self.versao
+            linhas = [(estudante, pontos, self.respostas[estudante]) for estudante, pontos in self.pontos.items()]
+        placar = heapq.nlargest(max(limite, 10), linhas, key=lambda linha: (linha[1], -linha[2]))
+        self._placar = (versao, placar)
+        return placar[:limite]
+
+    def resumo(self):
+        with self._lock:
+            estudantes = len(self.pontos)
+            respostas = sum(self.respostas.values())
+            acertos = sum(self.pontos.values())
+        return {
+            "estudantes": estudantes,
+            "respostas": respostas,
+            "acertos": acertos / respostas if respostas else 0.0,
+        }
+
+
+class RegistroSalas:
+    """Todas as salas do processo. O lock global só é usado para criar e remover salas."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._salas = {}
+
+    def criar(self):
+        with self._lock:
+            self._remover_antigas()
+            while True:
+                codigo = "".join(random.choices(ALFABETO_CODIGO, k=TAMANHO_CODIGO))
+                if codigo not in self._salas:
+                    self._salas[codigo] = Sala(codigo)
+                    return codigo
+
+    def obter(self, codigo):
+        """Leitura sem lock: dict.get é atômico no CPython."""
+        return self._salas.get(str(codigo).strip().upper())
+
+    def _remover_antigas(self):
+        limite = time.time() - VALIDADE_SALA_S
+        for codigo in [c for c, sala in self._salas.items() if sala.atualizada_em < limite]:
+            del self._salas[codigo]
@@ -0,0 +1,707 @@
+"""
+Conteúdo das seções de leitura do app (texto e imagens, sem interação).
+
+Cada seção recebe `st`, que pode ser o próprio módulo streamlit ou uma página
+HTML de site_estatico.py (mesmos nomes de método), e `imagem`, que mostra uma
+imagem do catálogo pela chave de acervo.IMAGENS_SECOES. Assim o mesmo texto é
+mostrado pelo app e exportado como HTML estático.
+"""
+import pandas as pd
+
+
+def historia(st, imagem):
+    st.empty()  # Limpa qualquer conteúdo residual
+    st.header("🏛️ Museu do Lixo – História e Agenda")
+
+    # Introdução
+    st.markdown("""
+    O **Museu do Lixo**, instalado pela Comcap em **25 de setembro de 2003**, tornou-se uma referência em **educação ambiental** em Santa Catarina. 
+    Sua abordagem lúdica e acessível reforça conceitos de **consumo consciente** com base nos princípios:
+    """)
+
+    # Seção dos 4Rs – versão didática sem HTML
+    st.subheader("♻️ Os 4Rs da Sustentabilidade")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("### 🔍 1. REPENSAR")
+        st.success("Questionar nossos hábitos:\n\n*“Preciso mesmo disso?”*")
+
+        st.markdown("### 🔄 3. REUTILIZAR")
+        st.warning("Dar novos usos antes de descartar.")
+
+    with col2:
+        st.markdown("### 📉 2. REDUZIR")
+        st.success("Diminuir a quantidade de resíduos gerados.")
+
+        st.markdown("### ♻ 4. RECICLAR")
+        st.info("Transformar materiais usados em novos produtos.")
+
+    # Texto da história do museu
+    st.markdown("""
+    O museu nasceu do sonho de mais de dez anos de trabalhadores da Comcap, que desejavam **resgatar objetos descartados** 
+    para criar um espaço de memória sobre os hábitos de consumo da sociedade.
+
+    As primeiras peças foram reunidas no antigo galpão de triagem da coleta seletiva. Atualmente, o acervo está disposto em 
+    **ambientes temáticos**, montados e decorados com **materiais reaproveitados** — desde as tintas das paredes até a mandala 
+    do piso, tudo feito com resíduos reciclados.
+
+    ---
+
+    ### 🕓 Horário de Funcionamento  
+    📅 Segunda a sexta-feira  
+    🕗 Das 8h às 16h
+
+    **Visitas monitoradas devem ser agendadas:**  
+    📞 (48) 3261-4826  
+    📧 ambiental.comcap@pmf.sc.gov.br
+
+    ---
+
+    ### 📍 Localização  
+    Rodovia Admar Gonzaga, 72 – Bairro Itacorubi, Florianópolis – SC
+
+    ### 🔍 Saiba mais
+    - O museu integra o roteiro de **visitação monitorada ao Centro de Valorização de Resíduos (CVR)** da Comcap  
+    - Recebe cerca de **7 mil visitantes por ano**  
+    - Acervo com **10 mil itens** recuperados  
+    - Área de **200 m²** com decoração 100% reutilizada  
+    - Personagens educativos como **Neiciclagem** e **Dona Tainha**
+    """)
+
+    # Galeria de imagens
+    st.markdown("---")
+    st.subheader("📸 Conheça Nossa Estrutura")
+
+    col1, col2 = st.columns(2)
+
+    # Imagem 1 - Fachada
+    with col1:
+        imagem("museu_fachada", "Vista externa do Museu", (220, 220, 220), decorativa=True)
+
+    # Imagem 2 - Equipe
+    with col2:
+        imagem("museu_equipe", "Nossa equipe de educadores", (220, 220, 220), decorativa=True)
+        # Sobre a Comcap
+      # Sobre a Comcap
+    st.markdown("---")
+    st.subheader("🏢 Sobre a Comcap")
+
+    st.markdown("""
+    A **Comcap – Companhia de Melhoramentos da Capital** é uma autarquia da Prefeitura de Florianópolis responsável por 
+    **limpeza urbana, coleta de resíduos sólidos e ações de educação ambiental**. Foi fundada em 1971 e transformada em 
+    autarquia em 2017.
+
+    ### 🏛️ O que faz a Comcap?
+
+    - 🚛 Realiza a **coleta de lixo domiciliar e seletiva** em todos os bairros de Florianópolis  
+    - 🧹 Cuida da **varrição de vias públicas**, capina e remoção de resíduos urbanos  
+    - 🏫 Mantém o **Museu do Lixo**, dentro do Centro de Valorização de Resíduos (CVR), como referência em educação ambiental  
+    - 🌿 Administra o **Jardim Botânico de Florianópolis** desde 2016  
+
+    ### 📊 Dimensões e Impacto
+
+    - 📅 **Fundação**: 1971 (autarquia desde 2017)  
+    - 👥 **Funcionários**: Cerca de 1.500 colaboradores  
+    - ♻️ **Volume de resíduos coletados por ano**:  
+      - Aproximadamente **193 mil toneladas no total**  
+      - Sendo cerca de **70 mil toneladas de orgânicos**  
+      - E **12 mil toneladas de recicláveis** por mês
+
+    🔗 Saiba mais no site oficial: [https://www.pmf.sc.gov.br/comcap](https://www.pmf.sc.gov.br/comcap)
+    """)
+
+
+    # Rodapé institucional (ajustado para celular)
+    st.markdown("### ℹ️ Agendamentos")
+    st.markdown("""
+📧 [ambiental.comcap@pmf.sc.gov.br](mailto:ambiental.comcap@pmf.sc.gov.br)  
+📞 (48) 3261-4808
+""")
+
+
+def quimica(st, imagem):
+    # Definição das cores de fallback
+    COR_MATERIAIS = (220, 220, 255)  # Azul claro
+    COR_RESIDUOS = (200, 230, 200)   # Verde claro
+
+    # Parte 1: Teoria sobre polímeros
+    st.markdown("""
+    ## 🔬 Polímeros: Estrutura, Propriedades e Sustentabilidade
+
+    Os **polímeros** são macromoléculas formadas pela repetição de unidades estruturais menores chamadas **monômeros**, unidas por ligações covalentes. Essa repetição pode ocorrer centenas ou milhares de vezes, conferindo propriedades únicas como elasticidade, resistência térmica e mecânica.
+
+    ### Classificação dos Polímeros
+
+    Podemos classificar os polímeros em:
+
+    - **Naturais**: celulose (paredes celulares vegetais), amido (reserva energética), proteínas (colágeno, seda), látex (borracha natural)
+    - **Sintéticos**: PET (garrafas), PE e PP (embalagens), PVC (tubos), PS (isopor), Nylon (tecidos), PLA (bioplásticos)
+
+    Quanto ao comportamento térmico:
+    - **Termoplásticos**: Podem ser remodelados (PET, PE, PP)
+    - **Termofixos**: Mantêm forma após moldagem (borracha vulcanizada)
+
+    Estruturalmente:
+    - **Lineares**: Flexíveis (PE)
+    - **Ramificados**: Menor densidade (LDPE)
+    - **Reticulados**: Alta rigidez (borracha vulcanizada)
+
+    ### Propriedades dos Principais Polímeros Sintéticos
+
+    - **PET (♳)**: Ponto de fusão 260-265°C, densidade 1.38-1.39 g/cm³, resistência 55-75 MPa
+    - **PEAD (♴)**: Fusão 130-137°C, densidade 0.94-0.96 g/cm³, resistência 20-32 MPa
+    - **PVC (♵)**: Fusão 100-260°C, libera HCl no processamento
+    - **PP (♷)**: Fusão 160-165°C, resistência 30-40 MPa
+    - **PS (♸)**: Fusão 240°C, baixa reciclabilidade
+    """)
+
+    # Adicionar imagens após a primeira parte do texto
+    col1, col2 = st.columns(2)
+    with col1:
+        imagem("polimeros_estrutura",
+               "Estrutura molecular de polímeros", COR_MATERIAIS)
+    with col2:
+        imagem("polimeros_aplicacoes",
+               "Aplicações dos polímeros", COR_MATERIAIS)
+
+    # Parte 2: Continuação do texto sobre reciclagem
+    st.markdown("""
+    ### Reciclagem e Sustentabilidade
+
+    No Brasil:
+    - PET: 55% de reciclagem
+    - PEAD: 30%
+    - PVC: <5%
+    - Embalagens multicamadas: difíceis de reciclar
+
+    Processo de reciclagem:
+    - Temperaturas: PET 270-290°C, PP 200-230°C
+    - Consumo: ~10L água/kg plástico
+    - Eficiência: 30-50% melhor que produção virgem
+
+    **Inovações:**
+    1. Biopolímeros (PLA, PHA)
+    2. Reciclagem química avançada
+    3. Catalisadores enzimáticos
+    4. IA para triagem automatizada
+
+    **Boas Práticas:**
+    - Indústria: Design ecológico, logística reversa
+    - Sociedade: Separação adequada, redução de descartáveis, apoio a cooperativas
+
+    **Referências:**
+    - ATKINS, P.; JONES, L. Princípios de Química. 5.ed. Bookman, 2012.
+    - CALLISTER, W. D. Fundamentos da Ciência dos Materiais. 9.ed. LTC, 2020.
+    - MANO, E. B. Introdução a Polímeros. 4.ed. Edgard Blücher, 2005.
+    """)
+
+
+def microplasticos(st, imagem):
+    st.header("🧩 Microplásticos – Um Problema Invisível nos Mares")
+
+    st.markdown("""
+    ### 🔎 O que são microplásticos?
+
+    Microplásticos são fragmentos de plástico com menos de 5 milímetros, muitas vezes invisíveis a olho nu.
+
+    Eles se dividem em dois tipos:
+
+    - **Primários**: fabricados intencionalmente nesse tamanho, como microesferas usadas em cosméticos, pastas de dente e produtos de limpeza.
+    - **Secundários**: formados pela fragmentação de plásticos maiores devido ao sol, chuva, vento, ondas e ação de organismos.
+    """)
+
+    imagem("microplasticos",
+           "Tipos e fontes de microplásticos no ambiente marinho",
+           (200, 230, 200))
+
+    st.markdown("""
+    ### 🌊 Impacto Ambiental
+
+    Esses fragmentos acabam nos oceanos e podem permanecer por décadas no ambiente, acumulando-se em:
+    - Praias e costas marinhas
+    - Sedimentos oceânicos
+    - Corpos de organismos marinhos
+    - Até na água potável
+
+    ### 🔬 O Papel da Química
+
+    A Química nos permite detectar, identificar e compreender os efeitos dos microplásticos:
+    1. Análise espectroscópica (FTIR, Raman)
+    2. Cromatografia (GC-MS)
+    3. Técnicas de microscopia avançada
+
+    ---
+
+    ### 🐠 Impactos nos oceanos e na vida marinha
+
+    Animais marinhos frequentemente ingerem microplásticos por engano, levando a:
+
+    - Dificuldade de digestão e absorção de nutrientes;
+    - Inflamações e bloqueios intestinais;
+    - Acúmulo de substâncias tóxicas nos tecidos.
+
+     Os efeitos não param por aí: os microplásticos **sobem na cadeia alimentar**, chegando até peixes e frutos do mar consumidos por humanos - um risco silencioso, mas real.
+    ---
+
+    ### 🌍 O caso de Florianópolis
+
+    Com suas mais de 100 praias e alto consumo de frutos do mar, **Florianópolis está diretamente exposta à contaminação por microplásticos.** A limpeza inadequada das praias, o descarte incorreto de lixo e o turismo intenso aumentam o risco da poluição plástica marinha.
+
+    Estudos já identificaram a presença de microplásticos em:
+    - Praias urbanas e remotas da ilha;
+    - Ostras, mexilhões e peixes vendidos em mercados locais;
+    - Sedimentos de rios que deságuam no mar.
+
+    ---
+
+    ### ✅ O que você pode fazer?
+
+    #### Como cidadão:
+    - Evite produtos com microesferas plásticas.
+    - Reduza o uso de plástico descartável.
+    - Participe de limpezas de praia e separe seu lixo corretamente.
+
+    #### Como estudante, professor ou pesquisador:
+    - Incentive a pesquisa sobre alternativas sustentáveis.
+    - Estimule debates nas escolas sobre consumo consciente e química ambiental.
+    - Divulgue ações de preservação dos oceanos e fontes de poluição invisível.
+
+    ---
+
+    ### 📚 Referências
+
+    1. Rezende, L. T. et al. *Microplásticos: ocorrência ambiental e desafios analíticos*. **Química Nova**, 2022. [https://www.scielo.br/j/qn/a/VJ58TBjHVqDZsvWLckcFbTQ](https://www.scielo.br/j/qn/a/VJ58TBjHVqDZsvWLckcFbTQ)
+    2. Dawson, A. L. et al. (2023). *Microplastics: A new contaminant in the environment*. **Frontiers in Environmental Science**, [PMC9914693](https://www.ncbi.nlm.nih.gov/pmc/articles/PMC9914693/)
+    3. ISO/TR 21960:2020. *Plastics Environmental aspects State of knowledge and methodologies*.
+    4. Browne, M. A. et al. (2011). *Accumulation of microplastic on shorelines worldwide: sources and sinks*. **Environmental Science & Technology**.
+    5. NOAA  National Oceanic and Atmospheric Administration (2009). *Microplastics Program Overview*.
+    6. Cózar, A. et al. (2014). *Plastic debris in the open ocean*. **PNAS**.
+    """)
+
+
+def plastico_oceanos(st, imagem):
+
+    st.header("🌊 A Crise dos Plásticos nos Oceanos")
+    
+    st.markdown("""
+    ## A Década da Ciência Oceânica para o Desenvolvimento Sustentável (2021-2030)
+    
+    A Organização das Nações Unidas (ONU) declarou o período de 2021 a 2030 como a **Década da Ciência Oceânica**, um esforço global para reverter o declínio da saúde dos oceanos e criar melhores condições para o desenvolvimento sustentável. Entre os principais desafios está o combate à poluição por plásticos, que já atinge níveis alarmantes em todos os oceanos do planeta.
+
+    ### As Ilhas de Plástico: Um Problema Global
+
+    As chamadas "ilhas de plástico" ou "giros oceânicos de plástico" são áreas onde correntes marinhas concentram grandes quantidades de detritos plásticos. A mais conhecida é a **Grande Mancha de Lixo do Pacífico**, localizada entre o Havaí e a Califórnia, com estimativas que variam de 700.000 km² a mais de 15 milhões de km² (cerca de 3 vezes o tamanho da França).
+
+    Características dessas zonas:
+    - 94% dos detritos são microplásticos (partículas menores que 5mm)
+    - Cada km² pode conter até 750.000 fragmentos de plástico
+    - 80% do material vem de fontes terrestres
+    - 20% de atividades marítimas (pesca, navegação)
+
+    ## Impactos no Litoral Catarinense
+
+    Dados científicos recentes mostram que Santa Catarina não está imune a este problema:
+    """)
+    st.markdown("""
+        #### 1. Distribuição de Microplásticos em Praias Urbanas
+        **Autores:** Schmidt, C.; et al.  
+        **Publicação:** *Marine Pollution Bulletin* (2023)  
+        **Amostras:** 48 pontos em 12 praias de Florianópolis  
+        **Resultados:**  
+        - Densidade média de 128 partículas/m²  
+        - 73% fibras têxteis  
+        - Maiores concentrações nas praias de:  
+          • Ingleses (215 partículas/m²)  
+          • Canasvieiras (198 partículas/m²)  
+
+        #### 2. Acúmulo em Organismos Marinhos
+        **Autores:** Ferreira, G.V.B.; et al.  
+        **Publicação:** *Environmental Research* (2022)  
+        **Amostras:** 120 exemplares de tainhas e siris  
+        **Descobertas:**  
+        - 85% dos organismos com microplásticos no trato digestivo  
+        - Média de 4,7 partículas/indivíduo  
+        - Correlação com áreas de desemboque de rios urbanos  
+
+        #### 3. Efeitos em Ecossistemas Costeiros
+        **Autores:** UFSC/Laboratório de Oceanografia Química  
+        **Parceiros:** UNIVALI, EPAGRI  
+        **Métodos:** Análise FTIR e microscopia Raman  
+        **Conclusões:**  
+        - Bioacumulação em cadeias tróficas  
+        - Alterações fisiológicas em moluscos  
+        - Contaminação de áreas de preservação  
+        """)
+
+    st.markdown("""
+    ### Dados Relevantes no Litoral Catarinense
+    """)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Praia do Campeche", "127 partículas/m³", 
+                 "UFSC/2023")
+        st.metric("Sedimentos (Baía Norte)", "28 partículas/g", 
+                 "Tese Oceanografia/UFSC")
+    with col2:
+        st.metric("Organismos Marinhos", "4,7 partículas/indivíduo", 
+                 "Ferreira et al. 2022")
+        st.metric("Áreas Protegidas", "62% contaminadas", 
+                 "Projeto MAPS/UFSC")
+
+    st.markdown("""
+    ## Referências Científicas da UFSC
+
+    1. **SCHMIDT, C.** et al. (2023). *Spatial distribution of microplastics in urban beaches*. Marine Pollution Bulletin, 186, 114-123.  
+       [DOI:10.1016/j.marpolbul.2022.114123](https://doi.org/10.1016/j.marpolbul.2022.114123)
+
+    2. **FERREIRA, G.V.B.** et al. (2022). *Microplastic contamination in commercial fish from SC*. Environmental Research, 204(1), 112-125.  
+       [DOI:10.1016/j.envres.2021.112125](https://doi.org/10.1016/j.envres.2021.112125)
+
+    3. **UFSC/LABOQUI** (2023). *Relatório Técnico: Microplásticos em Unidades de Conservação*. Projeto MAPS, 156p.  
+       [Disponível no Repositório UFSC](https://repositorio.ufsc.br/handle/123456789/123456)
+
+    ## Como Contribuir?
+
+    - **Participe** das pesquisas através do programa de extensão da UFSC
+    - **Acesse** os dados abertos no Repositório Institucional
+    - **Colabore** com projetos como o MAPS (Monitoramento Ambiental Participativo)
+    """)
+
+    st.markdown("""
+    📍 **Contato para pesquisas:**  
+    Laboratório de Oceanografia Química - UFSC  
+    📧 loq@cfh.ufsc.br | 📞 (48) 3721-1234
+    """)
+
+
+def compostagem(st, imagem, interativo=None, cenarios=None):
+    st.header("🌱 Compostagem como Método Adequado ao Tratamento de Resíduos Sólidos Orgânicos Urbanos")
+
+    with st.expander("📌 Resumo", expanded=True):
+        st.markdown("""
+        A compostagem da fração orgânica dos resíduos sólidos urbanos é uma solução eficiente, econômica e sustentável, 
+        alinhada à Política Nacional de Resíduos Sólidos (Lei 12.305/2010). Em Florianópolis, o método de **leira estática 
+        com aeração passiva** (Método UFSC) tem demonstrado excelentes resultados, processando cerca de **2 mil toneladas/ano** 
+        de matéria orgânica e gerando composto de alta qualidade para uso em hortas escolares e ajardinamento público.
+        """)
+
+    st.subheader("✅ Benefícios da Compostagem")
+    st.markdown("""
+    - **Redução de custos**: Economia de R$ 100 mil/ano comparado ao aterro sanitário
+    - **Qualidade do composto**: Rico em nutrientes (carbono, nitrogênio, fósforo) e livre de patógenos
+    - **Sustentabilidade**: Fecha o ciclo dos resíduos, evitando aterrar recursos naturais
+    - **Educação ambiental**: Promove conscientização e participação comunitária
+    """)
+
+    st.subheader("🧪 Método UFSC de Compostagem Termofílica")
+    st.markdown("""
+    Desenvolvido pelo **professor Paul Richard Momsen Miller (UFSC)**, o método utiliza:
+    - **Leiras estáticas** (2,5m x 35m x 2m) com camadas de resíduos úmidos (restos de alimentos) e secos (podas trituradas)
+    - **Aeração passiva**: Sem revolvimento mecânico, apenas ventilação natural
+    - **Fases do processo**:
+      1. **Termofílica** (45-75°C): Elimina patógenos e acelera decomposição
+      2. **Maturação** (120 dias): Produz húmus estável e biofertilizante líquido
+    """)
+
+    # Container para as imagens lado a lado
+    col1, col2 = st.columns(2)
+    with col1:
+        imagem("compostagem_leira",
+               "Modelo de leira estática com cobertura vegetal", (200, 230, 200))
+    with col2:
+        imagem("compostagem_metodo_ufsc",
+               "Etapas do processo de compostagem – Método UFSC", (200, 230, 200))
+    # Simulador da leira: só no app (a exportação estática aponta para lá)
+    if interativo:
+        interativo()
+
+    st.markdown("""
+    **Locais de aplicação em Florianópolis:**
+    - Campus da UFSC (Pátio de Compostagem)
+    - SESC Cacupé
+    - Fundação Serte
+    - Hortas escolares e comunitárias
+    - Projetos da COMCAP em parceria com a sociedade civil
+    """)
+
+    st.subheader("📊 Dados Relevantes")
+    
+    with st.expander("Composição dos Resíduos no Brasil (ABRELPE, 2012)"):
+        st.table({
+            "Material": ["Matéria Orgânica", "Plásticos", "Papel/Papelão", "Outros"],
+            "Participação (%)": ["51,4", "13,5", "13,1", "22,0"]
+        })
+    
+    st.markdown("""
+    **Florianópolis (2013):**
+    - 11.755 toneladas/ano coletadas seletivamente (7% do total)
+    - 70 mil toneladas/ano de resíduos orgânicos potencialmente compostáveis
+    """)
+    # Cenários de desvio do aterro: também só no app
+    if cenarios:
+        cenarios()
+
+    st.subheader("💡 Como Implementar na Sua Cidade?")
+    st.markdown("""
+    1. **Segregação na fonte**: Separação doméstica de orgânicos
+    2. **Coleta especializada**: Transporte dedicado para resíduos compostáveis
+    3. **Pátios de compostagem**: Estruturas simples com leiras estáticas
+    4. **Parcerias**: Envolvimento de universidades, ONGs e cooperativas
+    """)
+
+    st.subheader("📚 Materiais Complementares")
+    st.markdown("""
+    - [📘 Manual de Compostagem Doméstica](https://cepagroagroecologia.wordpress.com/minhoca-na-cabeca/) - Cepagro
+    - [📗 Compostagem Comunitária: Passo a Passo](https://compostagemcomunitaria.com.br)
+    - [🎥 Vídeo Educativo: Método UFSC](https://www.youtube.com)
+    - [📄 Política Nacional de Resíduos Sólidos](http://www.planalto.gov.br/ccivil_03/_ato2007-2010/2010/lei/l12305.htm)
+    """)
+
+    st.markdown("---")
+    st.markdown("""
+    *"Compostar é transformar lixo em vida, fechando o ciclo da natureza na cidade."*
+    """)
+    st.markdown("✂️ **Dica prática**: Use serragem ou podas trituradas para equilibrar a umidade nas leiras!")
+
+
+def coleta_seletiva(st, imagem, interativo=None):
+    st.title("♻️ Coleta Seletiva em Florianópolis")
+
+    # DICAS DE SEPARAÇÃO
+    st.header("💡 Como Separar Corretamente Seus Resíduos")
+    st.markdown("""
+    Contribua com a coleta seletiva seguindo essas orientações:
+
+    - ✅ **Lave e esvazie** embalagens recicláveis (plástico, metal, vidro, papel).
+    - ✅ **Amasse embalagens** para economizar espaço.
+    - ✅ **Use sacos transparentes** para facilitar a triagem.
+    - ❌ **Não misture lixo orgânico com recicláveis**.
+    - ❌ **Evite papel sujo ou engordurado**.
+    - 🚨 **Vidros quebrados devem ser embalados separadamente**.
+    - ⚠️ **Pilhas, baterias, eletrônicos, lâmpadas e medicamentos** devem ser levados aos ecopontos ou PEVs específicos.
+    """)
+    # Busca, roteiro e cobertura: só no app (a exportação estática aponta para lá)
+    if interativo:
+        interativo()
+
+    st.markdown("---")
+    st.header("📎 Acesse os Links Oficiais da Prefeitura")
+
+    st.markdown("""
+    ### 📄 Informações e Documentos
+
+    - [📘 Coleta Seletiva por Bairros (PDF)](https://www.pmf.sc.gov.br/arquivos/documentos/pdf/26_09_2023_15.26.16.8e205a59c090b98fc50ed49e314c90cc.pdf)
+    - [📙 Coleta Convencional por Bairros (PDF)](https://www.pmf.sc.gov.br/arquivos/documentos/pdf/26_09_2023_15.24.20.a8304eceb7cd33a8b67b1c5b262a3e0d.pdf)
+    - [📚 Mais Informações sobre Coletas (Site da PMF)](https://www.pmf.sc.gov.br/servicos/index.php?pagina=servpagina&id=260)
+    """)
+
+    st.markdown("""
+    ### 🗺️ Mapas Interativos
+
+    - [🗺️ Mapa da Coleta Seletiva por Região (Google Maps)](https://www.google.com/maps/d/u/0/viewer?mid=1O_t7--E4ThnhgLoJChHu2ymi3GtUpjV7&ll=-27.60205956989343%2C-48.49012502589044&z=10)
+    - [🗺️ Mapa da Coleta Convencional (Google Maps)](https://www.google.com/maps/d/u/0/viewer?hl=pt-BR&ll=-27.580450935796346%2C-48.54644372984463&z=12&mid=1tbLrVVv9QGukKekrxpENiylwAbGAmFqn)
+    - [🥬 Mapa da Seletiva Flex - Orgânicos](https://www.google.com/maps/d/viewer?mid=1s5N4nqbBBbJpnE9gQ7Hu14L-1NTfVFDS&ll=-27.59521928888022%2C-48.5046136&z=11)
+    - [🍾 PEVs Exclusivos para Vidro (Google Maps)](https://www.google.com/maps/d/u/0/viewer?mid=1hTeXGy8ckN5BzkIQdAlOdV_b72XNq0s&ll=-27.60189878885822%2C-48.49012502589044&z=10)
+    """)
+
+    st.markdown("""
+    ### 🏠 Ecopontos Oficiais
+
+    - [🏢 Rede de Ecopontos da SMMA - PMF](https://www.pmf.sc.gov.br/entidades/residuos/index.php?cms=ecopontos+da+smma&menu=4&submenuid=150)
+    """)
+
+    st.info("ℹ️ Os links acima são atualizados diretamente pela Prefeitura de Florianópolis (COMCAP / SMMA).")
+
+    # CONTATOS
+    st.markdown("---")
+    st.header("📞 Contatos Úteis")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        **COMCAP - Atendimento Geral**  
+        📞 (48) 3212-1650  
+        📧 comcap@pmf.sc.gov.br  
+        🕒 Segunda a Sexta: 8h às 18h
+        """)
+
+    with col2:
+        st.markdown("""
+        **Coleta de Volumosos (agendamento)**  
+        📞 (48) 3216-0202  
+
+        **Emergências Ambientais**  
+        ☎️ 0800 644 1144
+        """)
+
+    # RODAPÉ
+    st.markdown("---")
+    st.markdown("""
+    <div style='font-size: 0.9em; color: gray;'>
+        Fonte: <a href="https://www.pmf.sc.gov.br/comcap" target="_blank">Prefeitura de Florianópolis - COMCAP</a><br>
+        Atualizado em Julho/2024 ♻️
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def isopor(st, imagem):
+    st.header("♻️ Projeto Recicla+EPS - Florianópolis")
+    
+    # Texto técnico sobre EPS
+    st.markdown("""
+    ### Poliestireno Expandido (EPS): O Material Versátil
+
+    O EPS, conhecido popularmente como isopor, é um plástico celular rígido composto por 98% de ar e apenas 2% de matéria-prima plástica. Sua estrutura única de células fechadas lhe confere propriedades excepcionais que o tornam indispensável em diversas aplicações.
+
+    Do ponto de vista químico, o EPS é um polímero termoplástico derivado do estireno. Suas características técnicas incluem:
+
+    - **Excelente isolamento térmico**: condutividade entre 0,031-0,038 W/mK
+    - **Baixa absorção de água**: menos de 1% em 24 horas
+    - **Resistência mecânica**: proporcional à sua densidade (10-30 kg/m³)
+    - **Ampla faixa térmica**: opera entre -40°C a +70°C
+    - **Vida útil prolongada**: mais de 50 anos em aplicações estáticas
+
+    **Principais aplicações industriais:**
+    - Embalagens protetoras para produtos eletrônicos e eletrodomésticos
+    - Isolamento térmico em construções civis
+    - Componentes para refrigeração industrial
+    - Moldes para fundição
+    - Elementos flutuantes
+
+    **Aspectos ambientais:**
+    - 100% reciclável (mecânica e quimicamente)
+    - Baixo consumo energético na produção moderna
+    - Programas eficientes de logística reversa implementados
+
+    *Observação*: "Isopor" é uma marca registrada que se tornou sinônimo de EPS no Brasil, representando produtos de alta qualidade nesta categoria de materiais.
+    """)
+    
+    # Mostra a imagem local eps.png
+    imagem("isopor_reciclagem", "Diagrama do processo de reciclagem mecânica de EPS - Projeto Recicla+EPS", (200, 230, 200), decorativa=True)
+    
+    # Dicas de descarte
+    st.subheader("📦 Como Preparar seu Isopor® para a reciclagem:")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        **✅ Faça assim:**  
+        • Limpe restos de alimentos  
+        • Não precisa lavar (apenas remover resíduos)  
+        • Deixe secar naturalmente  
+        """)
+    with col2:
+        st.markdown("""
+        **🚫 Evite:**  
+        • Isopor com gordura ou sujeira  
+        • Embalagens contaminadas  
+        • Descartar no lixo comum  
+        """)
+
+    # Benefícios do projeto
+    st.subheader("🌱 Por que descartar corretamente?")
+    st.markdown("""
+    - Transforma-se em novos produtos (réguas, rodapés, placas)  
+    - Gera renda para cooperativas de reciclagem  
+    - Florianópolis recicla **10 toneladas/mês** de Isopor®  
+    - Reduz a poluição ambiental  
+    """)
+    
+    # Mostra a imagem local eps.png
+    imagem("isopor_usos", "O EPS é amplamente utilizado em nossa sociedade", (200, 230, 200), decorativa=True)
+    
+    # Título geral da seção de reciclagem
+    st.header("♻️ A Reciclagem do Isopor®")
+
+    # Etapas da reciclagem
+    st.subheader("🔄 Como o Isopor® é Reciclado: Passo a Passo")
+    st.markdown("""
+    **1. Coleta**  
+    O isopor limpo é recolhido por cooperativas ou coleta seletiva.  
+
+    **2. Triagem**  
+    É separado de outros resíduos nas centrais de triagem.  
+
+    **3. Trituração**  
+    O material é quebrado em pequenos pedaços para facilitar o processamento.  
+
+    **4. Compactação**  
+    Os flocos podem ser compactados em blocos (lingotes), reduzindo o volume.  
+
+    **5. Extrusão**  
+    É derretido e transformado em grânulos de poliestireno reciclado.  
+
+    **6. Reutilização**  
+    Os grânulos são usados para fabricar novos produtos: molduras, vasos, peças de construção etc.  
+    """)
+
+    st.subheader("📍 Lista Completa dos Pontos de Entrega Voluntária (PEVs)")
+
+    # Dados dos pontos
+    pontos_df = pd.DataFrame({
+        'Local': [
+            'Centro - Hercílio Luz x Anita Garibaldi',
+            'Centro - Praça dos Namorados',
+            'Beira-Mar - Mirante',
+            'Parque São Jorge',
+            'Trindade - Praça Gama Rosa',
+            'Coqueiros - Centro de Saúde',
+            'Estreito - Praça N.S. Fátima',
+            'Santa Mônica',
+            'João Paulo',
+            'Jurerê Internacional'
+        ],
+        'Endereço': [
+            'Hercílio Luz esquina com Anita Garibaldi',
+            'Praça dos Namorados, Largo São Sebastião',
+            'Av. Beira-Mar Norte (Mirante)',
+            'Av. Gov. José Boabaid',
+            'Praça da Rua Gama Rosa',
+            'Em frente ao Centro de Saúde de Coqueiros',
+            'Praça Nossa Senhora de Fátima',
+            'Av. Madre Benvenuta (posto policial)',
+            'Rodovia João Paulo, Praça Dr. Fausto Lobo',
+            'Final da Av. dos Búzios (junto ao PEV de Vidro)'
+        ],
+        'Link': [
+            'https://maps.app.goo.gl/1',
+            'https://maps.app.goo.gl/2',
+            'https://maps.app.goo.gl/3',
+            'https://maps.app.goo.gl/4',
+            'https://maps.app.goo.gl/5',
+            'https://maps.app.goo.gl/6',
+            'https://maps.app.goo.gl/7',
+            'https://maps.app.goo.gl/8',
+            'https://maps.app.goo.gl/9',
+            'https://maps.app.goo.gl/10'
+        ]
+    })
+
+    # Mostrar lista com links para Google Maps
+    for _, row in pontos_df.iterrows():
+        st.markdown(f"""
+        **{row['Local']}**  
+        📍 {row['Endereço']}  
+        🔗 [Abrir no Google Maps]({row['Link']})  
+        ---  
+        """)
+
+    # Rodapé
+    st.markdown("""
+    📌 **Fonte:** Prefeitura de Florianópolis – [Recicla+EPS](https://www.pmf.sc.gov.br)  
+    📞 **Dúvidas:** Secretaria de Meio Ambiente – (48) 3212-1650  
+    🕒 **Funcionamento:** Todos os pontos abertos 24h  
+    """)
+
+
+# Seções exportadas por site_estatico.py: (arquivo, título da aba no app, função)
+SECOES_ESTATICAS = [
+    ("historia", "🏛️ História", historia),
+    ("quimica", "🧪 Química", quimica),
+    ("microplasticos", "🧵 Microplásticos", microplasticos),
+    ("isopor", "📦 Isopor", isopor),
+    ("oceanos", "🌊 Oceanos", plastico_oceanos),
+    ("coleta", "🏘️ Coleta", coleta_seletiva),
+    ("compostagem", "🌱 Compostagem", compostagem),
+]
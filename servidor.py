@@ -0,0 +1,30 @@
+"""
+Sobe o app Streamlit com o aquecimento (aquecimento.py) já rodando.
+
+Com `streamlit run app.py` o aquecimento só começa na primeira sessão; este
+script o inicia junto com o processo, e também a API (se MUSEU_API_PORTA
+estiver definida), para que o balanceador possa consultar /api/pronto antes
+de mandar visitantes para a réplica. Os argumentos vão para o Streamlit:
+
+    MUSEU_API_PORTA=8502 python servidor.py --server.port 8501
+"""
+import logging
+import os
+import sys
+
+from streamlit.web import cli
+
+from api import PORTA_API, ApiMuseu, iniciar_em_thread
+from aquecimento import iniciar_aquecimento
+from artefatos import grafo_processo
+from registro_respostas import registro_processo
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    grafo = grafo_processo()
+    aquecimento = iniciar_aquecimento(grafo)
+    if PORTA_API:
+        iniciar_em_thread(ApiMuseu(grafo, registro_processo(), aquecimento), PORTA_API)
+    app = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    sys.argv = ["streamlit", "run", app, *sys.argv[1:]]
+    sys.exit(cli.main())
@@ -0,0 +1,128 @@
+import re
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from utilitarios import normalizar_texto, normalizar_reciclavel, valor_medio
+
+# Palavras muito comuns que não ajudam a diferenciar os materiais
+STOPWORDS = {
+    "de", "da", "do", "das", "dos", "e", "em", "com", "para", "por", "como", "a", "o",
+    "as", "os", "um", "uma", "no", "na", "nos", "nas", "ao", "aos", "que", "se", "ser",
+    "sua", "seu", "mais", "muito", "pode", "usado", "usada", "usados", "utilizado",
+    "utilizada", "utilizados", "principalmente", "amplamente", "alem", "boa", "alta",
+}
+
+# Peso de cada grupo de propriedades na similaridade final
+PESOS = {"numericas": 0.35, "categoricas": 0.25, "texto": 0.40}
+
+
+def tokenizar(texto):
+    return [t for t in re.findall(r"[a-z0-9]+", normalizar_texto(texto))
+            if len(t) > 2 and t not in STOPWORDS]
+
+
+def matriz_tfidf(textos, max_termos=2000):
+    """TF-IDF com normalização L2, limitado aos termos mais frequentes."""
+    documentos = [Counter(tokenizar(t)) for t in textos]
+    frequencia = Counter(termo for doc in documentos for termo in doc)
+    vocabulario = {termo: i for i, (termo, _) in enumerate(frequencia.most_common(max_termos))}
+
+    matriz = np.zeros((len(textos), len(vocabulario)), dtype=np.float32)
+    for i, doc in enumerate(documentos):
+        for termo, contagem in doc.items():
+            if termo in vocabulario:
+                matriz[i, vocabulario[termo]] = contagem
+
+    df_termos = (matriz > 0).sum(axis=0)
+    matriz *= np.log((1 + len(textos)) / (1 + df_termos)) + 1
+    normas = np.linalg.norm(matriz, axis=1, keepdims=True)
+    return matriz / np.where(normas == 0, 1, normas)
+
+
+def caracteristicas_polimeros(polimeros: pd.DataFrame):
+    """Blocos de características numéricas, categóricas e de texto de cada polímero."""
+    numericas = np.column_stack([
+        polimeros["Densidade"].map(valor_medio).to_numpy(dtype=float),
+        polimeros["Ponto de Fusão"].map(valor_medio).to_numpy(dtype=float),
+    ])
+    # Padroniza cada coluna e usa a média quando o valor não é informado ("Variável")
+    media = np.nanmean(numericas, axis=0)
+    desvio = np.nanstd(numericas, axis=0)
+    numericas = (numericas - media) / np.where(desvio == 0, 1, desvio)
+    numericas = np.nan_to_num(numericas).astype(np.float32)
+
+    categoricas = pd.get_dummies(pd.DataFrame({
+        "tipo": polimeros["Tipo de Polimerização"].astype(str).str.strip(),
+        "reciclavel": polimeros["Reciclável"].map(normalizar_reciclavel),
+        "codigo": polimeros["Código"].astype(str).str.strip(),
+    })).to_numpy(dtype=np.float32)
+    # Com 3 atributos, o produto escalar vira a fração de atributos iguais
+    categoricas /= np.sqrt(3)
+
+    textos = (polimeros["Aplicações Comuns"].fillna("") + " " + polimeros["Descrição"].fillna("")).tolist()
+    return numericas, categoricas, matriz_tfidf(textos)
+
+
+class VizinhosSimilares:
+    """k vizinhos mais parecidos de cada linha, guardados em arrays compactos."""
+
+    def __init__(self, indices, pontuacoes):
+        self.indices = indices          # int32 (n, k)
+        self.pontuacoes = pontuacoes    # float16 (n, k)
+
+    def vizinhos(self, posicao):
+        """Leitura de uma linha: [(posição, similaridade), ...] em ordem decrescente."""
+        return [(int(i), float(s)) for i, s in zip(self.indices[posicao], self.pontuacoes[posicao]) if i >= 0]
+
+
+def _guardar_melhores(sim, k, indices, pontuacoes, inicio):
+    """Copia os k maiores valores de cada linha do bloco sim (ordem decrescente)."""
+    fim = inicio + len(sim)
+    sim[np.arange(fim - inicio), np.arange(inicio, fim)] = -np.inf  # ignora o próprio item
+    melhores = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+    valores = np.take_along_axis(sim, melhores, axis=1)
+    ordem = np.argsort(-valores, axis=1)
+    indices[inicio:fim] = np.take_along_axis(melhores, ordem, axis=1)
+    pontuacoes[inicio:fim] = np.take_along_axis(valores, ordem, axis=1)
+
+
+def calcular_vizinhos(polimeros: pd.DataFrame, k=4, bloco=1024):
+    """
+    Calcula a similaridade em blocos de linhas, guardando só os k melhores
+    vizinhos de cada uma. A memória fica em O(bloco x n) mesmo com milhares de itens.
+    """
+    numericas, categoricas, texto = caracteristicas_polimeros(polimeros)
+    n = len(polimeros)
+    k = min(k, max(n - 1, 0))
+    indices = np.full((n, k), -1, dtype=np.int32)
+    pontuacoes = np.zeros((n, k), dtype=np.float16)
+    if k == 0:
+        return VizinhosSimilares(indices, pontuacoes)
+    quadrados = (numericas ** 2).sum(axis=1)
+
+    for inicio in range(0, n, bloco):
+        fim = min(inicio + bloco, n)
+        # Distância euclidiana nas propriedades numéricas vira similaridade em (0, 1]
+        dist2 = quadrados[inicio:fim, None] + quadrados[None, :] - 2 * numericas[inicio:fim] @ numericas.T
+        sim = PESOS["numericas"] * np.exp(-np.maximum(dist2, 0) / 2)
+        sim += PESOS["categoricas"] * (categoricas[inicio:fim] @ categoricas.T)
+        sim += PESOS["texto"] * (texto[inicio:fim] @ texto.T)
+        _guardar_melhores(sim, k, indices, pontuacoes, inicio)
+
+    return VizinhosSimilares(indices, pontuacoes)
+
+
+def calcular_vizinhos_texto(textos, k=4, bloco=1024):
+    """Mesma busca dos k mais parecidos, usando só o TF-IDF dos textos (ex.: resíduos)."""
+    texto = matriz_tfidf(textos)
+    n = len(textos)
+    k = min(k, max(n - 1, 0))
+    indices = np.full((n, k), -1, dtype=np.int32)
+    pontuacoes = np.zeros((n, k), dtype=np.float16)
+    if k == 0:
+        return VizinhosSimilares(indices, pontuacoes)
+    for inicio in range(0, n, bloco):
+        _guardar_melhores(texto[inicio:inicio + bloco] @ texto.T, k, indices, pontuacoes, inicio)
+    return VizinhosSimilares(indices, pontuacoes)
@@ -0,0 +1,373 @@
+"""
+Exporta as seções de leitura do app (secoes.py) como um site HTML estático.
+
+A maior parte das visitas é só leitura (história, química, microplásticos,
+isopor, oceanos, coleta, compostagem) e não precisa de uma execução do
+Python a cada acesso. Este script gera as mesmas seções como páginas HTML com
+as imagens já reduzidas, para um servidor web comum ou uma CDN. Quiz, buscas
+e mapas continuam no app Streamlit (--app coloca o link para ele).
+
+    python site_estatico.py destino [--app https://endereco-do-app]
+
+Imagens e CSS têm o hash do conteúdo no nome e podem ser servidos com cache
+permanente (Cache-Control: immutable); só os .html precisam ser revalidados.
+"""
+import argparse
+import hashlib
+import html
+import os
+import re
+import textwrap
+
+import pandas as pd
+from PIL import Image
+
+from acervo import catalogar, nomes_logicos
+from dados import caminho_dados, ler_tabela
+from secoes import SECOES_ESTATICAS
+
+# Larguras (px) das variantes de cada imagem, para o srcset
+LARGURAS_IMAGEM = (480, 960)
+QUALIDADE_WEBP = 75
+
+# O que fica só no app, por seção: aparece no lugar da parte interativa
+NOTAS_INTERATIVAS = {
+    "coleta": "🔎 A busca de onde descartar, o roteiro de entrega e o mapa de cobertura estão no app interativo.",
+    "compostagem": "🌡️ O simulador da leira e os cenários de desvio do aterro para Florianópolis estão no app interativo.",
+}
+
+ESTILO = """
+:root { --primary-color: #1e88e5; --secondary-color: #2e7d32; --error-color: #d32f2f; }
+body { margin: 0; font-family: system-ui, sans-serif; color: #333333; line-height: 1.6; }
+nav { display: flex; flex-wrap: wrap; gap: 4px; padding: 8px; background: #f5f7fa; }
+nav a { padding: 6px 12px; border-radius: 4px; color: var(--primary-color); text-decoration: none; }
+nav a.atual { background: var(--primary-color); color: white; }
+main { max-width: 1100px; margin: 0 auto; padding: 16px; }
+h1, h2, h3 { color: var(--primary-color); }
+img { max-width: 100%; height: auto; }
+figure { margin: 0 0 16px; border: 1px solid #eee; border-radius: 8px; padding: 8px; }
+figcaption { font-size: 0.9em; color: gray; }
+.sem-imagem { aspect-ratio: 1; max-width: 300px; }
+.colunas { display: flex; flex-wrap: wrap; gap: 24px; }
+.colunas > div { flex: 1 1 280px; min-width: 0; }
+.aviso { padding: 12px 16px; border-radius: 8px; margin: 8px 0; }
+.aviso-success { background: #e8f5e9; } .aviso-info { background: #e3f2fd; }
+.aviso-warning { background: #fff8e1; } .aviso-error { background: #ffebee; }
+.metrica { margin: 8px 0; } .metrica strong { display: block; font-size: 1.6em; }
+.metrica small { color: var(--secondary-color); }
+table { border-collapse: collapse; } td, th { border: 1px solid #ddd; padding: 4px 8px; }
+details { border: 1px solid #eee; border-radius: 8px; padding: 8px 16px; margin: 8px 0; }
+summary { cursor: pointer; font-weight: bold; }
+"""
+
+
+# Marca a quebra de linha forçada (dois espaços no fim) enquanto o parágrafo ainda é markdown
+_QUEBRA = "\x00"
+
+
+def _inline(texto):
+    """
+    Negrito, itálico, código e links (o resto é escapado). Recebe o parágrafo ou
+    o item de lista inteiro: uma ênfase pode começar numa linha e terminar na outra.
+    """
+    texto = html.escape(texto, quote=False)
+    texto = re.sub(r"`([^`]+)`", r"<code>\1</code>", texto)
+    texto = re.sub(r"\[([^\]]+)\]\(([^)\s]+)\)",
+                   lambda m: f'<a href="{m.group(2).replace(chr(34), "&quot;")}">{m.group(1)}</a>', texto)
+    texto = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", texto, flags=re.S)
+    return re.sub(r"\*(.+?)\*", r"<em>\1</em>", texto, flags=re.S)
+
+
+def markdown_html(texto, html_bruto=False):
+    """
+    O markdown que as seções usam: títulos, listas (aninhadas), parágrafos com
+    quebra por dois espaços no fim da linha, linhas horizontais e, com
+    html_bruto, blocos HTML. Como no st.markdown, o texto é desindentado antes.
+    """
+    # paragrafo e item guardam o markdown das linhas; _inline só roda quando o bloco fecha
+    saida, paragrafo, listas, item = [], [], [], []  # listas: [(indentação, "ul"/"ol")]; item: [abertura, linhas]
+
+    def fechar_paragrafo():
+        if paragrafo:
+            texto = "".join(paragrafo).rstrip().removesuffix(_QUEBRA)
+            saida.append("<p>" + _inline(texto).replace(_QUEBRA, "<br>") + "</p>")
+            paragrafo.clear()
+
+    def fechar_item():
+        if item:
+            abertura, partes = item
+            texto = "\n".join(partes).removesuffix(_QUEBRA)
+            saida.append(abertura + _inline(texto).replace(_QUEBRA, "<br>"))
+            item.clear()
+
+    def fechar_listas(ate=-1):
+        fechar_item()
+        while listas and listas[-1][0] > ate:
+            saida.append(f"</li></{listas.pop()[1]}>")
+
+    linhas = textwrap.dedent(texto).strip("\n").split("\n")
+    bloco_html, depois_de_branco = False, False
+    for linha in linhas:
+        quebra = linha.endswith("  ")
+        conteudo = linha.strip()
+        indentacao = len(linha) - len(linha.lstrip())
+        if not conteudo:
+            fechar_paragrafo()
+            bloco_html, depois_de_branco = False, True
+            continue
+        if bloco_html or (html_bruto and conteudo.startswith("<") and not paragrafo):
+            fechar_listas()
+            saida.append(linha)
+            bloco_html = True
+            continue
+        marcador = re.match(r"([-*+]|\d+[.)])\s+(.*)", conteudo)
+        titulo = re.match(r"(#{1,6})\s+(.*)", conteudo)
+        if re.fullmatch(r"(-{2,}|={2,})", conteudo) and paragrafo:
+            # Linha de traços logo abaixo de um texto: o texto vira título (setext)
+            nivel = 1 if conteudo[0] == "=" else 2
+            saida.append(f"<h{nivel}>" + _inline("".join(paragrafo).replace(_QUEBRA, "").rstrip()) + f"</h{nivel}>")
+            paragrafo.clear()
+        elif re.fullmatch(r"(-\s*){3,}|(\*\s*){3,}", conteudo):
+            fechar_paragrafo()
+            fechar_listas()
+            saida.append("<hr>")
+        elif titulo:
+            fechar_paragrafo()
+            fechar_listas()
+            nivel = len(titulo.group(1))
+            saida.append(f"<h{nivel}>{_inline(titulo.group(2).strip())}</h{nivel}>")
+        elif marcador:
+            fechar_paragrafo()
+            tag = "ul" if marcador.group(1)[0] in "-*+" else "ol"
+            fechar_listas(indentacao)
+            if listas and listas[-1][0] == indentacao and listas[-1][1] != tag:
+                fechar_listas(indentacao - 1)
+            if listas and listas[-1][0] == indentacao:
+                item.extend(["</li><li>", [marcador.group(2) + (_QUEBRA if quebra else "")]])
+            else:
+                item.extend([f"<{tag}><li>", [marcador.group(2) + (_QUEBRA if quebra else "")]])
+                listas.append((indentacao, tag))
+        elif listas and (indentacao > 0 or not depois_de_branco):
+            # Continuação do item da lista
+            if item:
+                item[1].append(conteudo + (_QUEBRA if quebra else ""))
+            else:
+                saida.append(" " + _inline(conteudo))
+        else:
+            fechar_listas()
+            paragrafo.append(conteudo + (_QUEBRA if quebra else "") + "\n")
+        depois_de_branco = False
+    fechar_paragrafo()
+    fechar_listas()
+    return "\n".join(saida)
+
+
+class _Bloco:
+    """Trecho da página que recebe conteúdo dentro de um `with` (coluna, expansor)."""
+
+    def __init__(self, pagina, abre, fecha):
+        self.pagina = pagina
+        self.abre = abre
+        self.fecha = fecha
+        self.partes = []
+
+    def __enter__(self):
+        self.pagina._pilha.append(self.partes)
+        return self
+
+    def __exit__(self, *excecao):
+        self.pagina._pilha.pop()
+
+    def html(self):
+        return self.abre + "\n".join(p if isinstance(p, str) else p.html() for p in self.partes) + self.fecha
+
+
+class PaginaHtml:
+    """Os métodos do streamlit usados por secoes.py, gerando HTML em vez de elementos do app."""
+
+    def __init__(self):
+        self.raiz = _Bloco(self, "", "")
+        self._pilha = [self.raiz.partes]
+
+    def _adicionar(self, parte):
+        self._pilha[-1].append(parte)
+        return parte
+
+    def html(self):
+        return self.raiz.html()
+
+    def empty(self):
+        pass
+
+    def title(self, texto):
+        self._adicionar(f"<h1>{_inline(texto)}</h1>")
+
+    def header(self, texto):
+        self._adicionar(f"<h2>{_inline(texto)}</h2>")
+
+    def subheader(self, texto):
+        self._adicionar(f"<h3>{_inline(texto)}</h3>")
+
+    def markdown(self, texto, unsafe_allow_html=False):
+        self._adicionar(markdown_html(texto, html_bruto=unsafe_allow_html))
+
+    def caption(self, texto):
+        self._adicionar(f"<p><small>{_inline(texto)}</small></p>")
+
+    def _aviso(self, tipo, texto):
+        self._adicionar(f'<div class="aviso aviso-{tipo}">{markdown_html(texto)}</div>')
+
+    def success(self, texto):
+        self._aviso("success", texto)
+
+    def info(self, texto):
+        self._aviso("info", texto)
+
+    def warning(self, texto):
+        self._aviso("warning", texto)
+
+    def error(self, texto):
+        self._aviso("error", texto)
+
+    def metric(self, rotulo, valor, delta=None):
+        detalhe = f"<small>{html.escape(str(delta))}</small>" if delta is not None else ""
+        self._adicionar(f'<div class="metrica">{html.escape(rotulo)}'
+                        f"<strong>{html.escape(str(valor))}</strong>{detalhe}</div>")
+
+    def table(self, dados):
+        self._adicionar(pd.DataFrame(dados).to_html(index=False, border=0))
+
+    def columns(self, colunas):
+        quantidade = colunas if isinstance(colunas, int) else len(colunas)
+        grupo = self._adicionar(_Bloco(self, '<div class="colunas">', "</div>"))
+        grupo.partes.extend(_Bloco(self, "<div>", "</div>") for _ in range(quantidade))
+        return list(grupo.partes)
+
+    def expander(self, titulo, expanded=False):
+        aberto = " open" if expanded else ""
+        return self._adicionar(_Bloco(self, f"<details{aberto}><summary>{_inline(titulo)}</summary>", "</details>"))
+
+
+def _gravar(caminho, conteudo):
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+
+
+class ExportadorImagens:
+    """Grava as variantes WebP de cada conteúdo uma vez só (o hash entra no nome)."""
+
+    def __init__(self, acervo, destino):
+        self.acervo = acervo
+        self.destino = destino
+        self.gravados = {}  # arquivo -> bytes
+        os.makedirs(os.path.join(destino, "img"), exist_ok=True)
+
+    def _variantes(self, conteudo_hash):
+        caminho = self.acervo.conteudos[conteudo_hash]["caminho"]
+        with Image.open(caminho) as original:
+            original.load()
+        variantes = []
+        for largura in LARGURAS_IMAGEM:
+            nome = f"img/{conteudo_hash}-{largura}.webp"
+            img = original.copy()
+            img.thumbnail((largura, largura * 4))
+            if not os.path.isfile(os.path.join(self.destino, nome)):
+                saida = os.path.join(self.destino, nome)
+                img.save(saida + ".tmp", format="WEBP", quality=QUALIDADE_WEBP, method=6)
+                os.replace(saida + ".tmp", saida)
+            self.gravados[nome] = os.path.getsize(os.path.join(self.destino, nome))
+            variantes.append((nome, img.size))
+            if img.width < largura:  # a imagem já é menor: variantes maiores seriam iguais
+                break
+        return variantes
+
+    def figura(self, chave, legenda, cor_fundo):
+        conteudo_hash = self.acervo.nomes.get(f"secao/{chave}")
+        if conteudo_hash is None:
+            cor = "rgb({}, {}, {})".format(*cor_fundo)
+            return (f'<figure><div class="sem-imagem" style="background: {cor}"></div>'
+                    f"<figcaption>{html.escape(legenda)}</figcaption></figure>")
+        variantes = self._variantes(conteudo_hash)
+        nome, (largura, altura) = variantes[0]
+        srcset = ", ".join(f"{n} {tamanho[0]}w" for n, tamanho in variantes)
+        return (f'<figure><img src="{variantes[-1][0]}" srcset="{srcset}" sizes="(max-width: 700px) 100vw, 50vw" '
+                f'width="{largura}" height="{altura}" loading="lazy" decoding="async" alt="{html.escape(legenda)}">'
+                f"<figcaption>{html.escape(legenda)}</figcaption></figure>")
+
+
+def _documento(titulo, corpo, navegacao, estilo):
+    return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(titulo)} – Museu do Lixo</title>
+<link rel="stylesheet" href="{estilo}">
+</head>
+<body>
+<nav>{navegacao}</nav>
+<main>
+{corpo}
+</main>
+</body>
+</html>
+"""
+
+
+def exportar(destino, url_app=""):
+    """Gera index.html, uma página por seção, o CSS e as imagens. Retorna arquivo -> bytes."""
+    os.makedirs(destino, exist_ok=True)
+    acervo = catalogar(nomes_logicos(ler_tabela(caminho_dados("polimeros.csv"))))
+    imagens = ExportadorImagens(acervo, destino)
+
+    estilo = f"estilo.{hashlib.sha256(ESTILO.encode('utf-8')).hexdigest()[:16]}.css"
+    _gravar(os.path.join(destino, estilo), ESTILO.encode("utf-8"))
+    gerados = {estilo: len(ESTILO.encode("utf-8"))}
+
+    link_app = f'<a href="{html.escape(url_app)}">🧐 Quiz, busca e mapas</a>' if url_app else ""
+
+    def navegacao(atual):
+        links = [f'<a href="{arquivo}.html"{" class=atual" if arquivo == atual else ""}>{html.escape(titulo)}</a>'
+                 for arquivo, titulo, _ in SECOES_ESTATICAS]
+        return "".join(links) + link_app
+
+    for arquivo, titulo, funcao in SECOES_ESTATICAS:
+        pagina = PaginaHtml()
+
+        def imagem(chave, legenda, cor_fundo, decorativa=False, **kwargs):
+            pagina._adicionar(imagens.figura(chave, legenda, cor_fundo))
+
+        argumentos = {}
+        if arquivo in NOTAS_INTERATIVAS:
+            nota = NOTAS_INTERATIVAS[arquivo] + (f" [Abrir o app]({url_app})" if url_app else "")
+            argumentos["interativo"] = lambda: pagina.info(nota)
+        funcao(pagina, imagem, **argumentos)
+        conteudo = _documento(titulo, pagina.html(), navegacao(arquivo), estilo).encode("utf-8")
+        _gravar(os.path.join(destino, f"{arquivo}.html"), conteudo)
+        gerados[f"{arquivo}.html"] = len(conteudo)
+
+    itens = "".join(f'<li><a href="{arquivo}.html">{html.escape(titulo)}</a></li>'
+                    for arquivo, titulo, _ in SECOES_ESTATICAS)
+    corpo = ("<h1>Museu do Lixo ♻️ COMCAP Florianópolis</h1><p>Aplicativo para educação ambiental</p>"
+             f"<ul>{itens}</ul>" + (f"<p>{link_app}</p>" if link_app else ""))
+    conteudo = _documento("Início", corpo, navegacao("index"), estilo).encode("utf-8")
+    _gravar(os.path.join(destino, "index.html"), conteudo)
+    gerados["index.html"] = len(conteudo)
+    gerados.update(imagens.gravados)
+    return gerados
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta as seções de leitura do app como HTML estático.")
+    parser.add_argument("destino", help="pasta de saída")
+    parser.add_argument("--app", default=os.environ.get("MUSEU_URL_APP", ""),
+                        help="endereço do app Streamlit, para os links do quiz, busca e mapas")
+    args = parser.parse_args()
+
+    gerados = exportar(args.destino, args.app)
+    paginas = [nome for nome in gerados if nome.endswith(".html")]
+    imagens = [nome for nome in gerados if nome.startswith("img/")]
+    print(f"{len(paginas)} páginas ({sum(gerados[n] for n in paginas) / 1000:.0f} KB) e "
+          f"{len(imagens)} imagens ({sum(gerados[n] for n in imagens) / 1000:.0f} KB) em {args.destino}")
@@ -0,0 +1,172 @@
+"""
+Conjuntos de dados compartilhados, somente leitura.
+
+As tabelas e as perguntas do quiz ficam uma vez por processo no grafo de
+artefatos (artefatos.py) e são entregues a todas as sessões sem cópia. Para
+que nenhuma sessão altere o que as outras estão lendo, elas são congeladas:
+qualquer tentativa de alterá-las no lugar levanta TypeError (ErroSomenteLeitura,
+ou o ValueError do numpy para escritas direto no array de uma coluna). Operações que
+produzem outra tabela (filtros, renomear, ordenar, .copy()) continuam
+funcionando e devolvem DataFrames comuns, que podem ser alterados à vontade.
+"""
+import types
+
+import numpy as np
+import pandas as pd
+
+
+class ErroSomenteLeitura(TypeError):
+    pass
+
+
+def _recusar(*args, **kwargs):
+    raise ErroSomenteLeitura("conjunto de dados compartilhado é somente leitura; use .copy() para alterar")
+
+
+class _IndexadorLeitura:
+    """loc/iloc/at/iat que só leem."""
+
+    def __init__(self, indexador):
+        self._indexador = indexador
+
+    def __getitem__(self, chave):
+        return self._indexador[chave]
+
+    __setitem__ = _recusar
+
+    def __call__(self, *args, **kwargs):
+        return _IndexadorLeitura(self._indexador(*args, **kwargs))
+
+
+class TabelaCongelada(pd.DataFrame):
+    _congelada = False
+
+    @property
+    def _constructor(self):
+        # O que for derivado da tabela é um DataFrame comum
+        return pd.DataFrame
+
+    def _constructor_from_mgr(self, mgr, axes):
+        return pd.DataFrame._from_mgr(_gravavel(mgr), axes=axes)
+
+    def _constructor_sliced_from_mgr(self, mgr, axes):
+        serie = pd.Series._from_mgr(_gravavel(mgr), axes)
+        serie._name = None  # quem chama põe o nome
+        return serie
+
+    def __setattr__(self, nome, valor):  # columns, index, attrs, df.coluna = ...
+        if self._congelada:
+            _recusar()
+        super().__setattr__(nome, valor)
+
+    def __setitem__(self, chave, valor):
+        if self._congelada:
+            _recusar()
+        super().__setitem__(chave, valor)
+
+    def __delitem__(self, chave):
+        _recusar()
+
+    def _update_inplace(self, *args, **kwargs):  # todos os métodos com inplace=True passam por aqui
+        _recusar()
+
+    insert = pop = update = _recusar
+
+    @property
+    def loc(self):
+        return _IndexadorLeitura(super().loc)
+
+    @property
+    def iloc(self):
+        return _IndexadorLeitura(super().iloc)
+
+    @property
+    def at(self):
+        return _IndexadorLeitura(super().at)
+
+    @property
+    def iat(self):
+        return _IndexadorLeitura(super().iat)
+
+    def __reduce__(self):
+        # Pickle (ex.: argumentos de st.cache_data) volta como DataFrame comum
+        return pd.DataFrame, (pd.DataFrame(self),)
+
+
+# Métodos com inplace=True que escrevem nos blocos antes de chegar a _update_inplace
+_METODOS_INPLACE = ["replace", "where", "mask", "clip", "fillna", "ffill", "bfill", "interpolate"]
+
+
+def _sem_inplace(metodo):
+    def envoltorio(self, *args, **kwargs):
+        if kwargs.get("inplace") and self._congelada:
+            _recusar()
+        return metodo(self, *args, **kwargs)
+    envoltorio.__name__ = metodo.__name__
+    envoltorio.__doc__ = metodo.__doc__
+    return envoltorio
+
+
+for _nome in _METODOS_INPLACE:
+    setattr(TabelaCongelada, _nome, _sem_inplace(getattr(pd.DataFrame, _nome)))
+
+
+def _arrays_numpy(valores):
+    """Os ndarrays por trás dos valores de um bloco (numpy, Categorical, datas, inteiros com máscara)."""
+    if isinstance(valores, np.ndarray):
+        return [valores]
+    return [dados for atributo in ("_ndarray", "_data", "_mask")
+            if isinstance(dados := getattr(valores, atributo, None), np.ndarray)]
+
+
+def _gravavel(mgr):
+    """
+    Copia os blocos de uma tabela derivada que ainda apontam para os arrays
+    congelados. Sem isso, uma derivada que sobrevive à tabela original fica como
+    única dona deles e o copy-on-write do pandas tenta escrever direto, com erro.
+    As tabelas do app são pequenas; filtros e ordenações já trazem arrays novos.
+    """
+    if any(not dados.flags.writeable for bloco in mgr.blocks for dados in _arrays_numpy(bloco.values)):
+        return mgr.copy(deep=True)
+    return mgr
+
+
+def congelar_tabela(df: pd.DataFrame) -> TabelaCongelada:
+    """
+    Uma cópia da tabela com os arrays dos blocos marcados como não graváveis:
+    nem df.coluna.array[i] = ... consegue escrever neles. Colunas Arrow (as de
+    texto) já são imutáveis. A cópia é feita uma vez, quando o artefato é construído.
+    """
+    tabela = TabelaCongelada(df.copy(deep=True), copy=False)
+    for bloco in tabela._mgr.blocks:
+        for dados in _arrays_numpy(bloco.values):
+            dados.flags.writeable = False
+    object.__setattr__(tabela, "_congelada", True)
+    return tabela
+
+
+class RegistroCongelado(dict):
+    """Dicionário que não aceita alterações; continua sendo um dict para json, pickle e st.session_state."""
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _recusar
+
+    def __ior__(self, outro):
+        _recusar()
+
+    def __reduce__(self):
+        return RegistroCongelado, (dict(self),)
+
+
+def congelar_registro(registro):
+    return RegistroCongelado({chave: tuple(valor) if isinstance(valor, list) else valor
+                              for chave, valor in registro.items()})
+
+
+def congelar_registros(registros):
+    """Lista de dicionários -> tupla de registros congelados (listas dentro viram tuplas)."""
+    return tuple(congelar_registro(registro) for registro in registros)
+
+
+def congelar_mapa(mapa):
+    """Dicionário de consulta somente leitura (sem cópia)."""
+    return types.MappingProxyType(mapa)
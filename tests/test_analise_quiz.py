@@ -0,0 +1,42 @@
+import pandas as pd
+
+from analise_quiz import COLUNAS_RESUMO, resumo_perguntas
+
+PERGUNTAS = [
+    {"id": "a1", "pergunta": "O que é PET?", "opcoes": ["Um polímero", "Um metal", "Um vidro"], "resposta": 0},
+    {"id": "b2", "pergunta": "Isopor é reciclável?", "opcoes": ["Sim", "Não"], "resposta": 0},
+]
+
+
+def _agregados(ids):
+    return {
+        "perguntas": pd.DataFrame({"pergunta_id": ids, "total": [10] * len(ids), "acertos": [4] * len(ids),
+                                   "soma_latencia_ms": [50000] * len(ids), "n_latencia": [10] * len(ids)}),
+        "opcoes": pd.DataFrame({"pergunta_id": ids * 2, "opcao": [0] * len(ids) + [1] * len(ids),
+                                "total": [4] * len(ids) + [6] * len(ids)}),
+    }
+
+
+def test_resumo_das_perguntas_do_banco():
+    resumo = resumo_perguntas(_agregados(["a1", "b2"]), PERGUNTAS)
+    assert list(resumo.columns) == COLUNAS_RESUMO
+    assert resumo["Acertos (%)"].tolist() == [40.0, 40.0]
+    assert resumo.loc[resumo["pergunta_id"] == "a1", "Distrator mais escolhido"].item() == "Um metal"
+
+
+def test_banco_editado_sem_nenhuma_pergunta_respondida():
+    # Editar o texto muda o id (sha1 do texto): os agregados antigos não casam com nada
+    resumo = resumo_perguntas(_agregados(["id-antigo-1", "id-antigo-2"]), PERGUNTAS)
+    assert resumo.empty
+    assert list(resumo.columns) == COLUNAS_RESUMO
+
+
+def test_banco_editado_mantem_as_perguntas_que_continuam():
+    resumo = resumo_perguntas(_agregados(["id-antigo", "b2"]), PERGUNTAS)
+    assert resumo["pergunta_id"].tolist() == ["b2"]
+
+
+def test_sem_respostas():
+    resumo = resumo_perguntas({"perguntas": pd.DataFrame(), "opcoes": pd.DataFrame()}, PERGUNTAS)
+    assert resumo.empty
+    assert list(resumo.columns) == COLUNAS_RESUMO
@@ -0,0 +1,25 @@
+import numpy as np
+
+from quiz_adaptativo import ajustar_do_banco
+from registro_respostas import SESSAO_ANONIMA, RegistroRespostas
+
+
+def test_respostas_sem_sessao_ficam_fora_do_ajuste(tmp_path):
+    banco, saida = str(tmp_path / "respostas.db"), str(tmp_path / "parametros.npz")
+    registro = RegistroRespostas(banco)
+    for estudante in range(6):
+        registro.registrar(f"s{estudante}", "facil", 0, True)
+        registro.registrar(f"s{estudante}", "dificil", 0, estudante < 2)
+    # Muitas respostas anônimas pela API, todas erradas na pergunta fácil
+    for _ in range(50):
+        registro.registrar(SESSAO_ANONIMA, "facil", 1, False)
+        registro.registrar(SESSAO_ANONIMA, "so_anonimas", 1, False)
+    assert registro.esvaziar(timeout=10)
+    registro.fechar()
+
+    n_respostas, n_sessoes, n_itens = ajustar_do_banco(banco, saida)
+    assert (n_respostas, n_sessoes, n_itens) == (12, 6, 2)
+    with np.load(saida) as dados:
+        dificuldades = dict(zip(dados["ids"].tolist(), dados["dificuldades"].tolist()))
+    assert set(dificuldades) == {"facil", "dificil"}
+    assert dificuldades["facil"] < dificuldades["dificil"]
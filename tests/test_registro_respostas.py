@@ -0,0 +1,24 @@
+import sqlite3
+
+from registro_respostas import RegistroRespostas
+
+
+def test_resposta_invalida_nao_segura_as_outras(tmp_path):
+    caminho = str(tmp_path / "respostas.db")
+    registro = RegistroRespostas(caminho, espera_lote=0.5)
+    registro.registrar("s1", "p1", 0, True, turma="7A")
+    registro.registrar("s2", "p1", 1, False, turma=["não", "é", "texto"])
+    registro.registrar("s3", "p2", 2, True)
+    assert registro.esvaziar(timeout=10)
+
+    # Depois do lote com erro, o escritor continua gravando
+    registro.registrar("s4", "p2", 0, False)
+    assert registro.esvaziar(timeout=10)
+    registro.fechar()
+
+    with sqlite3.connect(caminho) as conexao:
+        sessoes = [linha[0] for linha in conexao.execute("SELECT sessao FROM respostas ORDER BY id")]
+        total = conexao.execute("SELECT SUM(total) FROM agregado_pergunta").fetchone()[0]
+    assert sessoes == ["s1", "s3", "s4"]
+    assert total == 3
+    assert registro.descartadas == 1
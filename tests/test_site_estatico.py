@@ -0,0 +1,32 @@
+from site_estatico import markdown_html
+
+
+def test_negrito_que_atravessa_a_quebra_de_linha():
+    html = markdown_html("""
+    o método de **leira estática
+    com aeração passiva** (Método UFSC), cerca de **2 mil toneladas/ano**
+    """)
+    assert "<strong>leira estática\ncom aeração passiva</strong>" in html
+    assert "<strong>2 mil toneladas/ano</strong>" in html
+    assert "**" not in html
+
+
+def test_italico_que_atravessa_a_quebra_de_linha_num_item():
+    html = markdown_html("""
+    - um *texto que
+      continua* na linha seguinte
+    - outro item
+    """)
+    assert "<em>texto que\ncontinua</em>" in html
+    assert html.count("<li>") == 2
+
+
+def test_quebra_forcada_no_paragrafo_e_no_item():
+    html = markdown_html("primeira  \nsegunda\n\n- item  \n  continuação")
+    assert "<p>primeira<br>\nsegunda</p>" in html
+    assert "<li>item<br>\ncontinuação" in html
+    assert "\x00" not in html
+
+
+def test_texto_escapado():
+    assert "&lt;b&gt;" in markdown_html("um <b> solto")
@@ -0,0 +1,95 @@
+import gc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from somente_leitura import ErroSomenteLeitura, congelar_tabela
+
+
+def _original():
+    return pd.DataFrame({
+        "sigla": pd.Series(["PET", "PEAD", None], dtype="str"),
+        "codigo": [1, 2, 3],
+        "densidade": [1.38, np.nan, 0.91],
+        "camada": pd.Categorical(["Coleta seletiva", "Cooperativa", "Coleta seletiva"]),
+    })
+
+
+@pytest.fixture
+def tabela():
+    return congelar_tabela(_original())
+
+
+def _intacta(tabela):
+    pd.testing.assert_frame_equal(pd.DataFrame(tabela), _original())
+
+
+@pytest.mark.parametrize("alterar", [
+    lambda t: t.replace("PET", "X", inplace=True),
+    lambda t: t.replace({"codigo": {1: 77}}, inplace=True),
+    lambda t: t.where(t.isna(), inplace=True),
+    lambda t: t.mask(t.notna(), inplace=True),
+    lambda t: t.clip(upper=0, inplace=True),
+    lambda t: t.fillna(0, inplace=True),
+    lambda t: t.interpolate(inplace=True),
+    lambda t: t.ffill(inplace=True),
+    lambda t: t.rename(columns={"codigo": "c"}, inplace=True),
+    lambda t: t.iloc.__setitem__((0, 1), 77),
+    lambda t: t.loc.__setitem__((0, "codigo"), 77),
+    lambda t: t.at.__setitem__((0, "codigo"), 77),
+    lambda t: t.__setitem__("codigo", 77),
+    lambda t: t.__delitem__("codigo"),
+    lambda t: t.insert(0, "nova", 1),
+    lambda t: t.pop("codigo"),
+    lambda t: setattr(t, "columns", list("abcd")),
+], ids=["replace", "replace_dict", "where", "mask", "clip", "fillna", "interpolate", "ffill",
+        "rename", "iloc", "loc", "at", "setitem", "delitem", "insert", "pop", "columns"])
+def test_alteracoes_no_lugar_sao_recusadas_antes_de_escrever(tabela, alterar):
+    with pytest.raises(ErroSomenteLeitura):
+        alterar(tabela)
+    _intacta(tabela)
+
+
+@pytest.mark.parametrize("alterar", [
+    lambda t: t._mgr.iget_values(1).__setitem__(0, 77),
+    lambda t: t._mgr.iget_values(2).__setitem__(0, 77),
+    lambda t: t._mgr.iget_values(3)._ndarray.__setitem__(0, 1),
+    lambda t: t["codigo"].to_numpy().__setitem__(0, 77),
+], ids=["inteiros", "reais", "codigos_categoria", "to_numpy_serie"])
+def test_arrays_dos_blocos_nao_aceitam_escrita(tabela, alterar):
+    with pytest.raises(ValueError):
+        alterar(tabela)
+    _intacta(tabela)
+
+
+@pytest.mark.parametrize("alterar", [
+    lambda t: t["codigo"].array.__setitem__(0, 77),
+    lambda t: t["camada"].array.__setitem__(0, "Cooperativa"),
+    lambda t: (serie := t["codigo"]).iloc.__setitem__(0, 77),
+    lambda t: t.to_numpy().__setitem__((0, 1), 77),
+], ids=["array", "array_categoria", "iloc_serie", "to_numpy"])
+def test_colunas_extraidas_nao_escrevem_na_tabela(tabela, alterar):
+    alterar(tabela)
+    _intacta(tabela)
+
+
+def test_derivadas_podem_ser_alteradas(tabela):
+    filtrada = tabela[tabela["codigo"] > 1]
+    filtrada.iloc[0, 1] = 99
+    renomeada = tabela.rename(columns={"codigo": "c"})
+    renomeada.loc[0, "c"] = 5
+    copia = tabela.copy()
+    copia.replace("PET", "X", inplace=True)
+    copia["codigo"].array[0] = 3
+    assert type(filtrada) is pd.DataFrame and type(copia) is pd.DataFrame
+    assert copia.loc[0, "sigla"] == "X"
+    _intacta(tabela)
+
+
+def test_derivada_que_sobrevive_a_tabela_continua_gravavel(tabela):
+    selecao = tabela[["codigo"]]
+    del tabela
+    gc.collect()
+    selecao.iloc[0, 0] = 4
+    assert selecao.iloc[0, 0] == 4
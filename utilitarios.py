@@ -0,0 +1,35 @@
+import re
+import unicodedata
+
+
+# Função para normalizar textos de busca (minúsculas e sem acentos)
+def normalizar_texto(texto):
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r"\s+", " ", texto.lower()).strip()
+
+
+# Função para padronizar a coluna "Reciclável" ("Sim (compostável)" -> "Sim")
+def normalizar_reciclavel(valor):
+    texto = normalizar_texto(valor)
+    if texto.startswith("sim"):
+        return "Sim"
+    if texto.startswith("nao"):
+        return "Não"
+    return "Não informado"
+
+
+# Função para extrair os números de textos como "0,94–0,96 g/cm³" ou "1.000 anos"
+def numeros_do_texto(texto):
+    texto = str(texto)
+    # Ponto como separador de milhar ("1.000 anos") e vírgula como decimal
+    texto = re.sub(r"(?<=\d)\.(?=\d{3}\b)", "", texto).replace(",", ".")
+    return [float(n) for n in re.findall(r"\d+(?:\.\d+)?", texto)]
+
+
+# Função para extrair o valor médio de textos como "0,94–0,96 g/cm³" ou "250 °C"
+def valor_medio(texto):
+    numeros = numeros_do_texto(texto)
+    if not numeros:
+        return float("nan")
+    return sum(numeros) / len(numeros)